@@ -0,0 +1,91 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+OPERATIONS = ['add_episode_bulk', 'add_episode', 'search_']
+LATENCY_METRICS = ['p50', 'p90', 'p99']
+
+
+def metrics(operation: dict[str, Any]) -> dict[str, float]:
+    values = {f'latency_ms.{name}': operation['latency_ms'][name] for name in LATENCY_METRICS}
+    values.update({f'per_item.{name}': value for name, value in operation['per_item'].items()})
+    return values
+
+
+def compare(
+    baseline: dict[str, Any], candidate: dict[str, Any], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Report lines comparing two benchmark results, and the lines that are regressions."""
+    lines: list[str] = []
+    regressions: list[str] = []
+    baseline_sizes = {result['episodes']: result for result in baseline['results']}
+    for result in candidate['results']:
+        baseline_result = baseline_sizes.get(result['episodes'])
+        if baseline_result is None:
+            continue
+        for operation in OPERATIONS:
+            if result[operation]['operations'] == 0:
+                continue
+            if baseline_result[operation]['operations'] == 0:
+                continue
+            baseline_metrics = metrics(baseline_result[operation])
+            for name, value in metrics(result[operation]).items():
+                baseline_value = baseline_metrics.get(name)
+                if not baseline_value:
+                    continue
+                change = (value - baseline_value) / baseline_value
+                line = (
+                    f'{result["episodes"]:>8} {operation:<18} {name:<32} '
+                    f'{baseline_value:>12.3f} {value:>12.3f} {change:>+8.1%}'
+                )
+                lines.append(line)
+                if change > threshold:
+                    regressions.append(line)
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description='Compare two run_benchmarks results files.')
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='relative increase above which a metric counts as a regression',
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    lines, regressions = compare(baseline, candidate, args.threshold)
+    print(f'{"episodes":>8} {"operation":<18} {"metric":<32} {"baseline":>12} {"candidate":>12}')
+    print('\n'.join(lines))
+    if regressions:
+        print(f'\n{len(regressions)} metrics regressed by more than {args.threshold:.0%}:')
+        print('\n'.join(regressions))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from typing import Any, cast
+
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession
+from graphiti_core.driver.operations import GraphOperations
+
+
+class CountingTransaction:
+    def __init__(self, tx: Any, driver: 'CountingDriver'):
+        self.tx = tx
+        self.driver = driver
+
+    async def run(self, query: Any, **kwargs: Any) -> Any:
+        # FalkorDB sessions run a list of queries for a single call
+        self.driver.round_trips += len(query) if isinstance(query, list) else 1
+        return await self.tx.run(query, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.tx, name)
+
+
+class CountingOperations:
+    def __init__(self, operations: GraphOperations, driver: 'CountingDriver'):
+        self.operations = operations
+        self.driver = driver
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self.operations, name)
+
+        async def counted(*args: Any, **kwargs: Any) -> Any:
+            self.driver.round_trips += 1
+            return await method(*args, **kwargs)
+
+        return counted
+
+
+class CountingSession(GraphDriverSession):
+    def __init__(self, session: Any, driver: 'CountingDriver'):
+        self.session = session
+        self.driver = driver
+
+    async def __aenter__(self):
+        await self.session.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self.session.__aexit__(exc_type, exc, tb)
+
+    async def run(self, query: Any, **kwargs: Any) -> Any:
+        return await CountingTransaction(self.session, self.driver).run(query, **kwargs)
+
+    async def close(self):
+        await self.session.close()
+
+    async def execute_write(self, func, *args, **kwargs):
+        async def counted(tx, *args, **kwargs):
+            return await func(CountingTransaction(tx, self.driver), *args, **kwargs)
+
+        return await self.session.execute_write(counted, *args, **kwargs)
+
+
+class CountingDriver(GraphDriver):
+    """
+    Wraps a driver and counts the queries sent to the database, including those in sessions.
+    For drivers that serve queries through GraphDriver.operations, each call counts as one query.
+    """
+
+    def __init__(self, driver: GraphDriver):
+        self.driver = driver
+        self.provider = driver.provider
+        self.round_trips = 0
+        if driver.operations is not None:
+            self.operations = cast(GraphOperations, CountingOperations(driver.operations, self))
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        self.round_trips += 1
+        return await self.driver.execute_query(cypher_query_, **kwargs)
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return CountingSession(self.driver.session(database), self)
+
+    async def close(self):
+        await self.driver.close()
+
+    async def delete_all_indexes(self, database_: str | None = None):
+        return await self.driver.delete_all_indexes(database_)
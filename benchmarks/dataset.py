@@ -0,0 +1,86 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from graphiti_core.nodes import EpisodeType
+from graphiti_core.utils.bulk_utils import RawEpisode
+
+PEOPLE = [
+    'Alice', 'Bob', 'Carol', 'Dave', 'Erin', 'Frank', 'Grace', 'Heidi', 'Ivan', 'Judy',
+    'Mallory', 'Niaj', 'Olivia', 'Peggy', 'Rupert', 'Sybil', 'Trent', 'Victor', 'Walter', 'Zoe',
+]  # fmt: skip
+PLACES = [
+    'Paris', 'Berlin', 'Lisbon', 'Oslo', 'Tokyo', 'Denver', 'Austin', 'Dublin', 'Zurich', 'Lima',
+]  # fmt: skip
+TOPICS = [
+    'Apollo', 'Borealis', 'Cascade', 'Delta', 'Ember', 'Falcon', 'Granite', 'Harbor', 'Ion',
+    'Juniper',
+]  # fmt: skip
+TEMPLATES = [
+    '{speaker}: I met {person} in {place} to talk about {topic}.',
+    '{speaker}: {person} is moving to {place} to lead {topic}.',
+    '{speaker}: {person} scheduled the {topic} review in {place}.',
+    '{speaker}: {person} and I finished the {topic} launch plan.',
+]
+
+START_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def group_id(index: int, episodes_per_group: int) -> str:
+    return f'benchmark-{index // episodes_per_group}'
+
+
+def group_ids(episode_count: int, episodes_per_group: int) -> list[str]:
+    """The groups of the first episode_count episodes."""
+    return [group_id(i, episodes_per_group) for i in range(0, episode_count, episodes_per_group)]
+
+
+def make_episodes(
+    start: int, count: int, episodes_per_group: int, seed: int = 0
+) -> list[tuple[str, RawEpisode]]:
+    """
+    Deterministic synthetic chat messages, numbered from start, with the group of each.
+
+    Episode i is the same whatever batch it is generated in, so graphs built in different
+    batch sizes contain the same episodes.
+    """
+    episodes: list[tuple[str, RawEpisode]] = []
+    for i in range(start, start + count):
+        rng = random.Random(seed * 1_000_003 + i)
+        speaker, person = rng.sample(PEOPLE, 2)
+        content = rng.choice(TEMPLATES).format(
+            speaker=speaker, person=person, place=rng.choice(PLACES), topic=rng.choice(TOPICS)
+        )
+        episodes.append(
+            (
+                group_id(i, episodes_per_group),
+                RawEpisode(
+                    name=f'episode-{i}',
+                    content=content,
+                    source=EpisodeType.message,
+                    source_description='benchmark chat',
+                    reference_time=START_TIME + timedelta(minutes=i),
+                ),
+            )
+        )
+    return episodes
+
+
+def make_queries(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [f'{rng.choice(PEOPLE)} {rng.choice(TOPICS)} {rng.choice(PLACES)}' for _ in range(count)]
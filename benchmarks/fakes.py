@@ -0,0 +1,263 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import ast
+import asyncio
+import hashlib
+import json
+import re
+import types
+import typing
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.embedder.client import EMBEDDING_DIM, EmbedderClient
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
+from graphiti_core.prompts.models import Message
+
+FAKE_MODEL = 'fake-llm'
+FAKE_SMALL_MODEL = 'fake-llm-small'
+
+NAME_PATTERN = re.compile(r'\b[A-Z][a-z]+\b')
+MAX_ENTITIES_PER_EPISODE = 6
+
+
+def section(prompt: str, *tags: str) -> str:
+    """The text between the first of the given <TAG> ... </TAG> pairs found in the prompt."""
+    for tag in tags:
+        match = re.search(f'<{tag}>(.*?)</{tag}>', prompt, re.DOTALL)
+        if match is not None:
+            return match.group(1).strip()
+    return ''
+
+
+def parse_literal(text: str) -> Any:
+    """Parse a JSON or Python literal embedded in a prompt, or None if it can't be parsed."""
+    for parse in (json.loads, ast.literal_eval):
+        try:
+            return parse(text)
+        except (ValueError, SyntaxError):
+            continue
+    return None
+
+
+def flatten(items: Any) -> list[dict[str, Any]]:
+    if not isinstance(items, list | tuple):
+        return []
+    flat: list[dict[str, Any]] = []
+    for item in items:
+        if isinstance(item, dict):
+            flat.append(item)
+        else:
+            flat.extend(flatten(item))
+    return flat
+
+
+def entity_names(text: str) -> list[str]:
+    names: list[str] = []
+    for name in NAME_PATTERN.findall(text):
+        if name not in names:
+            names.append(name)
+    return names[:MAX_ENTITIES_PER_EPISODE]
+
+
+def default_value(annotation: Any) -> Any:
+    """A placeholder value of the given type, used for fields the fake has no opinion about."""
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = typing.get_args(annotation)
+        return None if type(None) in args else default_value(args[0])
+    if origin in (list, tuple, set) or annotation in (list, tuple, set):
+        return []
+    if origin is dict or annotation is dict:
+        return {}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return default_response(annotation)
+    if annotation is bool:
+        return False
+    if annotation in (int, float):
+        return 0
+    return ''
+
+
+def default_response(response_model: type[BaseModel]) -> dict[str, Any]:
+    response: dict[str, Any] = {}
+    for name, field in response_model.model_fields.items():
+        if field.is_required():
+            response[name] = default_value(field.annotation)
+        else:
+            response[name] = field.get_default(call_default_factory=True)
+    return response
+
+
+def estimate_tokens(text: str) -> int:
+    return max(len(text) // 4, 1)
+
+
+class FakeLLMClient(LLMClient):
+    """
+    A deterministic LLM that answers Graphiti's prompts without calling a provider.
+
+    Entities are the capitalized words of the current episode, facts link consecutive
+    entities, and entities and facts with the same names as existing ones are resolved as
+    duplicates. Other prompts get placeholder values that satisfy their response models.
+    Each call waits latency seconds and reports token usage estimated from its text.
+    """
+
+    def __init__(self, latency: float = 0.0, config: LLMConfig | None = None):
+        if config is None:
+            config = LLMConfig(model=FAKE_MODEL, small_model=FAKE_SMALL_MODEL)
+        super().__init__(config, cache=False)
+        self.latency = latency
+        self.calls = 0
+
+    async def _generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> dict[str, Any]:
+        self.calls += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        prompt = messages[-1].content
+        response = self.respond(prompt, response_model)
+        model = self.small_model if model_size == ModelSize.small else self.model
+        self._record_token_usage(
+            model,
+            sum(estimate_tokens(message.content) for message in messages),
+            estimate_tokens(json.dumps(response)),
+        )
+        return response
+
+    def respond(self, prompt: str, response_model: type[BaseModel] | None) -> dict[str, Any]:
+        name = response_model.__name__ if response_model is not None else ''
+        if name == 'ExtractedEntities':
+            episode = section(prompt, 'CURRENT MESSAGE', 'TEXT', 'JSON')
+            return {
+                'extracted_entities': [
+                    {'name': entity, 'entity_type_id': 0} for entity in entity_names(episode)
+                ]
+            }
+        if name == 'NodeResolutions':
+            return {'entity_resolutions': self.resolve_nodes(prompt)}
+        if name == 'ExtractedEdges':
+            return {'edges': self.extract_edges(prompt)}
+        if name == 'EdgeDuplicate':
+            return self.resolve_edge(prompt)
+        if response_model is None:
+            return {}
+        return default_response(response_model)
+
+    def resolve_nodes(self, prompt: str) -> list[dict[str, Any]]:
+        extracted = flatten(parse_literal(section(prompt, 'ENTITIES')))
+        existing = flatten(parse_literal(section(prompt, 'EXISTING ENTITIES')))
+        existing_idx = {str(node.get('name', '')).lower(): node.get('idx') for node in existing}
+        return [
+            {
+                'id': node.get('id', i),
+                'name': node.get('name', ''),
+                'duplicate_idx': existing_idx.get(str(node.get('name', '')).lower(), -1),
+                'duplicates': [],
+            }
+            for i, node in enumerate(extracted)
+        ]
+
+    def extract_edges(self, prompt: str) -> list[dict[str, Any]]:
+        nodes = flatten(parse_literal(section(prompt, 'ENTITIES')))
+        return [
+            {
+                'relation_type': 'MENTIONED_WITH',
+                'source_entity_id': source.get('id', i),
+                'target_entity_id': target.get('id', i + 1),
+                'fact': f'{source.get("name")} was mentioned with {target.get("name")}',
+                'valid_at': None,
+                'invalid_at': None,
+            }
+            for i, (source, target) in enumerate(zip(nodes, nodes[1:], strict=False))
+        ]
+
+    def resolve_edge(self, prompt: str) -> dict[str, Any]:
+        new_fact = section(prompt, 'NEW FACT')
+        existing = flatten(parse_literal(section(prompt, 'EXISTING FACTS')))
+        return {
+            'duplicate_facts': [
+                i for i, edge in enumerate(existing) if edge.get('fact') == new_fact
+            ],
+            'contradicted_facts': [],
+            'fact_type': 'DEFAULT',
+        }
+
+
+def fake_embedding(text: str, dim: int) -> list[float]:
+    """A unit vector seeded by the text, so equal texts always embed to equal vectors."""
+    seed = int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:8], 'little')
+    vector = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class FakeEmbedder(EmbedderClient):
+    def __init__(self, latency: float = 0.0, embedding_dim: int = EMBEDDING_DIM):
+        self.latency = latency
+        self.embedding_dim = embedding_dim
+        self.calls = 0
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        self.calls += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        text = input_data if isinstance(input_data, str) else str(next(iter(input_data), ''))
+        return fake_embedding(text, self.embedding_dim)
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        self.calls += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return [fake_embedding(text, self.embedding_dim) for text in input_data_list]
+
+
+class FakeCrossEncoder(CrossEncoderClient):
+    """Scores passages by the share of query words they contain."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        self.calls += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        query_words = set(query.lower().split())
+        results = [
+            (
+                passage,
+                len(query_words & set(passage.lower().split())) / len(query_words)
+                if query_words
+                else 0.0,
+            )
+            for passage in passages
+        ]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
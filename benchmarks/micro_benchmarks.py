@@ -0,0 +1,427 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from benchmarks.dataset import PEOPLE, PLACES, START_TIME, TOPICS
+from benchmarks.fakes import fake_embedding
+from benchmarks.run_benchmarks import git_commit
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
+from graphiti_core.embedder.client import EMBEDDING_DIM
+from graphiti_core.helpers import lucene_sanitize
+from graphiti_core.nodes import EntityNode, get_entity_node_from_record
+from graphiti_core.search.search_filters import (
+    ComparisonOperator,
+    DateFilter,
+    SearchFilters,
+    edge_search_filter_query_constructor,
+)
+from graphiti_core.search.search_utils import (
+    edge_bfs_search,
+    fulltext_query,
+    maximal_marginal_relevance,
+    rrf,
+)
+from graphiti_core.utils.bulk_utils import (
+    compress_uuid_map,
+    edge_dedupe_candidates,
+    node_dedupe_candidates,
+    resolve_edge_pointers,
+)
+from graphiti_core.utils.maintenance.community_operations import Neighbor, label_propagation
+
+SCALES = ['small', 'medium', 'large']
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'micro_baseline.json')
+RESULTS_VERSION = 1
+
+# Tokens for synthetic queries, including Lucene operators that need escaping
+VERBS = ['leads', 'joined', 'reviewed', 'funded', 'paused', 'launched', 'audited', 'scoped']
+QUERY_WORDS = PEOPLE + PLACES + TOPICS + ['the', 'and', 'of', 'AND', 'OR', 'C++', '(draft)', 'v2:']
+
+Setup = Callable[[int], Callable[[], Any]]
+
+
+class MicroBenchmark:
+    def __init__(self, name: str, setup: Setup, sizes: dict[str, int]):
+        self.name = name
+        self.setup = setup
+        self.sizes = sizes
+
+
+BENCHMARKS: dict[str, MicroBenchmark] = {}
+
+
+def benchmark(name: str, small: int, medium: int, large: int) -> Callable[[Setup], Setup]:
+    """
+    Register a benchmark. The setup function builds synthetic input of the given size, outside
+    of the timed region, and returns the call to time.
+    """
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = MicroBenchmark(
+            name, setup, {'small': small, 'medium': medium, 'large': large}
+        )
+        return setup
+
+    return register
+
+
+def make_uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def make_name(rng: random.Random) -> str:
+    return f'{rng.choice(PEOPLE)} {rng.choice(TOPICS)}'
+
+
+def make_query(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(QUERY_WORDS) for _ in range(words))
+
+
+def make_entity_nodes(rng: random.Random, count: int) -> list[EntityNode]:
+    nodes: list[EntityNode] = []
+    for _ in range(count):
+        name = make_name(rng)
+        nodes.append(
+            EntityNode(
+                name=name,
+                group_id='benchmark',
+                labels=['Entity'],
+                name_embedding=fake_embedding(name, EMBEDDING_DIM),
+            )
+        )
+    return nodes
+
+
+def make_entity_edges(rng: random.Random, count: int) -> list[EntityEdge]:
+    edges: list[EntityEdge] = []
+    for _ in range(count):
+        fact = f'{rng.choice(PEOPLE)} {rng.choice(VERBS)} {rng.choice(TOPICS)}'
+        edges.append(
+            EntityEdge(
+                source_node_uuid=make_uuid(rng),
+                target_node_uuid=make_uuid(rng),
+                name='LEADS',
+                fact=fact,
+                group_id='benchmark',
+                created_at=START_TIME,
+                fact_embedding=fake_embedding(fact, EMBEDDING_DIM),
+            )
+        )
+    return edges
+
+
+@benchmark('rrf', small=100, medium=1_000, large=10_000)
+def setup_rrf(size: int) -> Callable[[], Any]:
+    rng = random.Random(0)
+    pool = [make_uuid(rng) for _ in range(size * 2)]
+    results = [rng.sample(pool, size) for _ in range(4)]
+    return lambda: rrf(results)
+
+
+@benchmark('maximal_marginal_relevance', small=10, medium=100, large=500)
+def setup_maximal_marginal_relevance(size: int) -> Callable[[], Any]:
+    rng = random.Random(0)
+    query_vector = fake_embedding('query', EMBEDDING_DIM)
+    candidates = {make_uuid(rng): fake_embedding(str(i), EMBEDDING_DIM) for i in range(size)}
+    return lambda: maximal_marginal_relevance(query_vector, candidates, max_results=size // 2)
+
+
+@benchmark('compress_uuid_map', small=100, medium=1_000, large=10_000)
+def setup_compress_uuid_map(size: int) -> Callable[[], Any]:
+    # Duplicate chains of random length, as produced by bulk deduplication
+    rng = random.Random(0)
+    uuids = [make_uuid(rng) for _ in range(size)]
+    uuid_map = {uuid: rng.choice(uuids) for uuid in uuids if rng.random() < 0.5}
+    return lambda: compress_uuid_map(uuid_map)
+
+
+@benchmark('label_propagation', small=100, medium=1_000, large=5_000)
+def setup_label_propagation(size: int) -> Callable[[], Any]:
+    # Disjoint cliques of 20 nodes. label_propagation updates all nodes at once, which can
+    # oscillate forever on irregular graphs, so the input is kept regular enough to converge.
+    rng = random.Random(0)
+    uuids = [make_uuid(rng) for _ in range(size)]
+    projection: dict[str, list[Neighbor]] = {}
+    for i, uuid in enumerate(uuids):
+        cluster = uuids[i - i % 20 : i - i % 20 + 20]
+        projection[uuid] = [
+            Neighbor(node_uuid=neighbor, edge_count=2) for neighbor in cluster if neighbor != uuid
+        ]
+    return lambda: label_propagation(projection)
+
+
+@benchmark('resolve_edge_pointers', small=100, medium=1_000, large=10_000)
+def setup_resolve_edge_pointers(size: int) -> Callable[[], Any]:
+    rng = random.Random(0)
+    edges = make_entity_edges(rng, size)
+    endpoints = [edge.source_node_uuid for edge in edges] + [
+        edge.target_node_uuid for edge in edges
+    ]
+    # Map endpoints to themselves so that repeated calls do the same work
+    uuid_map = {uuid: uuid for uuid in rng.sample(endpoints, len(endpoints) // 2)}
+    return lambda: resolve_edge_pointers(edges, uuid_map)
+
+
+@benchmark('lucene_sanitize', small=10, medium=100, large=1_000)
+def setup_lucene_sanitize(size: int) -> Callable[[], Any]:
+    query = make_query(random.Random(0), size)
+    return lambda: lucene_sanitize(query)
+
+
+@benchmark('fulltext_query', small=10, medium=100, large=1_000)
+def setup_fulltext_query(size: int) -> Callable[[], Any]:
+    query = make_query(random.Random(0), size)
+    return lambda: fulltext_query(query)
+
+
+@benchmark('edge_search_filter_query_constructor', small=1, medium=10, large=100)
+def setup_edge_search_filter_query_constructor(size: int) -> Callable[[], Any]:
+    # size OR clauses of two date filters on each date field
+    def date_filters() -> list[list[DateFilter]]:
+        return [
+            [
+                DateFilter(
+                    date=START_TIME + timedelta(days=i),
+                    comparison_operator=ComparisonOperator.greater_than_equal,
+                ),
+                DateFilter(
+                    date=START_TIME + timedelta(days=i + 1),
+                    comparison_operator=ComparisonOperator.less_than,
+                ),
+            ]
+            for i in range(size)
+        ]
+
+    filters = SearchFilters(
+        node_labels=['Person', 'Place'],
+        edge_types=['LEADS', 'MENTIONED_WITH'],
+        valid_at=date_filters(),
+        invalid_at=date_filters(),
+        created_at=date_filters(),
+        expired_at=date_filters(),
+    )
+    return lambda: edge_search_filter_query_constructor(filters)
+
+
+@benchmark('get_entity_edge_from_record', small=10, medium=100, large=1_000)
+def setup_get_entity_edge_from_record(size: int) -> Callable[[], Any]:
+    rng = random.Random(0)
+    records = []
+    for edge in make_entity_edges(rng, size):
+        record = edge.model_dump()
+        record['created_at'] = START_TIME.isoformat()
+        record['episodes'] = [make_uuid(rng) for _ in range(3)]
+        record['attributes'] = {'uuid': edge.uuid, 'fact': edge.fact, 'role': 'lead'}
+        records.append(record)
+    return lambda: [get_entity_edge_from_record(record) for record in records]
+
+
+@benchmark('get_entity_node_from_record', small=10, medium=100, large=1_000)
+def setup_get_entity_node_from_record(size: int) -> Callable[[], Any]:
+    rng = random.Random(0)
+    records = []
+    for node in make_entity_nodes(rng, size):
+        record = node.model_dump()
+        record['created_at'] = START_TIME.isoformat()
+        record['attributes'] = {'uuid': node.uuid, 'name': node.name, 'mention_count': 2}
+        records.append(record)
+    return lambda: [get_entity_node_from_record(record) for record in records]
+
+
+@benchmark('node_dedupe_candidates', small=5, medium=10, large=20)
+def setup_node_dedupe_candidates(size: int) -> Callable[[], Any]:
+    # size episodes of 5 extracted nodes each, as in dedupe_nodes_bulk
+    rng = random.Random(0)
+    extracted_nodes = [make_entity_nodes(rng, 5) for _ in range(size)]
+    return lambda: node_dedupe_candidates(extracted_nodes)
+
+
+@benchmark('edge_dedupe_candidates', small=5, medium=10, large=20)
+def setup_edge_dedupe_candidates(size: int) -> Callable[[], Any]:
+    # size episodes of 4 extracted edges each, as in dedupe_edges_bulk
+    rng = random.Random(0)
+    extracted_edges = [make_entity_edges(rng, 4) for _ in range(size)]
+    return lambda: edge_dedupe_candidates(extracted_edges)
+
+
+@benchmark('edge_bfs_search_hub', small=100, medium=1_000, large=2_000)
+def setup_edge_bfs_search_hub(size: int) -> Callable[[], Any]:
+    # An origin linked to a hub with size spokes, each linking back to the hub and to 20 children,
+    # on the in-memory driver. A 3-hop expansion reaches every path through the hub.
+    hub = EntityNode(name='hub', group_id='benchmark')
+    origin = EntityNode(name='origin', group_id='benchmark')
+    nodes = [origin, hub]
+    links = [(origin, hub)]
+    for i in range(size):
+        spoke = EntityNode(name=f'spoke {i}', group_id='benchmark')
+        children = [EntityNode(name=f'child {i} {j}', group_id='benchmark') for j in range(20)]
+        nodes += [spoke, *children]
+        links += [(hub, spoke), (spoke, hub), *((spoke, child) for child in children)]
+    edges = [
+        EntityEdge(
+            source_node_uuid=source.uuid,
+            target_node_uuid=target.uuid,
+            name='LINKS',
+            fact=f'{source.name} links {target.name}',
+            group_id='benchmark',
+            created_at=START_TIME,
+        )
+        for source, target in links
+    ]
+
+    driver = InMemoryDriver()
+    asyncio.run(driver.operations.save_nodes(nodes))
+    asyncio.run(driver.operations.save_edges(edges))
+    return lambda: asyncio.run(edge_bfs_search(driver, [origin.uuid], 3, SearchFilters(), limit=20))
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    """Time fn with timeit, calling it enough times per repetition to take at least 0.2s."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = [total / number * 1e6 for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'number': number,
+        'repeat': repeat,
+        'min_us': min(times),
+        'median_us': statistics.median(times),
+    }
+
+
+def run(names: list[str], scales: list[str], repeat: int) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for name in names:
+        micro_benchmark = BENCHMARKS[name]
+        for scale in scales:
+            size = micro_benchmark.sizes[scale]
+            fn = micro_benchmark.setup(size)
+            result = {'benchmark': name, 'scale': scale, 'size': size, **measure(fn, repeat)}
+            print(
+                f'{name:<38} {scale:<8} {size:>8} {result["min_us"]:>14.1f}us',
+                file=sys.stderr,
+            )
+            results.append(result)
+
+    return {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'results': results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], candidate: dict[str, Any], threshold: float
+) -> tuple[list[str], list[str]]:
+    """
+    Report lines comparing the fastest time of each benchmark in two results, and the lines
+    that are regressions.
+    """
+    lines: list[str] = []
+    regressions: list[str] = []
+    baseline_results = {
+        (result['benchmark'], result['scale']): result for result in baseline['results']
+    }
+    for result in candidate['results']:
+        baseline_result = baseline_results.get((result['benchmark'], result['scale']))
+        if baseline_result is None or baseline_result['size'] != result['size']:
+            continue
+        baseline_value = baseline_result['min_us']
+        if not baseline_value:
+            continue
+        change = (result['min_us'] - baseline_value) / baseline_value
+        line = (
+            f'{result["benchmark"]:<38} {result["scale"]:<8} '
+            f'{baseline_value:>14.1f} {result["min_us"]:>14.1f} {change:>+8.1%}'
+        )
+        lines.append(line)
+        if change > threshold:
+            regressions.append(line)
+    return lines, regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Time pure-Python hot paths of ingestion and search on synthetic input.'
+    )
+    parser.add_argument(
+        '--benchmarks',
+        nargs='+',
+        choices=list(BENCHMARKS),
+        default=list(BENCHMARKS),
+        help='benchmarks to run (default: all)',
+    )
+    parser.add_argument('--scales', nargs='+', choices=SCALES, default=SCALES)
+    parser.add_argument('--repeat', type=int, default=5, help='timed repetitions per benchmark')
+    parser.add_argument('--output', help='write the JSON results to this file')
+    parser.add_argument(
+        '--compare',
+        nargs='?',
+        const=DEFAULT_BASELINE,
+        metavar='BASELINE',
+        help=f'compare against a results file (default: {os.path.relpath(DEFAULT_BASELINE)}) '
+        'and exit with status 1 on regressions',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='relative slowdown above which a benchmark counts as a regression',
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    results = run(args.benchmarks, args.scales, args.repeat)
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            f.write(json.dumps(results, indent=2) + '\n')
+
+    if args.compare is None:
+        if args.output is None:
+            print(json.dumps(results, indent=2))
+        return
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    lines, regressions = compare(baseline, results, args.threshold)
+    print(f'{"benchmark":<38} {"scale":<8} {"baseline us":>14} {"candidate us":>14}')
+    print('\n'.join(lines))
+    if regressions:
+        print(f'\n{len(regressions)} benchmarks regressed by more than {args.threshold:.0%}:')
+        print('\n'.join(regressions))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
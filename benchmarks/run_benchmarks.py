@@ -0,0 +1,372 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from benchmarks.counting_driver import CountingDriver
+from benchmarks.dataset import group_ids, make_episodes, make_queries
+from benchmarks.fakes import FakeCrossEncoder, FakeEmbedder, FakeLLMClient
+from graphiti_core import Graphiti
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.search import search_config_recipes
+from graphiti_core.search.search_config import SearchConfig
+from graphiti_core.telemetry.telemetry import TELEMETRY_ENV_VAR
+from graphiti_core.usage import collect_usage
+from graphiti_core.utils.maintenance.graph_data_operations import clear_data
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+RESULTS_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+class Counters:
+    """The driver and model call counters of a benchmark run."""
+
+    def __init__(
+        self,
+        driver: CountingDriver,
+        llm_client: FakeLLMClient,
+        embedder: FakeEmbedder,
+        cross_encoder: FakeCrossEncoder,
+    ):
+        self.driver = driver
+        self.llm_client = llm_client
+        self.embedder = embedder
+        self.cross_encoder = cross_encoder
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            'db_round_trips': self.driver.round_trips,
+            'llm_calls': self.llm_client.calls,
+            'embedder_calls': self.embedder.calls,
+            'cross_encoder_calls': self.cross_encoder.calls,
+        }
+
+
+class OperationStats:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.items = 0
+        self.calls: dict[str, int] = {}
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def add(
+        self,
+        latency: float,
+        items: int,
+        before: dict[str, int],
+        after: dict[str, int],
+        input_tokens: int,
+        output_tokens: int,
+    ):
+        self.latencies.append(latency)
+        self.items += items
+        for name, value in after.items():
+            self.calls[name] = self.calls.get(name, 0) + value - before[name]
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+    def summary(self) -> dict[str, Any]:
+        if len(self.latencies) == 0:
+            return {'operations': 0}
+
+        latencies_ms = np.array(self.latencies) * 1000
+        total_seconds = sum(self.latencies)
+        return {
+            'operations': len(self.latencies),
+            'items': self.items,
+            'items_per_second': self.items / total_seconds if total_seconds > 0 else None,
+            'latency_ms': {
+                'mean': float(latencies_ms.mean()),
+                'p50': float(np.percentile(latencies_ms, 50)),
+                'p90': float(np.percentile(latencies_ms, 90)),
+                'p99': float(np.percentile(latencies_ms, 99)),
+                'max': float(latencies_ms.max()),
+            },
+            # Per item, i.e. per episode for ingestion and per query for search
+            'per_item': {
+                **{name: value / self.items for name, value in sorted(self.calls.items())},
+                'input_tokens': self.input_tokens / self.items,
+                'output_tokens': self.output_tokens / self.items,
+            },
+        }
+
+
+async def measure(stats: OperationStats, counters: Counters, items: int, operation):
+    before = counters.snapshot()
+    with collect_usage() as usage:
+        start = perf_counter()
+        await operation
+        latency = perf_counter() - start
+    summary = usage.summary()
+    stats.add(
+        latency, items, before, counters.snapshot(), summary.input_tokens, summary.output_tokens
+    )
+
+
+def create_driver(args: argparse.Namespace) -> GraphDriver:
+    if args.backend == 'memory':
+        from graphiti_core.driver.memory_driver import InMemoryDriver
+
+        return InMemoryDriver(ann=args.memory_ann)
+
+    if args.backend == 'kuzu':
+        from graphiti_core.driver.kuzu_driver import KuzuDriver
+
+        return KuzuDriver(db=args.kuzu_db)
+
+    if args.backend == 'falkordb':
+        from graphiti_core.driver.falkordb_driver import FalkorDriver
+
+        return FalkorDriver(host=args.falkordb_host, port=args.falkordb_port)
+
+    from graphiti_core.driver.neo4j_driver import Neo4jDriver
+
+    return Neo4jDriver(args.neo4j_uri, args.neo4j_user, args.neo4j_password)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def grow_graph(
+    graphiti: Graphiti,
+    counters: Counters,
+    stats: OperationStats,
+    start: int,
+    end: int,
+    args: argparse.Namespace,
+):
+    """Add episodes start to end with add_episode_bulk, one batch per group at a time."""
+    index = start
+    while index < end:
+        group_end = (index // args.episodes_per_group + 1) * args.episodes_per_group
+        count = min(args.bulk_batch_size, end - index, group_end - index)
+        episodes = make_episodes(index, count, args.episodes_per_group, args.seed)
+        await measure(
+            stats,
+            counters,
+            count,
+            graphiti.add_episode_bulk(
+                [episode for _, episode in episodes], group_id=episodes[0][0]
+            ),
+        )
+        index += count
+
+
+async def run_size(
+    graphiti: Graphiti,
+    counters: Counters,
+    size: int,
+    current: int,
+    search_config: SearchConfig,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    bulk_stats = OperationStats()
+    add_episode_stats = OperationStats()
+    search_stats = OperationStats()
+
+    sample_size = min(args.add_episode_samples, size - current)
+    await grow_graph(graphiti, counters, bulk_stats, current, size - sample_size, args)
+
+    for episode_group_id, episode in make_episodes(
+        size - sample_size, sample_size, args.episodes_per_group, args.seed
+    ):
+        await measure(
+            add_episode_stats,
+            counters,
+            1,
+            graphiti.add_episode(
+                name=episode.name,
+                episode_body=episode.content,
+                source_description=episode.source_description,
+                reference_time=episode.reference_time,
+                source=episode.source,
+                group_id=episode_group_id,
+            ),
+        )
+
+    searched_groups = group_ids(size, args.episodes_per_group)
+    for query in make_queries(args.search_queries, args.seed + size):
+        await measure(
+            search_stats,
+            counters,
+            1,
+            graphiti.search_(query, config=search_config, group_ids=searched_groups),
+        )
+
+    return {
+        'episodes': size,
+        'add_episode_bulk': bulk_stats.summary(),
+        'add_episode': add_episode_stats.summary(),
+        'search_': search_stats.summary(),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    search_config = getattr(search_config_recipes, args.search_recipe)
+    if not isinstance(search_config, SearchConfig):
+        raise ValueError(f'{args.search_recipe} is not a search config recipe')
+    search_config = search_config.model_copy(update={'limit': args.search_limit})
+
+    sizes = sorted(args.sizes)
+    driver = CountingDriver(create_driver(args))
+    llm_client = FakeLLMClient(latency=args.llm_latency)
+    embedder = FakeEmbedder(latency=args.embedder_latency)
+    cross_encoder = FakeCrossEncoder(latency=args.cross_encoder_latency)
+    counters = Counters(driver, llm_client, embedder, cross_encoder)
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=llm_client,
+        embedder=embedder,
+        cross_encoder=cross_encoder,
+        max_coroutines=args.max_coroutines,
+    )
+
+    benchmark_groups = group_ids(sizes[-1], args.episodes_per_group)
+    results = []
+    try:
+        await graphiti.build_indices_and_constraints()
+        # Only the benchmark's own groups are cleared, so other data in the database is kept
+        await clear_data(driver, benchmark_groups)
+
+        current = 0
+        for size in sizes:
+            logger.info(f'benchmarking at {size} episodes')
+            results.append(await run_size(graphiti, counters, size, current, search_config, args))
+            current = size
+    finally:
+        if not args.keep_graph:
+            await clear_data(driver, benchmark_groups)
+        await graphiti.close()
+
+    return {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'backend': args.backend,
+        'config': {
+            'seed': args.seed,
+            'episodes_per_group': args.episodes_per_group,
+            'bulk_batch_size': args.bulk_batch_size,
+            'add_episode_samples': args.add_episode_samples,
+            'search_queries': args.search_queries,
+            'search_recipe': args.search_recipe,
+            'search_limit': args.search_limit,
+            'llm_latency': args.llm_latency,
+            'embedder_latency': args.embedder_latency,
+            'cross_encoder_latency': args.cross_encoder_latency,
+            'max_coroutines': args.max_coroutines,
+        },
+        'results': results,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Benchmark ingestion and search against a local graph database, with '
+        'deterministic fake LLM, embedder and cross-encoder clients.'
+    )
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=DEFAULT_SIZES,
+        help='graph sizes, in episodes, at which to measure',
+    )
+    parser.add_argument(
+        '--backend', choices=['neo4j', 'falkordb', 'memory', 'kuzu'], default='neo4j'
+    )
+    parser.add_argument('--neo4j-uri', default=os.environ.get('NEO4J_URI', 'bolt://localhost:7687'))
+    parser.add_argument('--neo4j-user', default=os.environ.get('NEO4J_USER', 'neo4j'))
+    parser.add_argument('--neo4j-password', default=os.environ.get('NEO4J_PASSWORD', 'password'))
+    parser.add_argument('--falkordb-host', default=os.environ.get('FALKORDB_HOST', 'localhost'))
+    parser.add_argument(
+        '--falkordb-port', type=int, default=int(os.environ.get('FALKORDB_PORT', '6379'))
+    )
+    parser.add_argument('--kuzu-db', default=':memory:', help='database path for the kuzu backend')
+    parser.add_argument(
+        '--memory-ann',
+        action='store_true',
+        help='use approximate vector search with the memory backend',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--episodes-per-group', type=int, default=100)
+    parser.add_argument('--bulk-batch-size', type=int, default=50)
+    parser.add_argument(
+        '--add-episode-samples',
+        type=int,
+        default=20,
+        help='episodes added one at a time with add_episode at each size',
+    )
+    parser.add_argument('--search-queries', type=int, default=50)
+    parser.add_argument('--search-recipe', default='COMBINED_HYBRID_SEARCH_CROSS_ENCODER')
+    parser.add_argument('--search-limit', type=int, default=10)
+    parser.add_argument(
+        '--llm-latency', type=float, default=0.0, help='seconds added to each LLM call'
+    )
+    parser.add_argument(
+        '--embedder-latency', type=float, default=0.0, help='seconds added to each embedder call'
+    )
+    parser.add_argument(
+        '--cross-encoder-latency',
+        type=float,
+        default=0.0,
+        help='seconds added to each cross-encoder call',
+    )
+    parser.add_argument('--max-coroutines', type=int, default=None)
+    parser.add_argument(
+        '--keep-graph', action='store_true', help='keep the benchmark groups after the run'
+    )
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    # Benchmark runs should not be reported as usage
+    os.environ.setdefault(TELEMETRY_ENV_VAR, 'false')
+    args = parse_args(argv)
+    results = asyncio.run(run(args))
+
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import re
+import typing
+from collections import defaultdict
+from collections.abc import Iterable
+from time import monotonic
+
+import numpy as np
+from pydantic import BaseModel
+
+from .cross_encoder.client import CrossEncoderClient
+from .embedder.client import EmbedderClient
+from .errors import CassetteMissError
+from .llm_client.client import LLMClient
+from .llm_client.config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
+from .prompts.models import Message
+from .tracer import traced
+from .usage import collect_usage, track_llm_call
+
+CASSETTE_VERSION = 1
+
+UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
+
+def normalize_text(text: str) -> str:
+    return ' '.join(text.split())
+
+
+def request_key(*parts: str) -> str:
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def anonymize_uuids(text: str, uuids: list[str]) -> str:
+    """Replace the UUIDs in text with placeholders numbered by first appearance in uuids."""
+
+    def placeholder(match: re.Match) -> str:
+        uuid = match.group(0)
+        if uuid not in uuids:
+            uuids.append(uuid)
+        return f'<uuid:{uuids.index(uuid)}>'
+
+    return UUID_PATTERN.sub(placeholder, text)
+
+
+def restore_uuids(text: str, uuids: list[str]) -> str:
+    return re.sub(r'<uuid:(\d+)>', lambda match: uuids[int(match.group(1))], text)
+
+
+def encode_embedding(embedding: list[float]) -> str:
+    return base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode('ascii')
+
+
+def decode_embedding(encoded: str) -> list[float]:
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float32).tolist()
+
+
+def embedding_text(input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]) -> str:
+    """The text of an embedding request, so that create and create_batch share recordings."""
+    if isinstance(input_data, str):
+        return normalize_text(input_data)
+    items = list(input_data)
+    if len(items) == 1 and isinstance(items[0], str):
+        return normalize_text(items[0])
+    return json.dumps(items, default=list)
+
+
+class Cassette:
+    """
+    Recorded model responses, keyed by a hash of the normalized request.
+
+    Requests are normalized by collapsing whitespace and, for LLM prompts, by replacing UUIDs
+    with placeholders numbered in order of appearance, so that the same pipeline run on a fresh
+    graph finds its recordings. A request recorded several times is replayed in the recorded
+    order, and its last response is repeated once they are used up.
+
+    Cassettes are saved as JSON lines, gzip-compressed when the path ends in .gz.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.entries: dict[tuple[str, str], list[dict[str, typing.Any]]] = defaultdict(list)
+        self.replayed: dict[tuple[str, str], int] = defaultdict(int)
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        cassette = cls(path)
+        with cls._open(path, 'rt') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if 'version' in entry:
+                    continue
+                cassette.entries[(entry.pop('kind'), entry.pop('key'))].append(entry)
+        return cassette
+
+    def save(self, path: str | None = None):
+        path = path or self.path
+        if path is None:
+            raise ValueError('no path to save the cassette to')
+        with self._open(path, 'wt') as f:
+            f.write(json.dumps({'version': CASSETTE_VERSION}) + '\n')
+            for (kind, key), entries in self.entries.items():
+                for entry in entries:
+                    f.write(json.dumps({'kind': kind, 'key': key, **entry}) + '\n')
+
+    def record(self, kind: str, key: str, duration: float, **entry: typing.Any):
+        self.entries[(kind, key)].append({'duration_ms': round(duration * 1000, 3), **entry})
+
+    def play(self, kind: str, key: str) -> dict[str, typing.Any]:
+        entries = self.entries.get((kind, key))
+        if not entries:
+            raise CassetteMissError(kind, key)
+        index = self.replayed[(kind, key)]
+        self.replayed[(kind, key)] += 1
+        return entries[min(index, len(entries) - 1)]
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.entries.values())
+
+    @staticmethod
+    def _open(path: str, mode: str) -> typing.TextIO:
+        if path.endswith('.gz'):
+            return gzip.open(path, mode, encoding='utf-8')  # type: ignore[return-value]
+        return open(path, mode.replace('t', ''), encoding='utf-8')
+
+
+def llm_request_key(
+    messages: list[Message],
+    response_model: type[BaseModel] | None,
+    model_size: ModelSize,
+) -> tuple[str, list[str]]:
+    """The request key of an LLM call, and the UUIDs its prompt contains in placeholder order."""
+    uuids: list[str] = []
+    parts = [
+        response_model.__name__ if response_model is not None else '',
+        model_size.value,
+    ]
+    for message in messages:
+        parts.append(message.role)
+        parts.append(anonymize_uuids(normalize_text(message.content), uuids))
+    return request_key(*parts), uuids
+
+
+def rank_request_key(query: str, passages: list[str]) -> tuple[str, list[str]]:
+    """The request key of a rerank call, and its passages in the order scores are stored."""
+    ordered_passages = sorted(dict.fromkeys(passages))
+    return request_key(normalize_text(query), *ordered_passages), ordered_passages
+
+
+class RecordingLLMClient(LLMClient):
+    """Records the responses of a wrapped LLMClient, with their latency and token usage."""
+
+    def __init__(self, llm_client: LLMClient, cassette: Cassette):
+        super().__init__(llm_client.config, cache=False)
+        self.llm_client = llm_client
+        self.cassette = cassette
+
+    async def _generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> dict[str, typing.Any]:
+        return await self.generate_response(messages, response_model, max_tokens, model_size)
+
+    async def generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int | None = None,
+        model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
+    ) -> dict[str, typing.Any]:
+        # The wrapped client appends instructions to the messages, so key them beforehand
+        key, uuids = llm_request_key(messages, response_model, model_size)
+        start = monotonic()
+        with collect_usage() as usage:
+            response = await self.llm_client.generate_response(
+                messages,
+                response_model,
+                max_tokens=max_tokens,
+                model_size=model_size,
+                prompt_name=prompt_name,
+            )
+        summary = usage.summary()
+        self.cassette.record(
+            'llm',
+            key,
+            monotonic() - start,
+            prompt_name=prompt_name,
+            model=summary.prompts[0].model if summary.prompts else str(self.model),
+            input_tokens=summary.input_tokens,
+            output_tokens=summary.output_tokens,
+            response=json.loads(anonymize_uuids(json.dumps(response), uuids)),
+        )
+        return response
+
+
+class ReplayLLMClient(LLMClient):
+    """
+    Serves LLM responses from a cassette, raising CassetteMissError for unrecorded requests.
+
+    Token usage is reported as recorded. With latency set, each response is delayed by the
+    latency it was recorded with.
+    """
+
+    def __init__(self, cassette: Cassette, latency: bool = False, config: LLMConfig | None = None):
+        super().__init__(config, cache=False)
+        self.cassette = cassette
+        self.latency = latency
+
+    async def _generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        model_size: ModelSize = ModelSize.medium,
+    ) -> dict[str, typing.Any]:
+        key, uuids = llm_request_key(messages, response_model, model_size)
+        entry = self.cassette.play('llm', key)
+        if self.latency:
+            await asyncio.sleep(entry['duration_ms'] / 1000)
+        self._record_token_usage(entry['model'], entry['input_tokens'], entry['output_tokens'])
+        return json.loads(restore_uuids(json.dumps(entry['response']), uuids))
+
+    @traced('llm.generate_response')
+    @track_llm_call
+    async def generate_response(
+        self,
+        messages: list[Message],
+        response_model: type[BaseModel] | None = None,
+        max_tokens: int | None = None,
+        model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
+    ) -> dict[str, typing.Any]:
+        self._record_request(response_model, prompt_name)
+        return await self._generate_response(
+            messages, response_model, max_tokens or self.max_tokens, model_size
+        )
+
+
+class RecordingEmbedderClient(EmbedderClient):
+    """Records the embeddings of a wrapped EmbedderClient, with their latency."""
+
+    def __init__(self, embedder: EmbedderClient, cassette: Cassette):
+        self.embedder = embedder
+        self.cassette = cassette
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        start = monotonic()
+        embedding = await self.embedder.create(input_data)
+        self.cassette.record(
+            'embedding',
+            request_key(embedding_text(input_data)),
+            monotonic() - start,
+            embedding=encode_embedding(embedding),
+        )
+        return embedding
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        start = monotonic()
+        embeddings = await self.embedder.create_batch(input_data_list)
+        # Embeddings are recorded one text at a time, so that they replay in any batching
+        duration = (monotonic() - start) / max(len(input_data_list), 1)
+        for text, embedding in zip(input_data_list, embeddings, strict=True):
+            self.cassette.record(
+                'embedding',
+                request_key(embedding_text(text)),
+                duration,
+                embedding=encode_embedding(embedding),
+            )
+        return embeddings
+
+
+class ReplayEmbedderClient(EmbedderClient):
+    """Serves embeddings from a cassette, raising CassetteMissError for unrecorded texts."""
+
+    def __init__(self, cassette: Cassette, latency: bool = False):
+        self.cassette = cassette
+        self.latency = latency
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        entry = self.cassette.play('embedding', request_key(embedding_text(input_data)))
+        if self.latency:
+            await asyncio.sleep(entry['duration_ms'] / 1000)
+        return decode_embedding(entry['embedding'])
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        entries = [
+            self.cassette.play('embedding', request_key(embedding_text(text)))
+            for text in input_data_list
+        ]
+        if self.latency:
+            await asyncio.sleep(sum(entry['duration_ms'] for entry in entries) / 1000)
+        return [decode_embedding(entry['embedding']) for entry in entries]
+
+
+class RecordingCrossEncoderClient(CrossEncoderClient):
+    """Records the scores of a wrapped CrossEncoderClient, with their latency."""
+
+    def __init__(self, cross_encoder: CrossEncoderClient, cassette: Cassette):
+        self.cross_encoder = cross_encoder
+        self.cassette = cassette
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        start = monotonic()
+        results = await self.cross_encoder.rank(query, passages)
+        key, ordered_passages = rank_request_key(query, passages)
+        scores = dict(results)
+        self.cassette.record(
+            'rank',
+            key,
+            monotonic() - start,
+            scores=[scores.get(passage) for passage in ordered_passages],
+        )
+        return results
+
+
+class ReplayCrossEncoderClient(CrossEncoderClient):
+    """Serves reranker scores from a cassette, raising CassetteMissError for unrecorded calls."""
+
+    def __init__(self, cassette: Cassette, latency: bool = False):
+        self.cassette = cassette
+        self.latency = latency
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        key, ordered_passages = rank_request_key(query, passages)
+        entry = self.cassette.play('rank', key)
+        if self.latency:
+            await asyncio.sleep(entry['duration_ms'] / 1000)
+        scores = dict(zip(ordered_passages, entry['scores'], strict=True))
+        results = [
+            (passage, scores[passage]) for passage in passages if scores[passage] is not None
+        ]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
@@ -0,0 +1,150 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_SECONDS = 0.005
+DEFAULT_NUM_THREADS = 1
+
+PredictFunction = Callable[[list[tuple[str, str]]], Sequence[float]]
+
+
+class PendingPair:
+    def __init__(self, pair: tuple[str, str], future: asyncio.Future):
+        self.pair = pair
+        self.future = future
+        self.enqueued_at = monotonic()
+
+
+class BatchPredictExecutor:
+    """
+    Collects (query, passage) pairs from concurrent callers into batches for a local model.
+
+    Pairs are flushed once max_batch_size are pending or the oldest has waited max_wait_seconds.
+    Each flush sorts the pending pairs by length before splitting them into batches, so pairs
+    of similar length are padded together. Batches run on a dedicated pool of num_threads
+    threads, so concurrent searches never run more than num_threads model calls at once.
+    """
+
+    def __init__(
+        self,
+        predict: PredictFunction,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        num_threads: int = DEFAULT_NUM_THREADS,
+    ):
+        self.predict_batch = predict
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.thread_pool = ThreadPoolExecutor(
+            max_workers=num_threads, thread_name_prefix='cross-encoder'
+        )
+        self.lock = threading.Lock()
+        self.pending: list[PendingPair] = []
+        self.flush_timer: asyncio.TimerHandle | None = None
+
+        self.batches = 0
+        self.pairs = 0
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    async def predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        if len(pairs) == 0:
+            return []
+
+        loop = asyncio.get_running_loop()
+        pending = [PendingPair(pair, loop.create_future()) for pair in pairs]
+        with self.lock:
+            self.pending.extend(pending)
+            flush_now = len(self.pending) >= self.max_batch_size
+            if not flush_now and self.flush_timer is None:
+                self.flush_timer = loop.call_later(self.max_wait_seconds, self.flush)
+
+        if flush_now:
+            self.flush()
+
+        return list(await asyncio.gather(*[p.future for p in pending]))
+
+    def flush(self):
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            pending, self.pending = self.pending, []
+
+        if len(pending) == 0:
+            return
+
+        # Length bucketing: batching pairs of similar length keeps padding waste low
+        pending.sort(key=lambda p: len(p.pair[0]) + len(p.pair[1]))
+        for i in range(0, len(pending), self.max_batch_size):
+            self.submit(pending[i : i + self.max_batch_size])
+
+    def submit(self, batch: list[PendingPair]):
+        now = monotonic()
+        queue_waits = [now - p.enqueued_at for p in batch]
+        self.batches += 1
+        self.pairs += len(batch)
+        self.total_queue_wait += sum(queue_waits)
+        self.max_queue_wait = max(self.max_queue_wait, *queue_waits)
+
+        future = self.thread_pool.submit(self.predict_batch, [p.pair for p in batch])
+        future.add_done_callback(lambda f: self.resolve(batch, f))
+
+    @staticmethod
+    def resolve(batch: list[PendingPair], future: Future):
+        # Callers may be waiting on different event loops, so results are set thread-safely
+        error = future.exception()
+        scores: list[float | None] = (
+            [None] * len(batch) if error is not None else [float(s) for s in future.result()]
+        )
+        for pending, score in zip(batch, scores, strict=True):
+            try:
+                pending.future.get_loop().call_soon_threadsafe(
+                    set_future_result, pending.future, score, error
+                )
+            except RuntimeError:
+                # The caller's event loop has been closed
+                logger.debug('Dropping cross-encoder score for a closed event loop')
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.pairs / self.batches if self.batches > 0 else 0.0
+
+    @property
+    def mean_queue_wait(self) -> float:
+        return self.total_queue_wait / self.pairs if self.pairs > 0 else 0.0
+
+    def shutdown(self):
+        self.flush()
+        self.thread_pool.shutdown(wait=True)
+
+
+def set_future_result(future: asyncio.Future, result: float | None, error: BaseException | None):
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import asyncio
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,22 +28,86 @@ else:
             'Install it with: pip install graphiti-core[sentence-transformers]'
         ) from None
 
+from graphiti_core.cross_encoder.batch_executor import (
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_WAIT_SECONDS,
+    DEFAULT_NUM_THREADS,
+    BatchPredictExecutor,
+)
 from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.tracer import traced
+
+DEFAULT_MODEL = 'BAAI/bge-reranker-v2-m3'
+DEFAULT_MAX_LENGTH = 512
+
+shared_models: dict[str, CrossEncoder] = {}
+shared_executors: dict[str, BatchPredictExecutor] = {}
+shared_executors_lock = threading.Lock()
+
+
+def get_bge_executor(
+    model_name: str = DEFAULT_MODEL,
+    max_length: int = DEFAULT_MAX_LENGTH,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+    num_threads: int = DEFAULT_NUM_THREADS,
+) -> BatchPredictExecutor:
+    """
+    Return the process-wide executor for model_name, loading the model on first use.
+
+    The settings of the first call for a model are used for the lifetime of the process.
+    """
+    with shared_executors_lock:
+        executor = shared_executors.get(model_name)
+        if executor is None:
+            # Pairs longer than max_length tokens are truncated by the tokenizer
+            model = CrossEncoder(model_name, max_length=max_length)
+            executor = BatchPredictExecutor(
+                lambda pairs: model.predict(pairs, batch_size=len(pairs)),
+                max_batch_size=max_batch_size,
+                max_wait_seconds=max_wait_seconds,
+                num_threads=num_threads,
+            )
+            shared_models[model_name] = model
+            shared_executors[model_name] = executor
+        return executor
 
 
 class BGERerankerClient(CrossEncoderClient):
-    def __init__(self):
-        self.model = CrossEncoder('BAAI/bge-reranker-v2-m3')
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        max_length: int = DEFAULT_MAX_LENGTH,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        num_threads: int = DEFAULT_NUM_THREADS,
+    ):
+        """
+        Initialize the BGERerankerClient.
+
+        All clients for the same model share one model instance and one executor, which batches
+        the pairs of concurrent rank calls and runs them on num_threads dedicated threads.
+
+        Args:
+            model_name (str): The sentence-transformers cross-encoder model to load.
+            max_length (int): The token length pairs are truncated to.
+            max_batch_size (int): The maximum number of pairs scored in one model call.
+            max_wait_seconds (float): How long a pair may wait for a batch to fill up.
+            num_threads (int): The number of threads running model calls.
+        """
+        self.executor = get_bge_executor(
+            model_name, max_length, max_batch_size, max_wait_seconds, num_threads
+        )
+        self.model = shared_models[model_name]
 
+    @traced('cross_encoder.rank')
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         if not passages:
             return []
 
-        input_pairs = [[query, passage] for passage in passages]
+        input_pairs = [(query, passage) for passage in passages]
 
-        # Run the synchronous predict method in an executor
-        loop = asyncio.get_running_loop()
-        scores = await loop.run_in_executor(None, self.model.predict, input_pairs)
+        scores = await self.executor.predict(input_pairs)
 
         ranked_passages = sorted(
             [(passage, float(score)) for passage, score in zip(passages, scores, strict=False)],
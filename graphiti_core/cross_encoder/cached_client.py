@@ -0,0 +1,138 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+from collections import OrderedDict
+from time import monotonic
+
+from ..metrics import record_cache_lookup
+from ..tracer import add_span_attributes, traced
+from .client import CrossEncoderClient
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+def normalize_query(query: str) -> str:
+    return ' '.join(query.lower().split())
+
+
+def passage_hash(passage: str) -> str:
+    return hashlib.sha256(passage.encode('utf-8')).hexdigest()
+
+
+class CachedCrossEncoderClient(CrossEncoderClient):
+    """
+    Caches the scores of a wrapped CrossEncoderClient by (model, normalized query, passage hash).
+
+    Only the passages without a cached score are sent to the wrapped reranker, so the wrapped
+    reranker must score each passage independently of the others passed with it. This holds
+    for the pointwise rerankers, but not for listwise reranking, so listwise clients are
+    rejected.
+
+    Rerankers such as the Gemini one give a lone passage a constant score. A single uncached
+    passage is therefore ranked together with a cached one, and scores from a call with only
+    one passage are not cached.
+    """
+
+    def __init__(
+        self,
+        cross_encoder: CrossEncoderClient,
+        model: str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Args:
+            cross_encoder (CrossEncoderClient): The reranker whose scores are cached.
+            model (str | None): The model name used in cache keys. Defaults to the wrapped
+                client's configured model, or its class name if it has none.
+            max_entries (int): The maximum number of cached scores before the least recently
+                used are evicted.
+            ttl_seconds (float | None): How long a score stays cached. None disables expiry.
+        """
+        if getattr(cross_encoder, 'listwise', False):
+            raise ValueError('Listwise reranker scores depend on the other passages; cannot cache')
+
+        self.cross_encoder = cross_encoder
+        self.model = (
+            model
+            or getattr(getattr(cross_encoder, 'config', None), 'model', None)
+            or type(cross_encoder).__name__
+        )
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: OrderedDict[tuple[str, str, str], tuple[float, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @traced('cross_encoder.rank')
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        normalized_query = normalize_query(query)
+        scores: dict[str, float] = {}
+        uncached_passages: list[str] = []
+        for passage in dict.fromkeys(passages):
+            score = self.get(normalized_query, passage)
+            if score is None:
+                uncached_passages.append(passage)
+            else:
+                scores[passage] = score
+
+        add_span_attributes({'cache_hits': len(scores), 'cache_misses': len(uncached_passages)})
+        if len(uncached_passages) > 0:
+            request = uncached_passages
+            if len(request) == 1 and len(scores) > 0:
+                request = request + [next(iter(scores))]
+            for passage, score in await self.cross_encoder.rank(query, request):
+                scores[passage] = score
+                if len(request) > 1:
+                    self.put(normalized_query, passage, score)
+
+        results = [(passage, scores[passage]) for passage in passages if passage in scores]
+        results.sort(reverse=True, key=lambda x: x[1])
+        return results
+
+    def get(self, normalized_query: str, passage: str) -> float | None:
+        key = (self.model, normalized_query, passage_hash(passage))
+        entry = self.entries.get(key)
+        if entry is None or (
+            self.ttl_seconds is not None and monotonic() - entry[1] > self.ttl_seconds
+        ):
+            self.entries.pop(key, None)
+            self.misses += 1
+            record_cache_lookup('cross_encoder', False)
+            return None
+
+        self.hits += 1
+        record_cache_lookup('cross_encoder', True)
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, normalized_query: str, passage: str, score: float):
+        key = (self.model, normalized_query, passage_hash(passage))
+        self.entries[key] = (score, monotonic())
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
@@ -16,11 +16,21 @@ limitations under the License.
 
 import logging
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, RateLimitError
+from ..tracer import traced
+from ..usage import llm_call, record_token_usage
 from .client import CrossEncoderClient
+from .listwise import (
+    DEFAULT_LISTWISE_BATCH_SIZE,
+    LISTWISE_SYSTEM_PROMPT,
+    PassageScores,
+    batch_passages,
+    listwise_prompt,
+    parse_listwise_scores,
+)
 
 if TYPE_CHECKING:
     from google import genai
@@ -40,6 +50,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = 'gemini-2.5-flash-lite-preview-06-17'
 
 
+def record_response_usage(response: Any):
+    usage = getattr(response, 'usage_metadata', None)
+    if usage is not None:
+        record_token_usage(None, usage.prompt_token_count, usage.candidates_token_count)
+
+
 class GeminiRerankerClient(CrossEncoderClient):
     """
     Google Gemini Reranker Client
@@ -49,6 +65,8 @@ class GeminiRerankerClient(CrossEncoderClient):
         self,
         config: LLMConfig | None = None,
         client: 'genai.Client | None' = None,
+        listwise: bool = False,
+        listwise_batch_size: int = DEFAULT_LISTWISE_BATCH_SIZE,
     ):
         """
         Initialize the GeminiRerankerClient with the provided configuration and client.
@@ -57,9 +75,15 @@ class GeminiRerankerClient(CrossEncoderClient):
         this reranker uses the Gemini API to perform direct relevance scoring of passages.
         Each passage is scored individually on a 0-100 scale.
 
+        In listwise mode, up to listwise_batch_size passages are scored in a single request
+        using a structured JSON response. Batches whose response cannot be parsed are scored
+        individually instead.
+
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
             client (genai.Client | None): An optional async client instance to use. If not provided, a new genai.Client is created.
+            listwise (bool): Whether to score passages in batches rather than one request each.
+            listwise_batch_size (int): The maximum number of passages scored per listwise request.
         """
         if config is None:
             config = LLMConfig()
@@ -70,15 +94,80 @@ class GeminiRerankerClient(CrossEncoderClient):
         else:
             self.client = client
 
+        self.listwise = listwise
+        self.listwise_batch_size = listwise_batch_size
+
+    @traced('cross_encoder.rank')
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
         """
         Rank passages based on their relevance to the query using direct scoring.
 
-        Each passage is scored individually on a 0-100 scale, then normalized to [0,1].
+        Each passage is scored on a 0-100 scale, either individually or in listwise batches,
+        then normalized to [0,1].
         """
         if len(passages) <= 1:
             return [(passage, 1.0) for passage in passages]
 
+        with llm_call('cross_encoder.rank', self.config.model or DEFAULT_MODEL):
+            try:
+                if self.listwise:
+                    batch_scores = await semaphore_gather(
+                        *[
+                            self._score_listwise(query, batch)
+                            for batch in batch_passages(passages, self.listwise_batch_size)
+                        ]
+                    )
+                    scores = [score for batch in batch_scores for score in batch]
+                else:
+                    scores = await self._score_pointwise(query, passages)
+
+                results = [
+                    (passage, score) for passage, score in zip(passages, scores, strict=True)
+                ]
+
+                # Sort by score in descending order (highest relevance first)
+                results.sort(reverse=True, key=lambda x: x[1])
+                return results
+
+            except Exception as e:
+                # Check if it's a rate limit error based on Gemini API error codes
+                error_message = str(e).lower()
+                if (
+                    'rate limit' in error_message
+                    or 'quota' in error_message
+                    or 'resource_exhausted' in error_message
+                    or '429' in str(e)
+                ):
+                    raise RateLimitError from e
+
+                logger.error(f'Error in generating LLM response: {e}')
+                raise
+
+    async def _score_listwise(self, query: str, passages: list[str]) -> list[float]:
+        response = await self.client.aio.models.generate_content(
+            model=self.config.model or DEFAULT_MODEL,
+            contents=[
+                types.Content(
+                    role='user',
+                    parts=[types.Part.from_text(text=listwise_prompt(query, passages))],
+                )
+            ],  # type: ignore
+            config=types.GenerateContentConfig(
+                system_instruction=LISTWISE_SYSTEM_PROMPT,
+                temperature=0.0,
+                response_mime_type='application/json',
+                response_schema=PassageScores,
+            ),
+        )
+        record_response_usage(response)
+
+        try:
+            return parse_listwise_scores(getattr(response, 'text', None), len(passages))
+        except ValueError as e:
+            logger.warning(f'Falling back to pointwise reranking: {e}')
+            return await self._score_pointwise(query, passages)
+
+    async def _score_pointwise(self, query: str, passages: list[str]) -> list[float]:
         # Generate scoring prompts for each passage
         scoring_prompts = []
         for passage in passages:
@@ -99,63 +188,46 @@ Provide only a number between 0 and 100 (no explanation, just the number):"""
                 ]
             )
 
-        try:
-            # Execute all scoring requests concurrently - O(n) API calls
-            responses = await semaphore_gather(
-                *[
-                    self.client.aio.models.generate_content(
-                        model=self.config.model or DEFAULT_MODEL,
-                        contents=prompt_messages,  # type: ignore
-                        config=types.GenerateContentConfig(
-                            system_instruction='You are an expert at rating passage relevance. Respond with only a number from 0-100.',
-                            temperature=0.0,
-                            max_output_tokens=3,
-                        ),
-                    )
-                    for prompt_messages in scoring_prompts
-                ]
-            )
-
-            # Extract scores and create results
-            results = []
-            for passage, response in zip(passages, responses, strict=True):
-                try:
-                    if hasattr(response, 'text') and response.text:
-                        # Extract numeric score from response
-                        score_text = response.text.strip()
-                        # Handle cases where model might return non-numeric text
-                        score_match = re.search(r'\b(\d{1,3})\b', score_text)
-                        if score_match:
-                            score = float(score_match.group(1))
-                            # Normalize to [0, 1] range and clamp to valid range
-                            normalized_score = max(0.0, min(1.0, score / 100.0))
-                            results.append((passage, normalized_score))
-                        else:
-                            logger.warning(
-                                f'Could not extract numeric score from response: {score_text}'
-                            )
-                            results.append((passage, 0.0))
+        # Execute all scoring requests concurrently - O(n) API calls
+        responses = await semaphore_gather(
+            *[
+                self.client.aio.models.generate_content(
+                    model=self.config.model or DEFAULT_MODEL,
+                    contents=prompt_messages,  # type: ignore
+                    config=types.GenerateContentConfig(
+                        system_instruction='You are an expert at rating passage relevance. Respond with only a number from 0-100.',
+                        temperature=0.0,
+                        max_output_tokens=3,
+                    ),
+                )
+                for prompt_messages in scoring_prompts
+            ]
+        )
+
+        # Extract scores
+        scores: list[float] = []
+        for response in responses:
+            record_response_usage(response)
+            try:
+                if hasattr(response, 'text') and response.text:
+                    # Extract numeric score from response
+                    score_text = response.text.strip()
+                    # Handle cases where model might return non-numeric text
+                    score_match = re.search(r'\b(\d{1,3})\b', score_text)
+                    if score_match:
+                        score = float(score_match.group(1))
+                        # Normalize to [0, 1] range and clamp to valid range
+                        scores.append(max(0.0, min(1.0, score / 100.0)))
                     else:
-                        logger.warning('Empty response from Gemini for passage scoring')
-                        results.append((passage, 0.0))
-                except (ValueError, AttributeError) as e:
-                    logger.warning(f'Error parsing score from Gemini response: {e}')
-                    results.append((passage, 0.0))
-
-            # Sort by score in descending order (highest relevance first)
-            results.sort(reverse=True, key=lambda x: x[1])
-            return results
-
-        except Exception as e:
-            # Check if it's a rate limit error based on Gemini API error codes
-            error_message = str(e).lower()
-            if (
-                'rate limit' in error_message
-                or 'quota' in error_message
-                or 'resource_exhausted' in error_message
-                or '429' in str(e)
-            ):
-                raise RateLimitError from e
-
-            logger.error(f'Error in generating LLM response: {e}')
-            raise
+                        logger.warning(
+                            f'Could not extract numeric score from response: {score_text}'
+                        )
+                        scores.append(0.0)
+                else:
+                    logger.warning('Empty response from Gemini for passage scoring')
+                    scores.append(0.0)
+            except (ValueError, AttributeError) as e:
+                logger.warning(f'Error parsing score from Gemini response: {e}')
+                scores.append(0.0)
+
+        return scores
@@ -0,0 +1,81 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from pydantic import BaseModel, Field
+
+DEFAULT_LISTWISE_BATCH_SIZE = 20
+
+LISTWISE_SYSTEM_PROMPT = (
+    'You are an expert at rating passage relevance. Respond only with JSON matching the '
+    'requested format.'
+)
+
+
+class PassageScore(BaseModel):
+    index: int = Field(..., description='index of the passage in the PASSAGES list')
+    score: int = Field(..., description='relevance of the passage to the query, from 0 to 100')
+
+
+class PassageScores(BaseModel):
+    scores: list[PassageScore] = Field(..., description='one score for every passage')
+
+
+def batch_passages(passages: list[str], batch_size: int) -> list[list[str]]:
+    return [passages[i : i + batch_size] for i in range(0, len(passages), batch_size)]
+
+
+def listwise_prompt(query: str, passages: list[str]) -> str:
+    formatted_passages = '\n'.join(
+        f'<PASSAGE index="{i}">\n{passage}\n</PASSAGE>' for i, passage in enumerate(passages)
+    )
+    return f"""Rate how well each passage answers or relates to the query on a scale from 0 to 100.
+
+<QUERY>
+{query}
+</QUERY>
+
+<PASSAGES>
+{formatted_passages}
+</PASSAGES>
+
+Return a JSON object of the form {{"scores": [{{"index": 0, "score": 87}}, ...]}} with exactly one
+entry for each of the {len(passages)} passages."""
+
+
+def parse_listwise_scores(response_text: str | None, num_passages: int) -> list[float]:
+    """
+    Parse a listwise response into scores normalized to [0, 1], in passage order.
+
+    Raises ValueError if the response is not valid JSON or does not score every passage
+    exactly once, so that callers can fall back to pointwise scoring.
+    """
+    if not response_text:
+        raise ValueError('Empty listwise rerank response')
+
+    passage_scores = PassageScores.model_validate_json(response_text)
+
+    scores: dict[int, float] = {}
+    for passage_score in passage_scores.scores:
+        if passage_score.index < 0 or passage_score.index >= num_passages:
+            raise ValueError(f'Listwise rerank response has invalid index {passage_score.index}')
+        scores[passage_score.index] = max(0.0, min(1.0, passage_score.score / 100.0))
+
+    if len(scores) != num_passages:
+        raise ValueError(
+            f'Listwise rerank response scored {len(scores)} of {num_passages} passages'
+        )
+
+    return [scores[i] for i in range(num_passages)]
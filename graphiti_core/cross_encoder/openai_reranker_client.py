@@ -24,18 +24,35 @@ from openai import AsyncAzureOpenAI, AsyncOpenAI
 from ..helpers import semaphore_gather
 from ..llm_client import LLMConfig, OpenAIClient, RateLimitError
 from ..prompts import Message
+from ..tracer import traced
+from ..usage import llm_call, record_token_usage
 from .client import CrossEncoderClient
+from .listwise import (
+    DEFAULT_LISTWISE_BATCH_SIZE,
+    LISTWISE_SYSTEM_PROMPT,
+    batch_passages,
+    listwise_prompt,
+    parse_listwise_scores,
+)
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL = 'gpt-4.1-nano'
 
 
+def record_response_usage(model: str, response: Any):
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        record_token_usage(model, usage.prompt_tokens, usage.completion_tokens)
+
+
 class OpenAIRerankerClient(CrossEncoderClient):
     def __init__(
         self,
         config: LLMConfig | None = None,
         client: AsyncOpenAI | AsyncAzureOpenAI | OpenAIClient | None = None,
+        listwise: bool = False,
+        listwise_batch_size: int = DEFAULT_LISTWISE_BATCH_SIZE,
     ):
         """
         Initialize the OpenAIRerankerClient with the provided configuration and client.
@@ -43,9 +60,15 @@ class OpenAIRerankerClient(CrossEncoderClient):
         This reranker uses the OpenAI API to run a simple boolean classifier prompt concurrently
         for each passage. Log-probabilities are used to rank the passages.
 
+        In listwise mode, up to listwise_batch_size passages are scored in a single request
+        using a JSON response, so reranking costs one round-trip per batch instead of one per
+        passage. Batches whose response cannot be parsed are scored pointwise instead.
+
         Args:
             config (LLMConfig | None): The configuration for the LLM client, including API key, model, base URL, temperature, and max tokens.
             client (AsyncOpenAI | AsyncAzureOpenAI | OpenAIClient | None): An optional async client instance to use. If not provided, a new AsyncOpenAI client is created.
+            listwise (bool): Whether to score passages in batches rather than one request each.
+            listwise_batch_size (int): The maximum number of passages scored per listwise request.
         """
         if config is None:
             config = LLMConfig()
@@ -58,7 +81,55 @@ class OpenAIRerankerClient(CrossEncoderClient):
         else:
             self.client = client
 
+        self.listwise = listwise
+        self.listwise_batch_size = listwise_batch_size
+
+    @traced('cross_encoder.rank')
     async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        with llm_call('cross_encoder.rank', self.config.model or DEFAULT_MODEL):
+            try:
+                if self.listwise:
+                    batch_scores = await semaphore_gather(
+                        *[
+                            self._score_listwise(query, batch)
+                            for batch in batch_passages(passages, self.listwise_batch_size)
+                        ]
+                    )
+                    scores = [score for batch in batch_scores for score in batch]
+                else:
+                    scores = await self._score_pointwise(query, passages)
+
+                results = [
+                    (passage, score) for passage, score in zip(passages, scores, strict=True)
+                ]
+                results.sort(reverse=True, key=lambda x: x[1])
+                return results
+            except openai.RateLimitError as e:
+                raise RateLimitError from e
+            except Exception as e:
+                logger.error(f'Error in generating LLM response: {e}')
+                raise
+
+    async def _score_listwise(self, query: str, passages: list[str]) -> list[float]:
+        openai_messages: Any = [
+            Message(role='system', content=LISTWISE_SYSTEM_PROMPT),
+            Message(role='user', content=listwise_prompt(query, passages)),
+        ]
+        response = await self.client.chat.completions.create(
+            model=self.config.model or DEFAULT_MODEL,
+            messages=openai_messages,
+            temperature=0,
+            response_format={'type': 'json_object'},
+        )
+        record_response_usage(self.config.model or DEFAULT_MODEL, response)
+
+        try:
+            return parse_listwise_scores(response.choices[0].message.content, len(passages))
+        except ValueError as e:
+            logger.warning(f'Falling back to pointwise reranking: {e}')
+            return await self._score_pointwise(query, passages)
+
+    async def _score_pointwise(self, query: str, passages: list[str]) -> list[float]:
         openai_messages_list: Any = [
             [
                 Message(
@@ -80,44 +151,38 @@ class OpenAIRerankerClient(CrossEncoderClient):
             ]
             for passage in passages
         ]
-        try:
-            responses = await semaphore_gather(
-                *[
-                    self.client.chat.completions.create(
-                        model=DEFAULT_MODEL,
-                        messages=openai_messages,
-                        temperature=0,
-                        max_tokens=1,
-                        logit_bias={'6432': 1, '7983': 1},
-                        logprobs=True,
-                        top_logprobs=2,
-                    )
-                    for openai_messages in openai_messages_list
-                ]
-            )
-
-            responses_top_logprobs = [
-                response.choices[0].logprobs.content[0].top_logprobs
-                if response.choices[0].logprobs is not None
-                and response.choices[0].logprobs.content is not None
-                else []
-                for response in responses
+        responses = await semaphore_gather(
+            *[
+                self.client.chat.completions.create(
+                    model=DEFAULT_MODEL,
+                    messages=openai_messages,
+                    temperature=0,
+                    max_tokens=1,
+                    logit_bias={'6432': 1, '7983': 1},
+                    logprobs=True,
+                    top_logprobs=2,
+                )
+                for openai_messages in openai_messages_list
             ]
-            scores: list[float] = []
-            for top_logprobs in responses_top_logprobs:
-                if len(top_logprobs) == 0:
-                    continue
-                norm_logprobs = np.exp(top_logprobs[0].logprob)
-                if top_logprobs[0].token.strip().split(' ')[0].lower() == 'true':
-                    scores.append(norm_logprobs)
-                else:
-                    scores.append(1 - norm_logprobs)
-
-            results = [(passage, score) for passage, score in zip(passages, scores, strict=True)]
-            results.sort(reverse=True, key=lambda x: x[1])
-            return results
-        except openai.RateLimitError as e:
-            raise RateLimitError from e
-        except Exception as e:
-            logger.error(f'Error in generating LLM response: {e}')
-            raise
+        )
+        for response in responses:
+            record_response_usage(DEFAULT_MODEL, response)
+
+        responses_top_logprobs = [
+            response.choices[0].logprobs.content[0].top_logprobs
+            if response.choices[0].logprobs is not None
+            and response.choices[0].logprobs.content is not None
+            else []
+            for response in responses
+        ]
+        scores: list[float] = []
+        for top_logprobs in responses_top_logprobs:
+            if len(top_logprobs) == 0:
+                continue
+            norm_logprobs = np.exp(top_logprobs[0].logprob)
+            if top_logprobs[0].token.strip().split(' ')[0].lower() == 'true':
+                scores.append(norm_logprobs)
+            else:
+                scores.append(1 - norm_logprobs)
+
+        return scores
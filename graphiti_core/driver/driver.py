@@ -17,10 +17,28 @@ limitations under the License.
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Coroutine
-from typing import Any
+from contextvars import ContextVar
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from graphiti_core.driver.operations import GraphOperations
 
 logger = logging.getLogger(__name__)
 
+# Monotonic time by which queries issued from the current context must finish, set by search()
+query_deadline: ContextVar[float | None] = ContextVar('query_deadline', default=None)
+
+MIN_QUERY_TIMEOUT = 0.001
+
+
+def query_timeout() -> float | None:
+    """Seconds left before the current query deadline, or None if there is no deadline."""
+    deadline = query_deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - monotonic(), MIN_QUERY_TIMEOUT)
+
 
 class GraphDriverSession(ABC):
     async def __aenter__(self):
@@ -46,6 +64,8 @@ class GraphDriverSession(ABC):
 
 class GraphDriver(ABC):
     provider: str
+    # Set by drivers that do not run Cypher, which then serve every query through these calls
+    operations: 'GraphOperations | None' = None
 
     @abstractmethod
     def execute_query(self, cypher_query_: str, **kwargs: Any) -> Coroutine:
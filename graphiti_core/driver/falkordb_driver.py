@@ -16,6 +16,7 @@ limitations under the License.
 
 import logging
 from datetime import datetime
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -32,7 +33,9 @@ else:
             'Install it with: pip install graphiti-core[falkordb]'
         ) from None
 
-from graphiti_core.driver.driver import GraphDriver, GraphDriverSession
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, query_timeout
+from graphiti_core.metrics import db_query_duration, query_fingerprint
+from graphiti_core.tracer import add_span_attributes, traced
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +106,7 @@ class FalkorDriver(GraphDriver):
             graph_name = self._database
         return self.client.select_graph(graph_name)
 
+    @traced('driver.execute_query')
     async def execute_query(self, cypher_query_, **kwargs: Any):
         graph_name = kwargs.pop('database_', self._database)
         graph = self._get_graph(graph_name)
@@ -110,8 +114,18 @@ class FalkorDriver(GraphDriver):
         # Convert datetime objects to ISO strings (FalkorDB does not support datetime objects directly)
         params = convert_datetimes_to_strings(dict(kwargs))
 
+        start = monotonic()
         try:
-            result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+            timeout = query_timeout()
+            if timeout is None:
+                result = await graph.query(cypher_query_, params)  # type: ignore[reportUnknownArgumentType]
+            else:
+                # FalkorDB query timeouts are in milliseconds
+                result = await graph.query(
+                    cypher_query_,
+                    params,  # type: ignore[reportUnknownArgumentType]
+                    timeout=max(int(timeout * 1000), 1),
+                )
         except Exception as e:
             if 'already indexed' in str(e):
                 # check if index already exists
@@ -119,6 +133,12 @@ class FalkorDriver(GraphDriver):
                 return None
             logger.error(f'Error executing FalkorDB query: {e}')
             raise
+        finally:
+            db_query_duration.observe(
+                monotonic() - start,
+                provider=self.provider,
+                fingerprint=query_fingerprint(cypher_query_),
+            )
 
         # Convert the result header to a list of strings
         header = [h[1] for h in result.header]
@@ -135,6 +155,8 @@ class FalkorDriver(GraphDriver):
                     record[field_name] = None
             records.append(record)
 
+        add_span_attributes({'db.provider': self.provider, 'db.record_count': len(records)})
+
         return records, header, None
 
     def session(self, database: str | None = None) -> GraphDriverSession:
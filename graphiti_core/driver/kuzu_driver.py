@@ -0,0 +1,1228 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import kuzu
+else:
+    try:
+        import kuzu
+    except ImportError:
+        # If kuzu is not installed, raise an ImportError
+        raise ImportError(
+            'kuzu is required for KuzuDriver. Install it with: pip install graphiti-core[kuzu]'
+        ) from None
+
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, query_timeout
+from graphiti_core.driver.operations import EdgeT, GraphOperations, NodeT
+from graphiti_core.edges import CommunityEdge, Edge, EntityEdge, EpisodicEdge
+from graphiti_core.graph_queries import (
+    get_fulltext_indices,
+    get_nodes_query,
+    get_range_indices,
+    get_relationships_query,
+    get_vector_cosine_func_query,
+)
+from graphiti_core.metrics import db_query_duration, query_fingerprint
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode, Node
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.tracer import add_span_attributes, traced
+
+logger = logging.getLogger(__name__)
+
+NODE_TABLES: dict[type[Node], str] = {
+    EpisodicNode: 'Episodic',
+    EntityNode: 'Entity',
+    CommunityNode: 'Community',
+}
+
+# Kuzu relationships cannot be fulltext indexed, so every fact is stored as a RelatesToNode_
+# node linked to its source and target entities by RELATES_TO relationships
+EDGE_PATTERNS: dict[type[Edge], str] = {
+    EpisodicEdge: '(n:Episodic)-[e:MENTIONS]->(m:Entity)',
+    EntityEdge: '(n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)',
+    CommunityEdge: '(n:Community)-[e:HAS_MEMBER]->(m:Entity:Community)',
+}
+
+EDGE_RETURN = 'RETURN e, n.uuid AS source_node_uuid, m.uuid AS target_node_uuid'
+
+# The saves bind one list per column and unwind over the row positions, as Kuzu cannot bind a
+# list of maps whose values have different types (the UNWIND $nodes AS node form of the Neo4j
+# bulk saves). Each list is cast to its column type, since Kuzu cannot infer the type of a list
+# holding only nulls or empty lists. Kuzu lists are 1-indexed. Nodes are matched again after
+# the MERGE because Kuzu crashes when a batched MERGE sets several fulltext indexed properties.
+EPISODIC_NODES_SAVE = """
+    UNWIND range(1, size($uuids)) AS i
+    MERGE (n:Episodic {uuid: $uuids[i]})
+    WITH i
+    MATCH (n:Episodic {uuid: $uuids[i]})
+    SET n.name = CAST($names AS STRING[])[i],
+        n.group_id = CAST($group_ids AS STRING[])[i],
+        n.source = CAST($sources AS STRING[])[i],
+        n.source_description = CAST($source_descriptions AS STRING[])[i],
+        n.content = CAST($contents AS STRING[])[i],
+        n.entity_edges = CAST($entity_edges AS STRING[][])[i],
+        n.created_at = CAST($created_ats AS TIMESTAMP[])[i],
+        n.valid_at = CAST($valid_ats AS TIMESTAMP[])[i]
+"""
+
+# Like the Cypher saves, labels accumulate and the mention count is kept
+ENTITY_NODES_SAVE = """
+    UNWIND range(1, size($uuids)) AS i
+    MERGE (n:Entity {uuid: $uuids[i]})
+    ON CREATE SET n.labels = CAST($labels AS STRING[][])[i], n.mention_count = 0
+    ON MATCH SET n.labels = list_distinct(list_concat(n.labels, CAST($labels AS STRING[][])[i]))
+    WITH i
+    MATCH (n:Entity {uuid: $uuids[i]})
+    SET n.name = CAST($names AS STRING[])[i],
+        n.group_id = CAST($group_ids AS STRING[])[i],
+        n.summary = CAST($summaries AS STRING[])[i],
+        n.name_embedding = CAST($name_embeddings AS FLOAT[][])[i],
+        n.attributes = CAST($attributes AS STRING[])[i],
+        n.created_at = CAST($created_ats AS TIMESTAMP[])[i]
+"""
+
+COMMUNITY_NODES_SAVE = """
+    UNWIND range(1, size($uuids)) AS i
+    MERGE (n:Community {uuid: $uuids[i]})
+    WITH i
+    MATCH (n:Community {uuid: $uuids[i]})
+    SET n.name = CAST($names AS STRING[])[i],
+        n.group_id = CAST($group_ids AS STRING[])[i],
+        n.summary = CAST($summaries AS STRING[])[i],
+        n.name_embedding = CAST($name_embeddings AS FLOAT[][])[i],
+        n.created_at = CAST($created_ats AS TIMESTAMP[])[i]
+"""
+
+EPISODIC_EDGES_SAVE = """
+    UNWIND range(1, size($uuids)) AS i
+    MATCH (n:Episodic {uuid: $source_uuids[i]}), (m:Entity {uuid: $target_uuids[i]})
+    MERGE (n)-[e:MENTIONS {uuid: $uuids[i]}]->(m)
+    SET e.group_id = CAST($group_ids AS STRING[])[i],
+        e.created_at = CAST($created_ats AS TIMESTAMP[])[i]
+"""
+
+ENTITY_EDGES_SAVE = """
+    UNWIND range(1, size($uuids)) AS i
+    MATCH (n:Entity {uuid: $source_uuids[i]}), (m:Entity {uuid: $target_uuids[i]})
+    MERGE (e:RelatesToNode_ {uuid: $uuids[i]})
+    WITH i, n, m
+    MATCH (e:RelatesToNode_ {uuid: $uuids[i]})
+    SET e.name = CAST($names AS STRING[])[i],
+        e.group_id = CAST($group_ids AS STRING[])[i],
+        e.fact = CAST($facts AS STRING[])[i],
+        e.fact_embedding = CAST($fact_embeddings AS FLOAT[][])[i],
+        e.episodes = CAST($episodes AS STRING[][])[i],
+        e.episode_count = size(CAST($episodes AS STRING[][])[i]),
+        e.attributes = CAST($attributes AS STRING[])[i],
+        e.created_at = CAST($created_ats AS TIMESTAMP[])[i],
+        e.expired_at = CAST($expired_ats AS TIMESTAMP[])[i],
+        e.valid_at = CAST($valid_ats AS TIMESTAMP[])[i],
+        e.invalid_at = CAST($invalid_ats AS TIMESTAMP[])[i]
+    MERGE (n)-[:RELATES_TO]->(e)
+    MERGE (e)-[:RELATES_TO]->(m)
+"""
+
+# Kuzu cannot merge a relationship whose endpoint may be in either of two tables, so members
+# are saved once per member table and each run only matches the members in its table
+COMMUNITY_EDGES_SAVE = """
+    UNWIND range(1, size($uuids)) AS i
+    MATCH (n:Community {{uuid: $source_uuids[i]}}), (m:{member_table} {{uuid: $target_uuids[i]}})
+    MERGE (n)-[e:HAS_MEMBER {{uuid: $uuids[i]}}]->(m)
+    SET e.group_id = CAST($group_ids AS STRING[])[i],
+        e.created_at = CAST($created_ats AS TIMESTAMP[])[i]
+"""
+
+# Mention counts are recounted rather than incremented, since Kuzu does not guarantee that a
+# row sees the updates made by earlier rows of the same statement
+MENTION_COUNTS_REBUILD = """
+    MATCH (n:Entity)
+    {where}
+    OPTIONAL MATCH (:Episodic)-[r:MENTIONS]->(n)
+    WITH n, count(r) AS mention_count
+    SET n.mention_count = mention_count
+"""
+
+
+def to_kuzu(obj: Any) -> Any:
+    """Parameters as Kuzu binds them: datetimes become naive UTC timestamps."""
+    if isinstance(obj, dict):
+        return {k: to_kuzu(v) for k, v in obj.items()}
+    elif isinstance(obj, list | tuple):
+        return [to_kuzu(item) for item in obj]
+    elif isinstance(obj, datetime) and obj.tzinfo is not None:
+        return obj.astimezone(timezone.utc).replace(tzinfo=None)
+    else:
+        return obj
+
+
+def utc(value: datetime | None) -> datetime | None:
+    # Kuzu TIMESTAMP columns hold naive UTC datetimes
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def where(conditions: list[str]) -> str:
+    return 'WHERE ' + ' AND '.join(conditions) if conditions else ''
+
+
+def vector_param(name: str, vector: list[float]) -> str:
+    # array_cosine_similarity needs a fixed-size array, while the columns are variable lists
+    return f'CAST(${name} AS FLOAT[{len(vector)}])'
+
+
+def labels_condition(alias: str, node_labels: list[str], params: dict[str, Any]) -> str:
+    # Kuzu cannot read parameters inside list comprehensions, so each label gets its own
+    labels: list[str] = []
+    for i, label in enumerate(node_labels):
+        params[f'node_label_{i}'] = label
+        labels.append(f'list_contains({alias}.labels, $node_label_{i})')
+    return '(' + ' OR '.join(labels or ['false']) + ')'
+
+
+def node_filter_conditions(search_filter: SearchFilters, params: dict[str, Any]) -> list[str]:
+    if search_filter.node_labels is None:
+        return []
+    return [labels_condition('n', search_filter.node_labels, params)]
+
+
+def edge_filter_conditions(search_filter: SearchFilters, params: dict[str, Any]) -> list[str]:
+    conditions: list[str] = []
+    if search_filter.edge_types is not None:
+        params['edge_types'] = search_filter.edge_types
+        conditions.append('e.name IN $edge_types')
+
+    if search_filter.node_labels is not None:
+        conditions.append(labels_condition('n', search_filter.node_labels, params))
+        conditions.append(labels_condition('m', search_filter.node_labels, params))
+
+    for field in ('valid_at', 'invalid_at', 'created_at', 'expired_at'):
+        date_filters = getattr(search_filter, field)
+        if date_filters is None:
+            continue
+
+        or_conditions: list[str] = []
+        for i, and_list in enumerate(date_filters):
+            and_conditions: list[str] = []
+            for j, date_filter in enumerate(and_list):
+                name = f'{field}_{i}_{j}'
+                params[name] = date_filter.date
+                and_conditions.append(f'e.{field} {date_filter.comparison_operator.value} ${name}')
+            if and_conditions:
+                or_conditions.append('(' + ' AND '.join(and_conditions) + ')')
+        if or_conditions:
+            conditions.append('(' + ' OR '.join(or_conditions) + ')')
+
+    return conditions
+
+
+def episode_from_record(record: dict[str, Any]) -> EpisodicNode:
+    return EpisodicNode(
+        uuid=record['uuid'],
+        name=record['name'],
+        group_id=record['group_id'],
+        source=EpisodeType.from_str(record['source']),
+        source_description=record['source_description'],
+        content=record['content'],
+        entity_edges=record['entity_edges'] or [],
+        created_at=utc(record['created_at']),
+        valid_at=utc(record['valid_at']),
+    )
+
+
+def entity_from_record(record: dict[str, Any], include_embeddings: bool = False) -> EntityNode:
+    return EntityNode(
+        uuid=record['uuid'],
+        name=record['name'],
+        group_id=record['group_id'],
+        labels=record['labels'] or [],
+        summary=record['summary'] or '',
+        name_embedding=(record['name_embedding'] or None) if include_embeddings else None,
+        attributes=json.loads(record['attributes'] or '{}'),
+        mention_count=record['mention_count'] or 0,
+        created_at=utc(record['created_at']),
+    )
+
+
+def community_from_record(
+    record: dict[str, Any], include_embeddings: bool = False
+) -> CommunityNode:
+    return CommunityNode(
+        uuid=record['uuid'],
+        name=record['name'],
+        group_id=record['group_id'],
+        summary=record['summary'] or '',
+        name_embedding=(record['name_embedding'] or None) if include_embeddings else None,
+        created_at=utc(record['created_at']),
+    )
+
+
+def node_from_record(
+    node_type: type[NodeT], record: dict[str, Any], include_embeddings: bool = False
+) -> NodeT:
+    if node_type is EpisodicNode:
+        return episode_from_record(record)  # type: ignore[return-value]
+    if node_type is EntityNode:
+        return entity_from_record(record, include_embeddings)  # type: ignore[return-value]
+    if node_type is CommunityNode:
+        return community_from_record(record, include_embeddings)  # type: ignore[return-value]
+    raise ValueError(f'Unsupported node type: {node_type.__name__}')
+
+
+def edge_from_record(
+    edge_type: type[EdgeT], record: dict[str, Any], include_embeddings: bool = False
+) -> EdgeT:
+    """Edge from a record of the form returned by EDGE_RETURN."""
+    edge = record['e']
+    if edge_type is EntityEdge:
+        return EntityEdge(  # type: ignore[return-value]
+            uuid=edge['uuid'],
+            group_id=edge['group_id'],
+            source_node_uuid=record['source_node_uuid'],
+            target_node_uuid=record['target_node_uuid'],
+            name=edge['name'],
+            fact=edge['fact'],
+            fact_embedding=(edge['fact_embedding'] or None) if include_embeddings else None,
+            episodes=edge['episodes'] or [],
+            episode_count=edge['episode_count'] or 0,
+            attributes=json.loads(edge['attributes'] or '{}'),
+            created_at=utc(edge['created_at']),
+            expired_at=utc(edge['expired_at']),
+            valid_at=utc(edge['valid_at']),
+            invalid_at=utc(edge['invalid_at']),
+        )
+    if edge_type is EpisodicEdge or edge_type is CommunityEdge:
+        return edge_type(
+            uuid=edge['uuid'],
+            group_id=edge['group_id'],
+            source_node_uuid=record['source_node_uuid'],
+            target_node_uuid=record['target_node_uuid'],
+            created_at=utc(edge['created_at']),
+        )
+    raise ValueError(f'Unsupported edge type: {edge_type.__name__}')
+
+
+class KuzuGraphOperations(GraphOperations):
+    """
+    GraphOperations in Kuzu's Cypher dialect.
+
+    Kuzu has a fixed schema of node and relationship tables, no secondary indices and no
+    procedures of the Neo4j APOC or GDS kind, so the queries of the other drivers cannot run
+    unchanged. Writes are batched into one statement per node or edge type.
+    """
+
+    def __init__(self, driver: 'KuzuDriver'):
+        self.driver = driver
+
+    async def _query(self, cypher_query_: str, /, **params: Any) -> list[dict[str, Any]]:
+        records, _, _ = await self.driver.execute_query(cypher_query_, **params)
+        return records
+
+    async def _nodes(
+        self,
+        node_type: type[NodeT],
+        conditions: list[str],
+        params: dict[str, Any],
+        suffix: str = '',
+        include_embeddings: bool = False,
+    ) -> list[NodeT]:
+        records = await self._query(
+            f'MATCH (n:{NODE_TABLES[node_type]}) {where(conditions)} RETURN n {suffix}', **params
+        )
+        return [node_from_record(node_type, record['n'], include_embeddings) for record in records]
+
+    async def _edges(
+        self,
+        edge_type: type[EdgeT],
+        conditions: list[str],
+        params: dict[str, Any],
+        suffix: str = '',
+        include_embeddings: bool = False,
+    ) -> list[EdgeT]:
+        records = await self._query(
+            f'MATCH {EDGE_PATTERNS[edge_type]} {where(conditions)} {EDGE_RETURN} {suffix}',
+            **params,
+        )
+        return [edge_from_record(edge_type, record, include_embeddings) for record in records]
+
+    async def _recount_mentions(self, entity_uuids: list[str]):
+        if entity_uuids:
+            await self._query(
+                MENTION_COUNTS_REBUILD.format(where='WHERE n.uuid IN $uuids'), uuids=entity_uuids
+            )
+
+    # Writes
+
+    async def save_nodes(self, nodes: Sequence[Node]) -> None:
+        episodes = [node for node in nodes if isinstance(node, EpisodicNode)]
+        entities = [node for node in nodes if isinstance(node, EntityNode)]
+        communities = [node for node in nodes if isinstance(node, CommunityNode)]
+        if len(episodes) + len(entities) + len(communities) != len(nodes):
+            unsupported = next(node for node in nodes if not isinstance(node, tuple(NODE_TABLES)))
+            raise ValueError(f'Unsupported node type: {type(unsupported).__name__}')
+
+        if episodes:
+            await self._query(
+                EPISODIC_NODES_SAVE,
+                uuids=[node.uuid for node in episodes],
+                names=[node.name for node in episodes],
+                group_ids=[node.group_id for node in episodes],
+                sources=[node.source.value for node in episodes],
+                source_descriptions=[node.source_description for node in episodes],
+                contents=[node.content for node in episodes],
+                entity_edges=[node.entity_edges for node in episodes],
+                created_ats=[node.created_at for node in episodes],
+                valid_ats=[node.valid_at for node in episodes],
+            )
+        if entities:
+            await self._query(
+                ENTITY_NODES_SAVE,
+                uuids=[node.uuid for node in entities],
+                names=[node.name for node in entities],
+                group_ids=[node.group_id for node in entities],
+                labels=[list(dict.fromkeys([*node.labels, 'Entity'])) for node in entities],
+                summaries=[node.summary for node in entities],
+                name_embeddings=[node.name_embedding for node in entities],
+                attributes=[json.dumps(node.attributes) for node in entities],
+                created_ats=[node.created_at for node in entities],
+            )
+        if communities:
+            await self._query(
+                COMMUNITY_NODES_SAVE,
+                uuids=[node.uuid for node in communities],
+                names=[node.name for node in communities],
+                group_ids=[node.group_id for node in communities],
+                summaries=[node.summary for node in communities],
+                name_embeddings=[node.name_embedding for node in communities],
+                created_ats=[node.created_at for node in communities],
+            )
+
+    async def save_edges(self, edges: Sequence[Edge]) -> None:
+        mentions = [edge for edge in edges if isinstance(edge, EpisodicEdge)]
+        facts = [edge for edge in edges if isinstance(edge, EntityEdge)]
+        memberships = [edge for edge in edges if isinstance(edge, CommunityEdge)]
+        if len(mentions) + len(facts) + len(memberships) != len(edges):
+            unsupported = next(edge for edge in edges if not isinstance(edge, tuple(EDGE_PATTERNS)))
+            raise ValueError(f'Unsupported edge type: {type(unsupported).__name__}')
+
+        for query, batch in (
+            (EPISODIC_EDGES_SAVE, mentions),
+            (COMMUNITY_EDGES_SAVE.format(member_table='Entity'), memberships),
+            (COMMUNITY_EDGES_SAVE.format(member_table='Community'), memberships),
+        ):
+            if batch:
+                await self._query(
+                    query,
+                    uuids=[edge.uuid for edge in batch],
+                    source_uuids=[edge.source_node_uuid for edge in batch],
+                    target_uuids=[edge.target_node_uuid for edge in batch],
+                    group_ids=[edge.group_id for edge in batch],
+                    created_ats=[edge.created_at for edge in batch],
+                )
+        if facts:
+            await self._query(
+                ENTITY_EDGES_SAVE,
+                uuids=[edge.uuid for edge in facts],
+                source_uuids=[edge.source_node_uuid for edge in facts],
+                target_uuids=[edge.target_node_uuid for edge in facts],
+                names=[edge.name for edge in facts],
+                group_ids=[edge.group_id for edge in facts],
+                facts=[edge.fact for edge in facts],
+                fact_embeddings=[edge.fact_embedding for edge in facts],
+                episodes=[edge.episodes for edge in facts],
+                attributes=[json.dumps(edge.attributes) for edge in facts],
+                created_ats=[edge.created_at for edge in facts],
+                expired_ats=[edge.expired_at for edge in facts],
+                valid_ats=[edge.valid_at for edge in facts],
+                invalid_ats=[edge.invalid_at for edge in facts],
+            )
+
+        await self._recount_mentions(list({edge.target_node_uuid for edge in mentions}))
+
+    async def delete_nodes(self, uuids: list[str]) -> None:
+        if not uuids:
+            return
+
+        records = await self._query(
+            """
+            MATCH (n:Episodic)-[:MENTIONS]->(m:Entity)
+            WHERE n.uuid IN $uuids AND NOT m.uuid IN $uuids
+            RETURN DISTINCT m.uuid AS uuid
+            """,
+            uuids=uuids,
+        )
+        await self._query(
+            """
+            MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)
+            WHERE n.uuid IN $uuids
+            WITH DISTINCT e
+            DETACH DELETE e
+            """,
+            uuids=uuids,
+        )
+        await self._query(
+            'MATCH (n:Episodic:Entity:Community) WHERE n.uuid IN $uuids DETACH DELETE n',
+            uuids=uuids,
+        )
+        await self._recount_mentions([record['uuid'] for record in records])
+
+    async def delete_edges(self, uuids: list[str]) -> None:
+        if not uuids:
+            return
+
+        records = await self._query(
+            """
+            MATCH (:Episodic)-[e:MENTIONS]->(m:Entity)
+            WHERE e.uuid IN $uuids
+            RETURN DISTINCT m.uuid AS uuid
+            """,
+            uuids=uuids,
+        )
+        await self._query(
+            'MATCH ()-[e:MENTIONS|HAS_MEMBER]->() WHERE e.uuid IN $uuids DELETE e', uuids=uuids
+        )
+        await self._query(
+            'MATCH (e:RelatesToNode_) WHERE e.uuid IN $uuids DETACH DELETE e', uuids=uuids
+        )
+        await self._recount_mentions([record['uuid'] for record in records])
+
+    async def delete_groups(self, group_ids: list[str] | None) -> None:
+        if group_ids is None:
+            await self._query('MATCH (n) DETACH DELETE n')
+            return
+
+        await self._query(
+            """
+            MATCH (n:Entity)-[:RELATES_TO]-(e:RelatesToNode_)
+            WHERE n.group_id IN $group_ids
+            WITH DISTINCT e
+            DETACH DELETE e
+            """,
+            group_ids=group_ids,
+        )
+        await self._query(
+            """
+            MATCH (n:Episodic:Entity:Community)
+            WHERE n.group_id IN $group_ids
+            DETACH DELETE n
+            """,
+            group_ids=group_ids,
+        )
+
+    async def delete_communities(self) -> None:
+        await self._query('MATCH (n:Community) DETACH DELETE n')
+
+    async def rebuild_mention_counts(self, group_ids: list[str] | None) -> None:
+        params: dict[str, Any] = {}
+        node_where = ''
+        edge_where = ''
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            node_where = 'WHERE n.group_id IN $group_ids'
+            edge_where = 'WHERE e.group_id IN $group_ids'
+
+        await self._query(MENTION_COUNTS_REBUILD.format(where=node_where), **params)
+        await self._query(
+            f'MATCH (e:RelatesToNode_) {edge_where} SET e.episode_count = size(e.episodes)',
+            **params,
+        )
+
+    async def build_indices(self, delete_existing: bool = False) -> None:
+        # The node and relationship tables are created by the driver, only the fulltext
+        # indices are left to build
+        if delete_existing:
+            await self.driver.delete_all_indexes()
+
+        existing = {
+            record['index_name']
+            for record in await self._query('CALL SHOW_INDEXES() RETURN index_name')
+        }
+        for query in get_fulltext_indices('kuzu'):
+            if not any(f"'{index_name}'" in query for index_name in existing):
+                await self._query(query)
+
+    # Lookups
+
+    async def get_nodes_by_uuids(
+        self, node_type: type[NodeT], uuids: list[str], include_embeddings: bool = False
+    ) -> list[NodeT]:
+        if not uuids:
+            return []
+        return await self._nodes(
+            node_type, ['n.uuid IN $uuids'], {'uuids': uuids}, '', include_embeddings
+        )
+
+    async def get_nodes_by_group_ids(
+        self,
+        node_type: type[NodeT],
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[NodeT]:
+        if not group_ids:
+            return []
+
+        params: dict[str, Any] = {'group_ids': group_ids}
+        conditions = ['n.group_id IN $group_ids']
+        suffix = 'ORDER BY n.uuid DESC'
+        if uuid_cursor is not None:
+            params['uuid'] = uuid_cursor
+            conditions.append('n.uuid < $uuid')
+        if limit is not None:
+            params['limit'] = limit
+            suffix += ' LIMIT $limit'
+
+        return await self._nodes(node_type, conditions, params, suffix)
+
+    async def get_edges_by_uuids(
+        self, edge_type: type[EdgeT], uuids: list[str], include_embeddings: bool = False
+    ) -> list[EdgeT]:
+        if not uuids:
+            return []
+        return await self._edges(
+            edge_type, ['e.uuid IN $uuids'], {'uuids': uuids}, '', include_embeddings
+        )
+
+    async def get_edges_by_group_ids(
+        self,
+        edge_type: type[EdgeT],
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[EdgeT]:
+        if not group_ids:
+            return []
+
+        params: dict[str, Any] = {'group_ids': group_ids}
+        conditions = ['e.group_id IN $group_ids']
+        suffix = 'ORDER BY e.uuid DESC'
+        if uuid_cursor is not None:
+            params['uuid'] = uuid_cursor
+            conditions.append('e.uuid < $uuid')
+        if limit is not None:
+            params['limit'] = limit
+            suffix += ' LIMIT $limit'
+
+        return await self._edges(edge_type, conditions, params, suffix)
+
+    async def get_entity_group_ids(self) -> list[str]:
+        records = await self._query(
+            'MATCH (n:Entity) WHERE n.group_id IS NOT NULL RETURN DISTINCT n.group_id AS group_id'
+        )
+        return [record['group_id'] for record in records]
+
+    async def get_episodic_nodes_by_entity_node_uuid(
+        self, entity_node_uuid: str
+    ) -> list[EpisodicNode]:
+        records = await self._query(
+            """
+            MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $entity_node_uuid})
+            RETURN DISTINCT e
+            """,
+            entity_node_uuid=entity_node_uuid,
+        )
+        return [episode_from_record(record['e']) for record in records]
+
+    async def get_entity_edges_by_node_uuid(self, node_uuid: str) -> list[EntityEdge]:
+        return await self._edges(
+            EntityEdge, ['(n.uuid = $node_uuid OR m.uuid = $node_uuid)'], {'node_uuid': node_uuid}
+        )
+
+    async def get_entity_neighbor_uuids(self, node_uuids: list[str]) -> list[str]:
+        if not node_uuids:
+            return []
+
+        records = await self._query(
+            """
+            MATCH (n:Entity)-[:RELATES_TO]-(:RelatesToNode_)-[:RELATES_TO]-(m:Entity)
+            WHERE n.uuid IN $node_uuids AND m.uuid <> n.uuid
+            RETURN DISTINCT m.uuid AS uuid
+            """,
+            node_uuids=node_uuids,
+        )
+        return [record['uuid'] for record in records]
+
+    async def get_mentioned_nodes(self, episode_uuids: list[str]) -> list[EntityNode]:
+        if not episode_uuids:
+            return []
+
+        records = await self._query(
+            """
+            MATCH (e:Episodic)-[:MENTIONS]->(n:Entity)
+            WHERE e.uuid IN $episode_uuids
+            RETURN DISTINCT n
+            """,
+            episode_uuids=episode_uuids,
+        )
+        return [entity_from_record(record['n']) for record in records]
+
+    async def get_communities_by_nodes(self, node_uuids: list[str]) -> list[CommunityNode]:
+        if not node_uuids:
+            return []
+
+        records = await self._query(
+            """
+            MATCH (c:Community)-[:HAS_MEMBER]->(n:Entity)
+            WHERE n.uuid IN $node_uuids
+            RETURN DISTINCT c
+            """,
+            node_uuids=node_uuids,
+        )
+        return [community_from_record(record['c']) for record in records]
+
+    async def retrieve_episodes(
+        self,
+        reference_time: datetime,
+        last_n: int,
+        group_ids: list[str] | None = None,
+        source: EpisodeType | None = None,
+    ) -> list[EpisodicNode]:
+        params: dict[str, Any] = {'reference_time': reference_time, 'num_episodes': last_n}
+        conditions = ['n.valid_at <= $reference_time']
+        if group_ids:
+            params['group_ids'] = group_ids
+            conditions.append('n.group_id IN $group_ids')
+        if source is not None:
+            params['source'] = source.value
+            conditions.append('n.source = $source')
+
+        return await self._nodes(
+            EpisodicNode, conditions, params, 'ORDER BY n.valid_at DESC LIMIT $num_episodes'
+        )
+
+    # Search
+
+    async def _fulltext_nodes(
+        self,
+        node_type: type[NodeT],
+        index_name: str,
+        conditions: list[str],
+        params: dict[str, Any],
+        include_embeddings: bool = False,
+    ) -> list[NodeT]:
+        # Like the Neo4j queries, the index returns its top matches before they are filtered
+        records = await self._query(
+            f"""
+            {get_nodes_query('kuzu', index_name, '$query', '$limit')}
+            WITH node AS n, score
+            {where(conditions)}
+            RETURN n
+            ORDER BY score DESC
+            LIMIT $limit
+            """,
+            **params,
+        )
+        return [node_from_record(node_type, record['n'], include_embeddings) for record in records]
+
+    async def node_fulltext_search(
+        self, query: str, search_filter: SearchFilters, group_ids: list[str] | None, limit: int
+    ) -> list[EntityNode]:
+        params: dict[str, Any] = {'query': query, 'limit': limit}
+        conditions = node_filter_conditions(search_filter, params)
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            conditions.append('n.group_id IN $group_ids')
+
+        return await self._fulltext_nodes(EntityNode, 'node_name_and_summary', conditions, params)
+
+    async def _similar_nodes(
+        self,
+        node_type: type[NodeT],
+        search_vector: list[float],
+        conditions: list[str],
+        params: dict[str, Any],
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[NodeT]:
+        cosine = get_vector_cosine_func_query(
+            'n.name_embedding', vector_param('search_vector', search_vector), 'kuzu'
+        )
+        params.update({'search_vector': search_vector, 'limit': limit, 'min_score': min_score})
+        records = await self._query(
+            f"""
+            MATCH (n:{NODE_TABLES[node_type]})
+            {where(['n.name_embedding IS NOT NULL', *conditions])}
+            WITH n, {cosine} AS score
+            WHERE score > $min_score
+            RETURN n
+            ORDER BY score DESC
+            LIMIT $limit
+            """,
+            **params,
+        )
+        return [node_from_record(node_type, record['n'], include_embeddings) for record in records]
+
+    async def node_similarity_search(
+        self,
+        search_vector: list[float],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[EntityNode]:
+        params: dict[str, Any] = {}
+        conditions = node_filter_conditions(search_filter, params)
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            conditions.append('n.group_id IN $group_ids')
+
+        return await self._similar_nodes(
+            EntityNode, search_vector, conditions, params, limit, min_score, include_embeddings
+        )
+
+    async def edge_fulltext_search(
+        self, query: str, search_filter: SearchFilters, group_ids: list[str] | None, limit: int
+    ) -> list[EntityEdge]:
+        params: dict[str, Any] = {'query': query, 'limit': limit}
+        conditions = edge_filter_conditions(search_filter, params)
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            conditions.append('e.group_id IN $group_ids')
+
+        records = await self._query(
+            f"""
+            {get_relationships_query('edge_name_and_fact', 'kuzu', '$limit', '$query')}
+            WITH node AS e, score
+            MATCH {EDGE_PATTERNS[EntityEdge]}
+            {where(conditions)}
+            {EDGE_RETURN}
+            ORDER BY score DESC
+            LIMIT $limit
+            """,
+            **params,
+        )
+        return [edge_from_record(EntityEdge, record) for record in records]
+
+    async def _similar_edges(
+        self,
+        search_vector: list[float],
+        conditions: list[str],
+        params: dict[str, Any],
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[EntityEdge]:
+        cosine = get_vector_cosine_func_query(
+            'e.fact_embedding', vector_param('search_vector', search_vector), 'kuzu'
+        )
+        params.update({'search_vector': search_vector, 'limit': limit, 'min_score': min_score})
+        records = await self._query(
+            f"""
+            MATCH {EDGE_PATTERNS[EntityEdge]}
+            {where(['e.fact_embedding IS NOT NULL', *conditions])}
+            WITH e, n, m, {cosine} AS score
+            WHERE score > $min_score
+            {EDGE_RETURN}
+            ORDER BY score DESC
+            LIMIT $limit
+            """,
+            **params,
+        )
+        return [edge_from_record(EntityEdge, record, include_embeddings) for record in records]
+
+    async def edge_similarity_search(
+        self,
+        search_vector: list[float],
+        source_node_uuid: str | None,
+        target_node_uuid: str | None,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[EntityEdge]:
+        params: dict[str, Any] = {}
+        conditions = edge_filter_conditions(search_filter, params)
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            conditions.append('e.group_id IN $group_ids')
+
+        endpoint_uuids = [uuid for uuid in (source_node_uuid, target_node_uuid) if uuid is not None]
+        if endpoint_uuids:
+            params['endpoint_uuids'] = endpoint_uuids
+            conditions.append('n.uuid IN $endpoint_uuids')
+            conditions.append('m.uuid IN $endpoint_uuids')
+
+        return await self._similar_edges(
+            search_vector, conditions, params, limit, min_score, include_embeddings
+        )
+
+    async def episode_fulltext_search(
+        self, query: str, group_ids: list[str] | None, limit: int
+    ) -> list[EpisodicNode]:
+        params: dict[str, Any] = {'query': query, 'limit': limit}
+        conditions: list[str] = []
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            conditions.append('n.group_id IN $group_ids')
+
+        return await self._fulltext_nodes(EpisodicNode, 'episode_content', conditions, params)
+
+    async def community_fulltext_search(
+        self, query: str, group_ids: list[str] | None, limit: int
+    ) -> list[CommunityNode]:
+        params: dict[str, Any] = {'query': query, 'limit': limit}
+        conditions: list[str] = []
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            conditions.append('n.group_id IN $group_ids')
+
+        return await self._fulltext_nodes(CommunityNode, 'community_name', conditions, params)
+
+    async def community_similarity_search(
+        self, search_vector: list[float], group_ids: list[str] | None, limit: int, min_score: float
+    ) -> list[CommunityNode]:
+        params: dict[str, Any] = {}
+        conditions: list[str] = []
+        if group_ids is not None:
+            params['group_ids'] = group_ids
+            conditions.append('n.group_id IN $group_ids')
+
+        return await self._similar_nodes(
+            CommunityNode, search_vector, conditions, params, limit, min_score, True
+        )
+
+    async def _bfs_level(
+        self,
+        frontier: list[str],
+        visited_edge_uuids: set[str],
+        matches: list[str],
+        params: dict[str, Any],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Facts and mentions leading from the frontier to entities of the same group, as records
+        holding the edge e, its target entity m and whether the edge matches the conditions.
+        Mentions have no fact, and match no conditions.
+        """
+        level_params: dict[str, Any] = {'frontier': frontier, 'level_limit': limit}
+        conditions = ['n.uuid IN $frontier', 'm.group_id = n.group_id']
+        if visited_edge_uuids:
+            level_params['visited_edge_uuids'] = list(visited_edge_uuids)
+            conditions.append('NOT e.uuid IN $visited_edge_uuids')
+
+        facts = await self._query(
+            f"""
+            MATCH {EDGE_PATTERNS[EntityEdge]}
+            {where(conditions)}
+            {EDGE_RETURN}, m, {' AND '.join(matches) or 'true'} AS matches
+            LIMIT $level_limit
+            """,
+            **level_params,
+            **params,
+        )
+        mentions = await self._query(
+            f"""
+            MATCH {EDGE_PATTERNS[EpisodicEdge]}
+            {where(conditions)}
+            RETURN e, m, false AS matches
+            LIMIT $level_limit
+            """,
+            **level_params,
+        )
+        return (facts + mentions)[:limit]
+
+    async def edge_bfs_search(
+        self,
+        bfs_origin_node_uuids: list[str],
+        bfs_max_depth: int,
+        search_filter: SearchFilters,
+        limit: int,
+        max_frontier: int,
+    ) -> list[EntityEdge]:
+        params: dict[str, Any] = {}
+        matches = edge_filter_conditions(search_filter, params)
+
+        edges: list[EntityEdge] = []
+        visited_node_uuids = set(bfs_origin_node_uuids)
+        visited_edge_uuids: set[str] = set()
+        frontier = list(dict.fromkeys(bfs_origin_node_uuids))[:max_frontier]
+        for _ in range(bfs_max_depth):
+            if len(frontier) == 0 or len(edges) >= limit:
+                break
+
+            level = await self._bfs_level(
+                frontier, visited_edge_uuids, matches, params, limit - len(edges) + max_frontier
+            )
+
+            frontier = []
+            for record in level:
+                visited_edge_uuids.add(record['e']['uuid'])
+                if record['matches'] and len(edges) < limit:
+                    edges.append(edge_from_record(EntityEdge, record))
+
+                target_uuid = record['m']['uuid']
+                if target_uuid not in visited_node_uuids:
+                    visited_node_uuids.add(target_uuid)
+                    if len(frontier) < max_frontier:
+                        frontier.append(target_uuid)
+
+        return edges
+
+    async def node_bfs_search(
+        self,
+        bfs_origin_node_uuids: list[str],
+        search_filter: SearchFilters,
+        bfs_max_depth: int,
+        limit: int,
+        max_frontier: int,
+    ) -> list[EntityNode]:
+        nodes: list[EntityNode] = []
+        visited_node_uuids = set(bfs_origin_node_uuids)
+        visited_edge_uuids: set[str] = set()
+        frontier = list(dict.fromkeys(bfs_origin_node_uuids))[:max_frontier]
+        for _ in range(bfs_max_depth):
+            if len(frontier) == 0 or len(nodes) >= limit:
+                break
+
+            level = await self._bfs_level(
+                frontier, visited_edge_uuids, [], {}, limit - len(nodes) + max_frontier
+            )
+
+            frontier = []
+            for record in level:
+                visited_edge_uuids.add(record['e']['uuid'])
+                target = entity_from_record(record['m'])
+                if target.uuid in visited_node_uuids:
+                    continue
+
+                visited_node_uuids.add(target.uuid)
+                if len(nodes) < limit and (
+                    search_filter.node_labels is None
+                    or any(label in target.labels for label in search_filter.node_labels)
+                ):
+                    nodes.append(target)
+                if len(frontier) < max_frontier:
+                    frontier.append(target.uuid)
+
+        return nodes
+
+    async def get_relevant_nodes(
+        self,
+        nodes: list[EntityNode],
+        queries: list[str],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[list[EntityNode]]:
+        group_id = nodes[0].group_id
+
+        relevant_nodes: list[list[EntityNode]] = []
+        for node, query in zip(nodes, queries, strict=True):
+            vector_nodes: list[EntityNode] = []
+            if node.name_embedding is not None:
+                vector_nodes = await self.node_similarity_search(
+                    node.name_embedding, search_filter, [group_id], limit, min_score, True
+                )
+
+            # The fulltext candidates are neither filtered nor scored against the embedding
+            fulltext_nodes: list[EntityNode] = []
+            if query:
+                fulltext_nodes = await self._fulltext_nodes(
+                    EntityNode,
+                    'node_name_and_summary',
+                    ['n.group_id = $group_id'],
+                    {'query': query, 'limit': limit, 'group_id': group_id},
+                    True,
+                )
+
+            matched_uuids = {found.uuid for found in vector_nodes}
+            relevant_nodes.append(
+                vector_nodes
+                + [found for found in fulltext_nodes if found.uuid not in matched_uuids]
+            )
+
+        return relevant_nodes
+
+    async def get_relevant_edges(
+        self, edges: list[EntityEdge], search_filter: SearchFilters, min_score: float, limit: int
+    ) -> list[list[EntityEdge]]:
+        relevant_edges: list[list[EntityEdge]] = []
+        for edge in edges:
+            if edge.fact_embedding is None:
+                relevant_edges.append([])
+                continue
+
+            params: dict[str, Any] = {
+                'group_id': edge.group_id,
+                'source_uuid': edge.source_node_uuid,
+                'target_uuid': edge.target_node_uuid,
+            }
+            conditions = [
+                'e.group_id = $group_id',
+                '((n.uuid = $source_uuid AND m.uuid = $target_uuid)'
+                ' OR (n.uuid = $target_uuid AND m.uuid = $source_uuid))',
+                *edge_filter_conditions(search_filter, params),
+            ]
+            relevant_edges.append(
+                await self._similar_edges(
+                    edge.fact_embedding, conditions, params, limit, min_score, True
+                )
+            )
+
+        return relevant_edges
+
+    async def get_edge_invalidation_candidates(
+        self, edges: list[EntityEdge], search_filter: SearchFilters, min_score: float, limit: int
+    ) -> list[list[EntityEdge]]:
+        invalidation_edges: list[list[EntityEdge]] = []
+        for edge in edges:
+            if edge.fact_embedding is None:
+                invalidation_edges.append([])
+                continue
+
+            params: dict[str, Any] = {
+                'group_id': edge.group_id,
+                'endpoint_uuids': [edge.source_node_uuid, edge.target_node_uuid],
+            }
+            conditions = [
+                'e.group_id = $group_id',
+                '(n.uuid IN $endpoint_uuids OR m.uuid IN $endpoint_uuids)',
+                *edge_filter_conditions(search_filter, params),
+            ]
+            invalidation_edges.append(
+                await self._similar_edges(
+                    edge.fact_embedding, conditions, params, limit, min_score, True
+                )
+            )
+
+        return invalidation_edges
+
+
+class KuzuDriverSession(GraphDriverSession):
+    def __init__(self, driver: 'KuzuDriver'):
+        self.driver = driver
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # No cleanup needed for Kuzu, but method must exist
+        pass
+
+    async def close(self):
+        # The connections belong to the driver, but method must exist
+        pass
+
+    async def execute_write(self, func, *args, **kwargs):
+        return await func(self, *args, **kwargs)
+
+    async def run(self, query: str | list, **kwargs: Any) -> Any:
+        if isinstance(query, list):
+            for cypher, params in query:
+                await self.driver.execute_query(cypher, **params)
+        else:
+            await self.driver.execute_query(query, **kwargs)
+        return None
+
+
+class KuzuDriver(GraphDriver):
+    """
+    Driver for Kuzu, an embedded graph database that runs inside the Python process.
+
+    Pass a directory path to persist the graph, or ':memory:' for a graph that lives as long
+    as the driver. Graphiti talks to Kuzu through driver.operations, since Kuzu's schema and
+    Cypher dialect differ from Neo4j's. execute_query runs Kuzu Cypher against the tables
+    created by get_range_indices('kuzu').
+    """
+
+    provider: str = 'kuzu'
+
+    def __init__(self, db: str = ':memory:', max_concurrent_queries: int = 1):
+        """
+        Kuzu runs a single write transaction at a time, so concurrent queries are only worth
+        raising for read-heavy workloads.
+        """
+        super().__init__()
+        self.db = kuzu.Database(db)
+        self._setup_schema()
+        self.client = kuzu.AsyncConnection(self.db, max_concurrent_queries=max_concurrent_queries)
+        self.operations: KuzuGraphOperations = KuzuGraphOperations(self)
+
+    def _setup_schema(self):
+        connection = kuzu.Connection(self.db)
+        # The FTS extension is bundled with recent Kuzu releases and downloaded by older ones
+        for query in ('INSTALL FTS', 'LOAD EXTENSION FTS'):
+            try:
+                connection.execute(query).close()  # type: ignore[union-attr]
+            except RuntimeError as e:
+                logger.debug(f'{query} failed: {e}')
+
+        for query in get_range_indices('kuzu'):
+            connection.execute(query).close()  # type: ignore[union-attr]
+        connection.close()
+
+    @traced('driver.execute_query')
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        # Kuzu has one database per driver and no cluster to route to
+        kwargs.pop('database_', None)
+        kwargs.pop('routing_', None)
+        params = to_kuzu(kwargs)
+
+        start = monotonic()
+        try:
+            # Kuzu cannot cancel a query from another thread, so a deadline only bounds the wait
+            result = await asyncio.wait_for(
+                self.client.execute(cypher_query_, parameters=params), query_timeout()
+            )
+        except Exception as e:
+            logger.error(f'Error executing Kuzu query: {e}')
+            raise
+        finally:
+            db_query_duration.observe(
+                monotonic() - start,
+                provider=self.provider,
+                fingerprint=query_fingerprint(cypher_query_),
+            )
+
+        # A query with several statements returns one result per statement. Results are closed
+        # as soon as they are read, since Kuzu crashes if one outlives its database.
+        results = result if isinstance(result, list) else [result]
+        header: list[str] = []
+        records: list[dict[str, Any]] = []
+        if results[-1] is not None:
+            header = results[-1].get_column_names()
+            records = list(results[-1].rows_as_dict())
+        for query_result in results:
+            if query_result is not None:
+                query_result.close()
+
+        add_span_attributes({'db.provider': self.provider, 'db.record_count': len(records)})
+
+        return records, header, None
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return KuzuDriverSession(self)
+
+    async def close(self) -> None:
+        self.client.close()
+        self.db.close()
+
+    async def delete_all_indexes(self, database_: str | None = None) -> None:
+        records, _, _ = await self.execute_query(
+            "CALL SHOW_INDEXES() WHERE index_type = 'FTS' RETURN table_name, index_name"
+        )
+        for record in records:
+            await self.execute_query(
+                f"CALL DROP_FTS_INDEX('{record['table_name']}', '{record['index_name']}')"
+            )
@@ -0,0 +1,926 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import copy
+import json
+import logging
+import operator
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import islice
+from typing import Any, Generic, TypeVar
+
+import numpy as np
+from pydantic import BaseModel
+
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession
+from graphiti_core.driver.memory_index import BM25Index, VectorIndex
+from graphiti_core.driver.operations import EdgeT, GraphOperations, NodeT
+from graphiti_core.edges import CommunityEdge, Edge, EntityEdge, EpisodicEdge
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode, Node
+from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+DEFAULT_N_PROBE = 8
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+RowT = TypeVar('RowT', bound=Node | Edge)
+
+COMPARISONS: dict[ComparisonOperator, Callable[[Any, Any], bool]] = {
+    ComparisonOperator.equals: operator.eq,
+    ComparisonOperator.not_equals: operator.ne,
+    ComparisonOperator.greater_than: operator.gt,
+    ComparisonOperator.less_than: operator.lt,
+    ComparisonOperator.greater_than_equal: operator.ge,
+    ComparisonOperator.less_than_equal: operator.le,
+}
+
+
+def detached(model: ModelT, **update: Any) -> ModelT:
+    """Copy of a model that shares no list or dict with the original."""
+    copied = model.model_copy(update=update)
+    for name, value in copied.__dict__.items():
+        if name not in update and isinstance(value, list | dict):
+            copied.__dict__[name] = copy.deepcopy(value)
+    return copied
+
+
+def dates_match(value: datetime | None, date_filters: list[list[DateFilter]] | None) -> bool:
+    # Filters are a disjunction of conjunctions; like Cypher, comparisons with null never match
+    if date_filters is None:
+        return True
+    if value is None:
+        return False
+    return any(
+        all(
+            COMPARISONS[date_filter.comparison_operator](value, date_filter.date)
+            for date_filter in and_filters
+        )
+        for and_filters in date_filters
+    )
+
+
+class Table(Generic[RowT]):
+    """Rows of one node or edge type, with uuid and group_id hash indexes."""
+
+    def __init__(self):
+        self.rows: dict[str, RowT] = {}
+        # Dicts rather than sets, so that iteration follows insertion order
+        self.groups: defaultdict[str, dict[str, None]] = defaultdict(dict)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def put(self, row: RowT):
+        self.pop(row.uuid)
+        self.rows[row.uuid] = row
+        self.groups[row.group_id][row.uuid] = None
+
+    def pop(self, uuid: str) -> RowT | None:
+        row = self.rows.pop(uuid, None)
+        if row is not None:
+            group = self.groups[row.group_id]
+            del group[uuid]
+            if len(group) == 0:
+                del self.groups[row.group_id]
+        return row
+
+    def uuids_in_groups(self, group_ids: list[str] | None) -> Iterable[str]:
+        if group_ids is None:
+            return self.rows.keys()
+        return [uuid for group_id in group_ids for uuid in self.groups.get(group_id, ())]
+
+    def in_groups(self, group_ids: list[str] | None) -> Iterator[RowT]:
+        return (self.rows[uuid] for uuid in self.uuids_in_groups(group_ids))
+
+
+class EdgeTable(Table[RowT]):
+    """A table of edges that also indexes them by source and target node."""
+
+    def __init__(self):
+        super().__init__()
+        self.outgoing: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self.incoming: defaultdict[str, dict[str, None]] = defaultdict(dict)
+
+    def put(self, row: RowT):
+        super().put(row)
+        self.outgoing[row.source_node_uuid][row.uuid] = None  # type: ignore[union-attr]
+        self.incoming[row.target_node_uuid][row.uuid] = None  # type: ignore[union-attr]
+
+    def pop(self, uuid: str) -> RowT | None:
+        row = super().pop(uuid)
+        if row is not None:
+            for adjacency, node_uuid in (
+                (self.outgoing, row.source_node_uuid),  # type: ignore[union-attr]
+                (self.incoming, row.target_node_uuid),  # type: ignore[union-attr]
+            ):
+                edges = adjacency[node_uuid]
+                edges.pop(uuid, None)
+                if len(edges) == 0:
+                    del adjacency[node_uuid]
+        return row
+
+    def by_node(self, node_uuid: str) -> list[str]:
+        """Edges in either direction, without duplicating self-loops."""
+        return list({**self.outgoing.get(node_uuid, {}), **self.incoming.get(node_uuid, {})})
+
+
+class InMemoryGraphOperations(GraphOperations):
+    """
+    GraphOperations over Python dicts and NumPy matrices.
+
+    Rows are stored in per-type tables indexed by uuid and group_id. Embeddings live in float32
+    matrices searched by cosine similarity, exactly or through an inverted file index with
+    ann=True, and each of the fulltext indices of graph_queries.get_fulltext_indices is a BM25
+    inverted index over the same fields.
+    """
+
+    def __init__(self, ann: bool = False, n_probe: int = DEFAULT_N_PROBE):
+        self.ann = ann
+        self.n_probe = n_probe
+        self.clear()
+
+    def clear(self):
+        self.episodes: Table[EpisodicNode] = Table()
+        self.entities: Table[EntityNode] = Table()
+        self.communities: Table[CommunityNode] = Table()
+        self.mentions: EdgeTable[EpisodicEdge] = EdgeTable()
+        self.facts: EdgeTable[EntityEdge] = EdgeTable()
+        self.memberships: EdgeTable[CommunityEdge] = EdgeTable()
+
+        self.entity_name_vectors = VectorIndex(self.ann, self.n_probe)
+        self.community_name_vectors = VectorIndex(self.ann, self.n_probe)
+        self.fact_vectors = VectorIndex(self.ann, self.n_probe)
+
+        self.episode_content = BM25Index()
+        self.node_name_and_summary = BM25Index()
+        self.community_name = BM25Index()
+        self.edge_name_and_fact = BM25Index()
+
+    # Storage
+
+    def _node_table(self, node_type: type[Node]) -> Table:
+        if issubclass(node_type, EpisodicNode):
+            return self.episodes
+        if issubclass(node_type, EntityNode):
+            return self.entities
+        if issubclass(node_type, CommunityNode):
+            return self.communities
+        raise ValueError(f'Unsupported node type: {node_type.__name__}')
+
+    def _edge_table(self, edge_type: type[Edge]) -> EdgeTable:
+        if issubclass(edge_type, EpisodicEdge):
+            return self.mentions
+        if issubclass(edge_type, EntityEdge):
+            return self.facts
+        if issubclass(edge_type, CommunityEdge):
+            return self.memberships
+        raise ValueError(f'Unsupported edge type: {edge_type.__name__}')
+
+    def _put_episode(self, episode: EpisodicNode):
+        self.episodes.put(episode)
+        self.episode_content.add(
+            episode.uuid,
+            ' '.join(
+                [
+                    episode.content,
+                    episode.source.value,
+                    episode.source_description,
+                    episode.group_id,
+                ]
+            ),
+        )
+
+    def _put_entity(self, node: EntityNode, name_embedding: list[float] | None):
+        self.entities.put(node)
+        self.node_name_and_summary.add(
+            node.uuid, ' '.join([node.name, node.summary, node.group_id])
+        )
+        self._set_vector(self.entity_name_vectors, node.uuid, name_embedding)
+
+    def _put_community(self, node: CommunityNode, name_embedding: list[float] | None):
+        self.communities.put(node)
+        self.community_name.add(node.uuid, ' '.join([node.name, node.group_id]))
+        self._set_vector(self.community_name_vectors, node.uuid, name_embedding)
+
+    def _put_fact(self, edge: EntityEdge, fact_embedding: list[float] | None):
+        self.facts.put(edge)
+        self.edge_name_and_fact.add(edge.uuid, ' '.join([edge.name, edge.fact, edge.group_id]))
+        self._set_vector(self.fact_vectors, edge.uuid, fact_embedding)
+
+    @staticmethod
+    def _set_vector(index: VectorIndex, uuid: str, vector: list[float] | None):
+        if vector is None:
+            index.remove(uuid)
+        else:
+            index.add(uuid, vector)
+
+    def _pop_edge(self, uuid: str):
+        mention = self.mentions.pop(uuid)
+        if mention is not None:
+            entity = self.entities.rows.get(mention.target_node_uuid)
+            if entity is not None:
+                entity.mention_count -= 1
+            return
+
+        if self.facts.pop(uuid) is not None:
+            self.edge_name_and_fact.remove(uuid)
+            self.fact_vectors.remove(uuid)
+            return
+
+        self.memberships.pop(uuid)
+
+    def _pop_node(self, uuid: str):
+        for table in (self.mentions, self.facts, self.memberships):
+            for edge_uuid in table.by_node(uuid):
+                self._pop_edge(edge_uuid)
+
+        if self.episodes.pop(uuid) is not None:
+            self.episode_content.remove(uuid)
+        elif self.entities.pop(uuid) is not None:
+            self.node_name_and_summary.remove(uuid)
+            self.entity_name_vectors.remove(uuid)
+        elif self.communities.pop(uuid) is not None:
+            self.community_name.remove(uuid)
+            self.community_name_vectors.remove(uuid)
+
+    # Conversion of stored rows to the models returned to callers
+
+    def _entity(self, row: EntityNode, include_embeddings: bool = False) -> EntityNode:
+        if include_embeddings:
+            return detached(row, name_embedding=self.entity_name_vectors.get(row.uuid))
+        return detached(row)
+
+    def _community(self, row: CommunityNode, include_embeddings: bool = False) -> CommunityNode:
+        if include_embeddings:
+            return detached(row, name_embedding=self.community_name_vectors.get(row.uuid))
+        return detached(row)
+
+    def _fact(self, row: EntityEdge, include_embeddings: bool = False) -> EntityEdge:
+        if include_embeddings:
+            return detached(row, fact_embedding=self.fact_vectors.get(row.uuid))
+        return detached(row)
+
+    def _row(self, row: Any, include_embeddings: bool = False) -> Any:
+        if isinstance(row, EntityNode):
+            return self._entity(row, include_embeddings)
+        if isinstance(row, CommunityNode):
+            return self._community(row, include_embeddings)
+        if isinstance(row, EntityEdge):
+            return self._fact(row, include_embeddings)
+        return detached(row)
+
+    # Filters
+
+    def _node_matches(self, node: EntityNode | None, search_filter: SearchFilters) -> bool:
+        if node is None:
+            return False
+        if search_filter.node_labels is None:
+            return True
+        return any(label in node.labels for label in search_filter.node_labels)
+
+    def _edge_matches(self, edge: EntityEdge, search_filter: SearchFilters) -> bool:
+        if search_filter.edge_types is not None and edge.name not in search_filter.edge_types:
+            return False
+        if search_filter.node_labels is not None and not (
+            self._node_matches(self.entities.rows.get(edge.source_node_uuid), search_filter)
+            and self._node_matches(self.entities.rows.get(edge.target_node_uuid), search_filter)
+        ):
+            return False
+        return (
+            dates_match(edge.valid_at, search_filter.valid_at)
+            and dates_match(edge.invalid_at, search_filter.invalid_at)
+            and dates_match(edge.created_at, search_filter.created_at)
+            and dates_match(edge.expired_at, search_filter.expired_at)
+        )
+
+    # Writes
+
+    async def save_nodes(self, nodes: Sequence[Node]) -> None:
+        for node in nodes:
+            if isinstance(node, EpisodicNode):
+                self._put_episode(detached(node))
+            elif isinstance(node, EntityNode):
+                # Like the Cypher saves, labels accumulate and the mention count is kept
+                existing = self.entities.rows.get(node.uuid)
+                labels = node.labels + ['Entity']
+                if existing is not None:
+                    labels = existing.labels + labels
+                row = detached(
+                    node,
+                    name_embedding=None,
+                    labels=list(dict.fromkeys(labels)),
+                    mention_count=existing.mention_count if existing is not None else 0,
+                )
+                self._put_entity(row, node.name_embedding)
+            elif isinstance(node, CommunityNode):
+                self._put_community(detached(node, name_embedding=None), node.name_embedding)
+            else:
+                raise ValueError(f'Unsupported node type: {type(node).__name__}')
+
+    async def save_edges(self, edges: Sequence[Edge]) -> None:
+        for edge in edges:
+            if isinstance(edge, EpisodicEdge):
+                entity = self.entities.rows.get(edge.target_node_uuid)
+                if edge.source_node_uuid not in self.episodes.rows or entity is None:
+                    continue
+                if edge.uuid not in self.mentions.rows:
+                    entity.mention_count += 1
+                self.mentions.put(detached(edge))
+            elif isinstance(edge, EntityEdge):
+                if (
+                    edge.source_node_uuid not in self.entities.rows
+                    or edge.target_node_uuid not in self.entities.rows
+                ):
+                    continue
+                row = detached(edge, fact_embedding=None, episode_count=len(edge.episodes))
+                self._put_fact(row, edge.fact_embedding)
+            elif isinstance(edge, CommunityEdge):
+                if edge.source_node_uuid not in self.communities.rows or (
+                    edge.target_node_uuid not in self.entities.rows
+                    and edge.target_node_uuid not in self.communities.rows
+                ):
+                    continue
+                self.memberships.put(detached(edge))
+            else:
+                raise ValueError(f'Unsupported edge type: {type(edge).__name__}')
+
+    async def delete_nodes(self, uuids: list[str]) -> None:
+        for uuid in uuids:
+            self._pop_node(uuid)
+
+    async def delete_edges(self, uuids: list[str]) -> None:
+        for uuid in uuids:
+            self._pop_edge(uuid)
+
+    async def delete_groups(self, group_ids: list[str] | None) -> None:
+        if group_ids is None:
+            self.clear()
+            return
+
+        for table in (self.episodes, self.entities, self.communities):
+            for uuid in list(table.uuids_in_groups(group_ids)):
+                self._pop_node(uuid)
+
+    async def delete_communities(self) -> None:
+        for uuid in list(self.communities.rows):
+            self._pop_node(uuid)
+
+    async def rebuild_mention_counts(self, group_ids: list[str] | None) -> None:
+        for entity in self.entities.in_groups(group_ids):
+            entity.mention_count = len(self.mentions.incoming.get(entity.uuid, ()))
+
+    async def build_indices(self, delete_existing: bool = False) -> None:
+        # Every index is maintained on write, so there is nothing to build
+        return None
+
+    # Lookups
+
+    async def get_nodes_by_uuids(
+        self, node_type: type[NodeT], uuids: list[str], include_embeddings: bool = False
+    ) -> list[NodeT]:
+        table = self._node_table(node_type)
+        return [
+            self._row(table.rows[uuid], include_embeddings)
+            for uuid in dict.fromkeys(uuids)
+            if uuid in table.rows
+        ]
+
+    async def get_nodes_by_group_ids(
+        self,
+        node_type: type[NodeT],
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[NodeT]:
+        return self._page(self._node_table(node_type), group_ids, limit, uuid_cursor)
+
+    async def get_edges_by_uuids(
+        self, edge_type: type[EdgeT], uuids: list[str], include_embeddings: bool = False
+    ) -> list[EdgeT]:
+        table = self._edge_table(edge_type)
+        return [
+            self._row(table.rows[uuid], include_embeddings)
+            for uuid in dict.fromkeys(uuids)
+            if uuid in table.rows
+        ]
+
+    async def get_edges_by_group_ids(
+        self,
+        edge_type: type[EdgeT],
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[EdgeT]:
+        return self._page(self._edge_table(edge_type), group_ids, limit, uuid_cursor)
+
+    def _page(
+        self, table: Table, group_ids: list[str], limit: int | None, uuid_cursor: str | None
+    ) -> list[Any]:
+        uuids = sorted(
+            (
+                uuid
+                for uuid in table.uuids_in_groups(group_ids)
+                if uuid_cursor is None or uuid < uuid_cursor
+            ),
+            reverse=True,
+        )
+        return [self._row(table.rows[uuid]) for uuid in uuids[:limit]]
+
+    async def get_entity_group_ids(self) -> list[str]:
+        return list(self.entities.groups)
+
+    async def get_episodic_nodes_by_entity_node_uuid(
+        self, entity_node_uuid: str
+    ) -> list[EpisodicNode]:
+        episode_uuids = [
+            self.mentions.rows[edge_uuid].source_node_uuid
+            for edge_uuid in self.mentions.incoming.get(entity_node_uuid, ())
+        ]
+        return [detached(self.episodes.rows[uuid]) for uuid in dict.fromkeys(episode_uuids)]
+
+    async def get_entity_edges_by_node_uuid(self, node_uuid: str) -> list[EntityEdge]:
+        return [self._fact(self.facts.rows[uuid]) for uuid in self.facts.by_node(node_uuid)]
+
+    async def get_entity_neighbor_uuids(self, node_uuids: list[str]) -> list[str]:
+        neighbor_uuids: dict[str, None] = {}
+        for node_uuid in node_uuids:
+            for edge_uuid in self.facts.by_node(node_uuid):
+                edge = self.facts.rows[edge_uuid]
+                for uuid in (edge.source_node_uuid, edge.target_node_uuid):
+                    if uuid != node_uuid:
+                        neighbor_uuids[uuid] = None
+        return list(neighbor_uuids)
+
+    async def get_mentioned_nodes(self, episode_uuids: list[str]) -> list[EntityNode]:
+        entity_uuids = [
+            self.mentions.rows[edge_uuid].target_node_uuid
+            for episode_uuid in episode_uuids
+            for edge_uuid in self.mentions.outgoing.get(episode_uuid, ())
+        ]
+        return [self._entity(self.entities.rows[uuid]) for uuid in dict.fromkeys(entity_uuids)]
+
+    async def get_communities_by_nodes(self, node_uuids: list[str]) -> list[CommunityNode]:
+        community_uuids = [
+            self.memberships.rows[edge_uuid].source_node_uuid
+            for node_uuid in node_uuids
+            for edge_uuid in self.memberships.incoming.get(node_uuid, ())
+        ]
+        return [
+            self._community(self.communities.rows[uuid]) for uuid in dict.fromkeys(community_uuids)
+        ]
+
+    async def retrieve_episodes(
+        self,
+        reference_time: datetime,
+        last_n: int,
+        group_ids: list[str] | None = None,
+        source: EpisodeType | None = None,
+    ) -> list[EpisodicNode]:
+        episodes = [
+            episode
+            for episode in self.episodes.in_groups(group_ids or None)
+            if episode.valid_at <= reference_time and (source is None or episode.source == source)
+        ]
+        episodes.sort(key=lambda episode: episode.valid_at, reverse=True)
+        return [detached(episode) for episode in episodes[:last_n]]
+
+    # Search
+
+    async def node_fulltext_search(
+        self, query: str, search_filter: SearchFilters, group_ids: list[str] | None, limit: int
+    ) -> list[EntityNode]:
+        nodes = (self.entities.rows[uuid] for uuid, _ in self.node_name_and_summary.search(query))
+        matches = (
+            node
+            for node in nodes
+            if (group_ids is None or node.group_id in group_ids)
+            and self._node_matches(node, search_filter)
+        )
+        return [self._entity(node) for node in islice(matches, limit)]
+
+    async def node_similarity_search(
+        self,
+        search_vector: list[float],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[EntityNode]:
+        hits = self.entity_name_vectors.search(
+            search_vector,
+            min_score,
+            None if group_ids is None else self.entities.uuids_in_groups(group_ids),
+        )
+        matches = (
+            node
+            for node in (self.entities.rows[uuid] for uuid, _ in hits)
+            if self._node_matches(node, search_filter)
+        )
+        return [self._entity(node, include_embeddings) for node in islice(matches, limit)]
+
+    async def edge_fulltext_search(
+        self, query: str, search_filter: SearchFilters, group_ids: list[str] | None, limit: int
+    ) -> list[EntityEdge]:
+        edges = (self.facts.rows[uuid] for uuid, _ in self.edge_name_and_fact.search(query))
+        matches = (
+            edge
+            for edge in edges
+            if (group_ids is None or edge.group_id in group_ids)
+            and self._edge_matches(edge, search_filter)
+        )
+        return [self._fact(edge) for edge in islice(matches, limit)]
+
+    async def edge_similarity_search(
+        self,
+        search_vector: list[float],
+        source_node_uuid: str | None,
+        target_node_uuid: str | None,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[EntityEdge]:
+        endpoint_uuids = {uuid for uuid in (source_node_uuid, target_node_uuid) if uuid is not None}
+        candidate_uuids: Iterable[str] | None = None
+        if len(endpoint_uuids) > 0:
+            # Either end of the fact must be one of the given nodes
+            candidate_uuids = [
+                edge_uuid
+                for edge_uuid in dict.fromkeys(
+                    edge_uuid
+                    for node_uuid in endpoint_uuids
+                    for edge_uuid in self.facts.by_node(node_uuid)
+                )
+                if (group_ids is None or self.facts.rows[edge_uuid].group_id in group_ids)
+                and (
+                    source_node_uuid is None
+                    or self.facts.rows[edge_uuid].source_node_uuid in endpoint_uuids
+                )
+                and (
+                    target_node_uuid is None
+                    or self.facts.rows[edge_uuid].target_node_uuid in endpoint_uuids
+                )
+            ]
+        elif group_ids is not None:
+            candidate_uuids = self.facts.uuids_in_groups(group_ids)
+
+        hits = self.fact_vectors.search(search_vector, min_score, candidate_uuids)
+        matches = (
+            edge
+            for edge in (self.facts.rows[uuid] for uuid, _ in hits)
+            if self._edge_matches(edge, search_filter)
+        )
+        return [self._fact(edge, include_embeddings) for edge in islice(matches, limit)]
+
+    async def episode_fulltext_search(
+        self, query: str, group_ids: list[str] | None, limit: int
+    ) -> list[EpisodicNode]:
+        episodes = (self.episodes.rows[uuid] for uuid, _ in self.episode_content.search(query))
+        matches = (
+            episode for episode in episodes if group_ids is None or episode.group_id in group_ids
+        )
+        return [detached(episode) for episode in islice(matches, limit)]
+
+    async def community_fulltext_search(
+        self, query: str, group_ids: list[str] | None, limit: int
+    ) -> list[CommunityNode]:
+        communities = (self.communities.rows[uuid] for uuid, _ in self.community_name.search(query))
+        matches = (
+            community
+            for community in communities
+            if group_ids is None or community.group_id in group_ids
+        )
+        return [self._community(community, True) for community in islice(matches, limit)]
+
+    async def community_similarity_search(
+        self, search_vector: list[float], group_ids: list[str] | None, limit: int, min_score: float
+    ) -> list[CommunityNode]:
+        hits = self.community_name_vectors.search(
+            search_vector,
+            min_score,
+            None if group_ids is None else self.communities.uuids_in_groups(group_ids),
+        )
+        return [self._community(self.communities.rows[uuid], True) for uuid, _ in hits[:limit]]
+
+    def _outgoing(self, origin_uuid: str) -> Iterator[tuple[Edge, EntityNode]]:
+        # Facts and mentions leading from an entity or episode to entities of the same group
+        origin = self.entities.rows.get(origin_uuid) or self.episodes.rows.get(origin_uuid)
+        if origin is None:
+            return
+
+        for table in (self.facts, self.mentions):
+            for edge_uuid in table.outgoing.get(origin_uuid, ()):
+                edge = table.rows[edge_uuid]
+                target = self.entities.rows.get(edge.target_node_uuid)
+                if target is not None and target.group_id == origin.group_id:
+                    yield edge, target
+
+    async def edge_bfs_search(
+        self,
+        bfs_origin_node_uuids: list[str],
+        bfs_max_depth: int,
+        search_filter: SearchFilters,
+        limit: int,
+        max_frontier: int,
+    ) -> list[EntityEdge]:
+        edges: list[EntityEdge] = []
+        visited_node_uuids = set(bfs_origin_node_uuids)
+        visited_edge_uuids: set[str] = set()
+        frontier = list(dict.fromkeys(bfs_origin_node_uuids))[:max_frontier]
+        for _ in range(bfs_max_depth):
+            if len(frontier) == 0 or len(edges) >= limit:
+                break
+
+            level = {
+                edge.uuid: (edge, target)
+                for origin_uuid in frontier
+                for edge, target in self._outgoing(origin_uuid)
+                if edge.uuid not in visited_edge_uuids
+            }
+
+            frontier = []
+            for edge, target in islice(level.values(), limit - len(edges) + max_frontier):
+                visited_edge_uuids.add(edge.uuid)
+                if (
+                    isinstance(edge, EntityEdge)
+                    and len(edges) < limit
+                    and self._edge_matches(edge, search_filter)
+                ):
+                    edges.append(self._fact(edge))
+
+                if target.uuid not in visited_node_uuids:
+                    visited_node_uuids.add(target.uuid)
+                    if len(frontier) < max_frontier:
+                        frontier.append(target.uuid)
+
+        return edges
+
+    async def node_bfs_search(
+        self,
+        bfs_origin_node_uuids: list[str],
+        search_filter: SearchFilters,
+        bfs_max_depth: int,
+        limit: int,
+        max_frontier: int,
+    ) -> list[EntityNode]:
+        nodes: list[EntityNode] = []
+        visited_node_uuids = set(bfs_origin_node_uuids)
+        frontier = list(dict.fromkeys(bfs_origin_node_uuids))[:max_frontier]
+        for _ in range(bfs_max_depth):
+            if len(frontier) == 0 or len(nodes) >= limit:
+                break
+
+            level = {
+                target.uuid: target
+                for origin_uuid in frontier
+                for _, target in self._outgoing(origin_uuid)
+                if target.uuid not in visited_node_uuids
+            }
+
+            frontier = []
+            for target in islice(level.values(), limit - len(nodes) + max_frontier):
+                visited_node_uuids.add(target.uuid)
+                if len(nodes) < limit and self._node_matches(target, search_filter):
+                    nodes.append(self._entity(target))
+                if len(frontier) < max_frontier:
+                    frontier.append(target.uuid)
+
+        return nodes
+
+    async def get_relevant_nodes(
+        self,
+        nodes: list[EntityNode],
+        queries: list[str],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[list[EntityNode]]:
+        group_id = nodes[0].group_id
+        group_uuids = list(self.entities.groups.get(group_id, ()))
+
+        relevant_nodes: list[list[EntityNode]] = []
+        for node, query in zip(nodes, queries, strict=True):
+            vector_uuids: list[str] = []
+            if node.name_embedding is not None:
+                vector_uuids = [
+                    uuid
+                    for uuid, _ in self.entity_name_vectors.search(
+                        node.name_embedding, min_score, group_uuids
+                    )
+                    if self._node_matches(self.entities.rows[uuid], search_filter)
+                ]
+
+            # The fulltext candidates are neither filtered nor scored against the embedding
+            fulltext_uuids = [
+                uuid
+                for uuid, _ in self.node_name_and_summary.search(query)
+                if self.entities.rows[uuid].group_id == group_id
+            ][:limit]
+
+            matched_uuids = set(vector_uuids)
+            uuids = vector_uuids[:limit] + [
+                uuid for uuid in fulltext_uuids if uuid not in matched_uuids
+            ]
+            relevant_nodes.append([self._entity(self.entities.rows[uuid], True) for uuid in uuids])
+
+        return relevant_nodes
+
+    def _similar_facts(
+        self,
+        edge: EntityEdge,
+        candidate_uuids: Iterable[str],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[EntityEdge]:
+        if edge.fact_embedding is None:
+            return []
+
+        candidates = [
+            uuid
+            for uuid in candidate_uuids
+            if self.facts.rows[uuid].group_id == edge.group_id
+            and self._edge_matches(self.facts.rows[uuid], search_filter)
+        ]
+        hits = self.fact_vectors.search(edge.fact_embedding, min_score, candidates)
+        return [self._fact(self.facts.rows[uuid], True) for uuid, _ in hits[:limit]]
+
+    async def get_relevant_edges(
+        self, edges: list[EntityEdge], search_filter: SearchFilters, min_score: float, limit: int
+    ) -> list[list[EntityEdge]]:
+        relevant_edges: list[list[EntityEdge]] = []
+        for edge in edges:
+            endpoints = {edge.source_node_uuid, edge.target_node_uuid}
+            between_uuids = [
+                uuid
+                for uuid in self.facts.by_node(edge.source_node_uuid)
+                if {
+                    self.facts.rows[uuid].source_node_uuid,
+                    self.facts.rows[uuid].target_node_uuid,
+                }
+                == endpoints
+            ]
+            relevant_edges.append(
+                self._similar_facts(edge, between_uuids, search_filter, min_score, limit)
+            )
+
+        return relevant_edges
+
+    async def get_edge_invalidation_candidates(
+        self, edges: list[EntityEdge], search_filter: SearchFilters, min_score: float, limit: int
+    ) -> list[list[EntityEdge]]:
+        invalidation_edges: list[list[EntityEdge]] = []
+        for edge in edges:
+            touching_uuids = dict.fromkeys(
+                self.facts.by_node(edge.source_node_uuid)
+                + self.facts.by_node(edge.target_node_uuid)
+            )
+            invalidation_edges.append(
+                self._similar_facts(edge, touching_uuids, search_filter, min_score, limit)
+            )
+
+        return invalidation_edges
+
+    # Snapshots
+
+    def save(self, path: str):
+        """
+        Write the graph to a compressed NumPy .npz archive, holding a JSON manifest of the rows and
+        the embedding matrix of each vector index.
+        """
+        manifest = {
+            'version': SNAPSHOT_VERSION,
+            'episodes': [row.model_dump(mode='json') for row in self.episodes.rows.values()],
+            'entities': [row.model_dump(mode='json') for row in self.entities.rows.values()],
+            'communities': [row.model_dump(mode='json') for row in self.communities.rows.values()],
+            'mentions': [row.model_dump(mode='json') for row in self.mentions.rows.values()],
+            'facts': [row.model_dump(mode='json') for row in self.facts.rows.values()],
+            'memberships': [row.model_dump(mode='json') for row in self.memberships.rows.values()],
+        }
+        arrays: dict[str, Any] = {
+            'manifest': np.frombuffer(json.dumps(manifest).encode('utf-8'), dtype=np.uint8)
+        }
+        for name, index in self._vector_indices().items():
+            uuids = list(index.slots)
+            arrays[f'{name}_uuids'] = np.array(uuids, dtype=str)
+            arrays[f'{name}_vectors'] = (
+                index.vectors[[index.slots[uuid] for uuid in uuids]]
+                if len(uuids) > 0
+                else np.zeros((0, 0), dtype=np.float32)
+            )
+
+        np.savez_compressed(path, **arrays)
+
+    def load(self, path: str):
+        """Replace the graph with a snapshot written by save."""
+        with np.load(path) as archive:
+            manifest = json.loads(archive['manifest'].tobytes().decode('utf-8'))
+            if manifest['version'] != SNAPSHOT_VERSION:
+                raise ValueError(f'Unsupported snapshot version: {manifest["version"]}')
+
+            embeddings: dict[str, dict[str, list[float]]] = {
+                name: dict(
+                    zip(
+                        archive[f'{name}_uuids'].tolist(),
+                        archive[f'{name}_vectors'].tolist(),
+                        strict=True,
+                    )
+                )
+                for name in self._vector_indices()
+            }
+
+        self.clear()
+        for row in manifest['episodes']:
+            self._put_episode(EpisodicNode.model_validate(row))
+        for row in manifest['entities']:
+            node = EntityNode.model_validate(row)
+            self._put_entity(node, embeddings['entity_names'].get(node.uuid))
+        for row in manifest['communities']:
+            node = CommunityNode.model_validate(row)
+            self._put_community(node, embeddings['community_names'].get(node.uuid))
+        for row in manifest['mentions']:
+            self.mentions.put(EpisodicEdge.model_validate(row))
+        for row in manifest['facts']:
+            edge = EntityEdge.model_validate(row)
+            self._put_fact(edge, embeddings['facts'].get(edge.uuid))
+        for row in manifest['memberships']:
+            self.memberships.put(CommunityEdge.model_validate(row))
+
+    def _vector_indices(self) -> dict[str, VectorIndex]:
+        return {
+            'entity_names': self.entity_name_vectors,
+            'community_names': self.community_name_vectors,
+            'facts': self.fact_vectors,
+        }
+
+
+class InMemoryDriverSession(GraphDriverSession):
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def run(self, query: str, **kwargs: Any) -> Any:
+        raise NotImplementedError('InMemoryDriver does not run Cypher, use driver.operations')
+
+    async def close(self):
+        pass
+
+    async def execute_write(self, func, *args, **kwargs):
+        return await func(self, *args, **kwargs)
+
+
+class InMemoryDriver(GraphDriver):
+    """
+    In-process graph backend that needs no database service.
+
+    Graphiti talks to it through driver.operations rather than Cypher. The graph lives in
+    memory and can be persisted with save(path) and restored with InMemoryDriver.load(path).
+    Set ann=True to search embeddings through an inverted file index instead of an exact scan,
+    which pays off once an index holds tens of thousands of vectors.
+    """
+
+    provider: str = 'memory'
+
+    def __init__(self, ann: bool = False, n_probe: int = DEFAULT_N_PROBE):
+        super().__init__()
+        self.operations: InMemoryGraphOperations = InMemoryGraphOperations(ann, n_probe)
+
+    async def execute_query(self, cypher_query_: str, **kwargs: Any):
+        raise NotImplementedError('InMemoryDriver does not run Cypher, use driver.operations')
+
+    def session(self, database: str | None = None) -> GraphDriverSession:
+        return InMemoryDriverSession()
+
+    async def close(self):
+        pass
+
+    async def delete_all_indexes(self, database_: str | None = None):
+        # The indices are part of the in-memory tables and cannot be dropped
+        pass
+
+    def save(self, path: str):
+        self.operations.save(path)
+
+    @classmethod
+    def load(cls, path: str, ann: bool = False, n_probe: int = DEFAULT_N_PROBE) -> 'InMemoryDriver':
+        driver = cls(ann, n_probe)
+        driver.operations.load(path)
+        return driver
@@ -0,0 +1,257 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+
+TERM_PATTERN = re.compile(r'\w+')
+
+# Lucene's BM25 defaults, so scores rank like the Neo4j fulltext indices
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+# The inverted file index is only trained once an index holds this many vectors
+MIN_ANN_VECTORS = 1024
+KMEANS_ITERATIONS = 10
+
+
+def tokenize(text: str) -> list[str]:
+    return TERM_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """Inverted index scoring documents against OR-ed query terms with Okapi BM25."""
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        self.k1 = k1
+        self.b = b
+        self.postings: defaultdict[str, dict[str, int]] = defaultdict(dict)
+        self.documents: dict[str, Counter[str]] = {}
+        self.lengths: dict[str, int] = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, uuid: str, text: str):
+        self.remove(uuid)
+        terms = Counter(tokenize(text))
+        self.documents[uuid] = terms
+        self.lengths[uuid] = sum(terms.values())
+        self.total_length += self.lengths[uuid]
+        for term, count in terms.items():
+            self.postings[term][uuid] = count
+
+    def remove(self, uuid: str):
+        terms = self.documents.pop(uuid, None)
+        if terms is None:
+            return
+
+        self.total_length -= self.lengths.pop(uuid)
+        for term in terms:
+            posting = self.postings[term]
+            del posting[uuid]
+            if len(posting) == 0:
+                del self.postings[term]
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """All documents matching any query term, best first."""
+        if len(self.documents) == 0:
+            return []
+
+        average_length = self.total_length / len(self.documents)
+        scores: defaultdict[str, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+
+            idf = math.log(1 + (len(self.documents) - len(posting) + 0.5) / (len(posting) + 0.5))
+            for uuid, count in posting.items():
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[uuid] / average_length)
+                scores[uuid] += idf * count * (self.k1 + 1) / (count + norm)
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+class VectorIndex:
+    """
+    Float32 embedding matrix with cosine similarity search.
+
+    Each uuid owns a row of the matrix, and rows freed by deletes are reused. Search is an exact
+    scan by default. With ann=True, once the index holds MIN_ANN_VECTORS vectors it is
+    partitioned with k-means into an inverted file, and a search only scores the vectors of the
+    n_probe partitions whose centroids are closest to the query. The partitions are retrained
+    whenever the index doubles in size.
+    """
+
+    def __init__(self, ann: bool = False, n_probe: int = 8):
+        self.ann = ann
+        self.n_probe = n_probe
+        self.slots: dict[str, int] = {}
+        self.uuids: list[str | None] = []
+        self.free_slots: list[int] = []
+        self.dimensions: int | None = None
+        self.vectors: NDArray[np.float32] = np.zeros((0, 0), dtype=np.float32)
+        self.norms: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        self.centroids: NDArray[np.float32] | None = None
+        self.partitions: NDArray[np.int32] = np.zeros(0, dtype=np.int32)
+        self.trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self.slots
+
+    def add(self, uuid: str, vector: list[float]):
+        array = np.asarray(vector, dtype=np.float32)
+        if self.dimensions is None:
+            self.dimensions = len(array)
+            self.vectors = np.zeros((0, self.dimensions), dtype=np.float32)
+        elif len(array) != self.dimensions:
+            raise ValueError(
+                f'Embedding of {uuid} has {len(array)} dimensions, expected {self.dimensions}'
+            )
+
+        slot = self.slots.get(uuid)
+        if slot is None:
+            slot = self.free_slots.pop() if self.free_slots else self._append_slot()
+            self.slots[uuid] = slot
+            self.uuids[slot] = uuid
+
+        self.vectors[slot] = array
+        self.norms[slot] = np.linalg.norm(array)
+        if self.centroids is not None:
+            self.partitions[slot] = self._nearest_partitions(array, 1)[0]
+
+    def remove(self, uuid: str):
+        slot = self.slots.pop(uuid, None)
+        if slot is None:
+            return
+
+        self.uuids[slot] = None
+        self.norms[slot] = 0
+        self.free_slots.append(slot)
+
+    def get(self, uuid: str) -> list[float] | None:
+        slot = self.slots.get(uuid)
+        if slot is None:
+            return None
+        return self.vectors[slot].tolist()
+
+    def items(self) -> Iterable[tuple[str, NDArray[np.float32]]]:
+        for uuid, slot in self.slots.items():
+            yield uuid, self.vectors[slot]
+
+    def search(
+        self,
+        query: list[float],
+        min_score: float,
+        uuids: Iterable[str] | None = None,
+        exact: bool = False,
+    ) -> list[tuple[str, float]]:
+        """
+        Vectors scoring above min_score against the query, best first.
+
+        Scores are normalized cosine similarities (1 + cos) / 2, as returned by Neo4j's
+        vector.similarity.cosine. If uuids is given, only those vectors are scored. exact skips
+        the inverted file, for searches whose uuids are already few enough to scan.
+        """
+        if len(self.slots) == 0:
+            return []
+
+        query_array = np.asarray(query, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query_array))
+        if len(query_array) != self.dimensions or query_norm == 0:
+            return []
+
+        if uuids is None:
+            candidates = np.flatnonzero(self.norms[: len(self.uuids)] > 0)
+        else:
+            candidates = np.fromiter(
+                (self.slots[uuid] for uuid in uuids if uuid in self.slots), dtype=np.int64
+            )
+            candidates = candidates[self.norms[candidates] > 0]
+
+        if self.ann and not exact:
+            self._train_if_stale()
+        if self.centroids is not None and not exact:
+            probed = self._nearest_partitions(query_array / query_norm, self.n_probe)
+            candidates = candidates[np.isin(self.partitions[candidates], probed)]
+
+        if len(candidates) == 0:
+            return []
+
+        cosines = (self.vectors[candidates] @ query_array) / (self.norms[candidates] * query_norm)
+        scores = (1 + cosines) / 2
+        hits = np.flatnonzero(scores > min_score)
+        order = hits[np.argsort(-scores[hits], kind='stable')]
+
+        return [(self.uuids[candidates[i]], float(scores[i])) for i in order]  # type: ignore
+
+    def _append_slot(self) -> int:
+        slot = len(self.uuids)
+        if slot == len(self.vectors):
+            capacity = max(16, 2 * len(self.vectors))
+            vectors = np.zeros((capacity, self.dimensions or 0), dtype=np.float32)
+            vectors[:slot] = self.vectors
+            self.vectors = vectors
+            self.norms = np.resize(self.norms, capacity)
+            self.norms[slot:] = 0
+            self.partitions = np.resize(self.partitions, capacity)
+
+        self.uuids.append(None)
+        return slot
+
+    def _nearest_partitions(self, unit_vector: NDArray[np.float32], count: int) -> NDArray:
+        assert self.centroids is not None
+        similarities = self.centroids @ unit_vector
+        if count >= len(similarities):
+            return np.arange(len(similarities))
+        return np.argpartition(-similarities, count)[:count]
+
+    def _train_if_stale(self):
+        if len(self.slots) < MIN_ANN_VECTORS or len(self.slots) < 2 * self.trained_size:
+            return
+
+        slots = np.fromiter(self.slots.values(), dtype=np.int64)
+        slots = slots[self.norms[slots] > 0]
+        if len(slots) == 0:
+            return
+
+        units = self.vectors[slots] / self.norms[slots, None]
+        n_partitions = max(1, int(math.sqrt(len(slots))))
+
+        # Spherical k-means, seeded deterministically so searches are reproducible
+        rng = np.random.default_rng(0)
+        centroids = units[rng.choice(len(units), n_partitions, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            assignments = np.argmax(units @ centroids.T, axis=1)
+            for partition in range(n_partitions):
+                members = units[assignments == partition]
+                if len(members) > 0:
+                    centroid = members.sum(axis=0)
+                    centroids[partition] = centroid / max(np.linalg.norm(centroid), 1e-12)
+
+        self.centroids = centroids
+        self.partitions[slots] = np.argmax(units @ centroids.T, axis=1)
+        self.trained_size = len(self.slots)
@@ -16,12 +16,15 @@ limitations under the License.
 
 import logging
 from collections.abc import Coroutine
+from time import monotonic
 from typing import Any
 
-from neo4j import AsyncGraphDatabase, EagerResult
+from neo4j import AsyncGraphDatabase, EagerResult, Query
 from typing_extensions import LiteralString
 
-from graphiti_core.driver.driver import GraphDriver, GraphDriverSession
+from graphiti_core.driver.driver import GraphDriver, GraphDriverSession, query_timeout
+from graphiti_core.metrics import db_query_duration, query_fingerprint
+from graphiti_core.tracer import add_span_attributes, traced
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,7 @@ class Neo4jDriver(GraphDriver):
         )
         self._database = database
 
+    @traced('driver.execute_query')
     async def execute_query(self, cypher_query_: LiteralString, **kwargs: Any) -> EagerResult:
         # Check if database_ is provided in kwargs.
         # If not populated, set the value to retain backwards compatibility
@@ -45,7 +49,22 @@ class Neo4jDriver(GraphDriver):
             params = {}
         params.setdefault('database_', self._database)
 
-        result = await self.client.execute_query(cypher_query_, parameters_=params, **kwargs)
+        # Run the query as a transaction with a timeout when it is part of a deadline-bound search
+        timeout = query_timeout()
+        query: LiteralString | Query = (
+            cypher_query_ if timeout is None else Query(cypher_query_, timeout=timeout)
+        )
+
+        start = monotonic()
+        try:
+            result = await self.client.execute_query(query, parameters_=params, **kwargs)
+        finally:
+            db_query_duration.observe(
+                monotonic() - start,
+                provider=self.provider,
+                fingerprint=query_fingerprint(cypher_query_),
+            )
+        add_span_attributes({'db.provider': self.provider, 'db.record_count': len(result.records)})
 
         return result
 
@@ -0,0 +1,352 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+from typing import TypeVar
+
+from graphiti_core.edges import Edge, EntityEdge
+from graphiti_core.helpers import semaphore_gather
+from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode, Node
+from graphiti_core.search.search_filters import SearchFilters
+
+NodeT = TypeVar('NodeT', bound=Node)
+EdgeT = TypeVar('EdgeT', bound=Edge)
+
+
+class GraphOperations(ABC):
+    """
+    The graph queries Graphiti needs, expressed as domain-level calls instead of Cypher.
+
+    Drivers for backends that do not speak Cypher set GraphDriver.operations to an
+    implementation of this class, and every node, edge, search and maintenance helper calls it
+    instead of GraphDriver.execute_query. Implementations must keep the semantics of the Cypher
+    queries they replace: saves merge on uuid, saving an entity keeps its mention_count, creating
+    a MENTIONS edge increments the mention_count of its entity and deleting one (or its episode)
+    decrements it, and similarity scores are normalized cosine similarities in [0, 1].
+
+    Fulltext queries are passed already compiled by search_utils.fulltext_query.
+    """
+
+    # Writes
+
+    @abstractmethod
+    async def save_nodes(self, nodes: Sequence[Node]) -> None:
+        """Create or replace nodes, keyed by uuid."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def save_edges(self, edges: Sequence[Edge]) -> None:
+        """Create or replace edges, keyed by uuid. Edges whose endpoints do not exist are skipped."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_nodes(self, uuids: list[str]) -> None:
+        """Delete nodes of any type together with their edges."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_edges(self, uuids: list[str]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_groups(self, group_ids: list[str] | None) -> None:
+        """Delete every node in the given groups, or the whole graph if group_ids is None."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def delete_communities(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def rebuild_mention_counts(self, group_ids: list[str] | None) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def build_indices(self, delete_existing: bool = False) -> None:
+        raise NotImplementedError()
+
+    # Lookups
+
+    @abstractmethod
+    async def get_nodes_by_uuids(
+        self, node_type: type[NodeT], uuids: list[str], include_embeddings: bool = False
+    ) -> list[NodeT]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_nodes_by_group_ids(
+        self,
+        node_type: type[NodeT],
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[NodeT]:
+        """Nodes in the given groups ordered by descending uuid, starting below uuid_cursor."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_edges_by_uuids(
+        self, edge_type: type[EdgeT], uuids: list[str], include_embeddings: bool = False
+    ) -> list[EdgeT]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_edges_by_group_ids(
+        self,
+        edge_type: type[EdgeT],
+        group_ids: list[str],
+        limit: int | None = None,
+        uuid_cursor: str | None = None,
+    ) -> list[EdgeT]:
+        """Edges in the given groups ordered by descending uuid, starting below uuid_cursor."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_entity_group_ids(self) -> list[str]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_episodic_nodes_by_entity_node_uuid(
+        self, entity_node_uuid: str
+    ) -> list[EpisodicNode]:
+        """Episodes that mention the entity."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_entity_edges_by_node_uuid(self, node_uuid: str) -> list[EntityEdge]:
+        """Facts in either direction between the entity and other entities."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_entity_neighbor_uuids(self, node_uuids: list[str]) -> list[str]:
+        """Distinct entities connected to any of the given entities by a fact."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_mentioned_nodes(self, episode_uuids: list[str]) -> list[EntityNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_communities_by_nodes(self, node_uuids: list[str]) -> list[CommunityNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def retrieve_episodes(
+        self,
+        reference_time: datetime,
+        last_n: int,
+        group_ids: list[str] | None = None,
+        source: EpisodeType | None = None,
+    ) -> list[EpisodicNode]:
+        """The last_n episodes valid at reference_time, most recent first."""
+        raise NotImplementedError()
+
+    # Search
+
+    @abstractmethod
+    async def node_fulltext_search(
+        self, query: str, search_filter: SearchFilters, group_ids: list[str] | None, limit: int
+    ) -> list[EntityNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def node_similarity_search(
+        self,
+        search_vector: list[float],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[EntityNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def edge_fulltext_search(
+        self, query: str, search_filter: SearchFilters, group_ids: list[str] | None, limit: int
+    ) -> list[EntityEdge]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def edge_similarity_search(
+        self,
+        search_vector: list[float],
+        source_node_uuid: str | None,
+        target_node_uuid: str | None,
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[EntityEdge]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def episode_fulltext_search(
+        self, query: str, group_ids: list[str] | None, limit: int
+    ) -> list[EpisodicNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def community_fulltext_search(
+        self, query: str, group_ids: list[str] | None, limit: int
+    ) -> list[CommunityNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def community_similarity_search(
+        self, search_vector: list[float], group_ids: list[str] | None, limit: int, min_score: float
+    ) -> list[CommunityNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def edge_bfs_search(
+        self,
+        bfs_origin_node_uuids: list[str],
+        bfs_max_depth: int,
+        search_filter: SearchFilters,
+        limit: int,
+        max_frontier: int,
+    ) -> list[EntityEdge]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def node_bfs_search(
+        self,
+        bfs_origin_node_uuids: list[str],
+        search_filter: SearchFilters,
+        bfs_max_depth: int,
+        limit: int,
+        max_frontier: int,
+    ) -> list[EntityNode]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_relevant_nodes(
+        self,
+        nodes: list[EntityNode],
+        queries: list[str],
+        search_filter: SearchFilters,
+        min_score: float,
+        limit: int,
+    ) -> list[list[EntityNode]]:
+        """
+        Candidate duplicates of each node in the group of the first node: the limit most similar
+        entities by name embedding, followed by the other fulltext matches of its query.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_relevant_edges(
+        self, edges: list[EntityEdge], search_filter: SearchFilters, min_score: float, limit: int
+    ) -> list[list[EntityEdge]]:
+        """Similar facts between the same two entities as each edge."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_edge_invalidation_candidates(
+        self, edges: list[EntityEdge], search_filter: SearchFilters, min_score: float, limit: int
+    ) -> list[list[EntityEdge]]:
+        """Similar facts touching either entity of each edge."""
+        raise NotImplementedError()
+
+    # Batched searches, which backends can override to share work between queries
+
+    async def node_fulltext_search_many(
+        self,
+        queries: list[str],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[list[EntityNode]]:
+        return list(
+            await semaphore_gather(
+                *[
+                    self.node_fulltext_search(query, search_filter, group_ids, limit)
+                    for query in queries
+                ]
+            )
+        )
+
+    async def node_similarity_search_many(
+        self,
+        search_vectors: list[list[float]],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[list[EntityNode]]:
+        return list(
+            await semaphore_gather(
+                *[
+                    self.node_similarity_search(
+                        search_vector,
+                        search_filter,
+                        group_ids,
+                        limit,
+                        min_score,
+                        include_embeddings,
+                    )
+                    for search_vector in search_vectors
+                ]
+            )
+        )
+
+    async def edge_fulltext_search_many(
+        self,
+        queries: list[str],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+    ) -> list[list[EntityEdge]]:
+        return list(
+            await semaphore_gather(
+                *[
+                    self.edge_fulltext_search(query, search_filter, group_ids, limit)
+                    for query in queries
+                ]
+            )
+        )
+
+    async def edge_similarity_search_many(
+        self,
+        search_vectors: list[list[float]],
+        search_filter: SearchFilters,
+        group_ids: list[str] | None,
+        limit: int,
+        min_score: float,
+        include_embeddings: bool = False,
+    ) -> list[list[EntityEdge]]:
+        return list(
+            await semaphore_gather(
+                *[
+                    self.edge_similarity_search(
+                        search_vector,
+                        None,
+                        None,
+                        search_filter,
+                        group_ids,
+                        limit,
+                        min_score,
+                        include_embeddings,
+                    )
+                    for search_vector in search_vectors
+                ]
+            )
+        )
@@ -31,9 +31,13 @@ from graphiti_core.helpers import parse_db_date
 from graphiti_core.models.edges.edge_db_queries import (
     COMMUNITY_EDGE_SAVE,
     ENTITY_EDGE_SAVE,
+    EPISODIC_EDGE_DELETE,
     EPISODIC_EDGE_SAVE,
 )
 from graphiti_core.nodes import Node
+from graphiti_core.search.ann_sidecar import index_embeddings, remove_embeddings
+from graphiti_core.search.node_distance_cache import invalidate_node_distances
+from graphiti_core.search.search_cache import record_graph_write
 
 logger = logging.getLogger(__name__)
 
@@ -65,13 +69,19 @@ class Edge(BaseModel, ABC):
     async def save(self, driver: GraphDriver): ...
 
     async def delete(self, driver: GraphDriver):
-        result = await driver.execute_query(
-            """
-        MATCH (n)-[e:MENTIONS|RELATES_TO|HAS_MEMBER {uuid: $uuid}]->(m)
-        DELETE e
-        """,
-            uuid=self.uuid,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.delete_edges([self.uuid])
+        else:
+            result = await driver.execute_query(
+                """
+            MATCH (n)-[e:MENTIONS|RELATES_TO|HAS_MEMBER {uuid: $uuid}]->(m)
+            DELETE e
+            """,
+                uuid=self.uuid,
+            )
+        invalidate_node_distances(driver, [self.source_node_uuid, self.target_node_uuid])
+        remove_embeddings(driver, self.group_id, edge_uuids=[self.uuid])
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Deleted Edge: {self.uuid}')
 
@@ -91,21 +101,43 @@ class Edge(BaseModel, ABC):
 
 class EpisodicEdge(Edge):
     async def save(self, driver: GraphDriver):
-        result = await driver.execute_query(
-            EPISODIC_EDGE_SAVE,
-            episode_uuid=self.source_node_uuid,
-            entity_uuid=self.target_node_uuid,
-            uuid=self.uuid,
-            group_id=self.group_id,
-            created_at=self.created_at,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.save_edges([self])
+        else:
+            result = await driver.execute_query(
+                EPISODIC_EDGE_SAVE,
+                episode_uuid=self.source_node_uuid,
+                entity_uuid=self.target_node_uuid,
+                uuid=self.uuid,
+                group_id=self.group_id,
+                created_at=self.created_at,
+            )
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
         return result
 
+    async def delete(self, driver: GraphDriver):
+        # Also decrements the mention count of the entity
+        if driver.operations is not None:
+            result = await driver.operations.delete_edges([self.uuid])
+        else:
+            result = await driver.execute_query(EPISODIC_EDGE_DELETE, uuid=self.uuid)
+        record_graph_write(driver, [self.group_id])
+
+        logger.debug(f'Deleted Edge: {self.uuid}')
+
+        return result
+
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
+        if driver.operations is not None:
+            edges = await driver.operations.get_edges_by_uuids(cls, [uuid])
+            if len(edges) == 0:
+                raise EdgeNotFoundError(uuid)
+            return edges[0]
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Episodic)-[e:MENTIONS {uuid: $uuid}]->(m:Entity)
@@ -128,6 +160,12 @@ class EpisodicEdge(Edge):
 
     @classmethod
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
+        if driver.operations is not None:
+            edges = await driver.operations.get_edges_by_uuids(cls, uuids)
+            if len(edges) == 0:
+                raise EdgeNotFoundError(uuids[0])
+            return edges
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Episodic)-[e:MENTIONS]->(m:Entity)
@@ -157,6 +195,14 @@ class EpisodicEdge(Edge):
         limit: int | None = None,
         uuid_cursor: str | None = None,
     ):
+        if driver.operations is not None:
+            edges = await driver.operations.get_edges_by_group_ids(
+                cls, group_ids, limit, uuid_cursor
+            )
+            if len(edges) == 0:
+                raise GroupsEdgesNotFoundError(group_ids)
+            return edges
+
         cursor_query: LiteralString = 'AND e.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
 
@@ -197,6 +243,10 @@ class EntityEdge(Edge):
         default=[],
         description='list of episode ids that reference these entity edges',
     )
+    episode_count: int = Field(
+        default=0,
+        description='number of episodes that reference the edge, stored with the edge on save',
+    )
     expired_at: datetime | None = Field(
         default=None, description='datetime of when the node was invalidated'
     )
@@ -222,6 +272,15 @@ class EntityEdge(Edge):
         return self.fact_embedding
 
     async def load_fact_embedding(self, driver: GraphDriver):
+        if driver.operations is not None:
+            edges = await driver.operations.get_edges_by_uuids(
+                EntityEdge, [self.uuid], include_embeddings=True
+            )
+            if len(edges) == 0:
+                raise EdgeNotFoundError(self.uuid)
+            self.fact_embedding = edges[0].fact_embedding
+            return
+
         query: LiteralString = """
             MATCH (n:Entity)-[e:RELATES_TO {uuid: $uuid}]->(m:Entity)
             RETURN e.fact_embedding AS fact_embedding
@@ -234,6 +293,7 @@ class EntityEdge(Edge):
         self.fact_embedding = records[0]['fact_embedding']
 
     async def save(self, driver: GraphDriver):
+        self.episode_count = len(self.episodes)
         edge_data: dict[str, Any] = {
             'source_uuid': self.source_node_uuid,
             'target_uuid': self.target_node_uuid,
@@ -243,6 +303,7 @@ class EntityEdge(Edge):
             'fact': self.fact,
             'fact_embedding': self.fact_embedding,
             'episodes': self.episodes,
+            'episode_count': self.episode_count,
             'created_at': self.created_at,
             'expired_at': self.expired_at,
             'valid_at': self.valid_at,
@@ -251,10 +312,16 @@ class EntityEdge(Edge):
 
         edge_data.update(self.attributes or {})
 
-        result = await driver.execute_query(
-            ENTITY_EDGE_SAVE,
-            edge_data=edge_data,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.save_edges([self])
+        else:
+            result = await driver.execute_query(
+                ENTITY_EDGE_SAVE,
+                edge_data=edge_data,
+            )
+        invalidate_node_distances(driver, [self.source_node_uuid, self.target_node_uuid])
+        index_embeddings(driver, edges=[self])
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
@@ -262,6 +329,12 @@ class EntityEdge(Edge):
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
+        if driver.operations is not None:
+            edges = await driver.operations.get_edges_by_uuids(cls, [uuid])
+            if len(edges) == 0:
+                raise EdgeNotFoundError(uuid)
+            return edges[0]
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Entity)-[e:RELATES_TO {uuid: $uuid}]->(m:Entity)
@@ -282,6 +355,9 @@ class EntityEdge(Edge):
         if len(uuids) == 0:
             return []
 
+        if driver.operations is not None:
+            return await driver.operations.get_edges_by_uuids(cls, uuids)
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Entity)-[e:RELATES_TO]->(m:Entity)
@@ -304,6 +380,14 @@ class EntityEdge(Edge):
         limit: int | None = None,
         uuid_cursor: str | None = None,
     ):
+        if driver.operations is not None:
+            edges = await driver.operations.get_edges_by_group_ids(
+                cls, group_ids, limit, uuid_cursor
+            )
+            if len(edges) == 0:
+                raise GroupsEdgesNotFoundError(group_ids)
+            return edges
+
         cursor_query: LiteralString = 'AND e.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
 
@@ -332,6 +416,9 @@ class EntityEdge(Edge):
 
     @classmethod
     async def get_by_node_uuid(cls, driver: GraphDriver, node_uuid: str):
+        if driver.operations is not None:
+            return await driver.operations.get_entity_edges_by_node_uuid(node_uuid)
+
         query: LiteralString = (
             """
                                                         MATCH (n:Entity {uuid: $node_uuid})-[e:RELATES_TO]-(m:Entity)
@@ -347,14 +434,18 @@ class EntityEdge(Edge):
 
 class CommunityEdge(Edge):
     async def save(self, driver: GraphDriver):
-        result = await driver.execute_query(
-            COMMUNITY_EDGE_SAVE,
-            community_uuid=self.source_node_uuid,
-            entity_uuid=self.target_node_uuid,
-            uuid=self.uuid,
-            group_id=self.group_id,
-            created_at=self.created_at,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.save_edges([self])
+        else:
+            result = await driver.execute_query(
+                COMMUNITY_EDGE_SAVE,
+                community_uuid=self.source_node_uuid,
+                entity_uuid=self.target_node_uuid,
+                uuid=self.uuid,
+                group_id=self.group_id,
+                created_at=self.created_at,
+            )
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Saved edge to Graph: {self.uuid}')
 
@@ -362,6 +453,12 @@ class CommunityEdge(Edge):
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
+        if driver.operations is not None:
+            edges = await driver.operations.get_edges_by_uuids(cls, [uuid])
+            if len(edges) == 0:
+                raise EdgeNotFoundError(uuid)
+            return edges[0]
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Community)-[e:HAS_MEMBER {uuid: $uuid}]->(m:Entity | Community)
@@ -382,6 +479,9 @@ class CommunityEdge(Edge):
 
     @classmethod
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
+        if driver.operations is not None:
+            return await driver.operations.get_edges_by_uuids(cls, uuids)
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Community)-[e:HAS_MEMBER]->(m:Entity | Community)
@@ -409,6 +509,11 @@ class CommunityEdge(Edge):
         limit: int | None = None,
         uuid_cursor: str | None = None,
     ):
+        if driver.operations is not None:
+            return await driver.operations.get_edges_by_group_ids(
+                cls, group_ids, limit, uuid_cursor
+            )
+
         cursor_query: LiteralString = 'AND e.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
 
@@ -463,6 +568,7 @@ def get_entity_edge_from_record(record: Any) -> EntityEdge:
         expired_at=parse_db_date(record['expired_at']),
         valid_at=parse_db_date(record['valid_at']),
         invalid_at=parse_db_date(record['invalid_at']),
+        fact_embedding=record.get('fact_embedding'),
         attributes=record['attributes'],
     )
 
@@ -477,6 +583,8 @@ def get_entity_edge_from_record(record: Any) -> EntityEdge:
     edge.attributes.pop('expired_at', None)
     edge.attributes.pop('valid_at', None)
     edge.attributes.pop('invalid_at', None)
+    # Edges saved before episode_count was stored fall back to their episodes list
+    edge.episode_count = edge.attributes.pop('episode_count', None) or len(edge.episodes)
 
     return edge
 
@@ -19,6 +19,8 @@ from typing import Any
 
 from openai import AsyncAzureOpenAI
 
+from ..metrics import embedding_batch_size, provider_label
+from ..tracer import traced
 from .client import EmbedderClient
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,7 @@ class AzureOpenAIEmbedderClient(EmbedderClient):
         self.azure_client = azure_client
         self.model = model
 
+    @traced('embedder.create', count_results=False)
     async def create(self, input_data: str | list[str] | Any) -> list[float]:
         """Create embeddings using Azure OpenAI client."""
         try:
@@ -51,8 +54,10 @@ class AzureOpenAIEmbedderClient(EmbedderClient):
             logger.error(f'Error in Azure OpenAI embedding: {e}')
             raise
 
+    @traced('embedder.create_batch')
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
         """Create batch embeddings using Azure OpenAI client."""
+        embedding_batch_size.observe(len(input_data_list), provider=provider_label(self))
         try:
             response = await self.azure_client.embeddings.create(
                 model=self.model, input=input_data_list
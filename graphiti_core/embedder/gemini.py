@@ -34,6 +34,8 @@ else:
 
 from pydantic import Field
 
+from ..metrics import embedding_batch_size, provider_label
+from ..tracer import traced
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'embedding-001'
@@ -130,6 +132,7 @@ class GeminiEmbedder(EmbedderClient):
                 else:
                     raise ValueError("No valid embeddings received from API")
 
+    @traced('embedder.create', count_results=False)
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
     ) -> list[float]:
@@ -169,7 +172,9 @@ class GeminiEmbedder(EmbedderClient):
 
         return result.embeddings[0].values
 
+    @traced('embedder.create_batch')
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        embedding_batch_size.observe(len(input_data_list), provider=provider_label(self))
         # Check if we should use custom endpoint
         if self.use_custom_endpoint and self.base_url:
             result = await self._call_custom_embedding_endpoint(input_data_list)
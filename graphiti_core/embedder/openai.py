@@ -19,6 +19,8 @@ from collections.abc import Iterable
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 from openai.types import EmbeddingModel
 
+from ..metrics import embedding_batch_size, provider_label
+from ..tracer import traced
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'text-embedding-3-small'
@@ -51,6 +53,7 @@ class OpenAIEmbedder(EmbedderClient):
         else:
             self.client = AsyncOpenAI(api_key=config.api_key, base_url=config.base_url)
 
+    @traced('embedder.create', count_results=False)
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
     ) -> list[float]:
@@ -59,7 +62,9 @@ class OpenAIEmbedder(EmbedderClient):
         )
         return result.data[0].embedding[: self.config.embedding_dim]
 
+    @traced('embedder.create_batch')
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        embedding_batch_size.observe(len(input_data_list), provider=provider_label(self))
         result = await self.client.embeddings.create(
             input=input_data_list, model=self.config.embedding_model
         )
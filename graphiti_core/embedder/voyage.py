@@ -30,6 +30,8 @@ else:
 
 from pydantic import Field
 
+from ..metrics import embedding_batch_size, provider_label
+from ..tracer import traced
 from .client import EmbedderClient, EmbedderConfig
 
 DEFAULT_EMBEDDING_MODEL = 'voyage-3'
@@ -51,6 +53,7 @@ class VoyageAIEmbedder(EmbedderClient):
         self.config = config
         self.client = voyageai.AsyncClient(api_key=config.api_key)  # type: ignore[reportUnknownMemberType]
 
+    @traced('embedder.create', count_results=False)
     async def create(
         self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
     ) -> list[float]:
@@ -68,7 +71,9 @@ class VoyageAIEmbedder(EmbedderClient):
         result = await self.client.embed(input_list, model=self.config.embedding_model)
         return [float(x) for x in result.embeddings[0][: self.config.embedding_dim]]
 
+    @traced('embedder.create_batch')
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        embedding_batch_size.observe(len(input_data_list), provider=provider_label(self))
         result = await self.client.embed(input_data_list, model=self.config.embedding_model)
         return [
             [float(x) for x in embedding[: self.config.embedding_dim]]
@@ -81,3 +81,20 @@ class GroupIdValidationError(GraphitiError):
     def __init__(self, group_id: str):
         self.message = f'group_id "{group_id}" must contain only alphanumeric characters, dashes, or underscores'
         super().__init__(self.message)
+
+
+class AdmissionRejectedError(GraphitiError):
+    """Raised when an ingestion queue is too full to accept more episodes."""
+
+    def __init__(self, text: str, retry_after: float | None):
+        self.message = text
+        self.retry_after = retry_after
+        super().__init__(self.message)
+
+
+class CassetteMissError(GraphitiError):
+    """Raised when a replayed model request was not recorded in the cassette."""
+
+    def __init__(self, kind: str, key: str):
+        self.message = f'no recorded {kind} response for request {key}'
+        super().__init__(self.message)
@@ -1,7 +1,7 @@
 """
 Database query utilities for different graph database backends.
 
-This module provides database-agnostic query generation for Neo4j and FalkorDB,
+This module provides database-agnostic query generation for Neo4j, FalkorDB and Kuzu,
 supporting index creation, fulltext search, and bulk operations.
 """
 
@@ -24,9 +24,42 @@ NEO4J_TO_FALKORDB_MAPPING = {
     'edge_name_and_fact': 'RELATES_TO',
 }
 
+# Mapping from Neo4j fulltext index names to the Kuzu node tables they index. Kuzu stores
+# facts as RelatesToNode_ nodes, since relationships cannot be fulltext indexed.
+NEO4J_TO_KUZU_MAPPING = {
+    'node_name_and_summary': 'Entity',
+    'community_name': 'Community',
+    'episode_content': 'Episodic',
+    'edge_name_and_fact': 'RelatesToNode_',
+}
+
 
 def get_range_indices(db_type: str = 'neo4j') -> list[LiteralString]:
-    if db_type == 'falkordb':
+    if db_type == 'kuzu':
+        # Kuzu has no secondary indices: its range indices are the primary keys of the node
+        # tables, so the schema itself is the index DDL. Embeddings are variable-length lists,
+        # as Kuzu's vector indices need a dimension fixed when the table is created.
+        return [
+            """CREATE NODE TABLE IF NOT EXISTS Episodic (uuid STRING PRIMARY KEY, name STRING,
+            group_id STRING, source STRING, source_description STRING, content STRING,
+            entity_edges STRING[], created_at TIMESTAMP, valid_at TIMESTAMP)""",
+            """CREATE NODE TABLE IF NOT EXISTS Entity (uuid STRING PRIMARY KEY, name STRING,
+            group_id STRING, labels STRING[], summary STRING, name_embedding FLOAT[],
+            mention_count INT64, attributes STRING, created_at TIMESTAMP)""",
+            """CREATE NODE TABLE IF NOT EXISTS Community (uuid STRING PRIMARY KEY, name STRING,
+            group_id STRING, summary STRING, name_embedding FLOAT[], created_at TIMESTAMP)""",
+            """CREATE NODE TABLE IF NOT EXISTS RelatesToNode_ (uuid STRING PRIMARY KEY,
+            name STRING, group_id STRING, fact STRING, fact_embedding FLOAT[], episodes STRING[],
+            episode_count INT64, attributes STRING, created_at TIMESTAMP, expired_at TIMESTAMP,
+            valid_at TIMESTAMP, invalid_at TIMESTAMP)""",
+            """CREATE REL TABLE IF NOT EXISTS RELATES_TO (FROM Entity TO RelatesToNode_,
+            FROM RelatesToNode_ TO Entity)""",
+            """CREATE REL TABLE IF NOT EXISTS MENTIONS (FROM Episodic TO Entity, uuid STRING,
+            group_id STRING, created_at TIMESTAMP)""",
+            """CREATE REL TABLE IF NOT EXISTS HAS_MEMBER (FROM Community TO Entity,
+            FROM Community TO Community, uuid STRING, group_id STRING, created_at TIMESTAMP)""",
+        ]
+    elif db_type == 'falkordb':
         return [
             # Entity node
             'CREATE INDEX FOR (n:Entity) ON (n.uuid, n.group_id, n.name, n.created_at)',
@@ -66,7 +99,17 @@ def get_range_indices(db_type: str = 'neo4j') -> list[LiteralString]:
 
 
 def get_fulltext_indices(db_type: str = 'neo4j') -> list[LiteralString]:
-    if db_type == 'falkordb':
+    if db_type == 'kuzu':
+        return [
+            """CALL CREATE_FTS_INDEX('Episodic', 'episode_content',
+            ['content', 'source', 'source_description', 'group_id'])""",
+            """CALL CREATE_FTS_INDEX('Entity', 'node_name_and_summary',
+            ['name', 'summary', 'group_id'])""",
+            """CALL CREATE_FTS_INDEX('Community', 'community_name', ['name', 'group_id'])""",
+            """CALL CREATE_FTS_INDEX('RelatesToNode_', 'edge_name_and_fact',
+            ['name', 'fact', 'group_id'])""",
+        ]
+    elif db_type == 'falkordb':
         return [
             """CREATE FULLTEXT INDEX FOR (e:Episodic) ON (e.content, e.source, e.source_description, e.group_id)""",
             """CREATE FULLTEXT INDEX FOR (n:Entity) ON (n.name, n.summary, n.group_id)""",
@@ -86,28 +129,42 @@ def get_fulltext_indices(db_type: str = 'neo4j') -> list[LiteralString]:
         ]
 
 
-def get_nodes_query(db_type: str = 'neo4j', name: str = '', query: str | None = None) -> str:
-    if db_type == 'falkordb':
+def get_nodes_query(
+    db_type: str = 'neo4j', name: str = '', query: str | None = None, limit: str = '$limit'
+) -> str:
+    if db_type == 'kuzu':
+        # Yields the matching nodes as node, with their BM25 score
+        table = NEO4J_TO_KUZU_MAPPING[name]
+        return f"CALL QUERY_FTS_INDEX('{table}', '{name}', CAST({query} AS STRING), TOP := {limit})"
+    elif db_type == 'falkordb':
         label = NEO4J_TO_FALKORDB_MAPPING[name]
         return f"CALL db.idx.fulltext.queryNodes('{label}', {query})"
     else:
-        return f'CALL db.index.fulltext.queryNodes("{name}", {query}, {{limit: $limit}})'
+        return f'CALL db.index.fulltext.queryNodes("{name}", {query}, {{limit: {limit}}})'
 
 
 def get_vector_cosine_func_query(vec1, vec2, db_type: str = 'neo4j') -> str:
-    if db_type == 'falkordb':
+    if db_type == 'kuzu':
+        # Normalized to [0, 1] like Neo4j's vector.similarity.cosine
+        return f'(1 + array_cosine_similarity({vec1}, {vec2})) / 2'
+    elif db_type == 'falkordb':
         # FalkorDB uses a different syntax for regular cosine similarity and Neo4j uses normalized cosine similarity
         return f'(2 - vec.cosineDistance({vec1}, vecf32({vec2})))/2'
     else:
         return f'vector.similarity.cosine({vec1}, {vec2})'
 
 
-def get_relationships_query(name: str, db_type: str = 'neo4j') -> str:
-    if db_type == 'falkordb':
+def get_relationships_query(
+    name: str, db_type: str = 'neo4j', limit: str = '$limit', query: str = '$query'
+) -> str:
+    if db_type == 'kuzu':
+        # Facts are RelatesToNode_ nodes in Kuzu, so they are queried like any other node
+        return get_nodes_query(db_type, name, query, limit)
+    elif db_type == 'falkordb':
         label = NEO4J_TO_FALKORDB_MAPPING[name]
-        return f"CALL db.idx.fulltext.queryRelationships('{label}', $query)"
+        return f"CALL db.idx.fulltext.queryRelationships('{label}', {query})"
     else:
-        return f'CALL db.index.fulltext.queryRelationships("{name}", $query, {{limit: $limit}})'
+        return f'CALL db.index.fulltext.queryRelationships("{name}", {query}, {{limit: {limit}}})'
 
 
 def get_entity_node_save_bulk_query(nodes, db_type: str = 'neo4j') -> str | Any:
@@ -120,8 +177,10 @@ def get_entity_node_save_bulk_query(nodes, db_type: str = 'neo4j') -> str | Any:
                         f"""
                     UNWIND $nodes AS node
                     MERGE (n:Entity {{uuid: node.uuid}})
+                    WITH n, node, coalesce(n.mention_count, 0) AS mention_count
                     SET n:{label}
                     SET n = node
+                    SET n.mention_count = mention_count
                     WITH n, node
                     SET n.name_embedding = vecf32(node.name_embedding)
                     RETURN n.uuid AS uuid
@@ -141,7 +200,7 @@ def get_entity_edge_save_bulk_query(db_type: str = 'neo4j') -> str:
         MATCH (source:Entity {uuid: edge.source_node_uuid}) 
         MATCH (target:Entity {uuid: edge.target_node_uuid}) 
         MERGE (source)-[r:RELATES_TO {uuid: edge.uuid}]->(target)
-        SET r = {uuid: edge.uuid, name: edge.name, group_id: edge.group_id, fact: edge.fact, episodes: edge.episodes, 
+        SET r = {uuid: edge.uuid, name: edge.name, group_id: edge.group_id, fact: edge.fact, episodes: edge.episodes, episode_count: edge.episode_count,
         created_at: edge.created_at, expired_at: edge.expired_at, valid_at: edge.valid_at, invalid_at: edge.invalid_at, fact_embedding: vecf32(edge.fact_embedding)}
         WITH r, edge
         RETURN edge.uuid AS uuid"""
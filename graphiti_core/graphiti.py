@@ -19,8 +19,7 @@ from datetime import datetime
 from time import time
 
 from dotenv import load_dotenv
-from pydantic import BaseModel
-from typing_extensions import LiteralString
+from pydantic import BaseModel, Field
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
@@ -35,8 +34,11 @@ from graphiti_core.helpers import (
     validate_group_id,
 )
 from graphiti_core.llm_client import LLMClient, OpenAIClient
+from graphiti_core.metrics import episodes_processed
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodeType, EpisodicNode
-from graphiti_core.search.search import SearchConfig, search
+from graphiti_core.search.ann_sidecar import AnnSidecar, attach_ann_sidecar
+from graphiti_core.search.search import SearchConfig, search, search_many
+from graphiti_core.search.search_cache import SearchResultCache, record_graph_write
 from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT, SearchResults
 from graphiti_core.search.search_config_recipes import (
     COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
@@ -51,6 +53,8 @@ from graphiti_core.search.search_utils import (
     get_relevant_edges,
 )
 from graphiti_core.telemetry import capture_event
+from graphiti_core.tracer import NoOpTracer, Tracer, add_span_attributes, trace_span, use_tracer
+from graphiti_core.usage import LLMUsage, collect_usage
 from graphiti_core.utils.bulk_utils import (
     RawEpisode,
     add_nodes_and_edges_bulk,
@@ -94,6 +98,14 @@ class AddEpisodeResults(BaseModel):
     episode: EpisodicNode
     nodes: list[EntityNode]
     edges: list[EntityEdge]
+    llm_usage: LLMUsage = Field(default_factory=LLMUsage)
+
+
+class AddBulkEpisodeResults(BaseModel):
+    episodes: list[EpisodicNode]
+    nodes: list[EntityNode]
+    edges: list[EntityEdge]
+    llm_usage: LLMUsage = Field(default_factory=LLMUsage)
 
 
 class Graphiti:
@@ -108,6 +120,9 @@ class Graphiti:
         store_raw_episode_content: bool = True,
         graph_driver: GraphDriver | None = None,
         max_coroutines: int | None = None,
+        search_cache: SearchResultCache | None = None,
+        tracer: Tracer | None = None,
+        ann_sidecar: AnnSidecar | None = None,
     ):
         """
         Initialize a Graphiti instance.
@@ -140,6 +155,20 @@ class Graphiti:
         max_coroutines : int | None, optional
             The maximum number of concurrent operations allowed. Overrides SEMAPHORE_LIMIT set in the environment.
             If not set, the Graphiti default is used.
+        search_cache : SearchResultCache | None, optional
+            A cache for search results, invalidated by writes to the searched groups made through
+            this Graphiti's driver. Writes made by other processes are only seen once the cached
+            results expire.
+            If not provided, search results are not cached.
+        tracer : Tracer | None, optional
+            A Tracer, such as an OpenTelemetryTracer, that receives spans for ingestion and search
+            stages, LLM, embedding and reranker calls, and database queries.
+            If not provided, no spans are recorded.
+        ann_sidecar : AnnSidecar | None, optional
+            A client-side nearest-neighbor index of the graph's embeddings, used to rank
+            deduplication and invalidation candidates without vector scans in the database.
+            It only serves groups it has loaded with AnnSidecar.rebuild.
+            If not provided, candidates are ranked in the database.
 
         Returns
         -------
@@ -169,6 +198,11 @@ class Graphiti:
 
         self.store_raw_episode_content = store_raw_episode_content
         self.max_coroutines = max_coroutines
+        self.search_cache = search_cache
+        self.tracer = tracer if tracer is not None else NoOpTracer()
+        self.ann_sidecar = ann_sidecar
+        if ann_sidecar is not None:
+            attach_ann_sidecar(self.driver, ann_sidecar)
         if llm_client:
             self.llm_client = llm_client
         else:
@@ -238,6 +272,10 @@ class Graphiti:
             return 'neo4j'
         elif 'falkor' in class_name:
             return 'falkordb'
+        elif 'inmemory' in class_name:
+            return 'memory'
+        elif 'kuzu' in class_name:
+            return 'kuzu'
         # Embedder providers
         elif 'voyage' in class_name:
             return 'voyage'
@@ -416,7 +454,11 @@ class Graphiti:
                 background_tasks.add_task(graphiti.add_episode, **episode_data.dict())
                 return {"message": "Episode processing started"}
         """
-        try:
+        with (
+            use_tracer(self.tracer),
+            trace_span('add_episode', {'group_id': group_id}),
+            collect_usage() as usage,
+        ):
             start = time()
             now = utc_now()
 
@@ -527,11 +569,12 @@ class Graphiti:
                 )
             end = time()
             logger.info(f'Completed add_episode in {(end - start) * 1000} ms')
+            episodes_processed.inc(method='add_episode')
+            add_span_attributes({'node_count': len(nodes), 'edge_count': len(entity_edges)})
 
-            return AddEpisodeResults(episode=episode, nodes=nodes, edges=entity_edges)
-
-        except Exception as e:
-            raise e
+            return AddEpisodeResults(
+                episode=episode, nodes=nodes, edges=entity_edges, llm_usage=usage.summary()
+            )
 
     ##### EXPERIMENTAL #####
     async def add_episode_bulk(
@@ -542,7 +585,7 @@ class Graphiti:
         excluded_entity_types: list[str] | None = None,
         edge_types: dict[str, BaseModel] | None = None,
         edge_type_map: dict[tuple[str, str], list[str]] | None = None,
-    ):
+    ) -> AddBulkEpisodeResults:
         """
         Process multiple episodes in bulk and update the graph.
 
@@ -558,7 +601,9 @@ class Graphiti:
 
         Returns
         -------
-        None
+        AddBulkEpisodeResults
+            The episodes, the entity nodes and edges saved for them, and the LLM usage of the
+            whole batch.
 
         Notes
         -----
@@ -579,7 +624,13 @@ class Graphiti:
         If these operations are required, use the `add_episode` method instead for each
         individual episode.
         """
-        try:
+        with (
+            use_tracer(self.tracer),
+            trace_span(
+                'add_episode_bulk', {'group_id': group_id, 'episode_count': len(bulk_episodes)}
+            ),
+            collect_usage() as usage,
+        ):
             start = time()
             now = utc_now()
 
@@ -701,20 +752,26 @@ class Graphiti:
             }
 
             # save data to KG
+            entity_edges = list(edges_by_uuid.values())
             await add_nodes_and_edges_bulk(
                 self.driver,
                 episodes,
                 episodic_edges,
                 hydrated_nodes,
-                list(edges_by_uuid.values()),
+                entity_edges,
                 self.embedder,
             )
 
             end = time()
             logger.info(f'Completed add_episode_bulk in {(end - start) * 1000} ms')
+            episodes_processed.inc(len(bulk_episodes), method='add_episode_bulk')
 
-        except Exception as e:
-            raise e
+            return AddBulkEpisodeResults(
+                episodes=episodes,
+                nodes=hydrated_nodes,
+                edges=entity_edges,
+                llm_usage=usage.summary(),
+            )
 
     async def build_communities(self, group_ids: list[str] | None = None) -> list[CommunityNode]:
         """
@@ -724,28 +781,30 @@ class Graphiti:
         query : list[str] | None
             Optional. Create communities only for the listed group_ids. If blank the entire graph will be used.
         """
-        # Clear existing communities
-        await remove_communities(self.driver)
+        with use_tracer(self.tracer), trace_span('build_communities', {'group_ids': group_ids}):
+            # Clear existing communities
+            await remove_communities(self.driver)
 
-        community_nodes, community_edges = await build_communities(
-            self.driver, self.llm_client, group_ids
-        )
+            community_nodes, community_edges = await build_communities(
+                self.driver, self.llm_client, group_ids
+            )
 
-        await semaphore_gather(
-            *[node.generate_name_embedding(self.embedder) for node in community_nodes],
-            max_coroutines=self.max_coroutines,
-        )
+            await semaphore_gather(
+                *[node.generate_name_embedding(self.embedder) for node in community_nodes],
+                max_coroutines=self.max_coroutines,
+            )
 
-        await semaphore_gather(
-            *[node.save(self.driver) for node in community_nodes],
-            max_coroutines=self.max_coroutines,
-        )
-        await semaphore_gather(
-            *[edge.save(self.driver) for edge in community_edges],
-            max_coroutines=self.max_coroutines,
-        )
+            await semaphore_gather(
+                *[node.save(self.driver) for node in community_nodes],
+                max_coroutines=self.max_coroutines,
+            )
+            await semaphore_gather(
+                *[edge.save(self.driver) for edge in community_edges],
+                max_coroutines=self.max_coroutines,
+            )
+            record_graph_write(self.driver, group_ids)
 
-        return community_nodes
+            return community_nodes
 
     async def search(
         self,
@@ -778,7 +837,9 @@ class Graphiti:
         Returns
         -------
         list
-            A list of EntityEdge objects that are relevant to the search query.
+            A list of EntityEdge objects that are relevant to the search query. The LLM usage
+            of the search is not returned; use search_, whose SearchResults carry it in
+            llm_usage.
 
         Notes
         -----
@@ -793,16 +854,18 @@ class Graphiti:
         )
         search_config.limit = num_results
 
-        edges = (
-            await search(
-                self.clients,
-                query,
-                group_ids,
-                search_config,
-                search_filter if search_filter is not None else SearchFilters(),
-                center_node_uuid,
-            )
-        ).edges
+        with use_tracer(self.tracer):
+            edges = (
+                await search(
+                    self.clients,
+                    query,
+                    group_ids,
+                    search_config,
+                    search_filter if search_filter is not None else SearchFilters(),
+                    center_node_uuid,
+                    cache=self.search_cache,
+                )
+            ).edges
 
         return edges
 
@@ -828,23 +891,59 @@ class Graphiti:
         center_node_uuid: str | None = None,
         bfs_origin_node_uuids: list[str] | None = None,
         search_filter: SearchFilters | None = None,
+        timeout: float | None = None,
     ) -> SearchResults:
         """search_ (replaces _search) is our advanced search method that returns Graph objects (nodes and edges) rather
         than a list of facts. This endpoint allows the end user to utilize more advanced features such as filters and
         different search and reranker methodologies across different layers in the graph.
 
         For different config recipes refer to search/search_config_recipes.
+
+        If timeout (in seconds) is set, stages still running at the deadline are cancelled and partial results are
+        returned, with the unfinished stages listed in the results' timed_out_stages and skipped_stages.
         """
 
-        return await search(
-            self.clients,
-            query,
-            group_ids,
-            config,
-            search_filter if search_filter is not None else SearchFilters(),
-            center_node_uuid,
-            bfs_origin_node_uuids,
-        )
+        with use_tracer(self.tracer):
+            return await search(
+                self.clients,
+                query,
+                group_ids,
+                config,
+                search_filter if search_filter is not None else SearchFilters(),
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                timeout=timeout,
+                cache=self.search_cache,
+            )
+
+    async def search_many(
+        self,
+        queries: list[str],
+        config: SearchConfig = COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+        group_ids: list[str] | None = None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+        search_filter: SearchFilters | None = None,
+    ) -> list[SearchResults]:
+        """Run search_ for a batch of related queries, returning one SearchResults per query.
+
+        The queries are embedded together and the edge and node fulltext and similarity stages
+        run as one database query per search method for the whole batch; episode and community
+        searches run per query. Results are served from and stored in the search cache as in
+        search_. Unlike search_, there is no timeout, since the batched stages serve every query.
+        """
+
+        with use_tracer(self.tracer):
+            return await search_many(
+                self.clients,
+                queries,
+                group_ids,
+                config,
+                search_filter if search_filter is not None else SearchFilters(),
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                cache=self.search_cache,
+            )
 
     async def get_nodes_and_edges_by_episode(self, episode_uuids: list[str]) -> SearchResults:
         episodes = await EpisodicNode.get_by_uuids(self.driver, episode_uuids)
@@ -916,14 +1015,7 @@ class Graphiti:
         # Find nodes mentioned by the episode
         nodes = await get_mentioned_nodes(self.driver, [episode])
         # We should delete all nodes that are only mentioned in the deleted episode
-        nodes_to_delete: list[EntityNode] = []
-        for node in nodes:
-            query: LiteralString = 'MATCH (e:Episodic)-[:MENTIONS]->(n:Entity {uuid: $uuid}) RETURN count(*) AS episode_count'
-            records, _, _ = await self.driver.execute_query(query, uuid=node.uuid, routing_='r')
-
-            for record in records:
-                if record['episode_count'] == 1:
-                    nodes_to_delete.append(node)
+        nodes_to_delete = [node for node in nodes if node.mention_count == 1]
 
         await semaphore_gather(
             *[node.delete(self.driver) for node in nodes_to_delete],
@@ -95,6 +95,12 @@ def normalize_l2(embedding: list[float]) -> NDArray:
     return np.where(norm == 0, embedding_array, embedding_array / norm)
 
 
+def normalize_l2_rows(embeddings: NDArray) -> NDArray:
+    # Normalize each row of a matrix of embeddings, leaving all-zero rows unchanged
+    norms = np.linalg.norm(embeddings, 2, axis=1, keepdims=True)
+    return np.divide(embeddings, norms, out=embeddings.copy(), where=norms != 0)
+
+
 # Use this instead of asyncio.gather() to bound coroutines
 async def semaphore_gather(
     *coroutines: Coroutine,
@@ -103,8 +109,12 @@ async def semaphore_gather(
     semaphore = asyncio.Semaphore(max_coroutines or SEMAPHORE_LIMIT)
 
     async def _wrap_coroutine(coroutine):
-        async with semaphore:
-            return await coroutine
+        try:
+            async with semaphore:
+                return await coroutine
+        finally:
+            # Close coroutines cancelled while waiting for the semaphore, before they started
+            coroutine.close()
 
     return await asyncio.gather(*(_wrap_coroutine(coroutine) for coroutine in coroutines))
 
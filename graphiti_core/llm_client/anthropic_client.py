@@ -24,6 +24,8 @@ from typing import TYPE_CHECKING, Literal
 from pydantic import BaseModel, ValidationError
 
 from ..prompts.models import Message
+from ..tracer import traced
+from ..usage import track_llm_call
 from .client import LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
@@ -191,6 +193,7 @@ class AnthropicClient(LLMClient):
             messages: List of message objects to send to the LLM.
             response_model: Optional Pydantic model to use for structured output.
             max_tokens: Maximum number of tokens to generate.
+            prompt_name: Name of the prompt, used to attribute token usage.
 
         Returns:
             Dictionary containing the structured response from the LLM.
@@ -223,6 +226,9 @@ class AnthropicClient(LLMClient):
                 tools=tools,
                 tool_choice=tool_choice,
             )
+            self._record_token_usage(
+                self.model, result.usage.input_tokens, result.usage.output_tokens
+            )
 
             # Extract the tool output from the response
             for content_item in result.content:
@@ -248,6 +254,7 @@ class AnthropicClient(LLMClient):
             )
 
         except anthropic.RateLimitError as e:
+            self._record_rate_limit(self.model)
             raise RateLimitError(f'Rate limit exceeded. Please try again later. Error: {e}') from e
         except anthropic.APIError as e:
             # Special case for content policy violations. We convert these to RefusalError
@@ -259,12 +266,15 @@ class AnthropicClient(LLMClient):
         except Exception as e:
             raise e
 
+    @traced('llm.generate_response')
+    @track_llm_call
     async def generate_response(
         self,
         messages: list[Message],
         response_model: type[BaseModel] | None = None,
         max_tokens: int | None = None,
         model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
         """
         Generate a response from the LLM.
@@ -273,6 +283,7 @@ class AnthropicClient(LLMClient):
             messages: List of message objects to send to the LLM.
             response_model: Optional Pydantic model to use for structured output.
             max_tokens: Maximum number of tokens to generate.
+            prompt_name: Name of the prompt, used to attribute token usage.
 
         Returns:
             Dictionary containing the structured response from the LLM.
@@ -282,6 +293,7 @@ class AnthropicClient(LLMClient):
             RefusalError: If the LLM refuses to respond.
             Exception: If an error occurs during the generation process.
         """
+        self._record_request(response_model, prompt_name)
         if max_tokens is None:
             max_tokens = self.max_tokens
 
@@ -25,7 +25,10 @@ from diskcache import Cache
 from pydantic import BaseModel
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
+from ..metrics import llm_rate_limits, llm_requests, llm_tokens, provider_label, record_cache_lookup
 from ..prompts.models import Message
+from ..tracer import add_span_attributes, traced
+from ..usage import record_token_usage, track_llm_call
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError
 
@@ -91,11 +94,13 @@ class LLMClient(ABC):
         stop=stop_after_attempt(4),
         wait=wait_random_exponential(multiplier=10, min=5, max=120),
         retry=retry_if_exception(is_server_or_retry_error),
-        after=lambda retry_state: logger.warning(
-            f'Retrying {retry_state.fn.__name__ if retry_state.fn else "function"} after {retry_state.attempt_number} attempts...'
-        )
-        if retry_state.attempt_number > 1
-        else None,
+        after=lambda retry_state: (
+            logger.warning(
+                f'Retrying {retry_state.fn.__name__ if retry_state.fn else "function"} after {retry_state.attempt_number} attempts...'
+            )
+            if retry_state.attempt_number > 1
+            else None
+        ),
         reraise=True,
     )
     async def _generate_response_with_retry(
@@ -120,19 +125,48 @@ class LLMClient(ABC):
     ) -> dict[str, typing.Any]:
         pass
 
+    def _record_request(self, response_model: type[BaseModel] | None, prompt_name: str | None):
+        add_span_attributes(
+            {
+                'llm.model': self.model,
+                'llm.prompt_name': prompt_name,
+                'llm.response_model': response_model.__name__ if response_model else None,
+            }
+        )
+        llm_requests.inc(provider=provider_label(self), model=str(self.model))
+
+    def _record_token_usage(
+        self, model: str | None, input_tokens: int | None, output_tokens: int | None
+    ):
+        """Record the token usage of an LLM call on the current span, usage and metrics."""
+        add_span_attributes({'llm.input_tokens': input_tokens, 'llm.output_tokens': output_tokens})
+        record_token_usage(model, input_tokens, output_tokens)
+        labels = {'provider': provider_label(self), 'model': str(model or self.model)}
+        if isinstance(input_tokens, int):
+            llm_tokens.inc(input_tokens, direction='input', **labels)
+        if isinstance(output_tokens, int):
+            llm_tokens.inc(output_tokens, direction='output', **labels)
+
+    def _record_rate_limit(self, model: str | None):
+        llm_rate_limits.inc(provider=provider_label(self), model=str(model or self.model))
+
     def _get_cache_key(self, messages: list[Message]) -> str:
         # Create a unique cache key based on the messages and model
         message_str = json.dumps([m.model_dump() for m in messages], sort_keys=True)
         key_str = f'{self.model}:{message_str}'
         return hashlib.md5(key_str.encode()).hexdigest()
 
+    @traced('llm.generate_response')
+    @track_llm_call
     async def generate_response(
         self,
         messages: list[Message],
         response_model: type[BaseModel] | None = None,
         max_tokens: int | None = None,
         model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
+        self._record_request(response_model, prompt_name)
         if max_tokens is None:
             max_tokens = self.max_tokens
 
@@ -151,6 +185,8 @@ class LLMClient(ABC):
             cache_key = self._get_cache_key(messages)
 
             cached_response = self.cache_dir.get(cache_key)
+            add_span_attributes({'llm.cache_hit': cached_response is not None})
+            record_cache_lookup('llm', cached_response is not None)
             if cached_response is not None:
                 logger.debug(f'Cache hit for {cache_key}')
                 return cached_response
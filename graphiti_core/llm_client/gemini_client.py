@@ -23,6 +23,8 @@ import aiohttp
 from pydantic import BaseModel
 
 from ..prompts.models import Message
+from ..tracer import traced
+from ..usage import track_llm_call
 from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError
@@ -327,6 +329,12 @@ class GeminiClient(LLMClient):
                 contents=gemini_messages,
                 config=generation_config,
             )
+            if response.usage_metadata is not None:
+                self._record_token_usage(
+                    model,
+                    response.usage_metadata.prompt_token_count,
+                    response.usage_metadata.candidates_token_count,
+                )
 
             # Check for safety and prompt blocks
             self._check_safety_blocks(response)
@@ -357,17 +365,21 @@ class GeminiClient(LLMClient):
                 or 'resource_exhausted' in error_message
                 or '429' in str(e)
             ):
+                self._record_rate_limit(self._get_model_for_size(model_size))
                 raise RateLimitError from e
 
             logger.error(f'Error in generating LLM response: {e}')
             raise
 
+    @traced('llm.generate_response')
+    @track_llm_call
     async def generate_response(
         self,
         messages: list[Message],
         response_model: type[BaseModel] | None = None,
         max_tokens: int | None = None,
         model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
         """
         Generate a response from the Gemini language model with retry logic and error handling.
@@ -378,10 +390,12 @@ class GeminiClient(LLMClient):
             response_model (type[BaseModel] | None): An optional Pydantic model to parse the response into.
             max_tokens (int | None): The maximum number of tokens to generate in the response.
             model_size (ModelSize): The size of the model to use (small or medium).
+            prompt_name (str | None): The name of the prompt, used to attribute token usage.
 
         Returns:
             dict[str, typing.Any]: The response from the language model.
         """
+        self._record_request(response_model, prompt_name)
         if max_tokens is None:
             max_tokens = self.max_tokens
 
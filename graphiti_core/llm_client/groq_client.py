@@ -76,9 +76,16 @@ class GroqClient(LLMClient):
                 max_tokens=max_tokens or self.max_tokens,
                 response_format={'type': 'json_object'},
             )
+            if response.usage is not None:
+                self._record_token_usage(
+                    self.model or DEFAULT_MODEL,
+                    response.usage.prompt_tokens,
+                    response.usage.completion_tokens,
+                )
             result = response.choices[0].message.content or ''
             return json.loads(result)
         except groq.RateLimitError as e:
+            self._record_rate_limit(self.model or DEFAULT_MODEL)
             raise RateLimitError from e
         except Exception as e:
             logger.error(f'Error in generating LLM response: {e}')
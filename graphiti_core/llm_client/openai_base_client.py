@@ -25,6 +25,8 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
+from ..tracer import traced
+from ..usage import track_llm_call
 from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
@@ -105,6 +107,11 @@ class BaseOpenAIClient(LLMClient):
         else:
             return self.model or DEFAULT_MODEL
 
+    def _record_response_usage(self, model: str, response: Any):
+        usage = getattr(response, 'usage', None)
+        if usage is not None:
+            self._record_token_usage(model, usage.prompt_tokens, usage.completion_tokens)
+
     def _handle_structured_response(self, response: Any) -> dict[str, Any]:
         """Handle structured response parsing and validation."""
         response_object = response.choices[0].message
@@ -141,6 +148,7 @@ class BaseOpenAIClient(LLMClient):
                     max_tokens=max_tokens or self.max_tokens,
                     response_model=response_model,
                 )
+                self._record_response_usage(model, response)
                 return self._handle_structured_response(response)
             else:
                 response = await self._create_completion(
@@ -149,24 +157,30 @@ class BaseOpenAIClient(LLMClient):
                     temperature=self.temperature,
                     max_tokens=max_tokens or self.max_tokens,
                 )
+                self._record_response_usage(model, response)
                 return self._handle_json_response(response)
 
         except openai.LengthFinishReasonError as e:
             raise Exception(f'Output length exceeded max tokens {self.max_tokens}: {e}') from e
         except openai.RateLimitError as e:
+            self._record_rate_limit(model)
             raise RateLimitError from e
         except Exception as e:
             logger.error(f'Error in generating LLM response: {e}')
             raise
 
+    @traced('llm.generate_response')
+    @track_llm_call
     async def generate_response(
         self,
         messages: list[Message],
         response_model: type[BaseModel] | None = None,
         max_tokens: int | None = None,
         model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
         """Generate a response with retry logic and error handling."""
+        self._record_request(response_model, prompt_name)
         if max_tokens is None:
             max_tokens = self.max_tokens
 
@@ -25,6 +25,8 @@ from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from ..prompts.models import Message
+from ..tracer import traced
+from ..usage import track_llm_call
 from .client import MULTILINGUAL_EXTRACTION_RESPONSES, LLMClient
 from .config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from .errors import RateLimitError, RefusalError
@@ -106,21 +108,32 @@ class OpenAIGenericClient(LLMClient):
                 max_tokens=self.max_tokens,
                 response_format={'type': 'json_object'},
             )
+            if response.usage is not None:
+                self._record_token_usage(
+                    self.model or DEFAULT_MODEL,
+                    response.usage.prompt_tokens,
+                    response.usage.completion_tokens,
+                )
             result = response.choices[0].message.content or ''
             return json.loads(result)
         except openai.RateLimitError as e:
+            self._record_rate_limit(self.model or DEFAULT_MODEL)
             raise RateLimitError from e
         except Exception as e:
             logger.error(f'Error in generating LLM response: {e}')
             raise
 
+    @traced('llm.generate_response')
+    @track_llm_call
     async def generate_response(
         self,
         messages: list[Message],
         response_model: type[BaseModel] | None = None,
         max_tokens: int | None = None,
         model_size: ModelSize = ModelSize.medium,
+        prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
+        self._record_request(response_model, prompt_name)
         if max_tokens is None:
             max_tokens = self.max_tokens
 
@@ -0,0 +1,290 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+
+LabelValues = tuple[str, ...]
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.lock = threading.Lock()
+
+    def label_values(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f'{self.name} expects labels {list(self.label_names)}, got {sorted(labels)}'
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def format_labels(self, values: LabelValues, extra: dict[str, str] | None = None) -> str:
+        pairs = list(zip(self.label_names, values, strict=True))
+        if extra:
+            pairs.extend(extra.items())
+        if len(pairs) == 0:
+            return ''
+        return '{' + ','.join(f'{k}="{escape_label_value(v)}"' for k, v in pairs) + '}'
+
+    def render_samples(self) -> list[str]:
+        raise NotImplementedError()
+
+    def render(self) -> str:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.type_name}',
+        ]
+        lines.extend(self.render_samples())
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self.values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        if amount < 0:
+            raise ValueError('Counters can only be incremented by non-negative amounts')
+        key = self.label_values(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(self.label_values(labels), 0)
+
+    def render_samples(self) -> list[str]:
+        with self.lock:
+            values = sorted(self.values.items())
+        return [f'{self.name}{self.format_labels(k)} {format_value(v)}' for k, v in values]
+
+
+class Gauge(Metric):
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self.values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str):
+        key = self.label_values(labels)
+        with self.lock:
+            self.values[key] = value
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(self.label_values(labels), 0)
+
+    def clear(self):
+        with self.lock:
+            self.values.clear()
+
+    def render_samples(self) -> list[str]:
+        with self.lock:
+            values = sorted(self.values.items())
+        return [f'{self.name}{self.format_labels(k)} {format_value(v)}' for k, v in values]
+
+
+class HistogramValues:
+    def __init__(self, num_buckets: int):
+        self.bucket_counts = [0] * num_buckets
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    type_name = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self.values: dict[LabelValues, HistogramValues] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self.label_values(labels)
+        bucket = bisect_left(self.buckets, value)
+        with self.lock:
+            values = self.values.get(key)
+            if values is None:
+                values = HistogramValues(len(self.buckets))
+                self.values[key] = values
+            if bucket < len(self.buckets):
+                values.bucket_counts[bucket] += 1
+            values.count += 1
+            values.sum += value
+
+    def get_count(self, **labels: str) -> int:
+        values = self.values.get(self.label_values(labels))
+        return values.count if values is not None else 0
+
+    def render_samples(self) -> list[str]:
+        lines: list[str] = []
+        with self.lock:
+            items = sorted(self.values.items())
+            for key, values in items:
+                cumulative = 0
+                for upper_bound, count in zip(self.buckets, values.bucket_counts, strict=True):
+                    cumulative += count
+                    labels = self.format_labels(key, {'le': format_value(upper_bound)})
+                    lines.append(f'{self.name}_bucket{labels} {cumulative}')
+                labels = self.format_labels(key, {'le': '+Inf'})
+                lines.append(f'{self.name}_bucket{labels} {values.count}')
+                lines.append(f'{self.name}_sum{self.format_labels(key)} {format_value(values.sum)}')
+                lines.append(f'{self.name}_count{self.format_labels(key)} {values.count}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics recorded by Graphiti and renders them in the Prometheus text format.
+
+    Metrics are registered once by name; registering a name again returns the existing metric.
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+        self.lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self.lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f'Metric {metric.name} is already registered as another type')
+                return existing
+            self.metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, label_names))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        with self.lock:
+            metrics = list(self.metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+
+metrics_registry = MetricsRegistry()
+
+ingest_queue_depth = metrics_registry.gauge(
+    'graphiti_ingest_queue_depth', 'Episodes waiting to be ingested.', ['group_id']
+)
+episodes_processed = metrics_registry.counter(
+    'graphiti_episodes_processed_total', 'Episodes added to the graph.', ['method']
+)
+stage_duration = metrics_registry.histogram(
+    'graphiti_stage_duration_seconds', 'Latency of ingestion and search stages.', ['stage']
+)
+llm_requests = metrics_registry.counter(
+    'graphiti_llm_requests_total', 'LLM generate_response calls.', ['provider', 'model']
+)
+llm_tokens = metrics_registry.counter(
+    'graphiti_llm_tokens_total', 'Tokens used by LLM calls.', ['provider', 'model', 'direction']
+)
+llm_rate_limits = metrics_registry.counter(
+    'graphiti_llm_rate_limits_total', 'LLM calls rejected with a rate limit.', ['provider', 'model']
+)
+embedding_batch_size = metrics_registry.histogram(
+    'graphiti_embedding_batch_size',
+    'Number of inputs per embedding batch call.',
+    ['provider'],
+    buckets=BATCH_SIZE_BUCKETS,
+)
+db_query_duration = metrics_registry.histogram(
+    'graphiti_db_query_duration_seconds',
+    'Latency of database queries, by query fingerprint.',
+    ['provider', 'fingerprint'],
+)
+search_duration = metrics_registry.histogram(
+    'graphiti_search_duration_seconds', 'Latency of searches, by config recipe.', ['recipe']
+)
+cache_requests = metrics_registry.counter(
+    'graphiti_cache_requests_total', 'Cache lookups, by cache and result.', ['cache', 'result']
+)
+
+
+def provider_label(client: object) -> str:
+    """A provider label for a client, e.g. 'openai' for OpenAIClient."""
+    name = type(client).__name__
+    for suffix in ('RerankerClient', 'EmbedderClient', 'LLMClient', 'Embedder', 'Client', 'Driver'):
+        if name.endswith(suffix) and name != suffix:
+            name = name[: -len(suffix)]
+            break
+    return name.lower()
+
+
+def query_fingerprint(query: str) -> str:
+    """A short, stable fingerprint of a query's text, ignoring whitespace differences."""
+    return hashlib.sha1(' '.join(query.split()).encode('utf-8')).hexdigest()[:12]
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    cache_requests.inc(cache=cache, result='hit' if hit else 'miss')
@@ -18,6 +18,7 @@ EPISODIC_EDGE_SAVE = """
         MATCH (episode:Episodic {uuid: $episode_uuid}) 
         MATCH (node:Entity {uuid: $entity_uuid}) 
         MERGE (episode)-[r:MENTIONS {uuid: $uuid}]->(node)
+        ON CREATE SET node.mention_count = coalesce(node.mention_count, 0) + 1
         SET r = {uuid: $uuid, group_id: $group_id, created_at: $created_at}
         RETURN r.uuid AS uuid"""
 
@@ -26,10 +27,17 @@ EPISODIC_EDGE_SAVE_BULK = """
     MATCH (episode:Episodic {uuid: edge.source_node_uuid}) 
     MATCH (node:Entity {uuid: edge.target_node_uuid}) 
     MERGE (episode)-[r:MENTIONS {uuid: edge.uuid}]->(node)
+    ON CREATE SET node.mention_count = coalesce(node.mention_count, 0) + 1
     SET r = {uuid: edge.uuid, group_id: edge.group_id, created_at: edge.created_at}
     RETURN r.uuid AS uuid
 """
 
+EPISODIC_EDGE_DELETE = """
+        MATCH (episode:Episodic)-[r:MENTIONS {uuid: $uuid}]->(node:Entity)
+        SET node.mention_count = coalesce(node.mention_count, 1) - 1
+        DELETE r
+        """
+
 ENTITY_EDGE_SAVE = """
         MATCH (source:Entity {uuid: $source_uuid}) 
         MATCH (target:Entity {uuid: $target_uuid}) 
@@ -31,20 +31,31 @@ EPISODIC_NODE_SAVE_BULK = """
 
 ENTITY_NODE_SAVE = """
         MERGE (n:Entity {uuid: $entity_data.uuid})
+        WITH n, coalesce(n.mention_count, 0) AS mention_count
         SET n:$($labels)
         SET n = $entity_data
+        SET n.mention_count = mention_count
         WITH n CALL db.create.setNodeVectorProperty(n, "name_embedding", $entity_data.name_embedding)
         RETURN n.uuid AS uuid"""
 
 ENTITY_NODE_SAVE_BULK = """
     UNWIND $nodes AS node
     MERGE (n:Entity {uuid: node.uuid})
+    WITH n, node, coalesce(n.mention_count, 0) AS mention_count
     SET n:$(node.labels)
     SET n = node
+    SET n.mention_count = mention_count
     WITH n, node CALL db.create.setNodeVectorProperty(n, "name_embedding", node.name_embedding)
     RETURN n.uuid AS uuid
 """
 
+EPISODIC_NODE_DELETE = """
+        MATCH (n:Episodic {uuid: $uuid})
+        OPTIONAL MATCH (n)-[:MENTIONS]->(m:Entity)
+        WITH n, collect(m) AS entities
+        FOREACH (m IN entities | SET m.mention_count = coalesce(m.mention_count, 1) - 1)
+        DETACH DELETE n"""
+
 COMMUNITY_NODE_SAVE = """
         MERGE (n:Community {uuid: $uuid})
         SET n = {uuid: $uuid, name: $name, group_id: $group_id, summary: $summary, created_at: $created_at}
@@ -32,8 +32,16 @@ from graphiti_core.helpers import parse_db_date
 from graphiti_core.models.nodes.node_db_queries import (
     COMMUNITY_NODE_SAVE,
     ENTITY_NODE_SAVE,
+    EPISODIC_NODE_DELETE,
     EPISODIC_NODE_SAVE,
 )
+from graphiti_core.search.ann_sidecar import (
+    index_embeddings,
+    remove_embeddings,
+    remove_group_embeddings,
+)
+from graphiti_core.search.node_distance_cache import invalidate_node_distances
+from graphiti_core.search.search_cache import record_graph_write
 from graphiti_core.utils.datetime_utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -97,13 +105,19 @@ class Node(BaseModel, ABC):
     async def save(self, driver: GraphDriver): ...
 
     async def delete(self, driver: GraphDriver):
-        result = await driver.execute_query(
-            """
-        MATCH (n:Entity|Episodic|Community {uuid: $uuid})
-        DETACH DELETE n
-        """,
-            uuid=self.uuid,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.delete_nodes([self.uuid])
+        else:
+            result = await driver.execute_query(
+                """
+            MATCH (n:Entity|Episodic|Community {uuid: $uuid})
+            DETACH DELETE n
+            """,
+                uuid=self.uuid,
+            )
+        invalidate_node_distances(driver, [self.uuid])
+        remove_embeddings(driver, self.group_id, node_uuids=[self.uuid])
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Deleted Node: {self.uuid}')
 
@@ -119,13 +133,19 @@ class Node(BaseModel, ABC):
 
     @classmethod
     async def delete_by_group_id(cls, driver: GraphDriver, group_id: str):
-        await driver.execute_query(
-            """
-        MATCH (n:Entity|Episodic|Community {group_id: $group_id})
-        DETACH DELETE n
-        """,
-            group_id=group_id,
-        )
+        if driver.operations is not None:
+            await driver.operations.delete_groups([group_id])
+        else:
+            await driver.execute_query(
+                """
+            MATCH (n:Entity|Episodic|Community {group_id: $group_id})
+            DETACH DELETE n
+            """,
+                group_id=group_id,
+            )
+        invalidate_node_distances(driver)
+        remove_group_embeddings(driver, [group_id])
+        record_graph_write(driver, [group_id])
 
         return 'SUCCESS'
 
@@ -149,25 +169,47 @@ class EpisodicNode(Node):
     )
 
     async def save(self, driver: GraphDriver):
-        result = await driver.execute_query(
-            EPISODIC_NODE_SAVE,
-            uuid=self.uuid,
-            name=self.name,
-            group_id=self.group_id,
-            source_description=self.source_description,
-            content=self.content,
-            entity_edges=self.entity_edges,
-            created_at=self.created_at,
-            valid_at=self.valid_at,
-            source=self.source.value,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.save_nodes([self])
+        else:
+            result = await driver.execute_query(
+                EPISODIC_NODE_SAVE,
+                uuid=self.uuid,
+                name=self.name,
+                group_id=self.group_id,
+                source_description=self.source_description,
+                content=self.content,
+                entity_edges=self.entity_edges,
+                created_at=self.created_at,
+                valid_at=self.valid_at,
+                source=self.source.value,
+            )
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
         return result
 
+    async def delete(self, driver: GraphDriver):
+        # Also decrements the mention counts of the entities mentioned by the episode
+        if driver.operations is not None:
+            result = await driver.operations.delete_nodes([self.uuid])
+        else:
+            result = await driver.execute_query(EPISODIC_NODE_DELETE, uuid=self.uuid)
+        record_graph_write(driver, [self.group_id])
+
+        logger.debug(f'Deleted Node: {self.uuid}')
+
+        return result
+
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
+        if driver.operations is not None:
+            episodes = await driver.operations.get_nodes_by_uuids(cls, [uuid])
+            if len(episodes) == 0:
+                raise NodeNotFoundError(uuid)
+            return episodes[0]
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (e:Episodic {uuid: $uuid})
@@ -194,6 +236,9 @@ class EpisodicNode(Node):
 
     @classmethod
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
+        if driver.operations is not None:
+            return await driver.operations.get_nodes_by_uuids(cls, uuids)
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (e:Episodic) WHERE e.uuid IN $uuids
@@ -224,6 +269,11 @@ class EpisodicNode(Node):
         limit: int | None = None,
         uuid_cursor: str | None = None,
     ):
+        if driver.operations is not None:
+            return await driver.operations.get_nodes_by_group_ids(
+                cls, group_ids, limit, uuid_cursor
+            )
+
         cursor_query: LiteralString = 'AND e.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
 
@@ -258,6 +308,9 @@ class EpisodicNode(Node):
 
     @classmethod
     async def get_by_entity_node_uuid(cls, driver: GraphDriver, entity_node_uuid: str):
+        if driver.operations is not None:
+            return await driver.operations.get_episodic_nodes_by_entity_node_uuid(entity_node_uuid)
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (e:Episodic)-[r:MENTIONS]->(n:Entity {uuid: $entity_node_uuid})
@@ -284,6 +337,10 @@ class EpisodicNode(Node):
 class EntityNode(Node):
     name_embedding: list[float] | None = Field(default=None, description='embedding of the name')
     summary: str = Field(description='regional summary of surrounding edges', default_factory=str)
+    mention_count: int = Field(
+        default=0,
+        description='number of episodes that mention the node, maintained by the database',
+    )
     attributes: dict[str, Any] = Field(
         default={}, description='Additional attributes of the node. Dependent on node labels'
     )
@@ -298,6 +355,15 @@ class EntityNode(Node):
         return self.name_embedding
 
     async def load_name_embedding(self, driver: GraphDriver):
+        if driver.operations is not None:
+            nodes = await driver.operations.get_nodes_by_uuids(
+                EntityNode, [self.uuid], include_embeddings=True
+            )
+            if len(nodes) == 0:
+                raise NodeNotFoundError(self.uuid)
+            self.name_embedding = nodes[0].name_embedding
+            return
+
         query: LiteralString = """
             MATCH (n:Entity {uuid: $uuid})
             RETURN n.name_embedding AS name_embedding
@@ -321,11 +387,16 @@ class EntityNode(Node):
 
         entity_data.update(self.attributes or {})
 
-        result = await driver.execute_query(
-            ENTITY_NODE_SAVE,
-            labels=self.labels + ['Entity'],
-            entity_data=entity_data,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.save_nodes([self])
+        else:
+            result = await driver.execute_query(
+                ENTITY_NODE_SAVE,
+                labels=self.labels + ['Entity'],
+                entity_data=entity_data,
+            )
+        index_embeddings(driver, nodes=[self])
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
@@ -333,6 +404,12 @@ class EntityNode(Node):
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
+        if driver.operations is not None:
+            nodes = await driver.operations.get_nodes_by_uuids(cls, [uuid])
+            if len(nodes) == 0:
+                raise NodeNotFoundError(uuid)
+            return nodes[0]
+
         query = (
             """
                                                                     MATCH (n:Entity {uuid: $uuid})
@@ -354,6 +431,9 @@ class EntityNode(Node):
 
     @classmethod
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
+        if driver.operations is not None:
+            return await driver.operations.get_nodes_by_uuids(cls, uuids)
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Entity) WHERE n.uuid IN $uuids
@@ -375,6 +455,11 @@ class EntityNode(Node):
         limit: int | None = None,
         uuid_cursor: str | None = None,
     ):
+        if driver.operations is not None:
+            return await driver.operations.get_nodes_by_group_ids(
+                cls, group_ids, limit, uuid_cursor
+            )
+
         cursor_query: LiteralString = 'AND n.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
 
@@ -404,15 +489,19 @@ class CommunityNode(Node):
     summary: str = Field(description='region summary of member nodes', default_factory=str)
 
     async def save(self, driver: GraphDriver):
-        result = await driver.execute_query(
-            COMMUNITY_NODE_SAVE,
-            uuid=self.uuid,
-            name=self.name,
-            group_id=self.group_id,
-            summary=self.summary,
-            name_embedding=self.name_embedding,
-            created_at=self.created_at,
-        )
+        if driver.operations is not None:
+            result = await driver.operations.save_nodes([self])
+        else:
+            result = await driver.execute_query(
+                COMMUNITY_NODE_SAVE,
+                uuid=self.uuid,
+                name=self.name,
+                group_id=self.group_id,
+                summary=self.summary,
+                name_embedding=self.name_embedding,
+                created_at=self.created_at,
+            )
+        record_graph_write(driver, [self.group_id])
 
         logger.debug(f'Saved Node to Graph: {self.uuid}')
 
@@ -428,6 +517,15 @@ class CommunityNode(Node):
         return self.name_embedding
 
     async def load_name_embedding(self, driver: GraphDriver):
+        if driver.operations is not None:
+            nodes = await driver.operations.get_nodes_by_uuids(
+                CommunityNode, [self.uuid], include_embeddings=True
+            )
+            if len(nodes) == 0:
+                raise NodeNotFoundError(self.uuid)
+            self.name_embedding = nodes[0].name_embedding
+            return
+
         query: LiteralString = """
             MATCH (c:Community {uuid: $uuid})
             RETURN c.name_embedding AS name_embedding
@@ -441,6 +539,12 @@ class CommunityNode(Node):
 
     @classmethod
     async def get_by_uuid(cls, driver: GraphDriver, uuid: str):
+        if driver.operations is not None:
+            nodes = await driver.operations.get_nodes_by_uuids(cls, [uuid])
+            if len(nodes) == 0:
+                raise NodeNotFoundError(uuid)
+            return nodes[0]
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Community {uuid: $uuid})
@@ -464,6 +568,9 @@ class CommunityNode(Node):
 
     @classmethod
     async def get_by_uuids(cls, driver: GraphDriver, uuids: list[str]):
+        if driver.operations is not None:
+            return await driver.operations.get_nodes_by_uuids(cls, uuids)
+
         records, _, _ = await driver.execute_query(
             """
         MATCH (n:Community) WHERE n.uuid IN $uuids
@@ -490,6 +597,11 @@ class CommunityNode(Node):
         limit: int | None = None,
         uuid_cursor: str | None = None,
     ):
+        if driver.operations is not None:
+            return await driver.operations.get_nodes_by_group_ids(
+                cls, group_ids, limit, uuid_cursor
+            )
+
         cursor_query: LiteralString = 'AND n.uuid < $uuid' if uuid_cursor else ''
         limit_query: LiteralString = 'LIMIT $limit' if limit is not None else ''
 
@@ -550,6 +662,7 @@ def get_entity_node_from_record(record: Any) -> EntityNode:
         labels=record['labels'],
         created_at=parse_db_date(record['created_at']),  # type: ignore
         summary=record['summary'],
+        name_embedding=record.get('name_embedding'),
         attributes=record['attributes'],
     )
 
@@ -559,6 +672,7 @@ def get_entity_node_from_record(record: Any) -> EntityNode:
     entity_node.attributes.pop('name_embedding', None)
     entity_node.attributes.pop('summary', None)
     entity_node.attributes.pop('created_at', None)
+    entity_node.mention_count = entity_node.attributes.pop('mention_count', None) or 0
 
     return entity_node
 
@@ -0,0 +1,536 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import logging
+import os
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from numpy.typing import NDArray
+
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.memory_index import VectorIndex
+
+if TYPE_CHECKING:
+    from graphiti_core.edges import EntityEdge
+    from graphiti_core.nodes import EntityNode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_N_PROBE = 8
+REBUILD_BATCH_SIZE = 10000
+
+# Slots are allocated in the memory-mapped files in blocks of at least this many
+MIN_CAPACITY = 16
+MAX_UUID_BYTES = 64
+RECORD_DTYPE = np.dtype(
+    [
+        ('uuid', f'S{MAX_UUID_BYTES}'),
+        ('source', f'S{MAX_UUID_BYTES}'),
+        ('target', f'S{MAX_UUID_BYTES}'),
+    ]
+)
+
+VECTORS_SUFFIX = '.f32'
+RECORDS_SUFFIX = '.uuids'
+STATE_FILE = 'sidecar.json'
+NODES = 'nodes'
+EDGES = 'edges'
+
+
+class SidecarIndex(VectorIndex):
+    """
+    The entity name or fact embeddings of one group, optionally backed by memory-mapped files.
+
+    With a path, the float32 rows live in path.f32 and each row's uuid (and, for facts, the
+    uuids of its source and target entities) in the fixed-width records of path.uuids, so
+    writes only touch the changed rows. Both files grow by doubling and are reopened as is.
+    """
+
+    def __init__(self, path: str | None = None, ann: bool = True, n_probe: int = DEFAULT_N_PROBE):
+        super().__init__(ann=ann, n_probe=n_probe)
+        self.path = path
+        self.records: NDArray | None = None
+        self.endpoints: dict[str, tuple[str, str]] = {}
+        self.uuids_by_node: defaultdict[str, set[str]] = defaultdict(set)
+        if path is not None and os.path.exists(path + RECORDS_SUFFIX):
+            self._open()
+
+    def add(self, uuid: str, vector: list[float], endpoints: tuple[str, str] | None = None):
+        if self.path is not None and any(
+            len(value.encode()) > MAX_UUID_BYTES for value in (uuid, *(endpoints or ()))
+        ):
+            raise ValueError(f'uuid {uuid} or its endpoints are longer than {MAX_UUID_BYTES} bytes')
+
+        super().add(uuid, vector)
+        self._unlink(uuid)
+        if endpoints is not None:
+            self.endpoints[uuid] = endpoints
+            for node_uuid in endpoints:
+                self.uuids_by_node[node_uuid].add(uuid)
+
+        if self.records is not None:
+            source, target = endpoints or ('', '')
+            self.records[self.slots[uuid]] = (uuid.encode(), source.encode(), target.encode())
+
+    def remove(self, uuid: str):
+        slot = self.slots.get(uuid)
+        if slot is None:
+            return
+
+        super().remove(uuid)
+        self._unlink(uuid)
+        if self.records is not None:
+            self.records[slot] = (b'', b'', b'')
+
+    def remove_touching(self, node_uuids: Iterable[str]):
+        """Remove the facts whose source or target is one of the given entities."""
+        for node_uuid in node_uuids:
+            for uuid in list(self.uuids_by_node.get(node_uuid, ())):
+                self.remove(uuid)
+
+    def touching(self, node_uuids: Iterable[str]) -> set[str]:
+        return set().union(*(self.uuids_by_node.get(node_uuid, set()) for node_uuid in node_uuids))
+
+    def flush(self):
+        for array in (self.vectors, self.records):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def destroy(self):
+        """Release the memory-mapped files and delete them."""
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.records = None
+        if self.path is None:
+            return
+        for suffix in (VECTORS_SUFFIX, RECORDS_SUFFIX):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+    def _unlink(self, uuid: str):
+        endpoints = self.endpoints.pop(uuid, None)
+        if endpoints is None:
+            return
+        for node_uuid in endpoints:
+            uuids = self.uuids_by_node.get(node_uuid)
+            if uuids is None:
+                continue
+            uuids.discard(uuid)
+            if len(uuids) == 0:
+                del self.uuids_by_node[node_uuid]
+
+    def _append_slot(self) -> int:
+        if self.path is None:
+            return super()._append_slot()
+
+        slot = len(self.uuids)
+        if slot == len(self.vectors):
+            capacity = max(MIN_CAPACITY, 2 * len(self.vectors))
+            self.vectors = self._map_file(
+                'vectors', VECTORS_SUFFIX, np.dtype(np.float32), (capacity, self.dimensions or 0)
+            )
+            self.records = self._map_file('records', RECORDS_SUFFIX, RECORD_DTYPE, (capacity,))
+            self.norms = np.resize(self.norms, capacity)
+            self.norms[slot:] = 0
+            self.partitions = np.resize(self.partitions, capacity)
+
+        self.uuids.append(None)
+        return slot
+
+    def _map_file(self, attribute: str, suffix: str, dtype: np.dtype, shape: tuple) -> np.memmap:
+        assert self.path is not None
+        # Close the current mapping first, since mapped files cannot be resized on every platform
+        mapping = getattr(self, attribute)
+        if isinstance(mapping, np.memmap):
+            mapping.flush()
+        setattr(self, attribute, None)
+        del mapping
+
+        file_path = self.path + suffix
+        with open(file_path, 'ab') as file:
+            file.truncate(int(np.prod(shape)) * dtype.itemsize)
+        return np.memmap(file_path, dtype=dtype, mode='r+', shape=shape)
+
+    def _open(self):
+        assert self.path is not None
+        records = np.memmap(self.path + RECORDS_SUFFIX, dtype=RECORD_DTYPE, mode='r+')
+        capacity = len(records)
+        dimensions = os.path.getsize(self.path + VECTORS_SUFFIX) // (4 * capacity)
+        self.records = records
+        self.dimensions = dimensions
+        self.vectors = np.memmap(
+            self.path + VECTORS_SUFFIX, dtype=np.float32, mode='r+', shape=(capacity, dimensions)
+        )
+        self.norms = np.zeros(capacity, dtype=np.float32)
+        self.partitions = np.zeros(capacity, dtype=np.int32)
+
+        used = np.flatnonzero(records['uuid'] != b'')
+        size = int(used[-1]) + 1 if len(used) > 0 else 0
+        self.uuids = [None] * size
+        self.norms[used] = np.linalg.norm(self.vectors[used], axis=1)
+        for slot in used:
+            record = records[slot]
+            uuid = record['uuid'].decode()
+            self.slots[uuid] = int(slot)
+            self.uuids[slot] = uuid
+            if record['source'] != b'':
+                endpoints = (record['source'].decode(), record['target'].decode())
+                self.endpoints[uuid] = endpoints
+                for node_uuid in endpoints:
+                    self.uuids_by_node[node_uuid].add(uuid)
+
+        self.free_slots = [slot for slot in range(size) if self.uuids[slot] is None]
+
+
+class AnnSidecar:
+    """
+    Client-side nearest-neighbor index over the entity name and fact embeddings of a graph.
+
+    Each group gets one SidecarIndex of entity names and one of facts, searched with the
+    inverted file of VectorIndex once a group holds enough vectors. Attached to a driver, it
+    is kept in sync by the bulk save and delete paths, and lets get_relevant_nodes,
+    get_relevant_edges and get_edge_invalidation_candidates rank candidates locally and fetch
+    only the winners from the database.
+
+    The sidecar only serves groups it has seen in full: every group after rebuild() without
+    group_ids, or the groups passed to rebuild(). Other groups, and groups whose embeddings
+    stopped fitting their index (such as after an embedder change), are searched in the
+    database as before. Writes made by other processes are not seen, so rebuild after them.
+
+    With a path, the indices are memory-mapped files under that directory and survive
+    restarts. A path must not be shared by two processes.
+    """
+
+    def __init__(self, path: str | None = None, ann: bool = True, n_probe: int = DEFAULT_N_PROBE):
+        self.path = path
+        self.ann = ann
+        self.n_probe = n_probe
+        self.indices: dict[tuple[str, str], SidecarIndex] = {}
+        self.synced_all = False
+        self.synced_groups: set[str] = set()
+        self.stale_groups: set[str] = set()
+        if path is not None:
+            for kind in (NODES, EDGES):
+                os.makedirs(os.path.join(path, kind), exist_ok=True)
+            self._load_state()
+
+    def serves(self, group_id: str) -> bool:
+        return group_id not in self.stale_groups and (
+            self.synced_all or group_id in self.synced_groups
+        )
+
+    # Writes
+
+    def add_nodes(self, nodes: Sequence['EntityNode']):
+        for node in nodes:
+            self._add(NODES, node.group_id, node.uuid, node.name_embedding)
+
+    def add_edges(self, edges: Sequence['EntityEdge']):
+        for edge in edges:
+            self._add(
+                EDGES,
+                edge.group_id,
+                edge.uuid,
+                edge.fact_embedding,
+                (edge.source_node_uuid, edge.target_node_uuid),
+            )
+
+    def remove_nodes(self, group_id: str, uuids: list[str]):
+        """Remove entities together with their facts, as DETACH DELETE does."""
+        node_index = self._index(NODES, group_id)
+        edge_index = self._index(EDGES, group_id)
+        for uuid in uuids:
+            if node_index is not None:
+                node_index.remove(uuid)
+        if edge_index is not None:
+            edge_index.remove_touching(uuids)
+
+    def remove_edges(self, group_id: str, uuids: list[str]):
+        index = self._index(EDGES, group_id)
+        if index is None:
+            return
+        for uuid in uuids:
+            index.remove(uuid)
+
+    def remove_groups(self, group_ids: list[str] | None):
+        """Drop the indices of the given groups, or of every group if group_ids is None."""
+        if group_ids is None:
+            group_ids = sorted({group_id for _, group_id in self.indices} | self._stored_groups())
+        for group_id in group_ids:
+            for kind in (NODES, EDGES):
+                index = self._index(kind, group_id)
+                if index is not None:
+                    index.destroy()
+                    del self.indices[(kind, group_id)]
+
+    async def rebuild(self, driver: GraphDriver, group_ids: list[str] | None = None):
+        """
+        Reload the embeddings of the given groups, or of the whole graph, from the database.
+
+        The rebuilt groups are served from then on. Writes must not run concurrently.
+        """
+        if driver.operations is not None:
+            raise ValueError(
+                f'{type(driver).__name__} searches in-process already and has no use for a sidecar'
+            )
+
+        self.remove_groups(group_ids)
+        rebuilt = set(group_ids or ())
+        self.stale_groups -= rebuilt
+        for kind in (NODES, EDGES):
+            cursor: str | None = None
+            while True:
+                records = await self._load_batch(driver, kind, group_ids, cursor)
+                for record in records:
+                    endpoints = None
+                    if kind == EDGES:
+                        endpoints = (record['source_node_uuid'], record['target_node_uuid'])
+                    self._add(
+                        kind, record['group_id'], record['uuid'], record['embedding'], endpoints
+                    )
+                    rebuilt.add(record['group_id'])
+                if len(records) < REBUILD_BATCH_SIZE:
+                    break
+                cursor = records[-1]['uuid']
+
+        if group_ids is None:
+            self.synced_all = True
+            self.stale_groups.clear()
+        self.synced_groups |= rebuilt
+        self._save_state()
+        self.flush()
+
+    # Lookups
+
+    def search_nodes(
+        self, group_id: str, vector: list[float] | None, min_score: float, limit: int
+    ) -> list[str]:
+        index = self._index(NODES, group_id)
+        if index is None or vector is None:
+            return []
+        return [uuid for uuid, _ in index.search(vector, min_score)[:limit]]
+
+    def search_edges_between(
+        self,
+        group_id: str,
+        vector: list[float] | None,
+        source_node_uuid: str,
+        target_node_uuid: str,
+        min_score: float,
+        limit: int,
+    ) -> list[str]:
+        """Facts between the two entities in either direction, best first."""
+        index = self._index(EDGES, group_id)
+        if index is None or vector is None:
+            return []
+        endpoints = {source_node_uuid, target_node_uuid}
+        candidates = [
+            uuid
+            for uuid in index.touching([source_node_uuid])
+            if set(index.endpoints[uuid]) == endpoints
+        ]
+        return [uuid for uuid, _ in index.search(vector, min_score, candidates, exact=True)[:limit]]
+
+    def search_edges_touching(
+        self,
+        group_id: str,
+        vector: list[float] | None,
+        node_uuids: list[str],
+        min_score: float,
+        limit: int,
+    ) -> list[str]:
+        """Facts whose source or target is one of the entities, best first."""
+        index = self._index(EDGES, group_id)
+        if index is None or vector is None:
+            return []
+        candidates = index.touching(node_uuids)
+        return [uuid for uuid, _ in index.search(vector, min_score, candidates, exact=True)[:limit]]
+
+    def get_node_embedding(self, group_id: str, uuid: str) -> list[float] | None:
+        index = self._index(NODES, group_id)
+        return None if index is None else index.get(uuid)
+
+    def get_edge_embedding(self, group_id: str, uuid: str) -> list[float] | None:
+        index = self._index(EDGES, group_id)
+        return None if index is None else index.get(uuid)
+
+    def flush(self):
+        for index in self.indices.values():
+            index.flush()
+
+    def _add(
+        self,
+        kind: str,
+        group_id: str,
+        uuid: str,
+        vector: list[float] | None,
+        endpoints: tuple[str, str] | None = None,
+    ):
+        if vector is None:
+            index = self._index(kind, group_id)
+            if index is not None:
+                index.remove(uuid)
+            return
+
+        index = self._index(kind, group_id, create=True)
+        assert index is not None
+        try:
+            index.add(uuid, vector, endpoints)
+        except ValueError as e:
+            index.remove(uuid)
+            if group_id not in self.stale_groups:
+                logger.warning(
+                    f'ANN sidecar of group {group_id!r} no longer matches the graph and is '
+                    f'bypassed until it is rebuilt: {e}'
+                )
+                self.stale_groups.add(group_id)
+                self._save_state()
+
+    def _index(self, kind: str, group_id: str, create: bool = False) -> SidecarIndex | None:
+        index = self.indices.get((kind, group_id))
+        if index is not None:
+            return index
+
+        path = None if self.path is None else os.path.join(self.path, kind, f'group-{group_id}')
+        stored = path is not None and os.path.exists(path + RECORDS_SUFFIX)
+        if not create and not stored:
+            return None
+
+        index = SidecarIndex(path, self.ann, self.n_probe)
+        self.indices[(kind, group_id)] = index
+        return index
+
+    def _stored_groups(self) -> set[str]:
+        if self.path is None:
+            return set()
+        return {
+            file_name[len('group-') : -len(RECORDS_SUFFIX)]
+            for kind in (NODES, EDGES)
+            for file_name in os.listdir(os.path.join(self.path, kind))
+            if file_name.endswith(RECORDS_SUFFIX)
+        }
+
+    async def _load_batch(
+        self, driver: GraphDriver, kind: str, group_ids: list[str] | None, cursor: str | None
+    ) -> list[Any]:
+        alias, match, embedding, endpoints = (
+            ('n', '(n:Entity)', 'name_embedding', '')
+            if kind == NODES
+            else (
+                'e',
+                '(n:Entity)-[e:RELATES_TO]->(m:Entity)',
+                'fact_embedding',
+                'n.uuid AS source_node_uuid, m.uuid AS target_node_uuid,',
+            )
+        )
+        conditions = [f'{alias}.{embedding} IS NOT NULL']
+        if group_ids is not None:
+            conditions.append(f'{alias}.group_id IN $group_ids')
+        if cursor is not None:
+            conditions.append(f'{alias}.uuid < $cursor')
+
+        records, _, _ = await driver.execute_query(
+            f"""
+            MATCH {match}
+            WHERE {' AND '.join(conditions)}
+            RETURN
+                {alias}.uuid AS uuid,
+                {alias}.group_id AS group_id,
+                {endpoints}
+                {alias}.{embedding} AS embedding
+            ORDER BY uuid DESC
+            LIMIT $limit
+            """,
+            group_ids=group_ids,
+            cursor=cursor,
+            limit=REBUILD_BATCH_SIZE,
+            routing_='r',
+        )
+        return records
+
+    def _load_state(self):
+        assert self.path is not None
+        state_path = os.path.join(self.path, STATE_FILE)
+        if not os.path.exists(state_path):
+            return
+        with open(state_path) as file:
+            state = json.load(file)
+        self.synced_all = state['synced_all']
+        self.synced_groups = set(state['synced_groups'])
+        self.stale_groups = set(state['stale_groups'])
+
+    def _save_state(self):
+        if self.path is None:
+            return
+        state = {
+            'synced_all': self.synced_all,
+            'synced_groups': sorted(self.synced_groups),
+            'stale_groups': sorted(self.stale_groups),
+        }
+        state_path = os.path.join(self.path, STATE_FILE)
+        with open(state_path + '.tmp', 'w') as file:
+            json.dump(state, file)
+        os.replace(state_path + '.tmp', state_path)
+
+
+ann_sidecars: WeakKeyDictionary[GraphDriver, AnnSidecar] = WeakKeyDictionary()
+
+
+def attach_ann_sidecar(driver: GraphDriver, sidecar: AnnSidecar):
+    ann_sidecars[driver] = sidecar
+
+
+def get_ann_sidecar(driver: GraphDriver) -> AnnSidecar | None:
+    return ann_sidecars.get(driver)
+
+
+def index_embeddings(
+    driver: GraphDriver,
+    nodes: Sequence['EntityNode'] = (),
+    edges: Sequence['EntityEdge'] = (),
+):
+    """Add saved entities and facts to the driver's sidecar, if it has one."""
+    sidecar = ann_sidecars.get(driver)
+    if sidecar is None:
+        return
+    sidecar.add_nodes(nodes)
+    sidecar.add_edges(edges)
+
+
+def remove_embeddings(
+    driver: GraphDriver,
+    group_id: str,
+    node_uuids: list[str] | None = None,
+    edge_uuids: list[str] | None = None,
+):
+    """Remove deleted nodes (with their facts) and edges from the driver's sidecar."""
+    sidecar = ann_sidecars.get(driver)
+    if sidecar is None:
+        return
+    sidecar.remove_nodes(group_id, node_uuids or [])
+    sidecar.remove_edges(group_id, edge_uuids or [])
+
+
+def remove_group_embeddings(driver: GraphDriver, group_ids: list[str] | None = None):
+    """Drop deleted groups, or every group if group_ids is None, from the driver's sidecar."""
+    sidecar = ann_sidecars.get(driver)
+    if sidecar is None:
+        return
+    sidecar.remove_groups(group_ids)
@@ -0,0 +1,113 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from weakref import WeakKeyDictionary
+
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.metrics import record_cache_lookup
+
+DEFAULT_MAX_CENTER_NODES = 128
+
+
+class NodeDistanceCache:
+    """
+    LRU cache of center node neighborhoods used by the node distance reranker.
+
+    Each entry maps the uuids of the entities within max_depth hops of a center node to their
+    shortest-path distance. An entry is evicted as soon as a write touches any node in its
+    neighborhood, since only such writes can change distances within max_depth hops.
+    """
+
+    def __init__(self, max_center_nodes: int = DEFAULT_MAX_CENTER_NODES):
+        self.max_center_nodes = max_center_nodes
+        self.entries: OrderedDict[tuple[str, int], dict[str, int]] = OrderedDict()
+        self.entries_by_node: defaultdict[str, set[tuple[str, int]]] = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, center_node_uuid: str, max_depth: int) -> dict[str, int] | None:
+        key = (center_node_uuid, max_depth)
+        distances = self.entries.get(key)
+        record_cache_lookup('node_distance', distances is not None)
+        if distances is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return distances
+
+    def put(self, center_node_uuid: str, max_depth: int, distances: dict[str, int]):
+        key = (center_node_uuid, max_depth)
+        self._evict(key)
+        self.entries[key] = distances
+        for node_uuid in distances:
+            self.entries_by_node[node_uuid].add(key)
+
+        while len(self.entries) > self.max_center_nodes:
+            self._evict(next(iter(self.entries)))
+
+    def invalidate(self, node_uuids: Iterable[str]):
+        """Evict every neighborhood that contains one of the given nodes."""
+        for node_uuid in node_uuids:
+            for key in list(self.entries_by_node.get(node_uuid, ())):
+                self._evict(key)
+
+    def clear(self):
+        self.entries.clear()
+        self.entries_by_node.clear()
+
+    def _evict(self, key: tuple[str, int]):
+        distances = self.entries.pop(key, None)
+        if distances is None:
+            return
+
+        for node_uuid in distances:
+            keys = self.entries_by_node.get(node_uuid)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if len(keys) == 0:
+                del self.entries_by_node[node_uuid]
+
+
+node_distance_caches: WeakKeyDictionary[GraphDriver, NodeDistanceCache] = WeakKeyDictionary()
+
+
+def get_node_distance_cache(driver: GraphDriver) -> NodeDistanceCache:
+    cache = node_distance_caches.get(driver)
+    if cache is None:
+        cache = NodeDistanceCache()
+        node_distance_caches[driver] = cache
+    return cache
+
+
+def invalidate_node_distances(driver: GraphDriver, node_uuids: Iterable[str] | None = None):
+    """
+    Drop cached neighborhoods after a write to the graph.
+
+    node_uuids are the nodes whose RELATES_TO edges changed. If None, the whole cache for the
+    driver is cleared, for writes whose affected nodes are unknown.
+    """
+    cache = node_distance_caches.get(driver)
+    if cache is None:
+        return
+    if node_uuids is None:
+        cache.clear()
+    else:
+        cache.invalidate(node_uuids)
@@ -14,19 +14,24 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import logging
 from collections import defaultdict
-from time import time
+from time import monotonic, time
 
 from graphiti_core.cross_encoder.client import CrossEncoderClient
-from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.driver import GraphDriver, query_deadline
 from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder import EmbedderClient
 from graphiti_core.errors import SearchRerankerError
 from graphiti_core.graphiti_types import GraphitiClients
 from graphiti_core.helpers import semaphore_gather
+from graphiti_core.metrics import search_duration
 from graphiti_core.nodes import CommunityNode, EntityNode, EpisodicNode
+from graphiti_core.search.search_cache import GraphVersion, SearchCacheKey, SearchResultCache
 from graphiti_core.search.search_config import (
     DEFAULT_SEARCH_LIMIT,
+    DEFAULT_SHORTLIST_MULTIPLIER,
     CommunityReranker,
     CommunitySearchConfig,
     EdgeReranker,
@@ -39,14 +44,20 @@ from graphiti_core.search.search_config import (
     NodeSearchMethod,
     SearchConfig,
     SearchResults,
+    ShortlistMethod,
 )
+from graphiti_core.search.search_config_recipes import get_recipe_name
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.search.search_utils import (
     community_fulltext_search,
     community_similarity_search,
+    cosine_similarity_ranking,
+    cross_encoder_reranker,
     edge_bfs_search,
     edge_fulltext_search,
+    edge_fulltext_search_many,
     edge_similarity_search,
+    edge_similarity_search_many,
     episode_fulltext_search,
     episode_mentions_reranker,
     get_embeddings_for_communities,
@@ -56,13 +67,18 @@ from graphiti_core.search.search_utils import (
     node_bfs_search,
     node_distance_reranker,
     node_fulltext_search,
+    node_fulltext_search_many,
     node_similarity_search,
+    node_similarity_search_many,
     rrf,
 )
+from graphiti_core.tracer import add_span_attributes, traced
+from graphiti_core.usage import LLMUsage, collect_usage
 
 logger = logging.getLogger(__name__)
 
 
+@traced('search')
 async def search(
     clients: GraphitiClients,
     query: str,
@@ -72,7 +88,20 @@ async def search(
     center_node_uuid: str | None = None,
     bfs_origin_node_uuids: list[str] | None = None,
     query_vector: list[float] | None = None,
+    timeout: float | None = None,
+    cache: SearchResultCache | None = None,
 ) -> SearchResults:
+    """
+    Search the graph for edges, nodes, episodes and communities relevant to the query.
+
+    If timeout is set, the search gets that many seconds in total. Driver queries run with a
+    transaction timeout for the time left, and stages still running at the deadline are
+    cancelled. The results of the stages that finished are returned, with the remaining
+    stages listed in timed_out_stages, or in skipped_stages if they never started.
+
+    If a cache is given, results are served from it while the searched groups are unchanged,
+    and complete results are stored in it.
+    """
     start = time()
 
     driver = clients.driver
@@ -86,16 +115,104 @@ async def search(
             episodes=[],
             communities=[],
         )
-    query_vector = (
-        query_vector
-        if query_vector is not None
-        else await embedder.create(input_data=[query.replace('\n', ' ')])
-    )
 
     # if group_ids is empty, set it to None
     group_ids = group_ids if group_ids and group_ids != [''] else None
-    edges, nodes, episodes, communities = await semaphore_gather(
-        edge_search(
+    add_span_attributes({'group_ids': group_ids, 'limit': config.limit})
+
+    cache_key: SearchCacheKey | None = None
+    cache_version: GraphVersion | None = None
+    if cache is not None:
+        cache_key = cache.key(
+            driver, query, config, search_filter, group_ids, center_node_uuid, bfs_origin_node_uuids
+        )
+        cached_results = cache.get(driver, cache_key)
+        add_span_attributes({'cache_hit': cached_results is not None})
+        if cached_results is not None:
+            search_duration.observe(time() - start, recipe=get_recipe_name(config))
+            return cached_results
+        # Taken before searching, so that writes made during the search invalidate the results
+        cache_version = cache.version(driver, cache_key)
+
+    deadline = monotonic() + timeout if timeout is not None else None
+    deadline_token = query_deadline.set(deadline)
+    try:
+        with collect_usage() as usage:
+            results = await search_with_deadline(
+                driver,
+                embedder,
+                cross_encoder,
+                query,
+                group_ids,
+                config,
+                search_filter,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+                query_vector,
+                deadline,
+                cache,
+                cache_key,
+                cache_version,
+            )
+        # Copied so that results stored in the cache do not carry this search's usage
+        return results.model_copy(update={'llm_usage': usage.summary()})
+    finally:
+        query_deadline.reset(deadline_token)
+
+        latency = (time() - start) * 1000
+        search_duration.observe(latency / 1000, recipe=get_recipe_name(config))
+
+        logger.debug(f'search returned context for query {query} in {latency} ms')
+
+
+async def search_with_deadline(
+    driver: GraphDriver,
+    embedder: EmbedderClient,
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None,
+    bfs_origin_node_uuids: list[str] | None,
+    query_vector: list[float] | None,
+    deadline: float | None,
+    cache: SearchResultCache | None = None,
+    cache_key: SearchCacheKey | None = None,
+    cache_version: GraphVersion | None = None,
+) -> SearchResults:
+    stage_configs = {
+        'edges': config.edge_config,
+        'nodes': config.node_config,
+        'episodes': config.episode_config,
+        'communities': config.community_config,
+    }
+    configured_stages = [stage for stage, stage_config in stage_configs.items() if stage_config]
+
+    if query_vector is None:
+        try:
+            query_vector = await asyncio.wait_for(
+                embedder.create(input_data=[query.replace('\n', ' ')]),
+                timeout=deadline - monotonic() if deadline is not None else None,
+            )
+        except asyncio.TimeoutError:
+            logger.warning('search deadline expired while embedding the query')
+            return SearchResults(
+                edges=[],
+                nodes=[],
+                episodes=[],
+                communities=[],
+                skipped_stages=configured_stages,
+            )
+
+    if cache is not None and cache_key is not None:
+        similar_results = cache.get_similar(driver, cache_key, query_vector)
+        if similar_results is not None:
+            add_span_attributes({'semantic_cache_hit': True})
+            return similar_results
+
+    stages = {
+        'edges': edge_search(
             driver,
             cross_encoder,
             query,
@@ -108,7 +225,7 @@ async def search(
             config.limit,
             config.reranker_min_score,
         ),
-        node_search(
+        'nodes': node_search(
             driver,
             cross_encoder,
             query,
@@ -121,7 +238,7 @@ async def search(
             config.limit,
             config.reranker_min_score,
         ),
-        episode_search(
+        'episodes': episode_search(
             driver,
             cross_encoder,
             query,
@@ -132,7 +249,7 @@ async def search(
             config.limit,
             config.reranker_min_score,
         ),
-        community_search(
+        'communities': community_search(
             driver,
             cross_encoder,
             query,
@@ -142,22 +259,309 @@ async def search(
             config.limit,
             config.reranker_min_score,
         ),
+    }
+    tasks = {stage: asyncio.create_task(coroutine) for stage, coroutine in stages.items()}
+
+    try:
+        await asyncio.wait(
+            tasks.values(), timeout=deadline - monotonic() if deadline is not None else None
+        )
+    finally:
+        # Cancel the stages still running at the deadline, or when the search itself is cancelled
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if len(pending) > 0:
+            await asyncio.wait(pending)
+
+    results: dict[str, list] = {}
+    timed_out_stages: list[str] = []
+    for stage, task in tasks.items():
+        if task.cancelled():
+            timed_out_stages.append(stage)
+            results[stage] = []
+        elif task.exception() is not None:
+            # Driver and reranker calls fail with their own timeout errors at the deadline
+            if deadline is not None and monotonic() >= deadline:
+                logger.warning(f'search {stage} stage failed at the deadline: {task.exception()}')
+                timed_out_stages.append(stage)
+                results[stage] = []
+            else:
+                raise task.exception()  # type: ignore[misc]
+        else:
+            results[stage] = task.result()
+
+    if len(timed_out_stages) > 0:
+        logger.warning(f'search deadline expired, returning partial results: {timed_out_stages}')
+
+    search_results = SearchResults(
+        edges=results['edges'],
+        nodes=results['nodes'],
+        episodes=results['episodes'],
+        communities=results['communities'],
+        timed_out_stages=timed_out_stages,
+    )
+    add_span_attributes(
+        {
+            'edge_count': len(search_results.edges),
+            'node_count': len(search_results.nodes),
+            'episode_count': len(search_results.episodes),
+            'community_count': len(search_results.communities),
+            'timed_out_stages': timed_out_stages,
+        }
     )
 
-    results = SearchResults(
-        edges=edges,
-        nodes=nodes,
-        episodes=episodes,
-        communities=communities,
+    if (
+        cache is not None
+        and cache_key is not None
+        and cache_version is not None
+        and len(timed_out_stages) == 0
+    ):
+        cache.put(cache_key, cache_version, search_results, query_vector)
+
+    return search_results
+
+
+@traced('search_many')
+async def search_many(
+    clients: GraphitiClients,
+    queries: list[str],
+    group_ids: list[str] | None,
+    config: SearchConfig,
+    search_filter: SearchFilters,
+    center_node_uuid: str | None = None,
+    bfs_origin_node_uuids: list[str] | None = None,
+    query_vectors: list[list[float]] | None = None,
+    cache: SearchResultCache | None = None,
+) -> list[SearchResults]:
+    """
+    Run search for a batch of queries, returning the results of each query in order.
+
+    All queries are embedded with a single batch call, and the edge and node fulltext and
+    similarity stages run as one UNWIND query per method for the whole batch. Episode and
+    community searches are not batched: like graph traversal and reranking, they run per query,
+    concurrently.
+
+    If a cache is given, cached queries are answered from it and the results of the others are
+    stored in it, as in search. There is no timeout: the batched stages serve every query, so
+    they cannot return partial results for one of them. Use search for deadline-bound queries.
+    """
+    add_span_attributes({'query_count': len(queries), 'group_ids': group_ids})
+    start = time()
+
+    driver = clients.driver
+    embedder = clients.embedder
+    cross_encoder = clients.cross_encoder
+
+    # if group_ids is empty, set it to None
+    group_ids = group_ids if group_ids and group_ids != [''] else None
+
+    results = [SearchResults(edges=[], nodes=[], episodes=[], communities=[]) for _ in queries]
+    query_indexes = [i for i, query in enumerate(queries) if query.strip() != '']
+
+    cache_keys: dict[int, SearchCacheKey] = {}
+    cache_versions: dict[int, GraphVersion] = {}
+    if cache is not None:
+        for i in query_indexes:
+            cache_key = cache.key(
+                driver,
+                queries[i],
+                config,
+                search_filter,
+                group_ids,
+                center_node_uuid,
+                bfs_origin_node_uuids,
+            )
+            cached_results = cache.get(driver, cache_key)
+            if cached_results is not None:
+                results[i] = cached_results
+                continue
+            cache_keys[i] = cache_key
+            # Taken before searching, so that writes made during the search invalidate the results
+            cache_versions[i] = cache.version(driver, cache_key)
+        query_indexes = list(cache_keys)
+        add_span_attributes({'cache_hits': len(queries) - len(query_indexes)})
+
+    if len(query_indexes) == 0:
+        return results
+
+    if query_vectors is not None:
+        batch_vectors = [query_vectors[i] for i in query_indexes]
+    else:
+        inputs = [queries[i].replace('\n', ' ') for i in query_indexes]
+        try:
+            batch_vectors = await embedder.create_batch(inputs)
+        except NotImplementedError:
+            batch_vectors = await semaphore_gather(
+                *[embedder.create(input_data=[text]) for text in inputs]
+            )
+
+    if cache is not None:
+        uncached: list[tuple[int, list[float]]] = []
+        for i, query_vector in zip(query_indexes, batch_vectors, strict=True):
+            similar_results = cache.get_similar(driver, cache_keys[i], query_vector)
+            if similar_results is not None:
+                results[i] = similar_results
+            else:
+                uncached.append((i, query_vector))
+        query_indexes = [i for i, _ in uncached]
+        batch_vectors = [query_vector for _, query_vector in uncached]
+        if len(query_indexes) == 0:
+            return results
+
+    batch_queries = [queries[i] for i in query_indexes]
+    edge_config = config.edge_config
+    node_config = config.node_config
+    limit = config.limit
+
+    async def no_results() -> list[list]:
+        return [[] for _ in batch_queries]
+
+    (
+        edge_fulltext_results,
+        edge_similarity_results,
+        node_fulltext_results,
+        node_similarity_results,
+    ) = await semaphore_gather(
+        edge_fulltext_search_many(driver, batch_queries, search_filter, group_ids, 2 * limit)
+        if edge_config is not None
+        else no_results(),
+        edge_similarity_search_many(
+            driver,
+            batch_vectors,
+            search_filter,
+            group_ids,
+            2 * limit,
+            edge_config.sim_min_score,
+            include_embeddings=edge_embeddings_needed(edge_config),
+        )
+        if edge_config is not None
+        else no_results(),
+        node_fulltext_search_many(driver, batch_queries, search_filter, group_ids, 2 * limit)
+        if node_config is not None
+        else no_results(),
+        node_similarity_search_many(
+            driver,
+            batch_vectors,
+            search_filter,
+            group_ids,
+            2 * limit,
+            node_config.sim_min_score,
+            include_embeddings=node_embeddings_needed(node_config),
+        )
+        if node_config is not None
+        else no_results(),
     )
 
+    async def search_one(i: int) -> SearchResults:
+        query = batch_queries[i]
+        query_vector = batch_vectors[i]
+        with collect_usage() as usage:
+            edges, nodes, episodes, communities = await semaphore_gather(
+                edge_search(
+                    driver,
+                    cross_encoder,
+                    query,
+                    query_vector,
+                    group_ids,
+                    edge_config,
+                    search_filter,
+                    center_node_uuid,
+                    bfs_origin_node_uuids,
+                    limit,
+                    config.reranker_min_score,
+                    prefetched_results=[edge_fulltext_results[i], edge_similarity_results[i]],
+                ),
+                node_search(
+                    driver,
+                    cross_encoder,
+                    query,
+                    query_vector,
+                    group_ids,
+                    node_config,
+                    search_filter,
+                    center_node_uuid,
+                    bfs_origin_node_uuids,
+                    limit,
+                    config.reranker_min_score,
+                    prefetched_results=[node_fulltext_results[i], node_similarity_results[i]],
+                ),
+                episode_search(
+                    driver,
+                    cross_encoder,
+                    query,
+                    query_vector,
+                    group_ids,
+                    config.episode_config,
+                    search_filter,
+                    limit,
+                    config.reranker_min_score,
+                ),
+                community_search(
+                    driver,
+                    cross_encoder,
+                    query,
+                    query_vector,
+                    group_ids,
+                    config.community_config,
+                    limit,
+                    config.reranker_min_score,
+                ),
+            )
+        return SearchResults(
+            edges=edges,
+            nodes=nodes,
+            episodes=episodes,
+            communities=communities,
+            llm_usage=usage.summary(),
+        )
+
+    batch_results = await semaphore_gather(*[search_one(i) for i in range(len(batch_queries))])
+
+    for i, search_results, query_vector in zip(
+        query_indexes, batch_results, batch_vectors, strict=True
+    ):
+        results[i] = search_results
+        if cache is not None:
+            # Stored without this search's usage, as in search
+            cache.put(
+                cache_keys[i],
+                cache_versions[i],
+                search_results.model_copy(update={'llm_usage': LLMUsage()}),
+                query_vector,
+            )
+
     latency = (time() - start) * 1000
 
-    logger.debug(f'search returned context for query {query} in {latency} ms')
+    logger.debug(f'search_many returned context for {len(queries)} queries in {latency} ms')
 
     return results
 
 
+def edge_embeddings_needed(config: EdgeSearchConfig) -> bool:
+    # Return embeddings from the similarity search when the reranker would otherwise load them
+    return config.reranker == EdgeReranker.mmr or (
+        config.reranker == EdgeReranker.cross_encoder
+        and config.shortlist_method == ShortlistMethod.cosine_similarity
+    )
+
+
+def node_embeddings_needed(config: NodeSearchConfig) -> bool:
+    # Return embeddings from the similarity search when the reranker would otherwise load them
+    return config.reranker == NodeReranker.mmr or (
+        config.reranker == NodeReranker.cross_encoder
+        and config.shortlist_method == ShortlistMethod.cosine_similarity
+    )
+
+
+def get_shortlist_size(shortlist_size: int | None, limit: int) -> int:
+    # The cross-encoder always sees at least limit passages, so the shortlist never cuts results
+    if shortlist_size is None:
+        return DEFAULT_SHORTLIST_MULTIPLIER * limit
+    return max(shortlist_size, limit)
+
+
+@traced('edge_search')
 async def edge_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -170,29 +574,49 @@ async def edge_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    prefetched_results: list[list[EntityEdge]] | None = None,
 ) -> list[EntityEdge]:
     if config is None:
         return []
-    search_results: list[list[EntityEdge]] = list(
-        await semaphore_gather(
-            *[
-                edge_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
-                edge_similarity_search(
-                    driver,
-                    query_vector,
-                    None,
-                    None,
-                    search_filter,
-                    group_ids,
-                    2 * limit,
-                    config.sim_min_score,
-                ),
-                edge_bfs_search(
-                    driver, bfs_origin_node_uuids, config.bfs_max_depth, search_filter, 2 * limit
-                ),
-            ]
-        )
+    add_span_attributes(
+        {
+            'search_methods': [method.value for method in config.search_methods],
+            'reranker': config.reranker.value,
+        }
     )
+    if prefetched_results is not None:
+        # fulltext and similarity results were already retrieved for a batch of queries
+        search_results: list[list[EntityEdge]] = prefetched_results + [
+            await edge_bfs_search(
+                driver, bfs_origin_node_uuids, config.bfs_max_depth, search_filter, 2 * limit
+            )
+        ]
+    else:
+        search_results = list(
+            await semaphore_gather(
+                *[
+                    edge_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
+                    edge_similarity_search(
+                        driver,
+                        query_vector,
+                        None,
+                        None,
+                        search_filter,
+                        group_ids,
+                        2 * limit,
+                        config.sim_min_score,
+                        include_embeddings=edge_embeddings_needed(config),
+                    ),
+                    edge_bfs_search(
+                        driver,
+                        bfs_origin_node_uuids,
+                        config.bfs_max_depth,
+                        search_filter,
+                        2 * limit,
+                    ),
+                ]
+            )
+        )
 
     if EdgeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
         source_node_uuids = [edge.source_node_uuid for result in search_results for edge in result]
@@ -218,13 +642,30 @@ async def edge_search(
             search_result_uuids_and_vectors,
             config.mmr_lambda,
             reranker_min_score,
+            max_results=limit,
         )
     elif config.reranker == EdgeReranker.cross_encoder:
-        fact_to_uuid_map = {edge.fact: edge.uuid for edge in list(edge_uuid_map.values())[:limit]}
-        reranked_facts = await cross_encoder.rank(query, list(fact_to_uuid_map.keys()))
-        reranked_uuids = [
-            fact_to_uuid_map[fact] for fact, score in reranked_facts if score >= reranker_min_score
-        ]
+        # use rrf or cosine similarity to pick the shortlist sent to the cross-encoder
+        if config.shortlist_method == ShortlistMethod.cosine_similarity:
+            shortlist_uuids = cosine_similarity_ranking(
+                query_vector, await get_embeddings_for_edges(driver, list(edge_uuid_map.values()))
+            )
+        else:
+            shortlist_uuids = rrf([[edge.uuid for edge in result] for result in search_results])
+        shortlist_size = get_shortlist_size(config.shortlist_size, limit)
+
+        fact_to_uuid_map: dict[str, str] = {}
+        for uuid in shortlist_uuids[:shortlist_size]:
+            fact_to_uuid_map.setdefault(edge_uuid_map[uuid].fact, uuid)
+
+        reranked_uuids = await cross_encoder_reranker(
+            cross_encoder,
+            query,
+            fact_to_uuid_map,
+            reranker_min_score,
+            limit,
+            config.early_exit_score,
+        )
     elif config.reranker == EdgeReranker.node_distance:
         if center_node_uuid is None:
             raise SearchRerankerError('No center node provided for Node Distance reranker')
@@ -244,7 +685,11 @@ async def edge_search(
         source_uuids = [source_node_uuid for source_node_uuid in source_to_edge_uuid_map]
 
         reranked_node_uuids = await node_distance_reranker(
-            driver, source_uuids, center_node_uuid, min_score=reranker_min_score
+            driver,
+            source_uuids,
+            center_node_uuid,
+            min_score=reranker_min_score,
+            max_depth=config.node_distance_max_depth,
         )
 
         for node_uuid in reranked_node_uuids:
@@ -253,11 +698,12 @@ async def edge_search(
     reranked_edges = [edge_uuid_map[uuid] for uuid in reranked_uuids]
 
     if config.reranker == EdgeReranker.episode_mentions:
-        reranked_edges.sort(reverse=True, key=lambda edge: len(edge.episodes))
+        reranked_edges.sort(reverse=True, key=lambda edge: edge.episode_count)
 
     return reranked_edges[:limit]
 
 
+@traced('node_search')
 async def node_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -270,22 +716,47 @@ async def node_search(
     bfs_origin_node_uuids: list[str] | None = None,
     limit=DEFAULT_SEARCH_LIMIT,
     reranker_min_score: float = 0,
+    prefetched_results: list[list[EntityNode]] | None = None,
 ) -> list[EntityNode]:
     if config is None:
         return []
-    search_results: list[list[EntityNode]] = list(
-        await semaphore_gather(
-            *[
-                node_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
-                node_similarity_search(
-                    driver, query_vector, search_filter, group_ids, 2 * limit, config.sim_min_score
-                ),
-                node_bfs_search(
-                    driver, bfs_origin_node_uuids, search_filter, config.bfs_max_depth, 2 * limit
-                ),
-            ]
-        )
+    add_span_attributes(
+        {
+            'search_methods': [method.value for method in config.search_methods],
+            'reranker': config.reranker.value,
+        }
     )
+    if prefetched_results is not None:
+        # fulltext and similarity results were already retrieved for a batch of queries
+        search_results: list[list[EntityNode]] = prefetched_results + [
+            await node_bfs_search(
+                driver, bfs_origin_node_uuids, search_filter, config.bfs_max_depth, 2 * limit
+            )
+        ]
+    else:
+        search_results = list(
+            await semaphore_gather(
+                *[
+                    node_fulltext_search(driver, query, search_filter, group_ids, 2 * limit),
+                    node_similarity_search(
+                        driver,
+                        query_vector,
+                        search_filter,
+                        group_ids,
+                        2 * limit,
+                        config.sim_min_score,
+                        include_embeddings=node_embeddings_needed(config),
+                    ),
+                    node_bfs_search(
+                        driver,
+                        bfs_origin_node_uuids,
+                        search_filter,
+                        config.bfs_max_depth,
+                        2 * limit,
+                    ),
+                ]
+            )
+        )
 
     if NodeSearchMethod.bfs in config.search_methods and bfs_origin_node_uuids is None:
         origin_node_uuids = [node.uuid for result in search_results for node in result]
@@ -311,19 +782,35 @@ async def node_search(
             search_result_uuids_and_vectors,
             config.mmr_lambda,
             reranker_min_score,
+            max_results=limit,
         )
     elif config.reranker == NodeReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for node in list(node_uuid_map.values())}
+        # use rrf or cosine similarity to pick the shortlist sent to the cross-encoder
+        if config.shortlist_method == ShortlistMethod.cosine_similarity:
+            shortlist_uuids = cosine_similarity_ranking(
+                query_vector, await get_embeddings_for_nodes(driver, list(node_uuid_map.values()))
+            )
+        else:
+            shortlist_uuids = rrf(search_result_uuids)
+        shortlist_size = get_shortlist_size(config.shortlist_size, limit)
 
-        reranked_node_names = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
-        reranked_uuids = [
-            name_to_uuid_map[name]
-            for name, score in reranked_node_names
-            if score >= reranker_min_score
-        ]
+        name_to_uuid_map: dict[str, str] = {}
+        for uuid in shortlist_uuids[:shortlist_size]:
+            name_to_uuid_map.setdefault(node_uuid_map[uuid].name, uuid)
+
+        reranked_uuids = await cross_encoder_reranker(
+            cross_encoder,
+            query,
+            name_to_uuid_map,
+            reranker_min_score,
+            limit,
+            config.early_exit_score,
+        )
     elif config.reranker == NodeReranker.episode_mentions:
-        reranked_uuids = await episode_mentions_reranker(
-            driver, search_result_uuids, min_score=reranker_min_score
+        reranked_uuids = episode_mentions_reranker(
+            search_result_uuids,
+            {uuid: node.mention_count for uuid, node in node_uuid_map.items()},
+            min_score=reranker_min_score,
         )
     elif config.reranker == NodeReranker.node_distance:
         if center_node_uuid is None:
@@ -333,6 +820,7 @@ async def node_search(
             rrf(search_result_uuids, min_score=reranker_min_score),
             center_node_uuid,
             min_score=reranker_min_score,
+            max_depth=config.node_distance_max_depth,
         )
 
     reranked_nodes = [node_uuid_map[uuid] for uuid in reranked_uuids]
@@ -340,6 +828,7 @@ async def node_search(
     return reranked_nodes[:limit]
 
 
+@traced('episode_search')
 async def episode_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -353,6 +842,12 @@ async def episode_search(
 ) -> list[EpisodicNode]:
     if config is None:
         return []
+    add_span_attributes(
+        {
+            'search_methods': [method.value for method in config.search_methods],
+            'reranker': config.reranker.value,
+        }
+    )
     search_results: list[list[EpisodicNode]] = list(
         await semaphore_gather(
             *[
@@ -369,24 +864,29 @@ async def episode_search(
         reranked_uuids = rrf(search_result_uuids, min_score=reranker_min_score)
 
     elif config.reranker == EpisodeReranker.cross_encoder:
-        # use rrf as a preliminary reranker
-        rrf_result_uuids = rrf(search_result_uuids, min_score=reranker_min_score)
-        rrf_results = [episode_uuid_map[uuid] for uuid in rrf_result_uuids][:limit]
+        # use rrf to pick the shortlist sent to the cross-encoder
+        shortlist_uuids = rrf(search_result_uuids)
+        shortlist_size = get_shortlist_size(config.shortlist_size, limit)
 
-        content_to_uuid_map = {episode.content: episode.uuid for episode in rrf_results}
+        content_to_uuid_map: dict[str, str] = {}
+        for uuid in shortlist_uuids[:shortlist_size]:
+            content_to_uuid_map.setdefault(episode_uuid_map[uuid].content, uuid)
 
-        reranked_contents = await cross_encoder.rank(query, list(content_to_uuid_map.keys()))
-        reranked_uuids = [
-            content_to_uuid_map[content]
-            for content, score in reranked_contents
-            if score >= reranker_min_score
-        ]
+        reranked_uuids = await cross_encoder_reranker(
+            cross_encoder,
+            query,
+            content_to_uuid_map,
+            reranker_min_score,
+            limit,
+            config.early_exit_score,
+        )
 
     reranked_episodes = [episode_uuid_map[uuid] for uuid in reranked_uuids]
 
     return reranked_episodes[:limit]
 
 
+@traced('community_search')
 async def community_search(
     driver: GraphDriver,
     cross_encoder: CrossEncoderClient,
@@ -399,6 +899,12 @@ async def community_search(
 ) -> list[CommunityNode]:
     if config is None:
         return []
+    add_span_attributes(
+        {
+            'search_methods': [method.value for method in config.search_methods],
+            'reranker': config.reranker.value,
+        }
+    )
 
     search_results: list[list[CommunityNode]] = list(
         await semaphore_gather(
@@ -425,14 +931,35 @@ async def community_search(
         )
 
         reranked_uuids = maximal_marginal_relevance(
-            query_vector, search_result_uuids_and_vectors, config.mmr_lambda, reranker_min_score
+            query_vector,
+            search_result_uuids_and_vectors,
+            config.mmr_lambda,
+            reranker_min_score,
+            max_results=limit,
         )
     elif config.reranker == CommunityReranker.cross_encoder:
-        name_to_uuid_map = {node.name: node.uuid for result in search_results for node in result}
-        reranked_nodes = await cross_encoder.rank(query, list(name_to_uuid_map.keys()))
-        reranked_uuids = [
-            name_to_uuid_map[name] for name, score in reranked_nodes if score >= reranker_min_score
-        ]
+        # use rrf or cosine similarity to pick the shortlist sent to the cross-encoder
+        if config.shortlist_method == ShortlistMethod.cosine_similarity:
+            shortlist_uuids = cosine_similarity_ranking(
+                query_vector,
+                await get_embeddings_for_communities(driver, list(community_uuid_map.values())),
+            )
+        else:
+            shortlist_uuids = rrf(search_result_uuids)
+        shortlist_size = get_shortlist_size(config.shortlist_size, limit)
+
+        name_to_uuid_map: dict[str, str] = {}
+        for uuid in shortlist_uuids[:shortlist_size]:
+            name_to_uuid_map.setdefault(community_uuid_map[uuid].name, uuid)
+
+        reranked_uuids = await cross_encoder_reranker(
+            cross_encoder,
+            query,
+            name_to_uuid_map,
+            reranker_min_score,
+            limit,
+            config.early_exit_score,
+        )
 
     reranked_communities = [community_uuid_map[uuid] for uuid in reranked_uuids]
 
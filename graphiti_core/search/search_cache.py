@@ -0,0 +1,254 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.metrics import record_cache_lookup
+
+if TYPE_CHECKING:
+    from graphiti_core.search.search_config import SearchConfig, SearchResults
+    from graphiti_core.search.search_filters import SearchFilters
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+# (driver id, config hash, filters hash, group_ids, center node, bfs origin nodes)
+SearchScope = tuple[int, str, str, tuple[str, ...] | None, str | None, tuple[str, ...] | None]
+SearchCacheKey = tuple[str, SearchScope]
+GraphVersion = tuple[int, ...]
+
+
+class GroupWriteVersions:
+    """
+    Write counters for the groups of the graph behind one driver, used to validate cached search
+    results.
+
+    Writes to known groups increment those groups' versions, and every write increments
+    any_version, which validates searches across all groups. Writes whose groups are unknown
+    increment global_version, which invalidates everything. driver_id is unique for the life of
+    the process, and scopes cached searches to the driver they ran through.
+    """
+
+    driver_ids = count()
+
+    def __init__(self):
+        self.driver_id = next(self.driver_ids)
+        self.global_version = 0
+        self.any_version = 0
+        self.versions: defaultdict[str, int] = defaultdict(int)
+
+    def bump(self, group_ids: Iterable[str] | None = None):
+        self.any_version += 1
+        if group_ids is None:
+            self.global_version += 1
+            return
+        for group_id in set(group_ids):
+            self.versions[group_id] += 1
+
+    def snapshot(self, group_ids: list[str] | None) -> GraphVersion:
+        if group_ids is None:
+            return self.global_version, self.any_version
+        return (self.global_version,) + tuple(self.versions[group_id] for group_id in group_ids)
+
+
+group_write_versions: WeakKeyDictionary[GraphDriver, GroupWriteVersions] = WeakKeyDictionary()
+
+
+def get_group_write_versions(driver: GraphDriver) -> GroupWriteVersions:
+    versions = group_write_versions.get(driver)
+    if versions is None:
+        versions = GroupWriteVersions()
+        group_write_versions[driver] = versions
+    return versions
+
+
+def record_graph_write(driver: GraphDriver, group_ids: Iterable[str] | None = None):
+    """
+    Invalidate cached search results after a write to the graph.
+
+    group_ids are the groups the write touched. If None, all cached results for the driver are
+    invalidated, for writes whose groups are unknown.
+    """
+    get_group_write_versions(driver).bump(group_ids)
+
+
+def normalize_query(query: str) -> str:
+    return ' '.join(query.lower().split())
+
+
+def stable_hash(value: str) -> str:
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+class SearchCacheEntry:
+    def __init__(
+        self,
+        results: 'SearchResults',
+        version: GraphVersion,
+        query_vector: list[float] | None,
+    ):
+        self.results = results
+        self.version = version
+        self.query_vector = (
+            None if query_vector is None else np.array(query_vector, dtype=np.float32)
+        )
+        if self.query_vector is not None:
+            norm = np.linalg.norm(self.query_vector)
+            if norm != 0:
+                self.query_vector /= norm
+        self.created_at = monotonic()
+
+
+class SearchResultCache:
+    """
+    LRU cache of search results keyed by driver, normalized query and search scope.
+
+    An entry is only served through the driver it was searched through, for at most ttl_seconds,
+    and while the write versions of its groups are unchanged since the search started.
+    Invalidation only sees writes made through the same driver in this process; writes made
+    through other drivers or processes are only picked up once the entry expires. If
+    semantic_threshold is set, a query that misses the exact cache can reuse the results of a
+    cached query in the same scope whose embedding has at least that cosine similarity to its
+    own.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        semantic_threshold: float | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.semantic_threshold = semantic_threshold
+        self.entries: OrderedDict[SearchCacheKey, SearchCacheEntry] = OrderedDict()
+        self.entries_by_scope: defaultdict[SearchScope, set[SearchCacheKey]] = defaultdict(set)
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        driver: GraphDriver,
+        query: str,
+        config: 'SearchConfig',
+        search_filter: 'SearchFilters',
+        group_ids: list[str] | None,
+        center_node_uuid: str | None = None,
+        bfs_origin_node_uuids: list[str] | None = None,
+    ) -> SearchCacheKey:
+        scope: SearchScope = (
+            get_group_write_versions(driver).driver_id,
+            stable_hash(config.model_dump_json()),
+            stable_hash(search_filter.model_dump_json()),
+            None if group_ids is None else tuple(sorted(set(group_ids))),
+            center_node_uuid,
+            None if bfs_origin_node_uuids is None else tuple(sorted(set(bfs_origin_node_uuids))),
+        )
+        return normalize_query(query), scope
+
+    @staticmethod
+    def version(driver: GraphDriver, key: SearchCacheKey) -> GraphVersion:
+        group_ids = key[1][3]
+        return get_group_write_versions(driver).snapshot(
+            None if group_ids is None else list(group_ids)
+        )
+
+    def get(self, driver: GraphDriver, key: SearchCacheKey) -> 'SearchResults | None':
+        entry = self.entries.get(key)
+        if entry is None or not self.is_valid(driver, key, entry):
+            self.misses += 1
+            record_cache_lookup('search', False)
+            return None
+
+        self.hits += 1
+        record_cache_lookup('search', True)
+        self.entries.move_to_end(key)
+        return entry.results.model_copy(deep=True)
+
+    def get_similar(
+        self, driver: GraphDriver, key: SearchCacheKey, query_vector: list[float]
+    ) -> 'SearchResults | None':
+        if self.semantic_threshold is None:
+            return None
+
+        query_array = np.array(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query_array)
+        if norm == 0:
+            return None
+        query_array /= norm
+
+        best_key: SearchCacheKey | None = None
+        best_score = self.semantic_threshold
+        for candidate_key in list(self.entries_by_scope.get(key[1], ())):
+            entry = self.entries[candidate_key]
+            if entry.query_vector is None or not self.is_valid(driver, candidate_key, entry):
+                continue
+            score = float(entry.query_vector @ query_array)
+            if score >= best_score:
+                best_key, best_score = candidate_key, score
+
+        record_cache_lookup('search_semantic', best_key is not None)
+        if best_key is None:
+            return None
+
+        self.semantic_hits += 1
+        self.entries.move_to_end(best_key)
+        return self.entries[best_key].results.model_copy(deep=True)
+
+    def put(
+        self,
+        key: SearchCacheKey,
+        version: GraphVersion,
+        results: 'SearchResults',
+        query_vector: list[float] | None = None,
+    ):
+        """Cache results, where version is the write version taken before the search ran."""
+        self.evict(key)
+        self.entries[key] = SearchCacheEntry(results.model_copy(deep=True), version, query_vector)
+        self.entries_by_scope[key[1]].add(key)
+
+        while len(self.entries) > self.max_entries:
+            self.evict(next(iter(self.entries)))
+
+    def is_valid(self, driver: GraphDriver, key: SearchCacheKey, entry: SearchCacheEntry) -> bool:
+        expired = self.ttl_seconds is not None and monotonic() - entry.created_at > self.ttl_seconds
+        if expired or entry.version != self.version(driver, key):
+            self.evict(key)
+            return False
+        return True
+
+    def evict(self, key: SearchCacheKey):
+        if self.entries.pop(key, None) is None:
+            return
+        keys = self.entries_by_scope.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if len(keys) == 0:
+                del self.entries_by_scope[key[1]]
+
+    def clear(self):
+        self.entries.clear()
+        self.entries_by_scope.clear()
@@ -25,8 +25,11 @@ from graphiti_core.search.search_utils import (
     DEFAULT_MMR_LAMBDA,
     MAX_SEARCH_DEPTH,
 )
+from graphiti_core.usage import LLMUsage
 
 DEFAULT_SEARCH_LIMIT = 10
+# Without a shortlist_size, the cross-encoder reranks this many times the result limit
+DEFAULT_SHORTLIST_MULTIPLIER = 3
 
 
 class EdgeSearchMethod(Enum):
@@ -50,6 +53,11 @@ class CommunitySearchMethod(Enum):
     bm25 = 'bm25'
 
 
+class ShortlistMethod(Enum):
+    rrf = 'reciprocal_rank_fusion'
+    cosine_similarity = 'cosine_similarity'
+
+
 class EdgeReranker(Enum):
     rrf = 'reciprocal_rank_fusion'
     node_distance = 'node_distance'
@@ -83,6 +91,10 @@ class EdgeSearchConfig(BaseModel):
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    node_distance_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    shortlist_method: ShortlistMethod = Field(default=ShortlistMethod.rrf)
+    shortlist_size: int | None = Field(default=None)
+    early_exit_score: float | None = Field(default=None)
 
 
 class NodeSearchConfig(BaseModel):
@@ -91,6 +103,10 @@ class NodeSearchConfig(BaseModel):
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    node_distance_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    shortlist_method: ShortlistMethod = Field(default=ShortlistMethod.rrf)
+    shortlist_size: int | None = Field(default=None)
+    early_exit_score: float | None = Field(default=None)
 
 
 class EpisodeSearchConfig(BaseModel):
@@ -99,6 +115,8 @@ class EpisodeSearchConfig(BaseModel):
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    shortlist_size: int | None = Field(default=None)
+    early_exit_score: float | None = Field(default=None)
 
 
 class CommunitySearchConfig(BaseModel):
@@ -107,6 +125,9 @@ class CommunitySearchConfig(BaseModel):
     sim_min_score: float = Field(default=DEFAULT_MIN_SCORE)
     mmr_lambda: float = Field(default=DEFAULT_MMR_LAMBDA)
     bfs_max_depth: int = Field(default=MAX_SEARCH_DEPTH)
+    shortlist_method: ShortlistMethod = Field(default=ShortlistMethod.rrf)
+    shortlist_size: int | None = Field(default=None)
+    early_exit_score: float | None = Field(default=None)
 
 
 class SearchConfig(BaseModel):
@@ -123,3 +144,12 @@ class SearchResults(BaseModel):
     nodes: list[EntityNode]
     episodes: list[EpisodicNode]
     communities: list[CommunityNode]
+    skipped_stages: list[str] = Field(
+        default_factory=list, description='stages not started before the search deadline'
+    )
+    timed_out_stages: list[str] = Field(
+        default_factory=list, description='stages cancelled at the search deadline'
+    )
+    llm_usage: LLMUsage = Field(
+        default_factory=LLMUsage, description='LLM usage of the search, such as reranking'
+    )
@@ -221,3 +221,19 @@ COMMUNITY_HYBRID_SEARCH_CROSS_ENCODER = SearchConfig(
     ),
     limit=3,
 )
+
+recipe_names: dict[str, str] = {}
+
+
+def recipe_key(config: SearchConfig) -> str:
+    # Callers commonly copy a recipe and change its limit
+    return config.model_dump_json(exclude={'limit'})
+
+
+def get_recipe_name(config: SearchConfig) -> str:
+    """The name of the recipe a search config matches, ignoring its limit, or 'custom'."""
+    if len(recipe_names) == 0:
+        for name, value in globals().items():
+            if isinstance(value, SearchConfig):
+                recipe_names.setdefault(recipe_key(value), name)
+    return recipe_names.get(recipe_key(config), 'custom')
@@ -15,14 +15,15 @@ limitations under the License.
 """
 
 import logging
+import re
 from collections import defaultdict
 from time import time
 from typing import Any
 
 import numpy as np
-from numpy._typing import NDArray
 from typing_extensions import LiteralString
 
+from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.edges import EntityEdge, get_entity_edge_from_record
 from graphiti_core.graph_queries import (
@@ -33,7 +34,7 @@ from graphiti_core.graph_queries import (
 from graphiti_core.helpers import (
     RUNTIME_QUERY,
     lucene_sanitize,
-    normalize_l2,
+    normalize_l2_rows,
     semaphore_gather,
 )
 from graphiti_core.nodes import (
@@ -45,11 +46,14 @@ from graphiti_core.nodes import (
     get_entity_node_from_record,
     get_episodic_node_from_record,
 )
+from graphiti_core.search.ann_sidecar import AnnSidecar, get_ann_sidecar
+from graphiti_core.search.node_distance_cache import get_node_distance_cache
 from graphiti_core.search.search_filters import (
     SearchFilters,
     edge_search_filter_query_constructor,
     node_search_filter_query_constructor,
 )
+from graphiti_core.tracer import add_span_attributes, traced
 
 logger = logging.getLogger(__name__)
 
@@ -57,27 +61,69 @@ RELEVANT_SCHEMA_LIMIT = 10
 DEFAULT_MIN_SCORE = 0.6
 DEFAULT_MMR_LAMBDA = 0.5
 MAX_SEARCH_DEPTH = 3
+# Maximum number of nodes expanded per level of a breadth-first search
+MAX_BFS_FRONTIER = 100
 MAX_QUERY_LENGTH = 32
+# Fulltext candidates fetched per requested result when group filtering happens in Cypher
+FULLTEXT_CANDIDATE_MULTIPLIER = 10
 
+# Common English words that carry no weight in a BM25 query
+STOPWORDS = frozenset(
+    """
+    a about above after again against all am an and any are as at be because been before being
+    below between both but by can could did do does doing down during each few for from further
+    had has have having he her here hers herself him himself his how i if in into is it its itself
+    just me more most my myself no nor not now of off on once only or other our ours ourselves out
+    over own same she should so some such than that the their theirs them themselves then there
+    these they this those through to too under until up very was we were what when where which
+    while who whom why will with would you your yours yourself yourselves
+    """.split()  # noqa: SIM905
+)
+
+TERM_PATTERN = re.compile(r'\w+')
 
-def fulltext_query(query: str, group_ids: list[str] | None = None):
-    group_ids_filter_list = (
-        [f'group_id:"{lucene_sanitize(g)}"' for g in group_ids] if group_ids is not None else []
-    )
-    group_ids_filter = ''
-    for f in group_ids_filter_list:
-        group_ids_filter += f if not group_ids_filter else f' OR {f}'
 
-    group_ids_filter += ' AND ' if group_ids_filter else ''
+def fulltext_query(query: str, max_terms: int = MAX_QUERY_LENGTH) -> str:
+    """
+    Compile free text into a bounded Lucene query.
+
+    The query is split into lowercase terms, stopwords and single characters are dropped, and
+    at most `max_terms` distinct terms are kept: the most frequent ones, preferring longer (more
+    specific) terms on ties. If nothing is left after dropping, all terms are used instead so
+    that queries like "The Who" still match. Returns an empty string if the query has no terms.
+    """
+    terms = TERM_PATTERN.findall(query.lower())
+    keywords = [term for term in terms if len(term) > 1 and term not in STOPWORDS] or terms
 
-    lucene_query = lucene_sanitize(query)
-    # If the lucene query is too long return no query
-    if len(lucene_query.split(' ')) + len(group_ids or '') >= MAX_QUERY_LENGTH:
-        return ''
+    counts: dict[str, int] = defaultdict(int)
+    first_seen: dict[str, int] = {}
+    for position, term in enumerate(keywords):
+        counts[term] += 1
+        first_seen.setdefault(term, position)
 
-    full_query = group_ids_filter + '(' + lucene_query + ')'
+    top_terms = sorted(counts, key=lambda term: (-counts[term], -len(term), first_seen[term]))
+    selected = sorted(top_terms[:max_terms], key=lambda term: first_seen[term])
+
+    return ' '.join(selected)
+
+
+def group_fulltext_query(query: str, group_id: str, provider: str) -> str:
+    """
+    Restrict a compiled fulltext query to one group inside the Neo4j index lookup.
+
+    Filtering on group_id only after the lookup lets other groups' hits use up its result limit.
+    The empty default group cannot be matched as a term, and FalkorDB's lookup has no result
+    limit, so for those the query is returned unchanged and only filtered afterwards.
+    """
+    if provider != 'neo4j' or group_id == '':
+        return query
+    return f'group_id:"{lucene_sanitize(group_id)}" AND ({query})'
 
-    return full_query
+
+def fulltext_candidate_limit(limit: int, group_ids: list[str] | None) -> int:
+    # Group filtering is applied after the index lookup, so fetch extra candidates to leave
+    # enough results once other groups are filtered out
+    return limit if group_ids is None else limit * FULLTEXT_CANDIDATE_MULTIPLIER
 
 
 async def get_episodes_by_mentions(
@@ -100,6 +146,9 @@ async def get_mentioned_nodes(
 ) -> list[EntityNode]:
     episode_uuids = [episode.uuid for episode in episodes]
 
+    if driver.operations is not None:
+        return await driver.operations.get_mentioned_nodes(episode_uuids)
+
     query = """
         MATCH (episode:Episodic)-[:MENTIONS]->(n:Entity) WHERE episode.uuid IN $uuids
         RETURN DISTINCT
@@ -128,6 +177,9 @@ async def get_communities_by_nodes(
 ) -> list[CommunityNode]:
     node_uuids = [node.uuid for node in nodes]
 
+    if driver.operations is not None:
+        return await driver.operations.get_communities_by_nodes(node_uuids)
+
     query = """
     MATCH (c:Community)-[:HAS_MEMBER]->(n:Entity) WHERE n.uuid IN $uuids
     RETURN DISTINCT
@@ -149,6 +201,7 @@ async def get_communities_by_nodes(
     return communities
 
 
+@traced('edge_fulltext_search')
 async def edge_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -157,18 +210,30 @@ async def edge_fulltext_search(
     limit=RELEVANT_SCHEMA_LIMIT,
 ) -> list[EntityEdge]:
     # fulltext search over facts
-    fuzzy_query = fulltext_query(query, group_ids)
+    fuzzy_query = fulltext_query(query)
     if fuzzy_query == '':
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.edge_fulltext_search(
+            fuzzy_query, search_filter, group_ids, limit
+        )
+
+    group_filter_query: LiteralString = 'WHERE r.uuid = rel.uuid'
+    if group_ids is not None:
+        group_filter_query += ' AND r.group_id IN $group_ids'
+
     filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
 
     query = (
-        get_relationships_query('edge_name_and_fact', db_type=driver.provider)
+        get_relationships_query(
+            'edge_name_and_fact', db_type=driver.provider, limit='$fulltext_limit'
+        )
         + """
         YIELD relationship AS rel, score
         MATCH (n:Entity)-[r:RELATES_TO]->(m:Entity)
-        WHERE r.group_id IN $group_ids """
+        """
+        + group_filter_query
         + filter_query
         + """
         WITH r, score, startNode(r) AS n, endNode(r) AS m
@@ -195,6 +260,7 @@ async def edge_fulltext_search(
         query=fuzzy_query,
         group_ids=group_ids,
         limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, group_ids),
         routing_='r',
     )
 
@@ -203,6 +269,7 @@ async def edge_fulltext_search(
     return edges
 
 
+@traced('edge_similarity_search')
 async def edge_similarity_search(
     driver: GraphDriver,
     search_vector: list[float],
@@ -212,10 +279,27 @@ async def edge_similarity_search(
     group_ids: list[str] | None = None,
     limit: int = RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
+    include_embeddings: bool = False,
 ) -> list[EntityEdge]:
     # vector similarity search over embedded facts
+    if driver.operations is not None:
+        return await driver.operations.edge_similarity_search(
+            search_vector,
+            source_node_uuid,
+            target_node_uuid,
+            search_filter,
+            group_ids,
+            limit,
+            min_score,
+            include_embeddings,
+        )
+
     query_params: dict[str, Any] = {}
 
+    embedding_return: LiteralString = ''
+    if include_embeddings:
+        embedding_return = ',\n            r.fact_embedding AS fact_embedding'
+
     filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
     query_params.update(filter_params)
 
@@ -256,7 +340,9 @@ async def edge_similarity_search(
             r.expired_at AS expired_at,
             r.valid_at AS valid_at,
             r.invalid_at AS invalid_at,
-            properties(r) AS attributes
+            properties(r) AS attributes"""
+        + embedding_return
+        + """
         ORDER BY score DESC
         LIMIT $limit
         """
@@ -278,60 +364,257 @@ async def edge_similarity_search(
     return edges
 
 
-async def edge_bfs_search(
+ENTITY_EDGE_MAP: LiteralString = """{
+            uuid: r.uuid,
+            group_id: r.group_id,
+            source_node_uuid: startNode(r).uuid,
+            target_node_uuid: endNode(r).uuid,
+            created_at: r.created_at,
+            name: r.name,
+            fact: r.fact,
+            episodes: r.episodes,
+            expired_at: r.expired_at,
+            valid_at: r.valid_at,
+            invalid_at: r.invalid_at,
+            attributes: properties(r)"""
+
+
+def split_results_by_query(records: list[Any], num_queries: int, key: str) -> list[list[Any]]:
+    # Batched queries return one row per query index with that query's results collected in order
+    results: list[list[Any]] = [[] for _ in range(num_queries)]
+    for record in records:
+        results[record['query_index']] = record[key]
+    return results
+
+
+@traced('edge_fulltext_search_many')
+async def edge_fulltext_search_many(
     driver: GraphDriver,
-    bfs_origin_node_uuids: list[str] | None,
-    bfs_max_depth: int,
+    queries: list[str],
     search_filter: SearchFilters,
-    limit: int,
-) -> list[EntityEdge]:
-    # vector similarity search over embedded facts
-    if bfs_origin_node_uuids is None:
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EntityEdge]]:
+    """Run edge_fulltext_search for a batch of queries with a single UNWIND query."""
+    if driver.operations is not None:
+        return await driver.operations.edge_fulltext_search_many(
+            [fulltext_query(query) for query in queries], search_filter, group_ids, limit
+        )
+
+    fuzzy_queries = [
+        {'index': i, 'query': fuzzy_query}
+        for i, fuzzy_query in enumerate(fulltext_query(query) for query in queries)
+        if fuzzy_query != ''
+    ]
+    if len(fuzzy_queries) == 0:
+        return [[] for _ in queries]
+
+    group_filter_query: LiteralString = 'WHERE r.uuid = rel.uuid'
+    if group_ids is not None:
+        group_filter_query += ' AND r.group_id IN $group_ids'
+
+    filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
+
+    query = (
+        """
+        UNWIND $queries AS q
+        """
+        + get_relationships_query(
+            'edge_name_and_fact', db_type=driver.provider, limit='$fulltext_limit', query='q.query'
+        )
+        + """
+        YIELD relationship AS rel, score
+        MATCH (n:Entity)-[r:RELATES_TO]->(m:Entity)
+        """
+        + group_filter_query
+        + filter_query
+        + """
+        WITH q, r, score
+        ORDER BY score DESC
+        WITH q.index AS query_index, collect("""
+        + ENTITY_EDGE_MAP
+        + """
+        })[0..$limit] AS edges
+        RETURN query_index, edges
+        """
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        params=filter_params,
+        queries=fuzzy_queries,
+        group_ids=group_ids,
+        limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, group_ids),
+        routing_='r',
+    )
+
+    return [
+        [get_entity_edge_from_record(record) for record in result]
+        for result in split_results_by_query(records, len(queries), 'edges')
+    ]
+
+
+@traced('edge_similarity_search_many')
+async def edge_similarity_search_many(
+    driver: GraphDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit: int = RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    include_embeddings: bool = False,
+) -> list[list[EntityEdge]]:
+    """
+    Run edge_similarity_search for a batch of query vectors with a single UNWIND query, so the
+    edges are scanned once for the whole batch.
+    """
+    if len(search_vectors) == 0:
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.edge_similarity_search_many(
+            search_vectors, search_filter, group_ids, limit, min_score, include_embeddings
+        )
+
+    embedding_return: LiteralString = ''
+    if include_embeddings:
+        embedding_return = ',\n            fact_embedding: r.fact_embedding'
+
     filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
 
+    group_filter_query: LiteralString = 'WHERE r.group_id IS NOT NULL'
+    if group_ids is not None:
+        group_filter_query += '\nAND r.group_id IN $group_ids'
+
     query = (
+        RUNTIME_QUERY
+        + """
+        UNWIND $search_vectors AS q
+        MATCH (n:Entity)-[r:RELATES_TO]->(m:Entity)
         """
-                                    UNWIND $bfs_origin_node_uuids AS origin_uuid
-                                    MATCH path = (origin:Entity|Episodic {uuid: origin_uuid})-[:RELATES_TO|MENTIONS]->{1,3}(n:Entity)
-                                    UNWIND relationships(path) AS rel
-                                    MATCH (n:Entity)-[r:RELATES_TO]-(m:Entity)
-                                    WHERE r.uuid = rel.uuid
-                                    """
+        + group_filter_query
         + filter_query
-        + """  
-                RETURN DISTINCT
-                    r.uuid AS uuid,
-                    r.group_id AS group_id,
-                    startNode(r).uuid AS source_node_uuid,
-                    endNode(r).uuid AS target_node_uuid,
-                    r.created_at AS created_at,
-                    r.name AS name,
-                    r.fact AS fact,
-                    r.episodes AS episodes,
-                    r.expired_at AS expired_at,
-                    r.valid_at AS valid_at,
-                    r.invalid_at AS invalid_at,
-                    properties(r) AS attributes
-                LIMIT $limit
+        + """
+        WITH DISTINCT q, r, """
+        + get_vector_cosine_func_query('r.fact_embedding', 'q.vector', driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH q, r, score
+        ORDER BY score DESC
+        WITH q.index AS query_index, collect("""
+        + ENTITY_EDGE_MAP
+        + embedding_return
+        + """
+        })[0..$limit] AS edges
+        RETURN query_index, edges
         """
     )
 
     records, _, _ = await driver.execute_query(
         query,
         params=filter_params,
-        bfs_origin_node_uuids=bfs_origin_node_uuids,
-        depth=bfs_max_depth,
+        search_vectors=[
+            {'index': i, 'vector': search_vector} for i, search_vector in enumerate(search_vectors)
+        ],
+        group_ids=group_ids,
         limit=limit,
+        min_score=min_score,
         routing_='r',
     )
 
-    edges = [get_entity_edge_from_record(record) for record in records]
+    return [
+        [get_entity_edge_from_record(record) for record in result]
+        for result in split_results_by_query(records, len(search_vectors), 'edges')
+    ]
+
+
+@traced('edge_bfs_search')
+async def edge_bfs_search(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    bfs_max_depth: int,
+    search_filter: SearchFilters,
+    limit: int,
+    max_frontier: int = MAX_BFS_FRONTIER,
+) -> list[EntityEdge]:
+    """
+    Collect facts reachable from the origin nodes within bfs_max_depth hops.
+
+    The graph is expanded one level at a time. Each level expands at most max_frontier nodes
+    that were not visited before, and the search stops as soon as limit edges are collected.
+    """
+    if bfs_origin_node_uuids is None:
+        return []
+
+    if driver.operations is not None:
+        return await driver.operations.edge_bfs_search(
+            bfs_origin_node_uuids, bfs_max_depth, search_filter, limit, max_frontier
+        )
+
+    filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
+
+    query = (
+        """
+        UNWIND $frontier AS origin_uuid
+        MATCH (origin:Entity|Episodic {uuid: origin_uuid})-[e:RELATES_TO|MENTIONS]->(target:Entity)
+        WHERE target.group_id = origin.group_id AND NOT e.uuid IN $visited_edge_uuids
+        WITH DISTINCT e, target
+        LIMIT $level_limit
+        WITH e AS r, target, startNode(e) AS n, endNode(e) AS m
+        RETURN
+            target.uuid AS bfs_target_uuid,
+            (type(r) = 'RELATES_TO' """
+        + filter_query
+        + """) AS matches,
+            r.uuid AS uuid,
+            r.group_id AS group_id,
+            n.uuid AS source_node_uuid,
+            m.uuid AS target_node_uuid,
+            r.created_at AS created_at,
+            r.name AS name,
+            r.fact AS fact,
+            r.episodes AS episodes,
+            r.expired_at AS expired_at,
+            r.valid_at AS valid_at,
+            r.invalid_at AS invalid_at,
+            properties(r) AS attributes
+        """
+    )
+
+    edges: list[EntityEdge] = []
+    visited_node_uuids = set(bfs_origin_node_uuids)
+    visited_edge_uuids: set[str] = set()
+    frontier = list(dict.fromkeys(bfs_origin_node_uuids))[:max_frontier]
+    for _ in range(bfs_max_depth):
+        if len(frontier) == 0 or len(edges) >= limit:
+            break
+
+        records, _, _ = await driver.execute_query(
+            query,
+            params=filter_params,
+            frontier=frontier,
+            visited_edge_uuids=list(visited_edge_uuids),
+            level_limit=limit - len(edges) + max_frontier,
+            routing_='r',
+        )
+
+        frontier = []
+        for record in records:
+            visited_edge_uuids.add(record['uuid'])
+            if record['matches'] and len(edges) < limit:
+                edges.append(get_entity_edge_from_record(record))
+
+            target_uuid = record['bfs_target_uuid']
+            if target_uuid not in visited_node_uuids:
+                visited_node_uuids.add(target_uuid)
+                if len(frontier) < max_frontier:
+                    frontier.append(target_uuid)
 
     return edges
 
 
+@traced('node_fulltext_search')
 async def node_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -340,20 +623,33 @@ async def node_fulltext_search(
     limit=RELEVANT_SCHEMA_LIMIT,
 ) -> list[EntityNode]:
     # BM25 search to get top nodes
-    fuzzy_query = fulltext_query(query, group_ids)
+    fuzzy_query = fulltext_query(query)
     if fuzzy_query == '':
         return []
+
+    if driver.operations is not None:
+        return await driver.operations.node_fulltext_search(
+            fuzzy_query, search_filter, group_ids, limit
+        )
+
+    group_filter_query: LiteralString = 'WHERE n:Entity'
+    if group_ids is not None:
+        group_filter_query += ' AND n.group_id IN $group_ids'
+
     filter_query, filter_params = node_search_filter_query_constructor(search_filter)
 
     query = (
-        get_nodes_query(driver.provider, 'node_name_and_summary', '$query')
+        get_nodes_query(driver.provider, 'node_name_and_summary', '$query', limit='$fulltext_limit')
         + """
         YIELD node AS n, score
-            WITH n, score
-            LIMIT $limit
-            WHERE n:Entity
         """
+        + group_filter_query
         + filter_query
+        + """
+        WITH n, score
+        ORDER BY score DESC
+        LIMIT $limit
+        """
         + ENTITY_NODE_RETURN
         + """
         ORDER BY score DESC
@@ -365,6 +661,7 @@ async def node_fulltext_search(
         query=fuzzy_query,
         group_ids=group_ids,
         limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, group_ids),
         routing_='r',
     )
 
@@ -373,6 +670,7 @@ async def node_fulltext_search(
     return nodes
 
 
+@traced('node_similarity_search')
 async def node_similarity_search(
     driver: GraphDriver,
     search_vector: list[float],
@@ -380,10 +678,20 @@ async def node_similarity_search(
     group_ids: list[str] | None = None,
     limit=RELEVANT_SCHEMA_LIMIT,
     min_score: float = DEFAULT_MIN_SCORE,
+    include_embeddings: bool = False,
 ) -> list[EntityNode]:
     # vector similarity search over entity names
+    if driver.operations is not None:
+        return await driver.operations.node_similarity_search(
+            search_vector, search_filter, group_ids, limit, min_score, include_embeddings
+        )
+
     query_params: dict[str, Any] = {}
 
+    embedding_return: LiteralString = ''
+    if include_embeddings:
+        embedding_return = ', n.name_embedding AS name_embedding'
+
     group_filter_query: LiteralString = 'WHERE n.group_id IS NOT NULL'
     if group_ids is not None:
         group_filter_query += ' AND n.group_id IN $group_ids'
@@ -405,6 +713,7 @@ async def node_similarity_search(
         + """ AS score
         WHERE score > $min_score"""
         + ENTITY_NODE_RETURN
+        + embedding_return
         + """
         ORDER BY score DESC
         LIMIT $limit
@@ -426,44 +735,226 @@ async def node_similarity_search(
     return nodes
 
 
-async def node_bfs_search(
+ENTITY_NODE_MAP: LiteralString = """{
+            uuid: n.uuid,
+            name: n.name,
+            group_id: n.group_id,
+            created_at: n.created_at,
+            summary: n.summary,
+            labels: labels(n),
+            attributes: properties(n)"""
+
+
+@traced('node_fulltext_search_many')
+async def node_fulltext_search_many(
     driver: GraphDriver,
-    bfs_origin_node_uuids: list[str] | None,
+    queries: list[str],
     search_filter: SearchFilters,
-    bfs_max_depth: int,
-    limit: int,
-) -> list[EntityNode]:
-    # vector similarity search over entity names
-    if bfs_origin_node_uuids is None:
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+) -> list[list[EntityNode]]:
+    """Run node_fulltext_search for a batch of queries with a single UNWIND query."""
+    if driver.operations is not None:
+        return await driver.operations.node_fulltext_search_many(
+            [fulltext_query(query) for query in queries], search_filter, group_ids, limit
+        )
+
+    fuzzy_queries = [
+        {'index': i, 'query': fuzzy_query}
+        for i, fuzzy_query in enumerate(fulltext_query(query) for query in queries)
+        if fuzzy_query != ''
+    ]
+    if len(fuzzy_queries) == 0:
+        return [[] for _ in queries]
+
+    group_filter_query: LiteralString = 'WHERE n:Entity'
+    if group_ids is not None:
+        group_filter_query += ' AND n.group_id IN $group_ids'
+
+    filter_query, filter_params = node_search_filter_query_constructor(search_filter)
+
+    query = (
+        """
+        UNWIND $queries AS q
+        """
+        + get_nodes_query(
+            driver.provider, 'node_name_and_summary', 'q.query', limit='$fulltext_limit'
+        )
+        + """
+        YIELD node AS n, score
+        """
+        + group_filter_query
+        + filter_query
+        + """
+        WITH q, n, score
+        ORDER BY score DESC
+        WITH q.index AS query_index, collect("""
+        + ENTITY_NODE_MAP
+        + """
+        })[0..$limit] AS nodes
+        RETURN query_index, nodes
+        """
+    )
+
+    records, _, _ = await driver.execute_query(
+        query,
+        params=filter_params,
+        queries=fuzzy_queries,
+        group_ids=group_ids,
+        limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, group_ids),
+        routing_='r',
+    )
+
+    return [
+        [get_entity_node_from_record(record) for record in result]
+        for result in split_results_by_query(records, len(queries), 'nodes')
+    ]
+
+
+@traced('node_similarity_search_many')
+async def node_similarity_search_many(
+    driver: GraphDriver,
+    search_vectors: list[list[float]],
+    search_filter: SearchFilters,
+    group_ids: list[str] | None = None,
+    limit=RELEVANT_SCHEMA_LIMIT,
+    min_score: float = DEFAULT_MIN_SCORE,
+    include_embeddings: bool = False,
+) -> list[list[EntityNode]]:
+    """
+    Run node_similarity_search for a batch of query vectors with a single UNWIND query, so the
+    entities are scanned once for the whole batch.
+    """
+    if len(search_vectors) == 0:
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.node_similarity_search_many(
+            search_vectors, search_filter, group_ids, limit, min_score, include_embeddings
+        )
+
+    embedding_return: LiteralString = ''
+    if include_embeddings:
+        embedding_return = ',\n            name_embedding: n.name_embedding'
+
+    group_filter_query: LiteralString = 'WHERE n.group_id IS NOT NULL'
+    if group_ids is not None:
+        group_filter_query += ' AND n.group_id IN $group_ids'
+
     filter_query, filter_params = node_search_filter_query_constructor(search_filter)
 
     query = (
+        RUNTIME_QUERY
+        + """
+        UNWIND $search_vectors AS q
+        MATCH (n:Entity)
         """
-                            UNWIND $bfs_origin_node_uuids AS origin_uuid
-                            MATCH (origin:Entity|Episodic {uuid: origin_uuid})-[:RELATES_TO|MENTIONS]->{1,3}(n:Entity)
-                            WHERE n.group_id = origin.group_id
-                            """
+        + group_filter_query
         + filter_query
-        + ENTITY_NODE_RETURN
         + """
-        LIMIT $limit
+        WITH q, n, """
+        + get_vector_cosine_func_query('n.name_embedding', 'q.vector', driver.provider)
+        + """ AS score
+        WHERE score > $min_score
+        WITH q, n, score
+        ORDER BY score DESC
+        WITH q.index AS query_index, collect("""
+        + ENTITY_NODE_MAP
+        + embedding_return
+        + """
+        })[0..$limit] AS nodes
+        RETURN query_index, nodes
         """
     )
+
     records, _, _ = await driver.execute_query(
         query,
         params=filter_params,
-        bfs_origin_node_uuids=bfs_origin_node_uuids,
-        depth=bfs_max_depth,
+        search_vectors=[
+            {'index': i, 'vector': search_vector} for i, search_vector in enumerate(search_vectors)
+        ],
+        group_ids=group_ids,
         limit=limit,
+        min_score=min_score,
         routing_='r',
     )
-    nodes = [get_entity_node_from_record(record) for record in records]
+
+    return [
+        [get_entity_node_from_record(record) for record in result]
+        for result in split_results_by_query(records, len(search_vectors), 'nodes')
+    ]
+
+
+@traced('node_bfs_search')
+async def node_bfs_search(
+    driver: GraphDriver,
+    bfs_origin_node_uuids: list[str] | None,
+    search_filter: SearchFilters,
+    bfs_max_depth: int,
+    limit: int,
+    max_frontier: int = MAX_BFS_FRONTIER,
+) -> list[EntityNode]:
+    """
+    Collect entities reachable from the origin nodes within bfs_max_depth hops.
+
+    The graph is expanded one level at a time. Each level expands at most max_frontier nodes
+    that were not visited before, and the search stops as soon as limit nodes are collected.
+    """
+    if bfs_origin_node_uuids is None:
+        return []
+
+    if driver.operations is not None:
+        return await driver.operations.node_bfs_search(
+            bfs_origin_node_uuids, search_filter, bfs_max_depth, limit, max_frontier
+        )
+
+    filter_query, filter_params = node_search_filter_query_constructor(search_filter)
+
+    query = (
+        """
+        UNWIND $frontier AS origin_uuid
+        MATCH (origin:Entity|Episodic {uuid: origin_uuid})-[:RELATES_TO|MENTIONS]->(n:Entity)
+        WHERE n.group_id = origin.group_id AND NOT n.uuid IN $visited_node_uuids
+        WITH DISTINCT n
+        LIMIT $level_limit
+        WITH n, (true """
+        + filter_query
+        + """) AS matches
+        """
+        + ENTITY_NODE_RETURN
+        + """, matches
+        """
+    )
+
+    nodes: list[EntityNode] = []
+    visited_node_uuids = set(bfs_origin_node_uuids)
+    frontier = list(dict.fromkeys(bfs_origin_node_uuids))[:max_frontier]
+    for _ in range(bfs_max_depth):
+        if len(frontier) == 0 or len(nodes) >= limit:
+            break
+
+        records, _, _ = await driver.execute_query(
+            query,
+            params=filter_params,
+            frontier=frontier,
+            visited_node_uuids=list(visited_node_uuids),
+            level_limit=limit - len(nodes) + max_frontier,
+            routing_='r',
+        )
+
+        frontier = []
+        for record in records:
+            visited_node_uuids.add(record['uuid'])
+            if record['matches'] and len(nodes) < limit:
+                nodes.append(get_entity_node_from_record(record))
+            if len(frontier) < max_frontier:
+                frontier.append(record['uuid'])
 
     return nodes
 
 
+@traced('episode_fulltext_search')
 async def episode_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -472,16 +963,25 @@ async def episode_fulltext_search(
     limit=RELEVANT_SCHEMA_LIMIT,
 ) -> list[EpisodicNode]:
     # BM25 search to get top episodes
-    fuzzy_query = fulltext_query(query, group_ids)
+    fuzzy_query = fulltext_query(query)
     if fuzzy_query == '':
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.episode_fulltext_search(fuzzy_query, group_ids, limit)
+
+    group_filter_query: LiteralString = ''
+    if group_ids is not None:
+        group_filter_query += ' AND e.group_id IN $group_ids'
+
     query = (
-        get_nodes_query(driver.provider, 'episode_content', '$query')
+        get_nodes_query(driver.provider, 'episode_content', '$query', limit='$fulltext_limit')
         + """
         YIELD node AS episode, score
         MATCH (e:Episodic)
-        WHERE e.uuid = episode.uuid
+        WHERE e.uuid = episode.uuid"""
+        + group_filter_query
+        + """
         RETURN 
             e.content AS content,
             e.created_at AS created_at,
@@ -502,6 +1002,7 @@ async def episode_fulltext_search(
         query=fuzzy_query,
         group_ids=group_ids,
         limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, group_ids),
         routing_='r',
     )
     episodes = [get_episodic_node_from_record(record) for record in records]
@@ -509,6 +1010,7 @@ async def episode_fulltext_search(
     return episodes
 
 
+@traced('community_fulltext_search')
 async def community_fulltext_search(
     driver: GraphDriver,
     query: str,
@@ -516,14 +1018,24 @@ async def community_fulltext_search(
     limit=RELEVANT_SCHEMA_LIMIT,
 ) -> list[CommunityNode]:
     # BM25 search to get top communities
-    fuzzy_query = fulltext_query(query, group_ids)
+    fuzzy_query = fulltext_query(query)
     if fuzzy_query == '':
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.community_fulltext_search(fuzzy_query, group_ids, limit)
+
+    group_filter_query: LiteralString = ''
+    if group_ids is not None:
+        group_filter_query += 'WHERE comm.group_id IN $group_ids'
+
     query = (
-        get_nodes_query(driver.provider, 'community_name', '$query')
+        get_nodes_query(driver.provider, 'community_name', '$query', limit='$fulltext_limit')
         + """
         YIELD node AS comm, score
+        """
+        + group_filter_query
+        + """
         RETURN
             comm.uuid AS uuid,
             comm.group_id AS group_id, 
@@ -541,6 +1053,7 @@ async def community_fulltext_search(
         query=fuzzy_query,
         group_ids=group_ids,
         limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, group_ids),
         routing_='r',
     )
     communities = [get_community_node_from_record(record) for record in records]
@@ -548,6 +1061,7 @@ async def community_fulltext_search(
     return communities
 
 
+@traced('community_similarity_search')
 async def community_similarity_search(
     driver: GraphDriver,
     search_vector: list[float],
@@ -556,6 +1070,11 @@ async def community_similarity_search(
     min_score=DEFAULT_MIN_SCORE,
 ) -> list[CommunityNode]:
     # vector similarity search over entity names
+    if driver.operations is not None:
+        return await driver.operations.community_similarity_search(
+            search_vector, group_ids, limit, min_score
+        )
+
     query_params: dict[str, Any] = {}
 
     group_filter_query: LiteralString = ''
@@ -683,8 +1202,21 @@ async def get_relevant_nodes(
     if len(nodes) == 0:
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.get_relevant_nodes(
+            nodes,
+            [fulltext_query(node.name) or lucene_sanitize(node.name) for node in nodes],
+            search_filter,
+            min_score,
+            limit,
+        )
+
     group_id = nodes[0].group_id
 
+    sidecar = get_ann_sidecar(driver)
+    if sidecar is not None and sidecar.serves(group_id) and search_filter == SearchFilters():
+        return await get_relevant_nodes_from_sidecar(driver, sidecar, nodes, min_score, limit)
+
     # vector similarity search over entity names
     query_params: dict[str, Any] = {}
 
@@ -705,11 +1237,13 @@ async def get_relevant_nodes(
         WHERE score > $min_score
         WITH node, collect(n)[..$limit] AS top_vector_nodes, collect(n.uuid) AS vector_node_uuids
         """
-        + get_nodes_query(driver.provider, 'node_name_and_summary', 'node.fulltext_query')
+        + get_nodes_query(
+            driver.provider, 'node_name_and_summary', 'node.fulltext_query', '$fulltext_limit'
+        )
         + """
         YIELD node AS m
         WHERE m.group_id = $group_id
-        WITH node, top_vector_nodes, vector_node_uuids, collect(m) AS fulltext_nodes
+        WITH node, top_vector_nodes, vector_node_uuids, collect(m)[..$limit] AS fulltext_nodes
 
         WITH node, 
              top_vector_nodes, 
@@ -740,7 +1274,9 @@ async def get_relevant_nodes(
             'uuid': node.uuid,
             'name': node.name,
             'name_embedding': node.name_embedding,
-            'fulltext_query': fulltext_query(node.name, [node.group_id]),
+            'fulltext_query': group_fulltext_query(
+                fulltext_query(node.name) or lucene_sanitize(node.name), group_id, driver.provider
+            ),
         }
         for node in nodes
     ]
@@ -751,6 +1287,7 @@ async def get_relevant_nodes(
         nodes=query_nodes,
         group_id=group_id,
         limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, [group_id]),
         min_score=min_score,
         routing_='r',
     )
@@ -777,6 +1314,27 @@ async def get_relevant_edges(
     if len(edges) == 0:
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.get_relevant_edges(edges, search_filter, min_score, limit)
+
+    sidecar = get_ann_sidecar(driver)
+    if sidecar is not None and serves_edges(sidecar, edges, search_filter):
+        return await fetch_ranked_edges(
+            driver,
+            sidecar,
+            [
+                sidecar.search_edges_between(
+                    edge.group_id,
+                    edge.fact_embedding,
+                    edge.source_node_uuid,
+                    edge.target_node_uuid,
+                    min_score,
+                    limit,
+                )
+                for edge in edges
+            ],
+        )
+
     query_params: dict[str, Any] = {}
 
     filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
@@ -846,6 +1404,28 @@ async def get_edge_invalidation_candidates(
     if len(edges) == 0:
         return []
 
+    if driver.operations is not None:
+        return await driver.operations.get_edge_invalidation_candidates(
+            edges, search_filter, min_score, limit
+        )
+
+    sidecar = get_ann_sidecar(driver)
+    if sidecar is not None and serves_edges(sidecar, edges, search_filter):
+        return await fetch_ranked_edges(
+            driver,
+            sidecar,
+            [
+                sidecar.search_edges_touching(
+                    edge.group_id,
+                    edge.fact_embedding,
+                    [edge.source_node_uuid, edge.target_node_uuid],
+                    min_score,
+                    limit,
+                )
+                for edge in edges
+            ],
+        )
+
     query_params: dict[str, Any] = {}
 
     filter_query, filter_params = edge_search_filter_query_constructor(search_filter)
@@ -905,6 +1485,103 @@ async def get_edge_invalidation_candidates(
     return invalidation_edges
 
 
+def serves_edges(
+    sidecar: AnnSidecar, edges: list[EntityEdge], search_filter: SearchFilters
+) -> bool:
+    # The sidecar holds no labels, types or dates, so filtered lookups stay in the database
+    return search_filter == SearchFilters() and all(sidecar.serves(edge.group_id) for edge in edges)
+
+
+async def get_relevant_nodes_from_sidecar(
+    driver: GraphDriver,
+    sidecar: AnnSidecar,
+    nodes: list[EntityNode],
+    min_score: float,
+    limit: int,
+) -> list[list[EntityNode]]:
+    """
+    get_relevant_nodes with the vector half ranked by the ANN sidecar.
+
+    Only the fulltext half runs in the database, returning uuids, and the union of both halves
+    is then fetched by uuid.
+    """
+    group_id = nodes[0].group_id
+    vector_uuids = [
+        sidecar.search_nodes(group_id, node.name_embedding, min_score, limit) for node in nodes
+    ]
+
+    query = (
+        RUNTIME_QUERY
+        + """
+        UNWIND $nodes AS node
+        """
+        + get_nodes_query(
+            driver.provider, 'node_name_and_summary', 'node.fulltext_query', '$fulltext_limit'
+        )
+        + """
+        YIELD node AS m
+        WHERE m.group_id = $group_id
+        RETURN node.uuid AS search_node_uuid, collect(m.uuid)[..$limit] AS fulltext_uuids
+        """
+    )
+    results, _, _ = await driver.execute_query(
+        query,
+        nodes=[
+            {
+                'uuid': node.uuid,
+                'fulltext_query': group_fulltext_query(
+                    fulltext_query(node.name) or lucene_sanitize(node.name),
+                    group_id,
+                    driver.provider,
+                ),
+            }
+            for node in nodes
+        ],
+        group_id=group_id,
+        limit=limit,
+        fulltext_limit=fulltext_candidate_limit(limit, [group_id]),
+        routing_='r',
+    )
+    fulltext_uuids: dict[str, list[str]] = {
+        result['search_node_uuid']: result['fulltext_uuids'] for result in results
+    }
+
+    rankings = [
+        list(dict.fromkeys(uuids + fulltext_uuids.get(node.uuid, [])))
+        for node, uuids in zip(nodes, vector_uuids, strict=True)
+    ]
+    uuids = sorted({uuid for ranking in rankings for uuid in ranking})
+    winners: dict[str, EntityNode] = {
+        node.uuid: node for node in (await EntityNode.get_by_uuids(driver, uuids) if uuids else [])
+    }
+    for node in winners.values():
+        node.name_embedding = sidecar.get_node_embedding(node.group_id, node.uuid)
+
+    return [
+        [winners[uuid].model_copy(deep=True) for uuid in ranking if uuid in winners]
+        for ranking in rankings
+    ]
+
+
+async def fetch_ranked_edges(
+    driver: GraphDriver, sidecar: AnnSidecar, rankings: list[list[str]]
+) -> list[list[EntityEdge]]:
+    """Fetch the facts ranked by the ANN sidecar in one query, in ranking order."""
+    uuids = sorted({uuid for ranking in rankings for uuid in ranking})
+    if len(uuids) == 0:
+        return [[] for _ in rankings]
+
+    winners = {edge.uuid: edge for edge in await EntityEdge.get_by_uuids(driver, uuids)}
+    for edge in winners.values():
+        edge.fact_embedding = sidecar.get_edge_embedding(edge.group_id, edge.uuid)
+
+    # Callers update candidates in place, so each ranking gets its own copies
+    return [
+        [winners[uuid].model_copy(deep=True) for uuid in ranking if uuid in winners]
+        for ranking in rankings
+    ]
+
+
 # takes in a list of rankings of uuids
 def rrf(results: list[list[str]], rank_const=1, min_score: float = 0) -> list[str]:
     scores: dict[str, float] = defaultdict(float)
@@ -920,39 +1597,70 @@ def rrf(results: list[list[str]], rank_const=1, min_score: float = 0) -> list[st
     return [uuid for uuid in sorted_uuids if scores[uuid] >= min_score]
 
 
+async def get_node_distances(
+    driver: GraphDriver,
+    center_node_uuid: str,
+    max_depth: int,
+    max_frontier: int = MAX_BFS_FRONTIER,
+) -> dict[str, int]:
+    """
+    Return the shortest-path distance to the entities within max_depth hops of the center node.
+
+    The neighborhood is expanded one level at a time, with a single query per level that
+    expands at most max_frontier of the nodes reached at the previous level. Around hubs, nodes
+    only reachable through unexpanded nodes are left out or get a longer distance.
+    Neighborhoods are cached per driver until a write touches one of their nodes.
+    """
+    cache = get_node_distance_cache(driver)
+    distances = cache.get(center_node_uuid, max_depth)
+    if distances is not None:
+        return distances
+
+    query: LiteralString = """
+        UNWIND $frontier AS node_uuid
+        MATCH (n:Entity {uuid: node_uuid})-[:RELATES_TO]-(m:Entity)
+        RETURN DISTINCT m.uuid AS uuid
+        """
+
+    distances = {center_node_uuid: 0}
+    frontier = [center_node_uuid]
+    for depth in range(1, max_depth + 1):
+        if driver.operations is not None:
+            neighbor_uuids = await driver.operations.get_entity_neighbor_uuids(frontier)
+        else:
+            records, _, _ = await driver.execute_query(query, frontier=frontier, routing_='r')
+            neighbor_uuids = [record['uuid'] for record in records]
+
+        frontier = []
+        for uuid in neighbor_uuids:
+            if uuid not in distances:
+                distances[uuid] = depth
+                if len(frontier) < max_frontier:
+                    frontier.append(uuid)
+        if len(frontier) == 0:
+            break
+
+    cache.put(center_node_uuid, max_depth, distances)
+
+    return distances
+
+
+@traced('node_distance_reranker')
 async def node_distance_reranker(
     driver: GraphDriver,
     node_uuids: list[str],
     center_node_uuid: str,
     min_score: float = 0,
+    max_depth: int = MAX_SEARCH_DEPTH,
 ) -> list[str]:
     # filter out node_uuid center node node uuid
     filtered_uuids = list(filter(lambda node_uuid: node_uuid != center_node_uuid, node_uuids))
-    scores: dict[str, float] = {center_node_uuid: 0.0}
 
-    # Find the shortest path to center node
-    query = """
-        UNWIND $node_uuids AS node_uuid
-        MATCH (center:Entity {uuid: $center_uuid})-[:RELATES_TO]-(n:Entity {uuid: node_uuid})
-        RETURN 1 AS score, node_uuid AS uuid
-        """
-    results, header, _ = await driver.execute_query(
-        query,
-        node_uuids=filtered_uuids,
-        center_uuid=center_node_uuid,
-        routing_='r',
-    )
-    if driver.provider == 'falkordb':
-        results = [dict(zip(header, row, strict=True)) for row in results]
-
-    for result in results:
-        uuid = result['uuid']
-        score = result['score']
-        scores[uuid] = score
-
-    for uuid in filtered_uuids:
-        if uuid not in scores:
-            scores[uuid] = float('inf')
+    # Shortest path distance to the center node, nodes further than max_depth score inf
+    distances = await get_node_distances(driver, center_node_uuid, max_depth)
+    scores: dict[str, float] = {
+        uuid: float(distances.get(uuid, float('inf'))) for uuid in filtered_uuids
+    }
 
     # rerank on shortest distance
     filtered_uuids.sort(key=lambda cur_uuid: scores[cur_uuid])
@@ -965,30 +1673,21 @@ async def node_distance_reranker(
     return [uuid for uuid in filtered_uuids if (1 / scores[uuid]) >= min_score]
 
 
-async def episode_mentions_reranker(
-    driver: GraphDriver, node_uuids: list[list[str]], min_score: float = 0
+def episode_mentions_reranker(
+    node_uuids: list[list[str]], mention_counts: dict[str, int], min_score: float = 0
 ) -> list[str]:
+    """
+    Rank nodes by the number of episodes that mention them.
+
+    mention_counts holds the denormalized mention_count of each candidate, so no query is needed.
+    Nodes with the same count keep their reciprocal rank fusion order.
+    """
     # use rrf as a preliminary ranker
     sorted_uuids = rrf(node_uuids)
-    scores: dict[str, float] = {}
+    scores = {uuid: mention_counts.get(uuid, 0) for uuid in sorted_uuids}
 
-    # Find the shortest path to center node
-    query = """
-        UNWIND $node_uuids AS node_uuid 
-        MATCH (episode:Episodic)-[r:MENTIONS]->(n:Entity {uuid: node_uuid})
-        RETURN count(*) AS score, n.uuid AS uuid
-        """
-    results, _, _ = await driver.execute_query(
-        query,
-        node_uuids=sorted_uuids,
-        routing_='r',
-    )
-
-    for result in results:
-        scores[result['uuid']] = result['score']
-
-    # rerank on shortest distance
-    sorted_uuids.sort(key=lambda cur_uuid: scores[cur_uuid])
+    # rerank on mention count
+    sorted_uuids.sort(reverse=True, key=lambda cur_uuid: scores[cur_uuid])
 
     return [uuid for uuid in sorted_uuids if scores[uuid] >= min_score]
 
@@ -998,43 +1697,130 @@ def maximal_marginal_relevance(
     candidates: dict[str, list[float]],
     mmr_lambda: float = DEFAULT_MMR_LAMBDA,
     min_score: float = -2.0,
+    max_results: int | None = None,
 ) -> list[str]:
-    start = time()
-    query_array = np.array(query_vector)
-    candidate_arrays: dict[str, NDArray] = {}
-    for uuid, embedding in candidates.items():
-        candidate_arrays[uuid] = normalize_l2(embedding)
+    """
+    Greedily select candidates by maximal marginal relevance.
 
-    uuids: list[str] = list(candidate_arrays.keys())
+    Each step picks the candidate maximizing
+    mmr_lambda * sim(query, c) - (1 - mmr_lambda) * max(0, sim(c, s) for s already selected),
+    and stops once the best remaining score is below min_score or max_results are selected.
+    Similarities are cosine similarities computed in float32 with a single matrix product.
+    """
+    start = time()
+    if len(candidates) == 0:
+        return []
 
-    similarity_matrix = np.zeros((len(uuids), len(uuids)))
+    uuids: list[str] = list(candidates.keys())
+    candidate_matrix = normalize_l2_rows(np.array(list(candidates.values()), dtype=np.float32))
+    query_array = normalize_l2_rows(np.array([query_vector], dtype=np.float32))[0]
 
-    for i, uuid_1 in enumerate(uuids):
-        for j, uuid_2 in enumerate(uuids[:i]):
-            u = candidate_arrays[uuid_1]
-            v = candidate_arrays[uuid_2]
-            similarity = np.dot(u, v)
+    relevance = candidate_matrix @ query_array
+    similarity_matrix = candidate_matrix @ candidate_matrix.T
 
-            similarity_matrix[i, j] = similarity
-            similarity_matrix[j, i] = similarity
+    max_selected = len(uuids) if max_results is None else min(max_results, len(uuids))
+    max_similarity = np.zeros(len(uuids), dtype=np.float32)
+    remaining = np.ones(len(uuids), dtype=bool)
+    selected: list[str] = []
+    while len(selected) < max_selected:
+        mmr_scores = mmr_lambda * relevance - (1 - mmr_lambda) * max_similarity
+        mmr_scores[~remaining] = -np.inf
+        best = int(np.argmax(mmr_scores))
 
-    mmr_scores: dict[str, float] = {}
-    for i, uuid in enumerate(uuids):
-        max_sim = np.max(similarity_matrix[i, :])
-        mmr = mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
-        mmr_scores[uuid] = mmr
+        # The redundancy penalty is clamped at 0 and never decreases, so scores only decrease
+        # as more candidates are selected and no later pick can qualify
+        if mmr_scores[best] < min_score:
+            break
 
-    uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
+        remaining[best] = False
+        np.maximum(max_similarity, similarity_matrix[best], out=max_similarity)
+        selected.append(uuids[best])
 
     end = time()
     logger.debug(f'Completed MMR reranking in {(end - start) * 1000} ms')
 
-    return [uuid for uuid in uuids if mmr_scores[uuid] >= min_score]
+    return selected
+
+
+def cosine_similarity_ranking(
+    query_vector: list[float], candidates: dict[str, list[float]], min_score: float = -1.0
+) -> list[str]:
+    """Rank candidates by the cosine similarity of their embedding to the query vector."""
+    if len(candidates) == 0:
+        return []
+
+    uuids: list[str] = list(candidates.keys())
+    candidate_matrix = normalize_l2_rows(np.array(list(candidates.values()), dtype=np.float32))
+    query_array = normalize_l2_rows(np.array([query_vector], dtype=np.float32))[0]
+    scores = candidate_matrix @ query_array
+
+    return [uuids[i] for i in np.argsort(-scores, kind='stable') if scores[i] >= min_score]
+
+
+@traced('cross_encoder_reranker')
+async def cross_encoder_reranker(
+    cross_encoder: CrossEncoderClient,
+    query: str,
+    passage_to_uuid: dict[str, str],
+    min_score: float = 0,
+    limit: int | None = None,
+    early_exit_score: float | None = None,
+) -> list[str]:
+    """
+    Rerank a shortlist of passages with the cross-encoder.
+
+    passage_to_uuid must be ordered by the preliminary ranking. If early_exit_score is set, the
+    shortlist is reranked in chunks of limit passages in that order, stopping as soon as limit
+    passages have scored at least early_exit_score. Scores from different chunks are compared,
+    so early exit needs a pointwise reranker whose scores do not depend on the other passages;
+    listwise rerankers always rank the whole shortlist. A remainder shorter than a chunk is
+    folded into the previous chunk, since some rerankers give a lone passage a constant score.
+    """
+    add_span_attributes({'passage_count': len(passage_to_uuid)})
+    passages = list(passage_to_uuid.keys())
+    if (
+        early_exit_score is None
+        or limit is None
+        or limit <= 0
+        or getattr(cross_encoder, 'listwise', False)
+    ):
+        ranked_passages = await cross_encoder.rank(query, passages)
+    else:
+        chunk_size = max(limit, 2)
+        ranked_passages = []
+        start = 0
+        while start < len(passages):
+            end = start + chunk_size
+            if len(passages) - end < chunk_size:
+                end = len(passages)
+            ranked_passages.extend(await cross_encoder.rank(query, passages[start:end]))
+            if sum(1 for _, score in ranked_passages if score >= early_exit_score) >= limit:
+                break
+            start = end
+        ranked_passages.sort(reverse=True, key=lambda x: x[1])
+
+    return [passage_to_uuid[passage] for passage, score in ranked_passages if score >= min_score]
 
 
 async def get_embeddings_for_nodes(
     driver: GraphDriver, nodes: list[EntityNode]
 ) -> dict[str, list[float]]:
+    # Only fetch the embeddings that were not already returned by the search queries
+    embeddings_dict: dict[str, list[float]] = {
+        node.uuid: node.name_embedding for node in nodes if node.name_embedding is not None
+    }
+    missing_uuids = [node.uuid for node in nodes if node.name_embedding is None]
+    if len(missing_uuids) == 0:
+        return embeddings_dict
+
+    if driver.operations is not None:
+        for node in await driver.operations.get_nodes_by_uuids(
+            EntityNode, missing_uuids, include_embeddings=True
+        ):
+            if node.name_embedding is not None:
+                embeddings_dict[node.uuid] = node.name_embedding
+        return embeddings_dict
+
     query: LiteralString = """MATCH (n:Entity)
                               WHERE n.uuid IN $node_uuids
                               RETURN DISTINCT
@@ -1042,11 +1828,8 @@ async def get_embeddings_for_nodes(
                                 n.name_embedding AS name_embedding
                     """
 
-    results, _, _ = await driver.execute_query(
-        query, node_uuids=[node.uuid for node in nodes], routing_='r'
-    )
+    results, _, _ = await driver.execute_query(query, node_uuids=missing_uuids, routing_='r')
 
-    embeddings_dict: dict[str, list[float]] = {}
     for result in results:
         uuid: str = result.get('uuid')
         embedding: list[float] = result.get('name_embedding')
@@ -1059,6 +1842,26 @@ async def get_embeddings_for_nodes(
 async def get_embeddings_for_communities(
     driver: GraphDriver, communities: list[CommunityNode]
 ) -> dict[str, list[float]]:
+    # Only fetch the embeddings that were not already returned by the search queries
+    embeddings_dict: dict[str, list[float]] = {
+        community.uuid: community.name_embedding
+        for community in communities
+        if community.name_embedding is not None
+    }
+    missing_uuids = [
+        community.uuid for community in communities if community.name_embedding is None
+    ]
+    if len(missing_uuids) == 0:
+        return embeddings_dict
+
+    if driver.operations is not None:
+        for community in await driver.operations.get_nodes_by_uuids(
+            CommunityNode, missing_uuids, include_embeddings=True
+        ):
+            if community.name_embedding is not None:
+                embeddings_dict[community.uuid] = community.name_embedding
+        return embeddings_dict
+
     query: LiteralString = """MATCH (c:Community)
                               WHERE c.uuid IN $community_uuids
                               RETURN DISTINCT
@@ -1068,11 +1871,10 @@ async def get_embeddings_for_communities(
 
     results, _, _ = await driver.execute_query(
         query,
-        community_uuids=[community.uuid for community in communities],
+        community_uuids=missing_uuids,
         routing_='r',
     )
 
-    embeddings_dict: dict[str, list[float]] = {}
     for result in results:
         uuid: str = result.get('uuid')
         embedding: list[float] = result.get('name_embedding')
@@ -1085,6 +1887,22 @@ async def get_embeddings_for_communities(
 async def get_embeddings_for_edges(
     driver: GraphDriver, edges: list[EntityEdge]
 ) -> dict[str, list[float]]:
+    # Only fetch the embeddings that were not already returned by the search queries
+    embeddings_dict: dict[str, list[float]] = {
+        edge.uuid: edge.fact_embedding for edge in edges if edge.fact_embedding is not None
+    }
+    missing_uuids = [edge.uuid for edge in edges if edge.fact_embedding is None]
+    if len(missing_uuids) == 0:
+        return embeddings_dict
+
+    if driver.operations is not None:
+        for edge in await driver.operations.get_edges_by_uuids(
+            EntityEdge, missing_uuids, include_embeddings=True
+        ):
+            if edge.fact_embedding is not None:
+                embeddings_dict[edge.uuid] = edge.fact_embedding
+        return embeddings_dict
+
     query: LiteralString = """MATCH (n:Entity)-[e:RELATES_TO]-(m:Entity)
                               WHERE e.uuid IN $edge_uuids
                               RETURN DISTINCT
@@ -1094,11 +1912,10 @@ async def get_embeddings_for_edges(
 
     results, _, _ = await driver.execute_query(
         query,
-        edge_uuids=[edge.uuid for edge in edges],
+        edge_uuids=missing_uuids,
         routing_='r',
     )
 
-    embeddings_dict: dict[str, list[float]] = {}
     for result in results:
         uuid: str = result.get('uuid')
         embedding: list[float] = result.get('fact_embedding')
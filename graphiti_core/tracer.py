@@ -0,0 +1,226 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+import inspect
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any, TypeVar
+
+from graphiti_core.metrics import stage_duration
+
+DEFAULT_SPAN_PREFIX = 'graphiti'
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class TracerSpan(ABC):
+    @abstractmethod
+    def add_attributes(self, attributes: dict[str, Any]):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set_status(self, status: str, description: str | None = None):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def record_exception(self, exception: BaseException):
+        raise NotImplementedError()
+
+
+class Tracer(ABC):
+    @abstractmethod
+    def start_span(self, name: str) -> AbstractContextManager[TracerSpan]:
+        raise NotImplementedError()
+
+
+class NoOpSpan(TracerSpan):
+    def add_attributes(self, attributes: dict[str, Any]):
+        pass
+
+    def set_status(self, status: str, description: str | None = None):
+        pass
+
+    def record_exception(self, exception: BaseException):
+        pass
+
+
+class NoOpTracer(Tracer):
+    @contextmanager
+    def start_span(self, name: str) -> Generator[TracerSpan, None, None]:
+        yield NOOP_SPAN
+
+
+NOOP_SPAN = NoOpSpan()
+NOOP_TRACER = NoOpTracer()
+
+
+def otel_attribute_value(value: Any) -> Any:
+    if isinstance(value, str | bool | int | float):
+        return value
+    if isinstance(value, list | tuple | set):
+        return [v if isinstance(v, str | bool | int | float) else str(v) for v in value]
+    return str(value)
+
+
+class OpenTelemetrySpan(TracerSpan):
+    def __init__(self, span: Any):
+        self.span = span
+
+    def add_attributes(self, attributes: dict[str, Any]):
+        for key, value in attributes.items():
+            if value is not None:
+                self.span.set_attribute(key, otel_attribute_value(value))
+
+    def set_status(self, status: str, description: str | None = None):
+        from opentelemetry.trace import Status, StatusCode
+
+        status_code = StatusCode.ERROR if status == 'error' else StatusCode.OK
+        self.span.set_status(
+            Status(status_code, description if status_code == StatusCode.ERROR else None)
+        )
+
+    def record_exception(self, exception: BaseException):
+        self.span.record_exception(exception)
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Adapts an OpenTelemetry tracer, such as one returned by opentelemetry.trace.get_tracer.
+
+    Span names are prefixed with span_prefix, so that Graphiti spans can be told apart from
+    those of the application.
+    """
+
+    def __init__(self, tracer: Any, span_prefix: str = DEFAULT_SPAN_PREFIX):
+        self.tracer = tracer
+        self.span_prefix = span_prefix
+
+    @contextmanager
+    def start_span(self, name: str) -> Generator[TracerSpan, None, None]:
+        # Exceptions are recorded by trace_span, so OpenTelemetry should not record them again
+        with self.tracer.start_as_current_span(
+            f'{self.span_prefix}.{name}', record_exception=False, set_status_on_exception=False
+        ) as span:
+            yield OpenTelemetrySpan(span)
+
+
+# The tracer used by spans started from the current context, set by Graphiti's entry points
+current_tracer: ContextVar[Tracer] = ContextVar('current_tracer', default=NOOP_TRACER)
+current_span: ContextVar[TracerSpan] = ContextVar('current_span', default=NOOP_SPAN)
+
+
+def get_tracer() -> Tracer:
+    return current_tracer.get()
+
+
+@contextmanager
+def use_tracer(tracer: Tracer | None) -> Generator[Tracer, None, None]:
+    """Trace the calls made from the current context with the given tracer."""
+    token = current_tracer.set(tracer if tracer is not None else NOOP_TRACER)
+    try:
+        yield current_tracer.get()
+    finally:
+        current_tracer.reset(token)
+
+
+@contextmanager
+def trace_span(
+    name: str, attributes: dict[str, Any] | None = None
+) -> Generator[TracerSpan, None, None]:
+    """
+    Start a span with the current tracer and make it the current span.
+
+    Exceptions raised inside the span are recorded on it, and the span is marked as failed.
+    The span's duration is recorded in the stage latency histogram whether or not a tracer is
+    installed.
+    """
+    start = monotonic()
+    try:
+        tracer = current_tracer.get()
+        if tracer is NOOP_TRACER:
+            yield NOOP_SPAN
+            return
+
+        with tracer.start_span(name) as span:
+            token = current_span.set(span)
+            try:
+                if attributes:
+                    span.add_attributes(attributes)
+                yield span
+            except BaseException as e:
+                span.record_exception(e)
+                span.set_status('error', str(e))
+                raise
+            finally:
+                current_span.reset(token)
+    finally:
+        stage_duration.observe(monotonic() - start, stage=name)
+
+
+def add_span_attributes(attributes: dict[str, Any]):
+    """Add attributes to the current span, such as token usage reported deep inside a call."""
+    current_span.get().add_attributes(attributes)
+
+
+def traced(name: str, count_results: bool = True) -> Callable[[F], F]:
+    """
+    Run each call of the decorated function in a span with the given name.
+
+    Call durations are recorded in the stage latency histogram, labelled with the name. If
+    count_results is set and the function returns a list, its length is recorded as the
+    result_count attribute.
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if current_tracer.get() is NOOP_TRACER:
+                    start = monotonic()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        stage_duration.observe(monotonic() - start, stage=name)
+                with trace_span(name) as span:
+                    result = await func(*args, **kwargs)
+                    if count_results and isinstance(result, list):
+                        span.add_attributes({'result_count': len(result)})
+                    return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current_tracer.get() is NOOP_TRACER:
+                start = monotonic()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    stage_duration.observe(monotonic() - start, stage=name)
+            with trace_span(name) as span:
+                result = func(*args, **kwargs)
+                if count_results and isinstance(result, list):
+                    span.add_attributes({'result_count': len(result)})
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
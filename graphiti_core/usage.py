@@ -0,0 +1,184 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, Field
+
+UNKNOWN_PROMPT = 'unknown'
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class PromptUsage(BaseModel):
+    prompt_name: str = Field(description='prompt the calls were made with, e.g. extract_nodes')
+    model: str
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    duration_ms: float = Field(default=0.0, description='total time spent in the calls')
+
+
+class ModelPrice(BaseModel):
+    input_per_million: float = Field(description='price of one million input tokens')
+    output_per_million: float = Field(description='price of one million output tokens')
+
+
+class LLMUsage(BaseModel):
+    prompts: list[PromptUsage] = Field(
+        default_factory=list, description='usage broken down by prompt and model'
+    )
+
+    @property
+    def calls(self) -> int:
+        return sum(usage.calls for usage in self.prompts)
+
+    @property
+    def input_tokens(self) -> int:
+        return sum(usage.input_tokens for usage in self.prompts)
+
+    @property
+    def output_tokens(self) -> int:
+        return sum(usage.output_tokens for usage in self.prompts)
+
+    def cost(self, prices: dict[str, ModelPrice]) -> float:
+        """The cost of the usage given prices by model. Models without a price are not counted."""
+        total = 0.0
+        for usage in self.prompts:
+            price = prices.get(usage.model)
+            if price is None:
+                continue
+            total += usage.input_tokens * price.input_per_million / 1_000_000
+            total += usage.output_tokens * price.output_per_million / 1_000_000
+        return total
+
+
+class UsageAccumulator:
+    """
+    Adds up the LLM usage of the calls made while it is the current accumulator.
+
+    Usage is also added to the accumulator that was current when this one was started, so
+    that usage collected for a search made during an ingestion still counts towards both.
+    """
+
+    def __init__(self, parent: 'UsageAccumulator | None' = None):
+        self.parent = parent
+        self.usage: dict[tuple[str, str], PromptUsage] = {}
+
+    def record(
+        self,
+        prompt_name: str,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        duration: float = 0.0,
+    ):
+        usage = self.usage.get((prompt_name, model))
+        if usage is None:
+            usage = PromptUsage(prompt_name=prompt_name, model=model)
+            self.usage[(prompt_name, model)] = usage
+        usage.calls += 1
+        usage.input_tokens += input_tokens
+        usage.output_tokens += output_tokens
+        usage.duration_ms += duration * 1000
+
+        if self.parent is not None:
+            self.parent.record(prompt_name, model, input_tokens, output_tokens, duration)
+
+    def summary(self) -> LLMUsage:
+        return LLMUsage(prompts=[usage.model_copy() for _, usage in sorted(self.usage.items())])
+
+
+class LLMCall:
+    def __init__(self, prompt_name: str, model: str):
+        self.prompt_name = prompt_name
+        self.model = model
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+
+current_usage: ContextVar[UsageAccumulator | None] = ContextVar('current_usage', default=None)
+current_llm_call: ContextVar[LLMCall | None] = ContextVar('current_llm_call', default=None)
+
+
+@contextmanager
+def collect_usage() -> Generator[UsageAccumulator, None, None]:
+    """Collect the LLM usage of the calls made from the current context."""
+    accumulator = UsageAccumulator(current_usage.get())
+    token = current_usage.set(accumulator)
+    try:
+        yield accumulator
+    finally:
+        current_usage.reset(token)
+
+
+@contextmanager
+def llm_call(prompt_name: str | None, model: str) -> Generator[LLMCall, None, None]:
+    """
+    Count the calls made inside as one LLM call, and add it to the current accumulator.
+
+    Token usage reported with record_token_usage inside the call, including by retries, is
+    added to it.
+    """
+    call = LLMCall(prompt_name or UNKNOWN_PROMPT, model)
+    token = current_llm_call.set(call)
+    start = monotonic()
+    try:
+        yield call
+    finally:
+        current_llm_call.reset(token)
+        accumulator = current_usage.get()
+        if accumulator is not None:
+            accumulator.record(
+                call.prompt_name,
+                call.model,
+                call.input_tokens,
+                call.output_tokens,
+                monotonic() - start,
+            )
+
+
+def record_token_usage(model: str | None, input_tokens: Any, output_tokens: Any):
+    """Add token usage reported by a provider to the current LLM call."""
+    call = current_llm_call.get()
+    if call is None:
+        return
+    if isinstance(model, str) and model:
+        call.model = model
+    if isinstance(input_tokens, int):
+        call.input_tokens += input_tokens
+    if isinstance(output_tokens, int):
+        call.output_tokens += output_tokens
+
+
+def track_llm_call(func: F) -> F:
+    """
+    Run each call of the decorated LLMClient.generate_response as an LLM call.
+
+    The call is attributed to the prompt_name keyword argument and the client's model.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        with llm_call(kwargs.get('prompt_name'), str(self.model)):
+            return await func(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
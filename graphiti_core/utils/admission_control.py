@@ -0,0 +1,151 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import math
+
+from pydantic import BaseModel
+
+from graphiti_core.errors import AdmissionRejectedError
+
+DEFAULT_RETRY_AFTER_SECONDS = 5.0
+PROCESSING_RATE_SMOOTHING = 0.2
+
+
+class AdmissionStatus(BaseModel):
+    group_depth: int | None
+    total_depth: int
+    max_group_queue: int | None
+    max_total_queue: int | None
+    max_estimated_wait: float | None
+    seconds_per_episode: float | None
+    estimated_wait: float | None
+
+
+class AdmissionController:
+    """
+    Decides whether new episodes may join an ingestion queue.
+
+    The controller does not own the queue: callers pass in the current depths, and report
+    finished work through `record_processed` so the controller can estimate how long a new
+    episode would wait. An episode is rejected when it would push its group or the whole
+    queue past a cap, or when its estimated wait exceeds `max_estimated_wait`.
+
+    Parameters
+    ----------
+    max_group_queue : int | None
+        Maximum number of queued episodes for a single group_id. None disables the cap.
+    max_total_queue : int | None
+        Maximum number of queued episodes across all groups. None disables the cap.
+    max_estimated_wait : float | None
+        Maximum estimated queueing delay in seconds. None disables the check.
+    concurrency : int
+        Number of groups that are processed in parallel, used to estimate global wait time.
+    """
+
+    def __init__(
+        self,
+        max_group_queue: int | None = None,
+        max_total_queue: int | None = None,
+        max_estimated_wait: float | None = None,
+        concurrency: int = 1,
+    ):
+        self.max_group_queue = max_group_queue
+        self.max_total_queue = max_total_queue
+        self.max_estimated_wait = max_estimated_wait
+        self.concurrency = max(concurrency, 1)
+        self.seconds_per_episode: float | None = None
+
+    def record_processed(self, episodes: int, seconds: float):
+        """Fold the processing time of a finished batch into the per-episode rate."""
+        if episodes <= 0:
+            return
+
+        sample = seconds / episodes
+        if self.seconds_per_episode is None:
+            self.seconds_per_episode = sample
+        else:
+            self.seconds_per_episode += PROCESSING_RATE_SMOOTHING * (
+                sample - self.seconds_per_episode
+            )
+
+    def estimate_wait(self, group_depth: int, total_depth: int) -> float | None:
+        """Estimated seconds before a newly queued episode starts processing."""
+        if self.seconds_per_episode is None:
+            return None
+
+        # Episodes of one group run sequentially; groups share `concurrency` workers
+        return max(
+            group_depth * self.seconds_per_episode,
+            total_depth * self.seconds_per_episode / self.concurrency,
+        )
+
+    def _retry_after(self, overflow: int, parallelism: int = 1) -> float:
+        if self.seconds_per_episode is None:
+            return DEFAULT_RETRY_AFTER_SECONDS
+        return max(math.ceil(overflow * self.seconds_per_episode / parallelism), 1)
+
+    def check(self, incoming: int, group_depth: int, total_depth: int):
+        """
+        Raise AdmissionRejectedError if `incoming` episodes may not be queued.
+
+        The error's retry_after is the estimated number of seconds until enough of the
+        backlog has drained, or None if the request can never fit under the caps.
+        """
+        if self.max_group_queue is not None:
+            if incoming > self.max_group_queue:
+                raise AdmissionRejectedError(
+                    f'{incoming} episodes exceed the per-group queue limit of {self.max_group_queue}',
+                    None,
+                )
+            overflow = group_depth + incoming - self.max_group_queue
+            if overflow > 0:
+                raise AdmissionRejectedError(
+                    f'group queue is full ({group_depth}/{self.max_group_queue} episodes)',
+                    self._retry_after(overflow),
+                )
+
+        if self.max_total_queue is not None:
+            if incoming > self.max_total_queue:
+                raise AdmissionRejectedError(
+                    f'{incoming} episodes exceed the ingestion queue limit of {self.max_total_queue}',
+                    None,
+                )
+            overflow = total_depth + incoming - self.max_total_queue
+            if overflow > 0:
+                raise AdmissionRejectedError(
+                    f'ingestion queue is full ({total_depth}/{self.max_total_queue} episodes)',
+                    self._retry_after(overflow, self.concurrency),
+                )
+
+        if self.max_estimated_wait is not None:
+            estimated_wait = self.estimate_wait(group_depth + incoming, total_depth + incoming)
+            if estimated_wait is not None and estimated_wait > self.max_estimated_wait:
+                raise AdmissionRejectedError(
+                    f'estimated queueing delay of {estimated_wait:.0f}s exceeds '
+                    f'the limit of {self.max_estimated_wait:.0f}s',
+                    max(math.ceil(estimated_wait - self.max_estimated_wait), 1),
+                )
+
+    def status(self, total_depth: int, group_depth: int | None = None) -> AdmissionStatus:
+        return AdmissionStatus(
+            group_depth=group_depth,
+            total_depth=total_depth,
+            max_group_queue=self.max_group_queue,
+            max_total_queue=self.max_total_queue,
+            max_estimated_wait=self.max_estimated_wait,
+            seconds_per_episode=self.seconds_per_episode,
+            estimated_wait=self.estimate_wait(group_depth or 0, total_depth),
+        )
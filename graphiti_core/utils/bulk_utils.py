@@ -38,6 +38,10 @@ from graphiti_core.models.nodes.node_db_queries import (
     EPISODIC_NODE_SAVE_BULK,
 )
 from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode, create_entity_node_embeddings
+from graphiti_core.search.ann_sidecar import index_embeddings
+from graphiti_core.search.node_distance_cache import invalidate_node_distances
+from graphiti_core.search.search_cache import record_graph_write
+from graphiti_core.tracer import add_span_attributes, traced
 from graphiti_core.utils.maintenance.edge_operations import (
     extract_edges,
     resolve_extracted_edge,
@@ -83,6 +87,7 @@ async def retrieve_previous_episodes_bulk(
     return episode_tuples
 
 
+@traced('add_nodes_and_edges_bulk')
 async def add_nodes_and_edges_bulk(
     driver: GraphDriver,
     episodic_nodes: list[EpisodicNode],
@@ -91,19 +96,53 @@ async def add_nodes_and_edges_bulk(
     entity_edges: list[EntityEdge],
     embedder: EmbedderClient,
 ):
-    session = driver.session()
-    try:
-        await session.execute_write(
-            add_nodes_and_edges_bulk_tx,
-            episodic_nodes,
-            episodic_edges,
-            entity_nodes,
-            entity_edges,
-            embedder,
-            driver=driver,
-        )
-    finally:
-        await session.close()
+    add_span_attributes(
+        {
+            'group_ids': sorted({node.group_id for node in episodic_nodes}),
+            'episode_count': len(episodic_nodes),
+            'episodic_edge_count': len(episodic_edges),
+            'entity_node_count': len(entity_nodes),
+            'entity_edge_count': len(entity_edges),
+        }
+    )
+    if driver.operations is not None:
+        for node in entity_nodes:
+            if node.name_embedding is None:
+                await node.generate_name_embedding(embedder)
+        for edge in entity_edges:
+            if edge.fact_embedding is None:
+                await edge.generate_embedding(embedder)
+
+        # Nodes first, since edges are only saved between existing nodes
+        await driver.operations.save_nodes([*episodic_nodes, *entity_nodes])
+        await driver.operations.save_edges([*episodic_edges, *entity_edges])
+    else:
+        session = driver.session()
+        try:
+            await session.execute_write(
+                add_nodes_and_edges_bulk_tx,
+                episodic_nodes,
+                episodic_edges,
+                entity_nodes,
+                entity_edges,
+                embedder,
+                driver=driver,
+            )
+        finally:
+            await session.close()
+
+    invalidate_node_distances(
+        driver,
+        [edge.source_node_uuid for edge in entity_edges]
+        + [edge.target_node_uuid for edge in entity_edges],
+    )
+    index_embeddings(driver, entity_nodes, entity_edges)
+    record_graph_write(
+        driver,
+        [node.group_id for node in episodic_nodes]
+        + [node.group_id for node in entity_nodes]
+        + [edge.group_id for edge in entity_edges],
+    )
 
 
 async def add_nodes_and_edges_bulk_tx(
@@ -139,6 +178,7 @@ async def add_nodes_and_edges_bulk_tx(
     for edge in entity_edges:
         if edge.fact_embedding is None:
             await edge.generate_embedding(embedder)
+        edge.episode_count = len(edge.episodes)
         edge_data: dict[str, Any] = {
             'uuid': edge.uuid,
             'source_node_uuid': edge.source_node_uuid,
@@ -148,6 +188,7 @@ async def add_nodes_and_edges_bulk_tx(
             'fact_embedding': edge.fact_embedding,
             'group_id': edge.group_id,
             'episodes': edge.episodes,
+            'episode_count': edge.episode_count,
             'created_at': edge.created_at,
             'expired_at': edge.expired_at,
             'valid_at': edge.valid_at,
@@ -200,22 +241,14 @@ async def extract_nodes_and_edges_bulk(
     return extracted_nodes_bulk, extracted_edges_bulk
 
 
-async def dedupe_nodes_bulk(
-    clients: GraphitiClients,
-    extracted_nodes: list[list[EntityNode]],
-    episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
-    entity_types: dict[str, BaseModel] | None = None,
-) -> tuple[dict[str, list[EntityNode]], dict[str, str]]:
-    embedder = clients.embedder
-    min_score = 0.8
-
-    # generate embeddings
-    await semaphore_gather(
-        *[create_entity_node_embeddings(embedder, nodes) for nodes in extracted_nodes]
-    )
-
-    # Find similar results
-    dedupe_tuples: list[tuple[list[EntityNode], list[EntityNode]]] = []
+def node_dedupe_candidates(
+    extracted_nodes: list[list[EntityNode]], min_score: float = 0.8
+) -> list[list[EntityNode]]:
+    """
+    For each episode's nodes, the nodes extracted from the other episodes that could be
+    duplicates: those sharing a word with one of its nodes or with similar name embeddings.
+    """
+    candidates: list[list[EntityNode]] = []
     for i, nodes_i in enumerate(extracted_nodes):
         existing_nodes: list[EntityNode] = []
         for j, nodes_j in enumerate(extracted_nodes):
@@ -243,7 +276,28 @@ async def dedupe_nodes_bulk(
                 if similarity >= min_score:
                     candidates_i.append(existing_node)
 
-        dedupe_tuples.append((nodes_i, candidates_i))
+        candidates.append(candidates_i)
+
+    return candidates
+
+
+async def dedupe_nodes_bulk(
+    clients: GraphitiClients,
+    extracted_nodes: list[list[EntityNode]],
+    episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
+    entity_types: dict[str, BaseModel] | None = None,
+) -> tuple[dict[str, list[EntityNode]], dict[str, str]]:
+    embedder = clients.embedder
+
+    # generate embeddings
+    await semaphore_gather(
+        *[create_entity_node_embeddings(embedder, nodes) for nodes in extracted_nodes]
+    )
+
+    # Find similar results
+    dedupe_tuples: list[tuple[list[EntityNode], list[EntityNode]]] = list(
+        zip(extracted_nodes, node_dedupe_candidates(extracted_nodes), strict=True)
+    )
 
     # Determine Node Resolutions
     bulk_node_resolutions: list[
@@ -299,24 +353,14 @@ async def dedupe_nodes_bulk(
     return nodes_by_episode, compressed_map
 
 
-async def dedupe_edges_bulk(
-    clients: GraphitiClients,
-    extracted_edges: list[list[EntityEdge]],
-    episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
-    _entities: list[EntityNode],
-    edge_types: dict[str, BaseModel],
-    _edge_type_map: dict[tuple[str, str], list[str]],
-) -> dict[str, list[EntityEdge]]:
-    embedder = clients.embedder
-    min_score = 0.6
-
-    # generate embeddings
-    await semaphore_gather(
-        *[create_entity_edge_embeddings(embedder, edges) for edges in extracted_edges]
-    )
-
-    # Find similar results
-    dedupe_tuples: list[tuple[EpisodicNode, EntityEdge, list[EntityEdge]]] = []
+def edge_dedupe_candidates(
+    extracted_edges: list[list[EntityEdge]], min_score: float = 0.6
+) -> list[list[list[EntityEdge]]]:
+    """
+    For each extracted edge, the edges extracted from the other episodes that could be
+    duplicates: those sharing a word with its fact or with similar fact embeddings.
+    """
+    candidates_by_episode: list[list[list[EntityEdge]]] = []
     for i, edges_i in enumerate(extracted_edges):
         existing_edges: list[EntityEdge] = []
         for j, edges_j in enumerate(extracted_edges):
@@ -324,6 +368,7 @@ async def dedupe_edges_bulk(
                 continue
             existing_edges += edges_j
 
+        candidates_i: list[list[EntityEdge]] = []
         for edge in edges_i:
             candidates: list[EntityEdge] = []
             for existing_edge in existing_edges:
@@ -344,6 +389,32 @@ async def dedupe_edges_bulk(
                 if similarity >= min_score:
                     candidates.append(existing_edge)
 
+            candidates_i.append(candidates)
+
+        candidates_by_episode.append(candidates_i)
+
+    return candidates_by_episode
+
+
+async def dedupe_edges_bulk(
+    clients: GraphitiClients,
+    extracted_edges: list[list[EntityEdge]],
+    episode_tuples: list[tuple[EpisodicNode, list[EpisodicNode]]],
+    _entities: list[EntityNode],
+    edge_types: dict[str, BaseModel],
+    _edge_type_map: dict[tuple[str, str], list[str]],
+) -> dict[str, list[EntityEdge]]:
+    embedder = clients.embedder
+
+    # generate embeddings
+    await semaphore_gather(
+        *[create_entity_edge_embeddings(embedder, edges) for edges in extracted_edges]
+    )
+
+    # Find similar results
+    dedupe_tuples: list[tuple[EpisodicNode, EntityEdge, list[EntityEdge]]] = []
+    for i, edge_candidates in enumerate(edge_dedupe_candidates(extracted_edges)):
+        for edge, candidates in zip(extracted_edges[i], edge_candidates, strict=True):
             dedupe_tuples.append((episode_tuples[i][0], edge, candidates))
 
     bulk_edge_resolutions: list[
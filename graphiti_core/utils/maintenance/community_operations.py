@@ -12,6 +12,7 @@ from graphiti_core.llm_client import LLMClient
 from graphiti_core.nodes import CommunityNode, EntityNode, get_community_node_from_record
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.summarize_nodes import Summary, SummaryDescription
+from graphiti_core.search.search_cache import record_graph_write
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import build_community_edges
 
@@ -31,20 +32,40 @@ async def get_community_clusters(
     community_clusters: list[list[EntityNode]] = []
 
     if group_ids is None:
-        group_id_values, _, _ = await driver.execute_query(
-            """
-        MATCH (n:Entity WHERE n.group_id IS NOT NULL)
-        RETURN 
-            collect(DISTINCT n.group_id) AS group_ids
-        """,
-        )
+        if driver.operations is not None:
+            group_ids = await driver.operations.get_entity_group_ids()
+        else:
+            group_id_values, _, _ = await driver.execute_query(
+                """
+            MATCH (n:Entity WHERE n.group_id IS NOT NULL)
+            RETURN 
+                collect(DISTINCT n.group_id) AS group_ids
+            """,
+            )
 
-        group_ids = group_id_values[0]['group_ids'] if group_id_values else []
+            group_ids = group_id_values[0]['group_ids'] if group_id_values else []
 
     for group_id in group_ids:
         projection: dict[str, list[Neighbor]] = {}
         nodes = await EntityNode.get_by_group_ids(driver, [group_id])
+        node_uuids = {node.uuid for node in nodes}
         for node in nodes:
+            if driver.operations is not None:
+                edge_counts: dict[str, int] = defaultdict(int)
+                for edge in await driver.operations.get_entity_edges_by_node_uuid(node.uuid):
+                    neighbor_uuid = (
+                        edge.target_node_uuid
+                        if edge.source_node_uuid == node.uuid
+                        else edge.source_node_uuid
+                    )
+                    if neighbor_uuid in node_uuids:
+                        edge_counts[neighbor_uuid] += 1
+                projection[node.uuid] = [
+                    Neighbor(node_uuid=uuid, edge_count=count)
+                    for uuid, count in edge_counts.items()
+                ]
+                continue
+
             records, _, _ = await driver.execute_query(
                 """
             MATCH (n:Entity {group_id: $group_id, uuid: $uuid})-[r:RELATES_TO]-(m: Entity {group_id: $group_id})
@@ -127,7 +148,9 @@ async def summarize_pair(llm_client: LLMClient, summary_pair: tuple[str, str]) -
     context = {'node_summaries': [{'summary': summary} for summary in summary_pair]}
 
     llm_response = await llm_client.generate_response(
-        prompt_library.summarize_nodes.summarize_pair(context), response_model=Summary
+        prompt_library.summarize_nodes.summarize_pair(context),
+        response_model=Summary,
+        prompt_name='summarize_nodes.summarize_pair',
     )
 
     pair_summary = llm_response.get('summary', '')
@@ -141,6 +164,7 @@ async def generate_summary_description(llm_client: LLMClient, summary: str) -> s
     llm_response = await llm_client.generate_response(
         prompt_library.summarize_nodes.summary_description(context),
         response_model=SummaryDescription,
+        prompt_name='summarize_nodes.summary_description',
     )
 
     description = llm_response.get('description', '')
@@ -217,51 +241,67 @@ async def build_communities(
 
 
 async def remove_communities(driver: GraphDriver):
-    await driver.execute_query(
-        """
-    MATCH (c:Community)
-    DETACH DELETE c
-    """,
-    )
+    if driver.operations is not None:
+        await driver.operations.delete_communities()
+    else:
+        await driver.execute_query(
+            """
+        MATCH (c:Community)
+        DETACH DELETE c
+        """,
+        )
+    record_graph_write(driver)
 
 
 async def determine_entity_community(
     driver: GraphDriver, entity: EntityNode
 ) -> tuple[CommunityNode | None, bool]:
     # Check if the node is already part of a community
-    records, _, _ = await driver.execute_query(
-        """
-    MATCH (c:Community)-[:HAS_MEMBER]->(n:Entity {uuid: $entity_uuid})
-    RETURN
-        c.uuid As uuid, 
-        c.name AS name,
-        c.group_id AS group_id,
-        c.created_at AS created_at, 
-        c.summary AS summary
-    """,
-        entity_uuid=entity.uuid,
-    )
+    if driver.operations is not None:
+        current_communities = await driver.operations.get_communities_by_nodes([entity.uuid])
+    else:
+        records, _, _ = await driver.execute_query(
+            """
+        MATCH (c:Community)-[:HAS_MEMBER]->(n:Entity {uuid: $entity_uuid})
+        RETURN
+            c.uuid As uuid, 
+            c.name AS name,
+            c.group_id AS group_id,
+            c.created_at AS created_at, 
+            c.summary AS summary
+        """,
+            entity_uuid=entity.uuid,
+        )
+        current_communities = [get_community_node_from_record(record) for record in records]
 
-    if len(records) > 0:
-        return get_community_node_from_record(records[0]), False
+    if len(current_communities) > 0:
+        return current_communities[0], False
 
     # If the node has no community, add it to the mode community of surrounding entities
-    records, _, _ = await driver.execute_query(
-        """
-    MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(n:Entity {uuid: $entity_uuid})
-    RETURN
-        c.uuid As uuid, 
-        c.name AS name,
-        c.group_id AS group_id,
-        c.created_at AS created_at, 
-        c.summary AS summary
-    """,
-        entity_uuid=entity.uuid,
-    )
+    communities: list[CommunityNode] = []
+    if driver.operations is not None:
+        for edge in await driver.operations.get_entity_edges_by_node_uuid(entity.uuid):
+            neighbor_uuid = (
+                edge.target_node_uuid
+                if edge.source_node_uuid == entity.uuid
+                else edge.source_node_uuid
+            )
+            communities.extend(await driver.operations.get_communities_by_nodes([neighbor_uuid]))
+    else:
+        records, _, _ = await driver.execute_query(
+            """
+        MATCH (c:Community)-[:HAS_MEMBER]->(m:Entity)-[:RELATES_TO]-(n:Entity {uuid: $entity_uuid})
+        RETURN
+            c.uuid As uuid, 
+            c.name AS name,
+            c.group_id AS group_id,
+            c.created_at AS created_at, 
+            c.summary AS summary
+        """,
+            entity_uuid=entity.uuid,
+        )
 
-    communities: list[CommunityNode] = [
-        get_community_node_from_record(record) for record in records
-    ]
+        communities = [get_community_node_from_record(record) for record in records]
 
     community_map: dict[str, int] = defaultdict(int)
     for community in communities:
@@ -38,6 +38,7 @@ from graphiti_core.prompts.dedupe_edges import EdgeDuplicate, UniqueFacts
 from graphiti_core.prompts.extract_edges import ExtractedEdges, MissingFacts
 from graphiti_core.search.search_filters import SearchFilters
 from graphiti_core.search.search_utils import get_edge_invalidation_candidates, get_relevant_edges
+from graphiti_core.tracer import add_span_attributes, traced
 from graphiti_core.utils.datetime_utils import ensure_utc, utc_now
 
 logger = logging.getLogger(__name__)
@@ -107,6 +108,7 @@ def build_community_edges(
     return edges
 
 
+@traced('extract_edges')
 async def extract_edges(
     clients: GraphitiClients,
     episode: EpisodicNode,
@@ -116,6 +118,7 @@ async def extract_edges(
     group_id: str = '',
     edge_types: dict[str, BaseModel] | None = None,
 ) -> list[EntityEdge]:
+    add_span_attributes({'group_id': group_id, 'node_count': len(nodes)})
     start = time()
 
     extract_edges_max_tokens = 16384
@@ -160,6 +163,7 @@ async def extract_edges(
             prompt_library.extract_edges.edge(context),
             response_model=ExtractedEdges,
             max_tokens=extract_edges_max_tokens,
+            prompt_name='extract_edges.edge',
         )
         edges_data = llm_response.get('edges', [])
 
@@ -171,6 +175,7 @@ async def extract_edges(
                 prompt_library.extract_edges.reflexion(context),
                 response_model=MissingFacts,
                 max_tokens=extract_edges_max_tokens,
+                prompt_name='extract_edges.reflexion',
             )
 
             missing_facts = reflexion_response.get('missing_facts', [])
@@ -244,6 +249,7 @@ async def extract_edges(
     return edges
 
 
+@traced('resolve_extracted_edges')
 async def resolve_extracted_edges(
     clients: GraphitiClients,
     extracted_edges: list[EntityEdge],
@@ -252,6 +258,9 @@ async def resolve_extracted_edges(
     edge_types: dict[str, BaseModel],
     edge_type_map: dict[tuple[str, str], list[str]],
 ) -> tuple[list[EntityEdge], list[EntityEdge]]:
+    add_span_attributes(
+        {'group_id': episode.group_id, 'extracted_edge_count': len(extracted_edges)}
+    )
     driver = clients.driver
     llm_client = clients.llm_client
     embedder = clients.embedder
@@ -333,6 +342,13 @@ async def resolve_extracted_edges(
         create_entity_edge_embeddings(embedder, invalidated_edges),
     )
 
+    add_span_attributes(
+        {
+            'resolved_edge_count': len(resolved_edges),
+            'invalidated_edge_count': len(invalidated_edges),
+        }
+    )
+
     return resolved_edges, invalidated_edges
 
 
@@ -415,6 +431,7 @@ async def resolve_extracted_edge(
         prompt_library.dedupe_edges.resolve_edge(context),
         response_model=EdgeDuplicate,
         model_size=ModelSize.small,
+        prompt_name='dedupe_edges.resolve_edge',
     )
 
     duplicate_fact_ids: list[int] = list(
@@ -449,6 +466,7 @@ async def resolve_extracted_edge(
             prompt_library.extract_edges.extract_attributes(edge_attributes_context),
             response_model=edge_model,  # type: ignore
             model_size=ModelSize.small,
+            prompt_name='extract_edges.extract_attributes',
         )
 
         resolved_edge.attributes = edge_attributes_response
@@ -503,7 +521,9 @@ async def dedupe_edge_list(
     context = {'edges': [{'uuid': edge.uuid, 'fact': edge.fact} for edge in edges]}
 
     llm_response = await llm_client.generate_response(
-        prompt_library.dedupe_edges.edge_list(context), response_model=UniqueFacts
+        prompt_library.dedupe_edges.edge_list(context),
+        response_model=UniqueFacts,
+        prompt_name='dedupe_edges.edge_list',
     )
     unique_edges_data = llm_response.get('unique_facts', [])
 
@@ -536,6 +556,18 @@ async def filter_existing_duplicate_of_edges(
         (source.uuid, target.uuid): (source, target) for source, target in duplicates_node_tuples
     }
 
+    if driver.operations is not None:
+        for source, target in duplicates_node_tuples:
+            edges = await driver.operations.get_entity_edges_by_node_uuid(source.uuid)
+            if any(
+                edge.name == 'IS_DUPLICATE_OF'
+                and edge.source_node_uuid == source.uuid
+                and edge.target_node_uuid == target.uuid
+                for edge in edges
+            ):
+                duplicate_nodes_map.pop((source.uuid, target.uuid), None)
+        return list(duplicate_nodes_map.values())
+
     records, _, _ = await driver.execute_query(
         query,
         duplicate_node_uuids=list(duplicate_nodes_map.keys()),
@@ -23,6 +23,9 @@ from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.graph_queries import get_fulltext_indices, get_range_indices
 from graphiti_core.helpers import parse_db_date, semaphore_gather
 from graphiti_core.nodes import EpisodeType, EpisodicNode
+from graphiti_core.search.ann_sidecar import remove_group_embeddings
+from graphiti_core.search.node_distance_cache import invalidate_node_distances
+from graphiti_core.search.search_cache import record_graph_write
 
 EPISODE_WINDOW_LEN = 3
 
@@ -30,6 +33,9 @@ logger = logging.getLogger(__name__)
 
 
 async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bool = False):
+    if driver.operations is not None:
+        return await driver.operations.build_indices(delete_existing)
+
     if delete_existing:
         records, _, _ = await driver.execute_query(
             """
@@ -63,21 +69,59 @@ async def build_indices_and_constraints(driver: GraphDriver, delete_existing: bo
 
 
 async def clear_data(driver: GraphDriver, group_ids: list[str] | None = None):
-    async with driver.session() as session:
+    if driver.operations is not None:
+        await driver.operations.delete_groups(group_ids)
+    else:
+        async with driver.session() as session:
+
+            async def delete_all(tx):
+                await tx.run('MATCH (n) DETACH DELETE n')
+
+            async def delete_group_ids(tx):
+                await tx.run(
+                    'MATCH (n:Entity|Episodic|Community) WHERE n.group_id IN $group_ids DETACH DELETE n',
+                    group_ids=group_ids,
+                )
 
-        async def delete_all(tx):
-            await tx.run('MATCH (n) DETACH DELETE n')
+            if group_ids is None:
+                await session.execute_write(delete_all)
+            else:
+                await session.execute_write(delete_group_ids)
 
-        async def delete_group_ids(tx):
-            await tx.run(
-                'MATCH (n:Entity|Episodic|Community) WHERE n.group_id IN $group_ids DETACH DELETE n',
-                group_ids=group_ids,
-            )
+    invalidate_node_distances(driver)
+    remove_group_embeddings(driver, group_ids)
+    record_graph_write(driver, group_ids)
 
-        if group_ids is None:
-            await session.execute_write(delete_all)
-        else:
-            await session.execute_write(delete_group_ids)
+
+async def rebuild_mention_counts(driver: GraphDriver, group_ids: list[str] | None = None):
+    """
+    Recompute the denormalized mention_count of entities and episode_count of entity edges.
+
+    Saving episodes keeps both counts up to date, so this is only needed for graphs that were
+    built before the counts existed.
+    """
+    if driver.operations is not None:
+        await driver.operations.rebuild_mention_counts(group_ids)
+    else:
+        await driver.execute_query(
+            """
+            MATCH (n:Entity)
+            WHERE $group_ids IS NULL OR n.group_id IN $group_ids
+            OPTIONAL MATCH (e:Episodic)-[:MENTIONS]->(n)
+            WITH n, count(e) AS mention_count
+            SET n.mention_count = mention_count
+            """,
+            group_ids=group_ids,
+        )
+        await driver.execute_query(
+            """
+            MATCH (:Entity)-[r:RELATES_TO]->(:Entity)
+            WHERE $group_ids IS NULL OR r.group_id IN $group_ids
+            SET r.episode_count = size(r.episodes)
+            """,
+            group_ids=group_ids,
+        )
+    record_graph_write(driver, group_ids)
 
 
 async def retrieve_episodes(
@@ -101,6 +145,12 @@ async def retrieve_episodes(
     Returns:
         list[EpisodicNode]: A list of EpisodicNode objects representing the retrieved episodes.
     """
+    if driver.operations is not None:
+        episodes = await driver.operations.retrieve_episodes(
+            reference_time, last_n, group_ids or None, source
+        )
+        return list(reversed(episodes))  # Return in chronological order
+
     group_id_filter: LiteralString = (
         '\nAND e.group_id IN $group_ids' if group_ids and len(group_ids) > 0 else ''
     )
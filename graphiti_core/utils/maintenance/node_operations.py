@@ -39,6 +39,7 @@ from graphiti_core.search.search import search
 from graphiti_core.search.search_config import SearchResults
 from graphiti_core.search.search_config_recipes import NODE_HYBRID_SEARCH_RRF
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.tracer import add_span_attributes, traced
 from graphiti_core.utils.datetime_utils import utc_now
 from graphiti_core.utils.maintenance.edge_operations import filter_existing_duplicate_of_edges
 
@@ -59,13 +60,16 @@ async def extract_nodes_reflexion(
     }
 
     llm_response = await llm_client.generate_response(
-        prompt_library.extract_nodes.reflexion(context), MissedEntities
+        prompt_library.extract_nodes.reflexion(context),
+        MissedEntities,
+        prompt_name='extract_nodes.reflexion',
     )
     missed_entities = llm_response.get('missed_entities', [])
 
     return missed_entities
 
 
+@traced('extract_nodes')
 async def extract_nodes(
     clients: GraphitiClients,
     episode: EpisodicNode,
@@ -73,6 +77,9 @@ async def extract_nodes(
     entity_types: dict[str, BaseModel] | None = None,
     excluded_entity_types: list[str] | None = None,
 ) -> list[EntityNode]:
+    add_span_attributes(
+        {'group_id': episode.group_id, 'previous_episode_count': len(previous_episodes)}
+    )
     start = time()
     llm_client = clients.llm_client
     llm_response = {}
@@ -115,14 +122,19 @@ async def extract_nodes(
             llm_response = await llm_client.generate_response(
                 prompt_library.extract_nodes.extract_message(context),
                 response_model=ExtractedEntities,
+                prompt_name='extract_nodes.extract_message',
             )
         elif episode.source == EpisodeType.text:
             llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_text(context), response_model=ExtractedEntities
+                prompt_library.extract_nodes.extract_text(context),
+                response_model=ExtractedEntities,
+                prompt_name='extract_nodes.extract_text',
             )
         elif episode.source == EpisodeType.json:
             llm_response = await llm_client.generate_response(
-                prompt_library.extract_nodes.extract_json(context), response_model=ExtractedEntities
+                prompt_library.extract_nodes.extract_json(context),
+                response_model=ExtractedEntities,
+                prompt_name='extract_nodes.extract_json',
             )
 
         extracted_entities: list[ExtractedEntity] = [
@@ -176,6 +188,7 @@ async def extract_nodes(
     return extracted_nodes
 
 
+@traced('resolve_extracted_nodes')
 async def resolve_extracted_nodes(
     clients: GraphitiClients,
     extracted_nodes: list[EntityNode],
@@ -184,6 +197,12 @@ async def resolve_extracted_nodes(
     entity_types: dict[str, BaseModel] | None = None,
     existing_nodes_override: list[EntityNode] | None = None,
 ) -> tuple[list[EntityNode], dict[str, str], list[tuple[EntityNode, EntityNode]]]:
+    add_span_attributes(
+        {
+            'group_id': episode.group_id if episode is not None else None,
+            'extracted_node_count': len(extracted_nodes),
+        }
+    )
     llm_client = clients.llm_client
     driver = clients.driver
 
@@ -252,6 +271,7 @@ async def resolve_extracted_nodes(
     llm_response = await llm_client.generate_response(
         prompt_library.dedupe_nodes.nodes(context),
         response_model=NodeResolutions,
+        prompt_name='dedupe_nodes.nodes',
     )
 
     node_resolutions: list = llm_response.get('entity_resolutions', [])
@@ -288,9 +308,14 @@ async def resolve_extracted_nodes(
         tuple[EntityNode, EntityNode]
     ] = await filter_existing_duplicate_of_edges(driver, node_duplicates)
 
+    add_span_attributes(
+        {'resolved_node_count': len(resolved_nodes), 'duplicate_count': len(new_node_duplicates)}
+    )
+
     return resolved_nodes, uuid_map, new_node_duplicates
 
 
+@traced('extract_attributes_from_nodes')
 async def extract_attributes_from_nodes(
     clients: GraphitiClients,
     nodes: list[EntityNode],
@@ -298,6 +323,9 @@ async def extract_attributes_from_nodes(
     previous_episodes: list[EpisodicNode] | None = None,
     entity_types: dict[str, BaseModel] | None = None,
 ) -> list[EntityNode]:
+    add_span_attributes(
+        {'group_id': episode.group_id if episode is not None else None, 'node_count': len(nodes)}
+    )
     llm_client = clients.llm_client
     embedder = clients.embedder
     updated_nodes: list[EntityNode] = await semaphore_gather(
@@ -365,6 +393,7 @@ async def extract_attributes_from_node(
         prompt_library.extract_nodes.extract_attributes(summary_context),
         response_model=entity_attributes_model,
         model_size=ModelSize.small,
+        prompt_name='extract_nodes.extract_attributes',
     )
 
     node.summary = llm_response.get('summary', node.summary)
@@ -397,7 +426,7 @@ async def dedupe_node_list(
     }
 
     llm_response = await llm_client.generate_response(
-        prompt_library.dedupe_nodes.node_list(context)
+        prompt_library.dedupe_nodes.node_list(context), prompt_name='dedupe_nodes.node_list'
     )
 
     nodes_data = llm_response.get('nodes', [])
@@ -10,32 +10,38 @@ import os
 import sys
 from collections.abc import Callable
 from datetime import datetime, timezone
-from typing import Any, TypedDict, cast
+from time import time
+from typing import Any, Literal, TypedDict, cast
+from uuid import uuid4
 
 # 添加项目根目录到路径的最前面，确保使用本地开发版本
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from openai import AsyncAzureOpenAI
 from pydantic import BaseModel, Field
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
 from graphiti_core import Graphiti
+from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.edges import EntityEdge
 from graphiti_core.embedder.azure_openai import AzureOpenAIEmbedderClient
 from graphiti_core.embedder.client import EmbedderClient
 from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
+from graphiti_core.errors import AdmissionRejectedError
 from graphiti_core.llm_client import LLMClient
 from graphiti_core.llm_client.azure_openai_client import AzureOpenAILLMClient
 from graphiti_core.llm_client.config import LLMConfig
 from graphiti_core.llm_client.openai_client import OpenAIClient
+from graphiti_core.metrics import PROMETHEUS_CONTENT_TYPE, ingest_queue_depth, metrics_registry
 
 # Import Gemini clients
 try:
-    from graphiti_core.llm_client.gemini_client import GeminiClient
     from graphiti_core.embedder.gemini import GeminiEmbedder, GeminiEmbedderConfig
+    from graphiti_core.llm_client.gemini_client import GeminiClient
     GEMINI_AVAILABLE = True
 
     # Try to import GeminiRerankerClient, but make it optional
@@ -59,8 +65,9 @@ from graphiti_core.search.search_config_recipes import (
     NODE_HYBRID_SEARCH_RRF,
 )
 from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.utils.admission_control import AdmissionController
+from graphiti_core.utils.bulk_utils import RawEpisode, add_nodes_and_edges_bulk
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
-from graphiti_core.cross_encoder.client import CrossEncoderClient
 
 load_dotenv()
 
@@ -87,6 +94,22 @@ DEFAULT_GEMINI_EMBEDDER_MODEL = 'embedding-001'
 # Increase if you have high rate limits.
 SEMAPHORE_LIMIT = int(os.getenv('SEMAPHORE_LIMIT', 2))
 
+# Admission control for add_memory. Once a group's queue or the total queue reaches its limit,
+# or the estimated queueing delay exceeds MAX_QUEUE_WAIT_SECONDS, add_memory is rejected with a
+# retry_after hint instead of queueing more work. Unset or empty values disable a limit.
+MAX_GROUP_QUEUE_SIZE = int(os.getenv('MAX_GROUP_QUEUE_SIZE') or 0) or None
+MAX_QUEUE_SIZE = int(os.getenv('MAX_QUEUE_SIZE') or 0) or None
+MAX_QUEUE_WAIT_SECONDS = float(os.getenv('MAX_QUEUE_WAIT_SECONDS') or 0) or None
+
+# Opt-in micro-batching of queued episodes. With EPISODE_BATCH_SIZE above 1, a group's queue
+# worker ingests up to EPISODE_BATCH_SIZE waiting episodes in one add_episode_bulk call, waiting
+# at most EPISODE_BATCH_MAX_WAIT seconds after the first episode for more to arrive. Batched
+# episodes skip edge invalidation and date extraction. The default of 1 disables batching.
+EPISODE_BATCH_SIZE = int(os.getenv('EPISODE_BATCH_SIZE', 1))
+EPISODE_BATCH_MAX_WAIT = float(os.getenv('EPISODE_BATCH_MAX_WAIT', 1.0))
+# Number of finished episode statuses kept for get_episode_status
+MAX_EPISODE_STATUSES = 1000
+
 
 def is_gemini_model(model_name: str) -> bool:
     """Check if the model name is a Gemini model."""
@@ -216,11 +239,35 @@ class EpisodeSearchResponse(TypedDict):
     episodes: list[dict[str, Any]]
 
 
+class EpisodeQueuedResponse(TypedDict):
+    message: str
+    task_id: str
+
+
+class EpisodeStatusResponse(TypedDict):
+    task_id: str
+    name: str
+    group_id: str
+    status: Literal['queued', 'processing', 'completed', 'failed']
+    batch_size: int | None
+    error: str | None
+
+
+class QueueFullResponse(TypedDict):
+    error: str
+    retry_after: float | None
+
+
 class StatusResponse(TypedDict):
     status: str
     message: str
 
 
+class QueueStatusResponse(TypedDict):
+    group_depths: dict[str, int]
+    admission: dict[str, Any]
+
+
 def create_azure_credential_token_provider() -> Callable[[], str]:
     credential = DefaultAzureCredential()
     token_provider = get_bearer_token_provider(
@@ -797,38 +844,228 @@ def format_fact_result(edge: EntityEdge) -> dict[str, Any]:
     return result
 
 
+class QueuedEpisode(BaseModel):
+    """An add_memory call waiting in a group's episode queue."""
+
+    task_id: str
+    name: str
+    episode_body: str
+    source: EpisodeType
+    source_description: str
+    uuid: str | None
+    reference_time: datetime
+    sequential: bool
+
+
 # Dictionary to store queues for each group_id
-# Each queue is a list of tasks to be processed sequentially
-episode_queues: dict[str, asyncio.Queue] = {}
+# Each queue holds the episodes to be processed for that group, in order
+episode_queues: dict[str, asyncio.Queue[QueuedEpisode]] = {}
 # Dictionary to track if a worker is running for each group_id
 queue_workers: dict[str, bool] = {}
+# Status of queued and recently processed episodes, keyed by task_id
+episode_statuses: dict[str, EpisodeStatusResponse] = {}
+# Rejects new episodes when the queues are over capacity
+admission_controller = AdmissionController(
+    max_group_queue=MAX_GROUP_QUEUE_SIZE,
+    max_total_queue=MAX_QUEUE_SIZE,
+    max_estimated_wait=MAX_QUEUE_WAIT_SECONDS,
+)
+
+
+def set_episode_status(
+    episode: QueuedEpisode,
+    status: Literal['completed', 'failed', 'processing'],
+    batch_size: int | None = None,
+    error: str | None = None,
+):
+    episode_status = episode_statuses.get(episode.task_id)
+    if episode_status is None:
+        return
+    episode_status['status'] = status
+    episode_status['batch_size'] = batch_size
+    episode_status['error'] = error
+
+    if status == 'processing':
+        return
+
+    # Forget the oldest finished episodes once too many statuses are kept
+    finished = [
+        task_id
+        for task_id, tracked in episode_statuses.items()
+        if tracked['status'] in ('completed', 'failed')
+    ]
+    for task_id in finished[: max(len(finished) - MAX_EPISODE_STATUSES, 0)]:
+        del episode_statuses[task_id]
+
+
+async def next_episode_batch(
+    queue: asyncio.Queue[QueuedEpisode], first: QueuedEpisode
+) -> tuple[list[QueuedEpisode], QueuedEpisode | None]:
+    """Collect the episodes to ingest together with `first`.
+
+    Batchable episodes are taken from the queue until EPISODE_BATCH_SIZE is reached, or until
+    EPISODE_BATCH_MAX_WAIT seconds have passed without the batch filling up. A sequential
+    episode ends the batch and is returned separately so it is processed next, on its own.
+    """
+    batch = [first]
+    if first.sequential:
+        return batch, None
+
+    deadline = time() + EPISODE_BATCH_MAX_WAIT
+    while len(batch) < EPISODE_BATCH_SIZE:
+        try:
+            if queue.empty():
+                remaining = deadline - time()
+                if remaining <= 0:
+                    break
+                episode = await asyncio.wait_for(queue.get(), remaining)
+            else:
+                episode = queue.get_nowait()
+        except asyncio.TimeoutError:
+            break
+
+        if episode.sequential:
+            return batch, episode
+        batch.append(episode)
+
+    return batch, None
+
+
+async def ingest_episode(client: Graphiti, group_id: str, episode: QueuedEpisode):
+    logger.info(f"Processing queued episode '{episode.name}' for group_id: {group_id}")
+    set_episode_status(episode, 'processing', batch_size=1)
+    # Use all entity types if use_custom_entities is enabled, otherwise use empty dict
+    entity_types = ENTITY_TYPES if config.use_custom_entities else {}
+
+    try:
+        await client.add_episode(
+            name=episode.name,
+            episode_body=episode.episode_body,
+            source=episode.source,
+            source_description=episode.source_description,
+            group_id=group_id,
+            uuid=episode.uuid,
+            reference_time=episode.reference_time,
+            entity_types=entity_types,
+        )
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(
+            f"Error processing episode '{episode.name}' for group_id {group_id}: {error_msg}"
+        )
+        set_episode_status(episode, 'failed', batch_size=1, error=error_msg)
+        return
+
+    logger.info(f"Episode '{episode.name}' processed successfully")
+    set_episode_status(episode, 'completed', batch_size=1)
+
+
+async def save_episodes(client: Graphiti, group_id: str, episodes: list[QueuedEpisode]):
+    """Save an episode node for each new episode before a bulk attempt.
+
+    add_episode_bulk saves its episodes before extraction, so a failed attempt can leave them
+    behind. Giving the queued episodes their uuids lets the retries reuse them instead of
+    adding duplicates.
+    """
+    new_episodes = [episode for episode in episodes if episode.uuid is None]
+    if not new_episodes:
+        return
+
+    now = datetime.now(timezone.utc)
+    nodes = [
+        EpisodicNode(
+            name=episode.name,
+            group_id=group_id,
+            labels=[],
+            source=episode.source,
+            content=episode.episode_body,
+            source_description=episode.source_description,
+            created_at=now,
+            valid_at=episode.reference_time,
+        )
+        for episode in new_episodes
+    ]
+    await add_nodes_and_edges_bulk(client.driver, nodes, [], [], [], client.embedder)
+    for episode, node in zip(new_episodes, nodes, strict=True):
+        episode.uuid = node.uuid
+
+
+async def ingest_episode_batch(client: Graphiti, group_id: str, episodes: list[QueuedEpisode]):
+    """Ingest a batch of episodes with add_episode_bulk, deduplicating entities across them.
+
+    If the bulk ingestion fails, the episodes are retried one at a time so that a single bad
+    episode does not fail the others. The retries reuse the episode nodes saved for the batch.
+    """
+    if len(episodes) == 1:
+        await ingest_episode(client, group_id, episodes[0])
+        return
+
+    logger.info(f'Processing batch of {len(episodes)} queued episodes for group_id: {group_id}')
+    for episode in episodes:
+        set_episode_status(episode, 'processing', batch_size=len(episodes))
+    entity_types = ENTITY_TYPES if config.use_custom_entities else {}
+
+    try:
+        await save_episodes(client, group_id, episodes)
+        await client.add_episode_bulk(
+            [
+                RawEpisode(
+                    name=episode.name,
+                    uuid=episode.uuid,
+                    content=episode.episode_body,
+                    source_description=episode.source_description,
+                    source=episode.source,
+                    reference_time=episode.reference_time,
+                )
+                for episode in episodes
+            ],
+            group_id=group_id,
+            entity_types=entity_types,
+        )
+    except Exception as e:
+        logger.error(
+            f'Error processing batch of {len(episodes)} episodes for group_id {group_id}, '
+            f'retrying them one at a time: {str(e)}'
+        )
+        for episode in episodes:
+            await ingest_episode(client, group_id, episode)
+        return
+
+    logger.info(f'Batch of {len(episodes)} episodes processed successfully')
+    for episode in episodes:
+        set_episode_status(episode, 'completed', batch_size=len(episodes))
 
 
 async def process_episode_queue(group_id: str):
-    """Process episodes for a specific group_id sequentially.
+    """Process episodes for a specific group_id.
 
-    This function runs as a long-lived task that processes episodes
-    from the queue one at a time.
+    This function runs as a long-lived task. Waiting episodes are ingested together in
+    micro-batches; episodes queued with sequential=True are processed on their own, in order.
     """
     global queue_workers
 
     logger.info(f'Starting episode queue worker for group_id: {group_id}')
     queue_workers[group_id] = True
+    queue = episode_queues[group_id]
+    next_episode: QueuedEpisode | None = None
 
     try:
         while True:
-            # Get the next episode processing function from the queue
-            # This will wait if the queue is empty
-            process_func = await episode_queues[group_id].get()
+            # Get the next episode from the queue, waiting if the queue is empty
+            first = next_episode if next_episode is not None else await queue.get()
+            batch, next_episode = await next_episode_batch(queue, first)
 
             try:
-                # Process the episode
-                await process_func()
+                # Process the batch and feed its duration into the admission wait estimate
+                start = time()
+                await ingest_episode_batch(cast(Graphiti, graphiti_client), group_id, batch)
+                admission_controller.record_processed(len(batch), time() - start)
             except Exception as e:
-                logger.error(f'Error processing queued episode for group_id {group_id}: {str(e)}')
+                logger.error(f'Error processing queued episodes for group_id {group_id}: {str(e)}')
             finally:
-                # Mark the task as done regardless of success/failure
-                episode_queues[group_id].task_done()
+                # Mark the episodes as done regardless of success/failure
+                for _ in batch:
+                    queue.task_done()
     except asyncio.CancelledError:
         logger.info(f'Episode queue worker for group_id {group_id} was cancelled')
     except Exception as e:
@@ -846,11 +1083,18 @@ async def add_memory(
     source: str = 'text',
     source_description: str = '',
     uuid: str | None = None,
-) -> SuccessResponse | ErrorResponse:
+    sequential: bool = False,
+) -> EpisodeQueuedResponse | ErrorResponse | QueueFullResponse:
     """Add an episode to memory. This is the primary way to add information to the graph.
 
     This function returns immediately and processes the episode addition in the background.
-    Episodes for the same group_id are processed sequentially to avoid race conditions.
+    The response contains a task_id that can be passed to get_episode_status.
+    Episodes for the same group_id are processed in order. If the server enables batching,
+    episodes that are waiting at the same time are ingested together as one batch, which
+    deduplicates entities across them but skips edge invalidation and date extraction; pass
+    sequential=True to process an episode on its own with the full pipeline.
+    If the server is overloaded the episode is not queued, and the response contains an
+    error and a retry_after value in seconds; wait at least that long before retrying.
 
     Args:
         name (str): Name of the episode
@@ -865,6 +1109,7 @@ async def add_memory(
                                - 'message': For conversation-style content
         source_description (str, optional): Description of the source
         uuid (str, optional): Optional UUID for the episode
+        sequential (bool, optional): Process this episode on its own instead of in a batch
 
     Examples:
         # Adding plain text content
@@ -922,53 +1167,53 @@ async def add_memory(
         # The Graphiti client expects a str for group_id, not Optional[str]
         group_id_str = str(effective_group_id) if effective_group_id is not None else ''
 
-        # We've already checked that graphiti_client is not None above
-        # This assert statement helps type checkers understand that graphiti_client is defined
-        assert graphiti_client is not None, 'graphiti_client should not be None here'
-
-        # Use cast to help the type checker understand that graphiti_client is not None
-        client = cast(Graphiti, graphiti_client)
-
-        # Define the episode processing function
-        async def process_episode():
-            try:
-                logger.info(f"Processing queued episode '{name}' for group_id: {group_id_str}")
-                # Use all entity types if use_custom_entities is enabled, otherwise use empty dict
-                entity_types = ENTITY_TYPES if config.use_custom_entities else {}
-
-                await client.add_episode(
-                    name=name,
-                    episode_body=episode_body,
-                    source=source_type,
-                    source_description=source_description,
-                    group_id=group_id_str,  # Using the string version of group_id
-                    uuid=uuid,
-                    reference_time=datetime.now(timezone.utc),
-                    entity_types=entity_types,
-                )
-                logger.info(f"Episode '{name}' added successfully")
-
-                logger.info(f"Episode '{name}' processed successfully")
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(
-                    f"Error processing episode '{name}' for group_id {group_id_str}: {error_msg}"
-                )
+        # Reject the episode if the queues are over capacity
+        group_queue = episode_queues.get(group_id_str)
+        admission_controller.concurrency = max(sum(queue_workers.values()), 1)
+        try:
+            admission_controller.check(
+                1,
+                group_queue.qsize() if group_queue is not None else 0,
+                sum(queue.qsize() for queue in episode_queues.values()),
+            )
+        except AdmissionRejectedError as e:
+            logger.warning(f'Rejected episode {name!r} for group_id {group_id_str}: {e.message}')
+            return QueueFullResponse(error=e.message, retry_after=e.retry_after)
 
         # Initialize queue for this group_id if it doesn't exist
         if group_id_str not in episode_queues:
             episode_queues[group_id_str] = asyncio.Queue()
 
-        # Add the episode processing function to the queue
-        await episode_queues[group_id_str].put(process_episode)
+        episode = QueuedEpisode(
+            task_id=str(uuid4()),
+            name=name,
+            episode_body=episode_body,
+            source=source_type,
+            source_description=source_description,
+            uuid=uuid,
+            reference_time=datetime.now(timezone.utc),
+            sequential=sequential,
+        )
+        episode_statuses[episode.task_id] = EpisodeStatusResponse(
+            task_id=episode.task_id,
+            name=name,
+            group_id=group_id_str,
+            status='queued',
+            batch_size=None,
+            error=None,
+        )
+
+        # Add the episode to the queue
+        await episode_queues[group_id_str].put(episode)
 
         # Start a worker for this queue if one isn't already running
         if not queue_workers.get(group_id_str, False):
             asyncio.create_task(process_episode_queue(group_id_str))
 
         # Return immediately with a success message
-        return SuccessResponse(
-            message=f"Episode '{name}' queued for processing (position: {episode_queues[group_id_str].qsize()})"
+        return EpisodeQueuedResponse(
+            message=f"Episode '{name}' queued for processing (position: {episode_queues[group_id_str].qsize()})",
+            task_id=episode.task_id,
         )
     except Exception as e:
         error_msg = str(e)
@@ -976,6 +1221,19 @@ async def add_memory(
         return ErrorResponse(error=f'Error queuing episode task: {error_msg}')
 
 
+@mcp.tool()
+async def get_episode_status(task_id: str) -> EpisodeStatusResponse | ErrorResponse:
+    """Get the processing status of an episode queued with add_memory.
+
+    Args:
+        task_id (str): The task_id returned by add_memory
+    """
+    episode_status = episode_statuses.get(task_id)
+    if episode_status is None:
+        return ErrorResponse(error=f'No episode found with task_id {task_id}')
+    return episode_status
+
+
 @mcp.tool()
 async def search_memory_nodes(
     query: str,
@@ -1309,6 +1567,26 @@ async def get_status() -> StatusResponse:
         )
 
 
+@mcp.resource('http://graphiti/queue')
+async def get_queue_status() -> QueueStatusResponse:
+    """Get the depth of each episode queue and the admission control state."""
+    group_depths = {group_id: queue.qsize() for group_id, queue in episode_queues.items()}
+    admission = admission_controller.status(sum(group_depths.values()))
+    return QueueStatusResponse(
+        group_depths=group_depths, admission=admission.model_dump(exclude={'group_depth'})
+    )
+
+
+@mcp.custom_route('/metrics', methods=['GET'])
+async def get_metrics(request: Request) -> PlainTextResponse:
+    """Expose Graphiti metrics in the Prometheus text format (SSE transport only)."""
+    ingest_queue_depth.clear()
+    for group_id, queue in episode_queues.items():
+        if queue.qsize() > 0:
+            ingest_queue_depth.set(queue.qsize(), group_id=group_id)
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 async def initialize_server() -> MCPConfig:
     """Parse CLI arguments and initialize the Graphiti server configuration."""
     global config
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime, timezone
+
+import graphiti_mcp_server as server
+import pytest
+
+from graphiti_core.nodes import EpisodeType
+
+
+def queued_episode(name: str, sequential: bool = False) -> server.QueuedEpisode:
+    return server.QueuedEpisode(
+        task_id=name,
+        name=name,
+        episode_body=f'{name} happened',
+        source=EpisodeType.text,
+        source_description='',
+        uuid=None,
+        reference_time=datetime.now(timezone.utc),
+        sequential=sequential,
+    )
+
+
+def episode_queue(*episodes: server.QueuedEpisode) -> asyncio.Queue[server.QueuedEpisode]:
+    queue: asyncio.Queue[server.QueuedEpisode] = asyncio.Queue()
+    for episode in episodes:
+        queue.put_nowait(episode)
+    return queue
+
+
+class FakeGraphiti:
+    """Fails every add_episode_bulk call and records the uuids passed to add_episode."""
+
+    def __init__(self):
+        self.driver = object()
+        self.embedder = None
+        self.bulk_calls: list[list[str | None]] = []
+        self.added: list[str | None] = []
+
+    async def add_episode_bulk(self, episodes, **kwargs):
+        self.bulk_calls.append([episode.uuid for episode in episodes])
+        raise RuntimeError('bulk ingestion failed')
+
+    async def add_episode(self, uuid, **kwargs):
+        self.added.append(uuid)
+
+
+@pytest.fixture(autouse=True)
+def batching(monkeypatch):
+    monkeypatch.setattr(server, 'EPISODE_BATCH_SIZE', 3)
+    monkeypatch.setattr(server, 'EPISODE_BATCH_MAX_WAIT', 0.05)
+
+
+@pytest.mark.asyncio
+async def test_sequential_episode_ends_the_batch_and_runs_alone():
+    queue = episode_queue(
+        queued_episode('b'), queued_episode('sequential', sequential=True), queued_episode('c')
+    )
+
+    batch, next_episode = await server.next_episode_batch(queue, queued_episode('a'))
+
+    assert [episode.name for episode in batch] == ['a', 'b']
+    assert next_episode is not None and next_episode.name == 'sequential'
+
+    batch, next_episode = await server.next_episode_batch(queue, next_episode)
+
+    assert [episode.name for episode in batch] == ['sequential']
+    assert next_episode is None
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_stops_at_batch_size():
+    queue = episode_queue(*(queued_episode(name) for name in 'bcde'))
+
+    batch, next_episode = await server.next_episode_batch(queue, queued_episode('a'))
+
+    assert [episode.name for episode in batch] == ['a', 'b', 'c']
+    assert next_episode is None
+    assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_stops_after_max_wait():
+    queue = episode_queue()
+
+    async def put_late():
+        await asyncio.sleep(0.01)
+        await queue.put(queued_episode('b'))
+        await asyncio.sleep(0.2)
+        await queue.put(queued_episode('c'))
+
+    producer = asyncio.create_task(put_late())
+    batch, _ = await server.next_episode_batch(queue, queued_episode('a'))
+    await producer
+
+    assert [episode.name for episode in batch] == ['a', 'b']
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_retries_reuse_saved_episodes(monkeypatch):
+    saved: list[str] = []
+
+    async def add_nodes_and_edges_bulk(driver, episodes, *args):
+        saved.extend(episode.uuid for episode in episodes)
+
+    monkeypatch.setattr(server, 'add_nodes_and_edges_bulk', add_nodes_and_edges_bulk)
+    client = FakeGraphiti()
+    episodes = [queued_episode(name) for name in 'abc']
+
+    await server.ingest_episode_batch(client, 'group', episodes)
+
+    assert len(saved) == 3
+    assert client.bulk_calls == [saved]
+    assert client.added == saved
+
+    # Another attempt at the same episodes saves no new episode nodes
+    await server.ingest_episode_batch(client, 'group', episodes)
+
+    assert len(saved) == 3
+    assert client.added == saved + saved
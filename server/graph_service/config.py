@@ -5,6 +5,12 @@ from fastapi import Depends
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict  # type: ignore
 
+DEFAULT_INGEST_CONCURRENCY = 4
+DEFAULT_INGEST_BULK_THRESHOLD = 10
+DEFAULT_INGEST_BATCH_SIZE = 50
+DEFAULT_INGEST_MAX_GROUP_QUEUE = 1000
+DEFAULT_INGEST_MAX_QUEUE = 10000
+
 
 class Settings(BaseSettings):
     openai_api_key: str
@@ -14,6 +20,14 @@ class Settings(BaseSettings):
     neo4j_uri: str
     neo4j_user: str
     neo4j_password: str
+    ingest_concurrency: int = Field(DEFAULT_INGEST_CONCURRENCY)
+    ingest_shutdown_timeout: float | None = Field(None)
+    ingest_queue_path: str = Field('ingest_queue.db')
+    ingest_bulk_threshold: int = Field(DEFAULT_INGEST_BULK_THRESHOLD)
+    ingest_batch_size: int = Field(DEFAULT_INGEST_BATCH_SIZE)
+    ingest_max_group_queue: int | None = Field(DEFAULT_INGEST_MAX_GROUP_QUEUE)
+    ingest_max_queue: int | None = Field(DEFAULT_INGEST_MAX_QUEUE)
+    ingest_max_wait_seconds: float | None = Field(None)
 
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -1,3 +1,4 @@
+from graphiti_core.utils.admission_control import AdmissionStatus  # type: ignore
 from pydantic import BaseModel, Field
 
 from graph_service.dto.common import Message
@@ -13,3 +14,14 @@ class AddEntityNodeRequest(BaseModel):
     group_id: str = Field(..., description='The group id of the node to add')
     name: str = Field(..., description='The name of the node to add')
     summary: str = Field(default='', description='The summary of the node to add')
+
+
+class IngestQueueStatus(BaseModel):
+    concurrency: int = Field(..., description='The number of ingestion worker shards')
+    shard_depths: list[int] = Field(..., description='The number of queued jobs in each shard')
+    pending_messages: int = Field(
+        ..., description='The number of persisted messages waiting to be ingested'
+    )
+    admission: AdmissionStatus = Field(
+        ..., description='The admission limits and the estimated queueing delay'
+    )
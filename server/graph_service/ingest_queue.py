@@ -0,0 +1,180 @@
+import asyncio
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+from graph_service.dto import Message
+
+MAX_JOB_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_id TEXT NOT NULL,
+    message_uuid TEXT UNIQUE,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    episode_uuid TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_group_id ON jobs (group_id, failed, id);
+CREATE TABLE IF NOT EXISTS processed_messages (
+    message_uuid TEXT PRIMARY KEY
+);
+"""
+
+
+@dataclass
+class QueuedMessage:
+    id: int
+    group_id: str
+    message: Message
+    # Uuid of an episode node already saved for this message by an earlier attempt
+    episode_uuid: str | None = None
+
+
+class PersistentJobQueue:
+    """SQLite-backed queue of messages waiting to be ingested.
+
+    Messages survive restarts until they are acknowledged. Messages that carry a uuid are
+    accepted at most once: a uuid that is already queued or was already processed is
+    skipped on enqueue.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(jobs)')}
+        if 'episode_uuid' not in columns:
+            self.conn.execute('ALTER TABLE jobs ADD COLUMN episode_uuid TEXT')
+        self.lock = threading.Lock()
+
+    def _enqueue(self, group_id: str, messages: list[Message]) -> int:
+        accepted = 0
+        with self.lock:
+            self.conn.execute('BEGIN')
+            try:
+                for message in messages:
+                    if message.uuid is not None:
+                        processed = self.conn.execute(
+                            'SELECT 1 FROM processed_messages WHERE message_uuid = ?',
+                            (message.uuid,),
+                        ).fetchone()
+                        if processed is not None:
+                            continue
+                    cursor = self.conn.execute(
+                        'INSERT OR IGNORE INTO jobs (group_id, message_uuid, payload) VALUES (?, ?, ?)',
+                        (group_id, message.uuid, message.model_dump_json()),
+                    )
+                    accepted += cursor.rowcount
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+        return accepted
+
+    def _dequeue_batch(self, group_id: str, limit: int) -> list[QueuedMessage]:
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT id, group_id, payload, episode_uuid FROM jobs '
+                'WHERE group_id = ? AND failed = 0 ORDER BY id LIMIT ?',
+                (group_id, limit),
+            ).fetchall()
+        return [
+            QueuedMessage(
+                id=row[0],
+                group_id=row[1],
+                message=Message.model_validate_json(row[2]),
+                episode_uuid=row[3],
+            )
+            for row in rows
+        ]
+
+    def _set_episode_uuids(self, jobs: list[QueuedMessage]):
+        with self.lock:
+            self.conn.executemany(
+                'UPDATE jobs SET episode_uuid = ? WHERE id = ?',
+                [(job.episode_uuid, job.id) for job in jobs],
+            )
+
+    def _ack(self, jobs: list[QueuedMessage]):
+        with self.lock:
+            self.conn.execute('BEGIN')
+            try:
+                self.conn.executemany('DELETE FROM jobs WHERE id = ?', [(job.id,) for job in jobs])
+                self.conn.executemany(
+                    'INSERT OR IGNORE INTO processed_messages (message_uuid) VALUES (?)',
+                    [(job.message.uuid,) for job in jobs if job.message.uuid is not None],
+                )
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+
+    def _nack(self, jobs: list[QueuedMessage]):
+        with self.lock:
+            self.conn.executemany(
+                'UPDATE jobs SET attempts = attempts + 1, failed = (attempts + 1 >= ?) WHERE id = ?',
+                [(MAX_JOB_ATTEMPTS, job.id) for job in jobs],
+            )
+
+    def _pending_groups(self) -> list[str]:
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT group_id FROM jobs WHERE failed = 0 GROUP BY group_id ORDER BY MIN(id)'
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _depth(self, group_id: str | None) -> int:
+        with self.lock:
+            if group_id is None:
+                row = self.conn.execute('SELECT COUNT(*) FROM jobs WHERE failed = 0').fetchone()
+            else:
+                row = self.conn.execute(
+                    'SELECT COUNT(*) FROM jobs WHERE group_id = ? AND failed = 0', (group_id,)
+                ).fetchone()
+        return row[0]
+
+    def _depths(self) -> dict[str, int]:
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT group_id, COUNT(*) FROM jobs WHERE failed = 0 GROUP BY group_id'
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    async def enqueue(self, group_id: str, messages: list[Message]) -> int:
+        """Persist messages for a group and return how many were accepted."""
+        return await asyncio.to_thread(self._enqueue, group_id, messages)
+
+    async def dequeue_batch(self, group_id: str, limit: int) -> list[QueuedMessage]:
+        """Return up to limit of the oldest pending messages for a group without removing them."""
+        return await asyncio.to_thread(self._dequeue_batch, group_id, limit)
+
+    async def ack(self, jobs: list[QueuedMessage]):
+        """Remove processed jobs and remember their message uuids."""
+        await asyncio.to_thread(self._ack, jobs)
+
+    async def set_episode_uuids(self, jobs: list[QueuedMessage]):
+        """Remember the episode nodes saved for jobs, so retries reuse them."""
+        await asyncio.to_thread(self._set_episode_uuids, jobs)
+
+    async def nack(self, jobs: list[QueuedMessage]):
+        """Record a failed attempt; jobs that reach MAX_JOB_ATTEMPTS are parked as failed."""
+        await asyncio.to_thread(self._nack, jobs)
+
+    async def pending_groups(self) -> list[str]:
+        return await asyncio.to_thread(self._pending_groups)
+
+    async def depth(self, group_id: str | None = None) -> int:
+        """Count pending messages for a group, or across all groups."""
+        return await asyncio.to_thread(self._depth, group_id)
+
+    async def depths(self) -> dict[str, int]:
+        """Count pending messages for each group that has any."""
+        return await asyncio.to_thread(self._depths)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
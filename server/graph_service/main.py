@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
+from graphiti_core.metrics import PROMETHEUS_CONTENT_TYPE, metrics_registry  # type: ignore
 
 from graph_service.config import get_settings
 from graph_service.routers import ingest, retrieve
+from graph_service.routers.ingest import update_queue_depth_metrics
 from graph_service.zep_graphiti import initialize_graphiti
 
 
@@ -27,3 +29,9 @@ app.include_router(ingest.router)
 @app.get('/healthcheck')
 async def healthcheck():
     return JSONResponse(content={'status': 'healthy'}, status_code=200)
+
+
+@app.get('/metrics')
+async def metrics():
+    await update_queue_depth_metrics()
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,73 +1,389 @@
 import asyncio
+import logging
+import math
+import zlib
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from functools import partial
+from time import time
+from typing import Annotated
 
-from fastapi import APIRouter, FastAPI, status
-from graphiti_core.nodes import EpisodeType  # type: ignore
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, status
+from graphiti_core.errors import AdmissionRejectedError  # type: ignore
+from graphiti_core.metrics import ingest_queue_depth  # type: ignore
+from graphiti_core.nodes import EpisodeType, EpisodicNode  # type: ignore
+from graphiti_core.utils.admission_control import AdmissionController  # type: ignore
+from graphiti_core.utils.bulk_utils import RawEpisode, add_nodes_and_edges_bulk  # type: ignore
+from graphiti_core.utils.datetime_utils import utc_now  # type: ignore
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data  # type: ignore
 
-from graph_service.dto import AddEntityNodeRequest, AddMessagesRequest, Message, Result
-from graph_service.zep_graphiti import ZepGraphitiDep
+from graph_service.config import (
+    DEFAULT_INGEST_BATCH_SIZE,
+    DEFAULT_INGEST_BULK_THRESHOLD,
+    DEFAULT_INGEST_CONCURRENCY,
+    get_settings,
+)
+from graph_service.dto import (
+    AddEntityNodeRequest,
+    AddMessagesRequest,
+    IngestQueueStatus,
+    Message,
+    Result,
+)
+from graph_service.ingest_queue import PersistentJobQueue, QueuedMessage
+from graph_service.zep_graphiti import ZepGraphiti, ZepGraphitiDep, create_graphiti
 
+logger = logging.getLogger(__name__)
 
-class AsyncWorker:
-    def __init__(self):
-        self.queue = asyncio.Queue()
-        self.task = None
+# Delay before re-draining a group after a failed batch, doubled on each consecutive failure
+DRAIN_RETRY_DELAY = 1.0
+MAX_DRAIN_RETRY_DELAY = 60.0
 
-    async def worker(self):
+
+class AsyncWorkerPool:
+    """Runs ingestion jobs on a fixed number of worker tasks, sharded by group_id.
+
+    Every group_id maps to exactly one shard, so jobs for a group run in the order they
+    were queued while different groups are processed in parallel.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_INGEST_CONCURRENCY):
+        self.concurrency = concurrency
+        self.queues: list[asyncio.Queue] = []
+        self.tasks: list[asyncio.Task] = []
+
+    def shard_for(self, group_id: str) -> int:
+        # crc32 is stable across processes, unlike the builtin str hash
+        return zlib.crc32(group_id.encode()) % self.concurrency
+
+    async def put(self, group_id: str, job: Callable[[], Awaitable[None]]):
+        await self.queues[self.shard_for(group_id)].put(job)
+
+    def queue_depths(self) -> list[int]:
+        return [queue.qsize() for queue in self.queues]
+
+    async def worker(self, shard: int):
+        queue = self.queues[shard]
         while True:
+            job = await queue.get()
             try:
-                print(f'Got a job: (size of remaining queue: {self.queue.qsize()})')
-                job = await self.queue.get()
+                logger.debug(f'Shard {shard} got a job (remaining in shard: {queue.qsize()})')
                 await job()
             except asyncio.CancelledError:
-                break
+                raise
+            except Exception as e:
+                logger.error(f'Error processing ingestion job on shard {shard}: {e}')
+            finally:
+                queue.task_done()
+
+    async def start(self, concurrency: int | None = None):
+        if concurrency is not None:
+            self.concurrency = concurrency
+        if self.concurrency < 1:
+            raise ValueError('ingest worker concurrency must be at least 1')
+
+        self.queues = [asyncio.Queue() for _ in range(self.concurrency)]
+        self.tasks = [asyncio.create_task(self.worker(shard)) for shard in range(self.concurrency)]
+
+    async def stop(self, timeout: float | None = None):
+        """Wait for every queued job to finish, then stop the workers.
+
+        If timeout elapses first, the remaining jobs are logged and dropped. Messages owned
+        by dropped jobs stay in the persistent queue and are resumed on the next start.
+        """
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self.queues)), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f'Ingestion queues not drained after {timeout}s, '
+                f'dropping {sum(self.queue_depths())} queued jobs'
+            )
+
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
 
-    async def start(self):
-        self.task = asyncio.create_task(self.worker())
+class MessageIngestor:
+    """Feeds persisted messages for each group into Graphiti.
 
-    async def stop(self):
-        if self.task:
-            self.task.cancel()
-            await self.task
-        while not self.queue.empty():
-            self.queue.get_nowait()
+    A group's backlog is drained on its worker shard in batches of up to batch_size. A batch
+    of at least bulk_threshold messages goes through add_episode_bulk in one pass; smaller
+    batches go through add_episode one message at a time, which keeps edge invalidation for
+    low-traffic groups. A failed bulk batch is retried one message at a time, so only the
+    failing message uses up its attempts, and a failed message stops the drain until a retry
+    scheduled with exponential backoff.
 
+    New messages pass through the admission controller first, which raises
+    AdmissionRejectedError when the group or the whole queue is over capacity.
+    """
 
-async_worker = AsyncWorker()
+    def __init__(
+        self,
+        pool: AsyncWorkerPool,
+        job_queue: PersistentJobQueue,
+        graphiti: ZepGraphiti,
+        admission: AdmissionController,
+        bulk_threshold: int = DEFAULT_INGEST_BULK_THRESHOLD,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    ):
+        self.pool = pool
+        self.job_queue = job_queue
+        self.graphiti = graphiti
+        self.admission = admission
+        self.bulk_threshold = bulk_threshold
+        self.batch_size = batch_size
+        self.scheduled: set[str] = set()
+        self.failures: dict[str, int] = {}
+        self.retries: set[asyncio.Task] = set()
+        self.submit_lock = asyncio.Lock()
+
+    async def submit(self, group_id: str, messages: list[Message]) -> int:
+        # Serialize check-and-enqueue so concurrent requests cannot overshoot the caps
+        async with self.submit_lock:
+            self.admission.check(
+                len(messages),
+                await self.job_queue.depth(group_id),
+                await self.job_queue.depth(),
+            )
+            accepted = await self.job_queue.enqueue(group_id, messages)
+        if accepted:
+            await self.schedule(group_id)
+        return accepted
+
+    async def schedule(self, group_id: str):
+        # A group needs at most one pending drain; a drain started after new messages
+        # arrived will pick them up
+        if group_id in self.scheduled:
+            return
+        self.scheduled.add(group_id)
+        await self.pool.put(group_id, partial(self.drain, group_id))
+
+    async def resume(self):
+        for group_id in await self.job_queue.pending_groups():
+            await self.schedule(group_id)
+
+    def stop(self):
+        """Cancel pending retries; their messages stay queued and resume on the next start."""
+        for task in self.retries:
+            task.cancel()
+
+    async def drain(self, group_id: str):
+        self.scheduled.discard(group_id)
+        while True:
+            batch = await self.job_queue.dequeue_batch(group_id, self.batch_size)
+            if not batch:
+                self.failures.pop(group_id, None)
+                return
+            if len(batch) >= self.bulk_threshold:
+                processed = await self.process_bulk(group_id, batch)
+            else:
+                processed = await self.process_sequential(group_id, batch)
+            if not processed:
+                # Back off instead of retrying hot, but keep the backlog scheduled
+                self.schedule_retry(group_id)
+                return
+            self.failures.pop(group_id, None)
+
+    def schedule_retry(self, group_id: str):
+        failures = self.failures.get(group_id, 0) + 1
+        self.failures[group_id] = failures
+        delay = min(MAX_DRAIN_RETRY_DELAY, DRAIN_RETRY_DELAY * 2 ** (failures - 1))
+        logger.info(f'Retrying the backlog of group {group_id} in {delay}s')
+
+        # The retry is the group's pending drain, so new submissions do not start one early
+        self.scheduled.add(group_id)
+        task = asyncio.create_task(self.retry_drain(group_id, delay))
+        self.retries.add(task)
+        task.add_done_callback(self.retries.discard)
+
+    async def retry_drain(self, group_id: str, delay: float):
+        await asyncio.sleep(delay)
+        await self.pool.put(group_id, partial(self.drain, group_id))
+
+    async def process_bulk(self, group_id: str, batch: list[QueuedMessage]) -> bool:
+        start = time()
+        try:
+            await self.save_episodes(group_id, batch)
+            await self.graphiti.add_episode_bulk(
+                [
+                    RawEpisode(
+                        name=job.message.name,
+                        uuid=job.episode_uuid or job.message.uuid,
+                        content=format_message_episode_body(job.message),
+                        source_description=job.message.source_description,
+                        source=EpisodeType.message,
+                        reference_time=job.message.timestamp,
+                    )
+                    for job in batch
+                ],
+                group_id=group_id,
+            )
+        except Exception as e:
+            logger.warning(
+                f'Bulk ingesting {len(batch)} messages for group {group_id} failed, '
+                f'retrying them one at a time: {e}'
+            )
+            return await self.process_sequential(group_id, batch)
+
+        self.admission.record_processed(len(batch), time() - start)
+        await self.job_queue.ack(batch)
+        return True
+
+    async def save_episodes(self, group_id: str, batch: list[QueuedMessage]):
+        """Save an episode node for each new message before a bulk attempt.
+
+        add_episode_bulk saves its episodes before extraction, so a failed attempt can leave
+        them behind. Recording their uuids lets the retries reuse them instead of adding
+        duplicates.
+        """
+        jobs = [job for job in batch if job.episode_uuid is None and job.message.uuid is None]
+        if not jobs:
+            return
+
+        now = utc_now()
+        episodes = [
+            EpisodicNode(
+                name=job.message.name,
+                group_id=group_id,
+                labels=[],
+                source=EpisodeType.message,
+                content=format_message_episode_body(job.message),
+                source_description=job.message.source_description,
+                created_at=now,
+                valid_at=job.message.timestamp,
+            )
+            for job in jobs
+        ]
+        await add_nodes_and_edges_bulk(
+            self.graphiti.driver, episodes, [], [], [], self.graphiti.embedder
+        )
+        for job, episode in zip(jobs, episodes, strict=True):
+            job.episode_uuid = episode.uuid
+        await self.job_queue.set_episode_uuids(jobs)
+
+    async def process_sequential(self, group_id: str, batch: list[QueuedMessage]) -> bool:
+        for job in batch:
+            start = time()
+            try:
+                await self.graphiti.add_episode(
+                    uuid=job.episode_uuid or job.message.uuid,
+                    group_id=group_id,
+                    name=job.message.name,
+                    episode_body=format_message_episode_body(job.message),
+                    reference_time=job.message.timestamp,
+                    source=EpisodeType.message,
+                    source_description=job.message.source_description,
+                )
+            except Exception as e:
+                logger.error(f'Error ingesting message {job.id} for group {group_id}: {e}')
+                await self.job_queue.nack([job])
+                return False
+
+            self.admission.record_processed(1, time() - start)
+            await self.job_queue.ack([job])
+        return True
+
+
+def format_message_episode_body(m: Message) -> str:
+    return f'{m.role or ""}({m.role_type}): {m.content}'
+
+
+async_worker = AsyncWorkerPool()
+ingestor: MessageIngestor | None = None
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    await async_worker.start()
+    global ingestor
+
+    settings = get_settings()
+    job_queue = PersistentJobQueue(settings.ingest_queue_path)
+    graphiti = create_graphiti(settings)
+    ingestor = MessageIngestor(
+        async_worker,
+        job_queue,
+        graphiti,
+        AdmissionController(
+            max_group_queue=settings.ingest_max_group_queue,
+            max_total_queue=settings.ingest_max_queue,
+            max_estimated_wait=settings.ingest_max_wait_seconds,
+            concurrency=settings.ingest_concurrency,
+        ),
+        bulk_threshold=settings.ingest_bulk_threshold,
+        batch_size=settings.ingest_batch_size,
+    )
+
+    await async_worker.start(settings.ingest_concurrency)
+    # Pick up messages persisted before the last shutdown
+    await ingestor.resume()
     yield
-    await async_worker.stop()
+    ingestor.stop()
+    await async_worker.stop(settings.ingest_shutdown_timeout)
+
+    await graphiti.close()
+    job_queue.close()
+    ingestor = None
 
 
 router = APIRouter(lifespan=lifespan)
 
 
-@router.post('/messages', status_code=status.HTTP_202_ACCEPTED)
-async def add_messages(
-    request: AddMessagesRequest,
-    graphiti: ZepGraphitiDep,
-):
-    async def add_messages_task(m: Message):
-        await graphiti.add_episode(
-            uuid=m.uuid,
-            group_id=request.group_id,
-            name=m.name,
-            episode_body=f'{m.role or ""}({m.role_type}): {m.content}',
-            reference_time=m.timestamp,
-            source=EpisodeType.message,
-            source_description=m.source_description,
+def get_ingestor() -> MessageIngestor:
+    if ingestor is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail='Ingestion is not running'
         )
+    return ingestor
+
+
+IngestorDep = Annotated[MessageIngestor, Depends(get_ingestor)]
+
 
-    for m in request.messages:
-        await async_worker.queue.put(partial(add_messages_task, m))
+async def update_queue_depth_metrics():
+    # Groups whose queues have drained are dropped rather than reported as zero
+    ingest_queue_depth.clear()
+    if ingestor is None:
+        return
+    for group_id, depth in (await ingestor.job_queue.depths()).items():
+        ingest_queue_depth.set(depth, group_id=group_id)
 
-    return Result(message='Messages added to processing queue', success=True)
+
+@router.post('/messages', status_code=status.HTTP_202_ACCEPTED)
+async def add_messages(request: AddMessagesRequest, ingestor: IngestorDep):
+    try:
+        accepted = await ingestor.submit(request.group_id, request.messages)
+    except AdmissionRejectedError as e:
+        if e.retry_after is None:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=e.message
+            ) from e
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={'Retry-After': str(math.ceil(e.retry_after))},
+        ) from e
+    skipped = len(request.messages) - accepted
+
+    message = 'Messages added to processing queue'
+    if skipped:
+        message += f' ({skipped} already queued or processed)'
+    return Result(message=message, success=True)
+
+
+@router.get('/messages/queue', status_code=status.HTTP_200_OK)
+async def get_queue_status(ingestor: IngestorDep, group_id: str | None = None):
+    total_depth = await ingestor.job_queue.depth()
+    group_depth = await ingestor.job_queue.depth(group_id) if group_id is not None else None
+    return IngestQueueStatus(
+        concurrency=ingestor.pool.concurrency,
+        shard_depths=ingestor.pool.queue_depths(),
+        pending_messages=group_depth if group_depth is not None else total_depth,
+        admission=ingestor.admission.status(total_depth, group_depth),
+    )
 
 
 @router.post('/entity-node', status_code=status.HTTP_201_CREATED)
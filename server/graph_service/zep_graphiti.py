@@ -8,7 +8,7 @@ from graphiti_core.errors import EdgeNotFoundError, GroupsEdgesNotFoundError, No
 from graphiti_core.llm_client import LLMClient  # type: ignore
 from graphiti_core.nodes import EntityNode, EpisodicNode  # type: ignore
 
-from graph_service.config import ZepEnvDep
+from graph_service.config import Settings, ZepEnvDep
 from graph_service.dto import FactResult
 
 logger = logging.getLogger(__name__)
@@ -71,7 +71,7 @@ class ZepGraphiti(Graphiti):
             raise HTTPException(status_code=404, detail=e.message) from e
 
 
-async def get_graphiti(settings: ZepEnvDep):
+def create_graphiti(settings: Settings) -> ZepGraphiti:
     client = ZepGraphiti(
         uri=settings.neo4j_uri,
         user=settings.neo4j_user,
@@ -83,6 +83,11 @@ async def get_graphiti(settings: ZepEnvDep):
         client.llm_client.config.api_key = settings.openai_api_key
     if settings.model_name is not None:
         client.llm_client.model = settings.model_name
+    return client
+
+
+async def get_graphiti(settings: ZepEnvDep):
+    client = create_graphiti(settings)
 
     try:
         yield client
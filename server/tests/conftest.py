@@ -0,0 +1,46 @@
+import pytest
+
+from graph_service.dto import Message
+from graph_service.ingest_queue import PersistentJobQueue
+
+
+def message(content: str = 'hello', uuid: str | None = None) -> Message:
+    return Message(content=content, uuid=uuid, name=content, role_type='user', role='alice')
+
+
+class FakeGraphiti:
+    """Records the episodes passed to add_episode and add_episode_bulk.
+
+    add_episode_bulk raises while fail_bulk is set, and add_episode raises for messages
+    whose name is in failing.
+    """
+
+    def __init__(self):
+        self.driver = object()
+        self.embedder = None
+        self.fail_bulk = False
+        self.failing: set[str] = set()
+        self.bulk_calls: list[list[str | None]] = []
+        self.added: list[str | None] = []
+
+    async def add_episode_bulk(self, episodes, group_id):
+        self.bulk_calls.append([episode.uuid for episode in episodes])
+        if self.fail_bulk:
+            raise RuntimeError('bulk ingestion failed')
+
+    async def add_episode(self, uuid, name, **kwargs):
+        if name in self.failing:
+            raise RuntimeError(f'ingesting {name} failed')
+        self.added.append(uuid)
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    queue = PersistentJobQueue(str(tmp_path / 'ingest_queue.db'))
+    yield queue
+    queue.close()
+
+
+@pytest.fixture
+def graphiti() -> FakeGraphiti:
+    return FakeGraphiti()
@@ -0,0 +1,57 @@
+import pytest
+
+from graph_service.ingest_queue import MAX_JOB_ATTEMPTS, PersistentJobQueue
+from tests.conftest import message
+
+
+@pytest.mark.asyncio
+async def test_enqueue_skips_queued_and_processed_message_uuids(job_queue):
+    accepted = await job_queue.enqueue(
+        'group', [message(uuid='1'), message(uuid='1'), message(), message()]
+    )
+    assert accepted == 3
+    assert await job_queue.enqueue('group', [message(uuid='1')]) == 0
+
+    batch = await job_queue.dequeue_batch('group', 10)
+    await job_queue.ack(batch)
+
+    assert await job_queue.depth() == 0
+    assert await job_queue.enqueue('group', [message(uuid='1'), message(uuid='2')]) == 1
+
+
+@pytest.mark.asyncio
+async def test_nack_parks_a_job_after_max_attempts(job_queue):
+    await job_queue.enqueue('group', [message()])
+
+    for _ in range(MAX_JOB_ATTEMPTS - 1):
+        batch = await job_queue.dequeue_batch('group', 10)
+        assert len(batch) == 1
+        await job_queue.nack(batch)
+
+    await job_queue.nack(batch)
+
+    assert await job_queue.dequeue_batch('group', 10) == []
+    assert await job_queue.pending_groups() == []
+    assert job_queue.conn.execute('SELECT attempts, failed FROM jobs').fetchall() == [
+        (MAX_JOB_ATTEMPTS, 1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_jobs_survive_reopening_the_queue(tmp_path):
+    path = str(tmp_path / 'ingest_queue.db')
+    job_queue = PersistentJobQueue(path)
+    await job_queue.enqueue('group', [message('first', uuid='1'), message('second')])
+    batch = await job_queue.dequeue_batch('group', 10)
+    batch[0].episode_uuid = 'episode'
+    await job_queue.set_episode_uuids(batch[:1])
+    job_queue.close()
+
+    job_queue = PersistentJobQueue(path)
+    try:
+        batch = await job_queue.dequeue_batch('group', 10)
+        assert [job.message.content for job in batch] == ['first', 'second']
+        assert [job.episode_uuid for job in batch] == ['episode', None]
+        assert await job_queue.pending_groups() == ['group']
+    finally:
+        job_queue.close()
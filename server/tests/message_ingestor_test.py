@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from graphiti_core.utils.admission_control import AdmissionController  # type: ignore
+
+from graph_service.main import app
+from graph_service.routers import ingest
+from graph_service.routers.ingest import AsyncWorkerPool, MessageIngestor
+from tests.conftest import message
+
+
+@pytest.fixture
+def saved_episodes(monkeypatch) -> list[str]:
+    """Uuids of the episode nodes saved ahead of bulk attempts."""
+    saved: list[str] = []
+
+    async def add_nodes_and_edges_bulk(driver, episodes, *args):
+        saved.extend(episode.uuid for episode in episodes)
+
+    monkeypatch.setattr(ingest, 'add_nodes_and_edges_bulk', add_nodes_and_edges_bulk)
+    return saved
+
+
+@pytest.fixture
+def ingestor(job_queue, graphiti, saved_episodes):
+    ingestor = MessageIngestor(
+        AsyncWorkerPool(), job_queue, graphiti, AdmissionController(), bulk_threshold=3
+    )
+    yield ingestor
+    ingestor.stop()
+
+
+@pytest.mark.asyncio
+async def test_batches_below_bulk_threshold_are_ingested_one_at_a_time(
+    ingestor, job_queue, graphiti
+):
+    await job_queue.enqueue('group', [message('a', uuid='a'), message('b', uuid='b')])
+    await ingestor.drain('group')
+
+    assert graphiti.bulk_calls == []
+    assert graphiti.added == ['a', 'b']
+
+    await job_queue.enqueue('group', [message(name, uuid=name) for name in 'cde'])
+    await ingestor.drain('group')
+
+    assert graphiti.bulk_calls == [['c', 'd', 'e']]
+    assert graphiti.added == ['a', 'b']
+    assert await job_queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_batch_reuses_saved_episodes(
+    ingestor, job_queue, graphiti, saved_episodes, monkeypatch
+):
+    retries: list[str] = []
+    monkeypatch.setattr(ingestor, 'schedule_retry', retries.append)
+    graphiti.fail_bulk = True
+    graphiti.failing = {'b'}
+    await job_queue.enqueue('group', [message(name) for name in 'abcd'])
+
+    await ingestor.drain('group')
+
+    assert len(saved_episodes) == 4
+    assert graphiti.bulk_calls == [saved_episodes]
+    assert graphiti.added == saved_episodes[:1]
+    assert retries == ['group']
+
+    graphiti.failing = set()
+    await ingestor.drain('group')
+
+    # The retry reuses the episodes saved by the first attempt instead of saving new ones
+    assert len(saved_episodes) == 4
+    assert graphiti.bulk_calls == [saved_episodes, saved_episodes[1:]]
+    assert graphiti.added == saved_episodes
+    assert await job_queue.depth() == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_is_capped(ingestor, monkeypatch):
+    delays: list[float] = []
+
+    async def retry_drain(group_id: str, delay: float):
+        delays.append(delay)
+
+    monkeypatch.setattr(ingestor, 'retry_drain', retry_drain)
+
+    for _ in range(9):
+        ingestor.schedule_retry('group')
+    await asyncio.gather(*ingestor.retries)
+
+    assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 32.0] + [ingest.MAX_DRAIN_RETRY_DELAY] * 3
+    assert 'group' in ingestor.scheduled
+
+
+@pytest.fixture
+def client(monkeypatch, job_queue, graphiti) -> TestClient:
+    """A client for the app with an ingestor that admits at most 2 queued messages per group."""
+    ingestor = MessageIngestor(
+        AsyncWorkerPool(), job_queue, graphiti, AdmissionController(max_group_queue=2)
+    )
+    scheduled: list[str] = []
+
+    async def schedule(group_id: str):
+        scheduled.append(group_id)
+
+    monkeypatch.setattr(ingestor, 'schedule', schedule)
+    monkeypatch.setattr(ingest, 'ingestor', ingestor)
+    return TestClient(app)
+
+
+def add_messages(client: TestClient, count: int):
+    return client.post(
+        '/messages',
+        json={
+            'group_id': 'group',
+            'messages': [message(str(index)).model_dump(mode='json') for index in range(count)],
+        },
+    )
+
+
+def test_messages_over_the_group_cap_are_rejected(client):
+    response = add_messages(client, 3)
+
+    assert response.status_code == 413
+    assert 'Retry-After' not in response.headers
+
+
+def test_messages_for_a_full_group_are_throttled(client):
+    assert add_messages(client, 2).status_code == 202
+
+    response = add_messages(client, 1)
+
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
@@ -0,0 +1,104 @@
+import asyncio
+import zlib
+
+import pytest
+
+from graph_service.routers.ingest import AsyncWorkerPool
+
+
+def groups_by_shard(pool: AsyncWorkerPool) -> list[str]:
+    """Return one group_id for each shard of the pool."""
+    groups: dict[int, str] = {}
+    index = 0
+    while len(groups) < pool.concurrency:
+        group_id = f'group-{index}'
+        groups.setdefault(pool.shard_for(group_id), group_id)
+        index += 1
+    return [groups[shard] for shard in range(pool.concurrency)]
+
+
+def test_shard_for_uses_crc32():
+    pool = AsyncWorkerPool(concurrency=4)
+
+    for group_id in ['a', 'b', 'group', 'another group']:
+        assert pool.shard_for(group_id) == zlib.crc32(group_id.encode()) % 4
+        assert 0 <= pool.shard_for(group_id) < 4
+
+
+@pytest.mark.asyncio
+async def test_jobs_for_a_group_run_in_order():
+    pool = AsyncWorkerPool(concurrency=2)
+    await pool.start()
+    completed: dict[str, list[int]] = {'a': [], 'b': []}
+
+    async def job(group_id: str, index: int):
+        # Later jobs finish faster, so only ordering within the shard keeps them in order
+        await asyncio.sleep(0.005 * (5 - index))
+        completed[group_id].append(index)
+
+    for index in range(5):
+        for group_id in completed:
+            await pool.put(group_id, lambda group_id=group_id, index=index: job(group_id, index))
+    await pool.stop()
+
+    assert completed == {'a': list(range(5)), 'b': list(range(5))}
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_jobs():
+    pool = AsyncWorkerPool(concurrency=2)
+    await pool.start()
+    completed: list[int] = []
+
+    async def job(index: int):
+        await asyncio.sleep(0.001)
+        completed.append(index)
+
+    for index in range(10):
+        await pool.put(f'group-{index}', lambda index=index: job(index))
+    await pool.stop()
+
+    assert sorted(completed) == list(range(10))
+    assert pool.tasks == []
+
+
+@pytest.mark.asyncio
+async def test_stop_drops_jobs_left_after_timeout():
+    pool = AsyncWorkerPool(concurrency=1)
+    await pool.start()
+    blocked = asyncio.Event()
+    started: list[str] = []
+
+    async def job(name: str):
+        started.append(name)
+        await blocked.wait()
+
+    await pool.put('group', lambda: job('first'))
+    await pool.put('group', lambda: job('second'))
+    await pool.stop(timeout=0.01)
+
+    assert started == ['first']
+    assert pool.tasks == []
+
+
+@pytest.mark.asyncio
+async def test_queue_depths_counts_jobs_waiting_per_shard():
+    pool = AsyncWorkerPool(concurrency=2)
+    await pool.start()
+    first, second = groups_by_shard(pool)
+    release = asyncio.Event()
+
+    async def job():
+        await release.wait()
+
+    for _ in range(3):
+        await pool.put(first, job)
+    await pool.put(second, job)
+    # Let each worker take its first job
+    await asyncio.sleep(0)
+
+    assert pool.queue_depths() == [2, 0]
+
+    release.set()
+    await pool.stop()
+    assert pool.queue_depths() == [0, 0]
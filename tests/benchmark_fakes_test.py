@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks.fakes import FakeCrossEncoder, FakeEmbedder, FakeLLMClient, default_response
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graphiti_types import GraphitiClients
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.prompts.summarize_nodes import Summary
+from graphiti_core.utils.maintenance.edge_operations import extract_edges, resolve_extracted_edge
+from graphiti_core.utils.maintenance.node_operations import (
+    extract_nodes,
+    resolve_extracted_nodes,
+)
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clients(clients, edge_driver) -> GraphitiClients:
+    edge_driver.edges = []
+    return clients.model_copy(
+        update={
+            'llm_client': FakeLLMClient(),
+            'embedder': FakeEmbedder(),
+            'cross_encoder': FakeCrossEncoder(),
+        }
+    )
+
+
+def make_episode(content: str) -> EpisodicNode:
+    return EpisodicNode(
+        name='episode',
+        group_id='group',
+        source=EpisodeType.message,
+        source_description='chat',
+        content=content,
+        valid_at=NOW,
+    )
+
+
+def make_node(name: str) -> EntityNode:
+    return EntityNode(name=name, group_id='group', labels=['Entity'])
+
+
+@pytest.mark.asyncio
+async def test_fake_llm_extracts_entities_and_facts(clients):
+    episode = make_episode('Alice: I met Bob in Paris.')
+
+    nodes = await extract_nodes(clients, episode, [])
+    assert [node.name for node in nodes] == ['Alice', 'Bob', 'Paris']
+
+    edges = await extract_edges(clients, episode, nodes, [], {}, 'group')
+    assert [edge.fact for edge in edges] == [
+        'Alice was mentioned with Bob',
+        'Bob was mentioned with Paris',
+    ]
+    assert edges[0].source_node_uuid == nodes[0].uuid
+
+
+@pytest.mark.asyncio
+async def test_fake_llm_resolves_duplicates_by_name(clients):
+    existing = make_node('Alice')
+
+    resolved, uuid_map, _ = await resolve_extracted_nodes(
+        clients,
+        [make_node('Alice'), make_node('Bob')],
+        make_episode('Alice: hi Bob'),
+        [],
+        existing_nodes_override=[existing],
+    )
+    assert resolved[0].uuid == existing.uuid
+    assert resolved[1].name == 'Bob'
+    assert len(uuid_map) == 2
+
+    def make_edge(fact: str) -> EntityEdge:
+        return EntityEdge(
+            source_node_uuid='a',
+            target_node_uuid='b',
+            name='MENTIONED_WITH',
+            fact=fact,
+            group_id='group',
+            created_at=NOW,
+        )
+
+    existing_edge = make_edge('Alice was mentioned with Bob')
+    resolved_edge, _, _ = await resolve_extracted_edge(
+        clients.llm_client,
+        make_edge('Alice was mentioned with Bob'),
+        [existing_edge],
+        [],
+        make_episode('Alice: hi Bob'),
+    )
+    assert resolved_edge.uuid == existing_edge.uuid
+
+
+def test_default_response_satisfies_response_model():
+    assert Summary.model_validate(default_response(Summary)).summary == ''
+
+
+@pytest.mark.asyncio
+async def test_fake_embedder_is_deterministic():
+    embedder = FakeEmbedder(embedding_dim=8)
+    first = await embedder.create(input_data=['alice'])
+    assert first == await embedder.create(input_data=['alice'])
+    assert first != await embedder.create(input_data=['bob'])
+    assert np.linalg.norm(first) == pytest.approx(1.0)
+    assert await embedder.create_batch(['alice']) == [first]
+
+
+def test_compare_flags_regressions():
+    def results(p50: float, llm_calls: float):
+        operation = {
+            'operations': 1,
+            'latency_ms': {'p50': p50, 'p90': p50, 'p99': p50},
+            'per_item': {'llm_calls': llm_calls},
+        }
+        empty = {'operations': 0}
+        return {
+            'results': [
+                {
+                    'episodes': 1000,
+                    'add_episode_bulk': operation,
+                    'add_episode': empty,
+                    'search_': empty,
+                }
+            ]
+        }
+
+    lines, regressions = compare(results(10, 5), results(10.5, 7), threshold=0.1)
+    assert len(lines) == 4
+    assert [line.split()[2] for line in regressions] == ['per_item.llm_calls']
@@ -0,0 +1,107 @@
+import re
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from benchmarks.fakes import FakeCrossEncoder, FakeEmbedder
+from graphiti_core.cassette import (
+    Cassette,
+    RecordingCrossEncoderClient,
+    RecordingEmbedderClient,
+    RecordingLLMClient,
+    ReplayCrossEncoderClient,
+    ReplayEmbedderClient,
+    ReplayLLMClient,
+)
+from graphiti_core.errors import CassetteMissError
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig, ModelSize
+from graphiti_core.prompts.models import Message
+from graphiti_core.usage import collect_usage
+
+
+class Duplicate(BaseModel):
+    uuid: str
+
+
+class EchoLLMClient(LLMClient):
+    """Answers with the last UUID of the prompt, as a duplicate resolution prompt would."""
+
+    def __init__(self):
+        super().__init__(LLMConfig(model='echo-model'))
+        self.calls = 0
+
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=0, model_size=ModelSize.medium
+    ) -> dict[str, Any]:
+        self.calls += 1
+        self._record_token_usage(self.model, 10, 2)
+        uuids = re.findall(r'[0-9a-f-]{36}', messages[-1].content)
+        return {'uuid': uuids[-1]}
+
+
+def messages(first: str, second: str) -> list[Message]:
+    return [
+        Message(role='system', content='Find the duplicate.'),
+        Message(role='user', content=f'Entities:  {first}\n{second}'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_llm_replay_maps_uuids_and_reports_usage(tmp_path):
+    cassette = Cassette()
+    recorder = RecordingLLMClient(EchoLLMClient(), cassette)
+    first, second = str(uuid4()), str(uuid4())
+    response = await recorder.generate_response(
+        messages(first, second), Duplicate, prompt_name='dedupe_nodes.node'
+    )
+    assert response == {'uuid': second}
+
+    path = str(tmp_path / 'cassette.jsonl.gz')
+    cassette.save(path)
+    replayer = ReplayLLMClient(Cassette.load(path))
+
+    # The same prompt about other entities, with different whitespace, replays
+    other_first, other_second = str(uuid4()), str(uuid4())
+    with collect_usage() as usage:
+        response = await replayer.generate_response(
+            [
+                Message(role='system', content='Find  the duplicate.'),
+                Message(role='user', content=f'Entities: {other_first}\n {other_second}'),
+            ],
+            Duplicate,
+            prompt_name='dedupe_nodes.node',
+        )
+    assert response == {'uuid': other_second}
+    [prompt_usage] = usage.summary().prompts
+    assert (prompt_usage.model, prompt_usage.input_tokens, prompt_usage.output_tokens) == (
+        'echo-model',
+        10,
+        2,
+    )
+
+    with pytest.raises(CassetteMissError):
+        await replayer.generate_response(messages(first, second), None)
+
+
+@pytest.mark.asyncio
+async def test_embedder_and_cross_encoder_replay():
+    cassette = Cassette()
+    embedder = RecordingEmbedderClient(FakeEmbedder(embedding_dim=8), cassette)
+    embeddings = await embedder.create_batch(['Alice', 'Bob  Smith'])
+    cross_encoder = RecordingCrossEncoderClient(FakeCrossEncoder(), cassette)
+    ranked = await cross_encoder.rank('alice bob', ['alice met bob', 'carol', 'alice'])
+
+    replay_embedder = ReplayEmbedderClient(cassette)
+    assert await replay_embedder.create(input_data=['Bob Smith']) == pytest.approx(embeddings[1])
+    assert await replay_embedder.create_batch(['Alice']) == [pytest.approx(embeddings[0])]
+
+    replay_cross_encoder = ReplayCrossEncoderClient(cassette)
+    assert (
+        await replay_cross_encoder.rank('alice  bob', ['carol', 'alice', 'alice met bob']) == ranked
+    )
+
+    with pytest.raises(CassetteMissError):
+        await replay_embedder.create(input_data=['Carol'])
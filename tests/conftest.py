@@ -0,0 +1,91 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from graphiti_core.driver.driver import query_timeout
+from graphiti_core.graphiti_types import GraphitiClients
+
+NOW = datetime.now(timezone.utc).isoformat()
+
+
+def edge_record(uuid: str = 'edge', fact: str = 'a relates to b') -> dict:
+    """An entity edge record of the form returned by the Cypher search queries."""
+    return {
+        'uuid': uuid,
+        'group_id': 'group',
+        'source_node_uuid': 'a',
+        'target_node_uuid': 'b',
+        'created_at': NOW,
+        'name': 'RELATES_TO',
+        'fact': fact,
+        'episodes': [],
+        'expired_at': None,
+        'valid_at': None,
+        'invalid_at': None,
+        'attributes': {},
+    }
+
+
+class EdgeGraphDriver:
+    """
+    Answers entity edge queries with its edge records, and other queries with no records after
+    an optional delay. Counts the queries and records their timeouts.
+    """
+
+    provider = 'neo4j'
+    operations = None
+
+    def __init__(self):
+        self.edges = [edge_record()]
+        self.delay = 0.0
+        self.queries = 0
+        self.timeouts: list[float | None] = []
+
+    async def execute_query(self, cypher_query_, **kwargs):
+        self.queries += 1
+        self.timeouts.append(query_timeout())
+        if 'RELATES_TO' in cypher_query_:
+            return self.edges, None, None
+        await asyncio.sleep(self.delay)
+        return [], None, None
+
+
+class StubEmbedder:
+    """Returns the configured vector for a text, [1.0, 0.0] by default, and records its calls."""
+
+    def __init__(self):
+        self.vectors: dict[str, list[float]] = {}
+        self.delay = 0.0
+        self.calls: list[list[str]] = []
+
+    async def create(self, input_data):
+        self.calls.append(input_data)
+        await asyncio.sleep(self.delay)
+        return self.vectors.get(input_data[0], [1.0, 0.0])
+
+    async def create_batch(self, input_data_list):
+        self.calls.append(input_data_list)
+        return [self.vectors.get(text, [1.0, 0.0]) for text in input_data_list]
+
+
+@pytest.fixture
+def make_edge_record():
+    return edge_record
+
+
+@pytest.fixture
+def edge_driver() -> EdgeGraphDriver:
+    return EdgeGraphDriver()
+
+
+@pytest.fixture
+def stub_embedder() -> StubEmbedder:
+    return StubEmbedder()
+
+
+@pytest.fixture
+def clients(edge_driver, stub_embedder) -> GraphitiClients:
+    return GraphitiClients.model_construct(
+        driver=edge_driver, embedder=stub_embedder, llm_client=None, cross_encoder=None
+    )
@@ -0,0 +1,77 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Running tests: pytest -xvs tests/cross_encoder/test_batch_executor.py
+
+import asyncio
+
+import pytest
+
+from graphiti_core.cross_encoder.batch_executor import BatchPredictExecutor
+
+
+class FakeModel:
+    """Scores pairs by passage length and records the batches it was called with."""
+
+    def __init__(self):
+        self.batches: list[list[tuple[str, str]]] = []
+
+    def predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        self.batches.append(pairs)
+        return [float(len(passage)) for _, passage in pairs]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_batched():
+    model = FakeModel()
+    executor = BatchPredictExecutor(model.predict, max_batch_size=32, max_wait_seconds=0.05)
+
+    results = await asyncio.gather(
+        executor.predict([('q1', 'a'), ('q1', 'bb')]),
+        executor.predict([('q2', 'ccc')]),
+    )
+
+    assert results == [[1.0, 2.0], [3.0]]
+    assert len(model.batches) == 1
+    assert executor.mean_batch_size == 3
+    assert executor.max_queue_wait > 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_batches_are_bounded_and_bucketed_by_length():
+    model = FakeModel()
+    executor = BatchPredictExecutor(model.predict, max_batch_size=2, max_wait_seconds=10)
+
+    passages = ['x' * n for n in [5, 1, 4, 2]]
+    results = await asyncio.gather(*[executor.predict([('q', p)]) for p in passages])
+
+    assert [scores[0] for scores in results] == [5.0, 1.0, 4.0, 2.0]
+    assert all(len(batch) <= 2 for batch in model.batches)
+    assert executor.batches == 2
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_prediction_errors_are_raised_to_callers():
+    def failing_predict(pairs):
+        raise RuntimeError('model failed')
+
+    executor = BatchPredictExecutor(failing_predict, max_wait_seconds=0)
+
+    with pytest.raises(RuntimeError, match='model failed'):
+        await executor.predict([('q', 'p')])
+    executor.shutdown()
@@ -0,0 +1,119 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Running tests: pytest -xvs tests/cross_encoder/test_cached_reranker_client.py
+
+from unittest.mock import patch
+
+import pytest
+
+from graphiti_core.cross_encoder.cached_client import CachedCrossEncoderClient
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+
+
+class LengthReranker(CrossEncoderClient):
+    """Scores passages by length and records the passages it was asked to rank."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        self.calls.append(passages)
+        return sorted(((p, float(len(p))) for p in passages), reverse=True, key=lambda x: x[1])
+
+
+@pytest.mark.asyncio
+async def test_cached_reranker_only_ranks_unseen_passages():
+    reranker = LengthReranker()
+    client = CachedCrossEncoderClient(reranker)
+
+    assert await client.rank('Who is Alice?', ['a', 'bbb']) == [('bbb', 3.0), ('a', 1.0)]
+    assert await client.rank('  who is   alice? ', ['cc', 'bbb', 'a']) == [
+        ('bbb', 3.0),
+        ('cc', 2.0),
+        ('a', 1.0),
+    ]
+
+    assert reranker.calls == [['a', 'bbb'], ['cc', 'bbb']]
+    assert client.hits == 2
+    assert client.misses == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_reranker_skips_inner_call_on_full_hit():
+    reranker = LengthReranker()
+    client = CachedCrossEncoderClient(reranker)
+
+    await client.rank('query', ['a', 'bb'])
+    await client.rank('query', ['bb', 'a'])
+
+    assert len(reranker.calls) == 1
+    assert client.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_cached_reranker_evicts_by_lru_and_ttl():
+    reranker = LengthReranker()
+    client = CachedCrossEncoderClient(reranker, max_entries=3, ttl_seconds=10)
+
+    with patch('graphiti_core.cross_encoder.cached_client.monotonic', return_value=0):
+        await client.rank('query', ['a', 'bb'])
+        await client.rank('query', ['a'])
+        await client.rank('query', ['ccc', 'dddd'])
+
+    assert reranker.calls[-1] == ['ccc', 'dddd']
+    assert client.get('query', 'bb') is None
+
+    with patch('graphiti_core.cross_encoder.cached_client.monotonic', return_value=11):
+        await client.rank('query', ['a', 'ccc'])
+
+    assert reranker.calls[-1] == ['a', 'ccc']
+
+
+class LonePassageReranker(LengthReranker):
+    """Gives a lone passage a constant score, like the Gemini reranker."""
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        if len(passages) <= 1:
+            self.calls.append(passages)
+            return [(passage, 100.0) for passage in passages]
+        return await super().rank(query, passages)
+
+
+@pytest.mark.asyncio
+async def test_cached_reranker_never_ranks_or_caches_a_lone_passage():
+    reranker = LonePassageReranker()
+    client = CachedCrossEncoderClient(reranker)
+
+    assert await client.rank('query', ['a']) == [('a', 100.0)]
+    assert client.get('query', 'a') is None
+
+    await client.rank('query', ['a', 'bb'])
+    assert await client.rank('query', ['a', 'bb', 'ccc']) == [
+        ('ccc', 3.0),
+        ('bb', 2.0),
+        ('a', 1.0),
+    ]
+    assert reranker.calls[-1] == ['ccc', 'a']
+
+
+class ListwiseReranker(LengthReranker):
+    listwise = True
+
+
+def test_cached_reranker_rejects_listwise_clients():
+    with pytest.raises(ValueError):
+        CachedCrossEncoderClient(ListwiseReranker())
@@ -349,5 +349,47 @@ class TestGeminiRerankerClientRanking:
         assert all(score == 0.0 for _, score in result)
 
 
+class TestGeminiRerankerClientListwise:
+    """Tests for listwise batched reranking."""
+
+    @pytest.fixture
+    def listwise_client(self, mock_gemini_client):
+        config = LLMConfig(api_key='test_api_key', model='test-model')
+        client = GeminiRerankerClient(config=config, listwise=True, listwise_batch_size=2)
+        client.client = mock_gemini_client
+        return client
+
+    @pytest.mark.asyncio
+    async def test_rank_listwise_batches_passages(self, listwise_client, mock_gemini_client):
+        """Test that passages are scored with one request per batch."""
+        mock_gemini_client.aio.models.generate_content.side_effect = [
+            create_mock_response(
+                '{"scores": [{"index": 0, "score": 20}, {"index": 1, "score": 90}]}'
+            ),
+            create_mock_response('{"scores": [{"index": 0, "score": 50}]}'),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2', 'Passage 3'])
+
+        assert result == [('Passage 2', 0.9), ('Passage 3', 0.5), ('Passage 1', 0.2)]
+        assert mock_gemini_client.aio.models.generate_content.call_count == 2
+        kwargs = mock_gemini_client.aio.models.generate_content.call_args_list[0].kwargs
+        assert kwargs['config'].response_mime_type == 'application/json'
+
+    @pytest.mark.asyncio
+    async def test_rank_listwise_falls_back_to_pointwise(self, listwise_client, mock_gemini_client):
+        """Test that a batch with an incomplete response is scored pointwise."""
+        mock_gemini_client.aio.models.generate_content.side_effect = [
+            create_mock_response('{"scores": [{"index": 0, "score": 20}]}'),
+            create_mock_response('30'),
+            create_mock_response('70'),
+        ]
+
+        result = await listwise_client.rank('Test query', ['Passage 1', 'Passage 2'])
+
+        assert result == [('Passage 2', 0.7), ('Passage 1', 0.3)]
+        assert mock_gemini_client.aio.models.generate_content.call_count == 3
+
+
 if __name__ == '__main__':
     pytest.main(['-v', 'test_gemini_reranker_client.py'])
@@ -0,0 +1,96 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Running tests: pytest -xvs tests/cross_encoder/test_openai_reranker_client.py
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from graphiti_core.cross_encoder.listwise import parse_listwise_scores
+from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
+from graphiti_core.llm_client import LLMConfig
+
+
+@pytest.fixture
+def mock_openai_client():
+    """Fixture to mock the OpenAI client."""
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock()
+    return mock_client
+
+
+def create_listwise_response(content: str) -> MagicMock:
+    """Helper function to create a mock JSON chat completion."""
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = content
+    return mock_response
+
+
+def create_pointwise_response(token: str, logprob: float) -> MagicMock:
+    """Helper function to create a mock single-token chat completion with logprobs."""
+    top_logprob = MagicMock()
+    top_logprob.token = token
+    top_logprob.logprob = logprob
+    mock_response = MagicMock()
+    mock_response.choices[0].logprobs.content[0].top_logprobs = [top_logprob]
+    return mock_response
+
+
+def test_parse_listwise_scores():
+    assert parse_listwise_scores(
+        '{"scores": [{"index": 1, "score": 150}, {"index": 0, "score": 40}]}', 2
+    ) == [0.4, 1.0]
+
+    for invalid in ['', 'not json', '{"scores": [{"index": 0, "score": 40}]}']:
+        with pytest.raises(ValueError):
+            parse_listwise_scores(invalid, 2)
+
+    with pytest.raises(ValueError):
+        parse_listwise_scores('{"scores": [{"index": 2, "score": 40}]}', 1)
+
+
+@pytest.mark.asyncio
+async def test_rank_listwise_uses_one_request_per_batch(mock_openai_client):
+    mock_openai_client.chat.completions.create.return_value = create_listwise_response(
+        '{"scores": [{"index": 0, "score": 10}, {"index": 1, "score": 80}, {"index": 2, "score": 50}]}'
+    )
+    client = OpenAIRerankerClient(
+        config=LLMConfig(model='test-model'), client=mock_openai_client, listwise=True
+    )
+
+    result = await client.rank('query', ['a', 'b', 'c'])
+
+    assert result == [('b', 0.8), ('c', 0.5), ('a', 0.1)]
+    assert mock_openai_client.chat.completions.create.call_count == 1
+    kwargs = mock_openai_client.chat.completions.create.call_args.kwargs
+    assert kwargs['model'] == 'test-model'
+    assert kwargs['response_format'] == {'type': 'json_object'}
+
+
+@pytest.mark.asyncio
+async def test_rank_listwise_falls_back_to_pointwise(mock_openai_client):
+    mock_openai_client.chat.completions.create.side_effect = [
+        create_listwise_response('{"scores": []}'),
+        create_pointwise_response('True', 0.0),
+        create_pointwise_response('False', 0.0),
+    ]
+    client = OpenAIRerankerClient(client=mock_openai_client, listwise=True)
+
+    result = await client.rank('query', ['a', 'b'])
+
+    assert result == [('a', 1.0), ('b', 0.0)]
+    assert mock_openai_client.chat.completions.create.call_count == 3
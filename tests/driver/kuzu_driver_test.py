@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from benchmarks.fakes import FakeCrossEncoder, FakeEmbedder, FakeLLMClient
+from graphiti_core.edges import EntityEdge
+from graphiti_core.graph_queries import (
+    get_nodes_query,
+    get_relationships_query,
+    get_vector_cosine_func_query,
+)
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
+
+try:
+    from graphiti_core.driver.kuzu_driver import KuzuDriver, edge_filter_conditions
+
+    HAS_KUZU = True
+except ImportError:
+    KuzuDriver = None
+    HAS_KUZU = False
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+LATER = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+def test_kuzu_fulltext_queries_target_node_tables():
+    assert get_nodes_query('kuzu', 'node_name_and_summary', '$query', '$limit') == (
+        "CALL QUERY_FTS_INDEX('Entity', 'node_name_and_summary', CAST($query AS STRING), "
+        'TOP := $limit)'
+    )
+    assert "QUERY_FTS_INDEX('RelatesToNode_', 'edge_name_and_fact'" in get_relationships_query(
+        'edge_name_and_fact', 'kuzu'
+    )
+    assert get_vector_cosine_func_query('a', 'b', 'kuzu') == (
+        '(1 + array_cosine_similarity(a, b)) / 2'
+    )
+
+
+@pytest.mark.skipif(not HAS_KUZU, reason='kuzu is not installed')
+def test_edge_filter_conditions_bind_every_date():
+    params: dict = {}
+    search_filter = SearchFilters(
+        edge_types=['KNOWS'],
+        valid_at=[
+            [DateFilter(date=NOW, comparison_operator=ComparisonOperator.greater_than_equal)],
+            [
+                DateFilter(date=NOW, comparison_operator=ComparisonOperator.less_than),
+                DateFilter(date=LATER, comparison_operator=ComparisonOperator.not_equals),
+            ],
+        ],
+    )
+
+    conditions = edge_filter_conditions(search_filter, params)
+
+    assert conditions == [
+        'e.name IN $edge_types',
+        '((e.valid_at >= $valid_at_0_0) OR (e.valid_at < $valid_at_1_0 '
+        'AND e.valid_at <> $valid_at_1_1))',
+    ]
+    assert params == {
+        'edge_types': ['KNOWS'],
+        'valid_at_0_0': NOW,
+        'valid_at_1_0': NOW,
+        'valid_at_1_1': LATER,
+    }
+
+
+@pytest.mark.skipif(not HAS_KUZU, reason='kuzu is not installed')
+@pytest.mark.asyncio
+async def test_add_episode_search_and_delete():
+    driver = KuzuDriver()
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=FakeLLMClient(),
+        embedder=FakeEmbedder(),
+        cross_encoder=FakeCrossEncoder(),
+    )
+    await graphiti.build_indices_and_constraints()
+
+    await graphiti.add_episode('first', 'Alice: I met Bob in Paris.', 'chat', NOW, group_id='group')
+    result = await graphiti.add_episode(
+        'second', 'Bob: Alice and I went to Paris again.', 'chat', LATER, group_id='group'
+    )
+
+    names = sorted(node.name for node in await EntityNode.get_by_group_ids(driver, ['group']))
+    assert names == ['Alice', 'Bob', 'Paris']
+    alice = next(node for node in result.nodes if node.name == 'Alice')
+    [stored_alice] = await EntityNode.get_by_uuids(driver, [alice.uuid])
+    assert stored_alice.mention_count == 2
+    assert stored_alice.created_at.tzinfo is not None
+
+    edges = await graphiti.search('Alice Bob', group_ids=['group'])
+    assert any('Alice' in edge.fact for edge in edges)
+
+    episodes = await graphiti.retrieve_episodes(LATER, group_ids=['group'])
+    assert [episode.name for episode in episodes] == ['first', 'second']
+
+    await graphiti.remove_episode(result.episode.uuid)
+    [stored_alice] = await EntityNode.get_by_uuids(driver, [alice.uuid])
+    assert stored_alice.mention_count == 1
+
+    await stored_alice.delete(driver)
+    assert await EntityEdge.get_by_node_uuid(driver, alice.uuid) == []
+    await driver.close()
@@ -0,0 +1,182 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from benchmarks.fakes import FakeCrossEncoder, FakeEmbedder, FakeLLMClient
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.driver.memory_index import MIN_ANN_VECTORS, BM25Index, VectorIndex
+from graphiti_core.edges import EntityEdge, EpisodicEdge
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import node_fulltext_search, node_similarity_search
+from graphiti_core.utils.bulk_utils import RawEpisode
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+LATER = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+def make_graphiti(driver: InMemoryDriver) -> Graphiti:
+    return Graphiti(
+        graph_driver=driver,
+        llm_client=FakeLLMClient(),
+        embedder=FakeEmbedder(),
+        cross_encoder=FakeCrossEncoder(),
+    )
+
+
+def make_episode(content: str) -> EpisodicNode:
+    return EpisodicNode(
+        name='episode',
+        group_id='group',
+        source=EpisodeType.message,
+        source_description='chat',
+        content=content,
+        valid_at=NOW,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_episode_and_search():
+    driver = InMemoryDriver()
+    graphiti = make_graphiti(driver)
+    await graphiti.build_indices_and_constraints()
+
+    await graphiti.add_episode('first', 'Alice: I met Bob in Paris.', 'chat', NOW, group_id='group')
+    result = await graphiti.add_episode(
+        'second', 'Bob: Alice and I went to Paris again.', 'chat', LATER, group_id='group'
+    )
+
+    names = sorted(node.name for node in await EntityNode.get_by_group_ids(driver, ['group']))
+    assert names == ['Alice', 'Bob', 'Paris']
+    alice = next(node for node in result.nodes if node.name == 'Alice')
+    [stored_alice] = await EntityNode.get_by_uuids(driver, [alice.uuid])
+    assert stored_alice.mention_count == 2
+
+    edges = await graphiti.search('Alice Bob', group_ids=['group'])
+    assert any('Alice' in edge.fact for edge in edges)
+    assert all(edge.episode_count == len(edge.episodes) > 0 for edge in edges)
+    assert await graphiti.search('Alice Bob', group_ids=['other']) == []
+
+    episodes = await graphiti.retrieve_episodes(LATER, group_ids=['group'])
+    assert [episode.name for episode in episodes] == ['first', 'second']
+
+
+@pytest.mark.asyncio
+async def test_add_episode_bulk_returns_saved_graph_and_usage():
+    driver = InMemoryDriver()
+    graphiti = make_graphiti(driver)
+    await graphiti.build_indices_and_constraints()
+
+    result = await graphiti.add_episode_bulk(
+        [
+            RawEpisode(
+                name=name,
+                content=content,
+                source_description='chat',
+                source=EpisodeType.message,
+                reference_time=NOW,
+            )
+            for name, content in [
+                ('first', 'Alice: I met Bob in Paris.'),
+                ('second', 'Bob: Alice and I went to Paris again.'),
+            ]
+        ],
+        group_id='group',
+    )
+
+    assert [episode.name for episode in result.episodes] == ['first', 'second']
+    stored_nodes = await EntityNode.get_by_group_ids(driver, ['group'])
+    assert {node.name for node in result.nodes} == {'Alice', 'Bob', 'Paris'}
+    assert {node.uuid for node in result.nodes} == {node.uuid for node in stored_nodes}
+    assert result.llm_usage.calls > 0
+
+
+@pytest.mark.asyncio
+async def test_deletes_keep_mention_counts_and_indices_in_sync():
+    driver = InMemoryDriver()
+    episode = make_episode('Alice talked about Bob')
+    alice = EntityNode(name='Alice', group_id='group', labels=['Person'], name_embedding=[1, 0])
+    bob = EntityNode(name='Bob', group_id='group', name_embedding=[0, 1])
+    fact = EntityEdge(
+        source_node_uuid=alice.uuid,
+        target_node_uuid=bob.uuid,
+        name='KNOWS',
+        fact='Alice knows Bob',
+        fact_embedding=[1, 1],
+        group_id='group',
+        created_at=NOW,
+    )
+    mention = EpisodicEdge(
+        source_node_uuid=episode.uuid, target_node_uuid=alice.uuid, group_id='group', created_at=NOW
+    )
+    for item in (episode, alice, bob, mention, fact):
+        await item.save(driver)
+
+    # Saving an entity again keeps its mention count and accumulates its labels
+    await EntityNode(
+        uuid=alice.uuid, name='Alice', group_id='group', labels=['Author'], name_embedding=[1, 0]
+    ).save(driver)
+    [stored_alice] = await EntityNode.get_by_uuids(driver, [alice.uuid])
+    assert stored_alice.mention_count == 1
+    assert set(stored_alice.labels) == {'Person', 'Author', 'Entity'}
+
+    filters = SearchFilters()
+    hits = await node_similarity_search(driver, [0.9, 0.1], filters, ['group'], min_score=0.6)
+    assert [node.name for node in hits] == ['Alice']
+
+    await episode.delete(driver)
+    [stored_alice] = await EntityNode.get_by_uuids(driver, [alice.uuid])
+    assert stored_alice.mention_count == 0
+
+    await bob.delete(driver)
+    assert await EntityEdge.get_by_node_uuid(driver, alice.uuid) == []
+    assert await node_fulltext_search(driver, 'Bob', filters, ['group']) == []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(tmp_path):
+    driver = InMemoryDriver()
+    graphiti = make_graphiti(driver)
+    await graphiti.add_episode('first', 'Alice: I met Bob in Paris.', 'chat', NOW, group_id='g')
+
+    path = str(tmp_path / 'graph.npz')
+    driver.save(path)
+    loaded = InMemoryDriver.load(path)
+
+    original = await EntityEdge.get_by_group_ids(driver, ['g'])
+    restored = await EntityEdge.get_by_group_ids(loaded, ['g'])
+    assert [edge.fact for edge in restored] == [edge.fact for edge in original]
+
+    await restored[0].load_fact_embedding(loaded)
+    await original[0].load_fact_embedding(driver)
+    assert restored[0].fact_embedding == pytest.approx(original[0].fact_embedding)
+
+
+def test_bm25_ranks_rarer_terms_higher():
+    index = BM25Index()
+    index.add('a', 'alice met bob')
+    index.add('b', 'bob met carol')
+    index.add('c', 'carol met dave')
+
+    assert [uuid for uuid, _ in index.search('alice bob')] == ['a', 'b']
+    index.remove('a')
+    assert [uuid for uuid, _ in index.search('alice')] == []
+
+
+def test_ann_search_finds_exact_nearest_neighbors():
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(2 * MIN_ANN_VECTORS, 16))
+    exact = VectorIndex()
+    ann = VectorIndex(ann=True, n_probe=8)
+    for i, vector in enumerate(vectors):
+        exact.add(str(i), vector.tolist())
+        ann.add(str(i), vector.tolist())
+
+    query = vectors[0].tolist()
+    assert ann.search(query, 0.9)[0][0] == exact.search(query, 0.9)[0][0] == '0'
+    assert ann.centroids is not None
+
+    ann.remove('0')
+    assert all(uuid != '0' for uuid, _ in ann.search(query, 0.0))
@@ -1,9 +1,42 @@
 import argparse
 import asyncio
+from time import perf_counter
 
+from graphiti_core.cassette import (
+    Cassette,
+    RecordingCrossEncoderClient,
+    RecordingEmbedderClient,
+    RecordingLLMClient,
+    ReplayCrossEncoderClient,
+    ReplayEmbedderClient,
+    ReplayLLMClient,
+)
+from graphiti_core.cross_encoder import OpenAIRerankerClient
+from graphiti_core.embedder import OpenAIEmbedder
+from graphiti_core.llm_client import LLMConfig, OpenAIClient
 from tests.evals.eval_e2e_graph_building import build_baseline_graph, eval_graph
 
 
+def cassette_clients(args: argparse.Namespace) -> tuple[Cassette | None, dict]:
+    """The model clients to record to or replay from a cassette, if one is given."""
+    if args.replay_cassette is not None:
+        cassette = Cassette.load(args.replay_cassette)
+        return cassette, {
+            'llm_client': ReplayLLMClient(cassette, latency=args.replay_latency),
+            'embedder': ReplayEmbedderClient(cassette, latency=args.replay_latency),
+            'cross_encoder': ReplayCrossEncoderClient(cassette, latency=args.replay_latency),
+        }
+    if args.record_cassette is not None:
+        cassette = Cassette(args.record_cassette)
+        llm_client = OpenAIClient(config=LLMConfig(model='gpt-4.1-mini'))
+        return cassette, {
+            'llm_client': RecordingLLMClient(llm_client, cassette),
+            'embedder': RecordingEmbedderClient(OpenAIEmbedder(), cassette),
+            'cross_encoder': RecordingCrossEncoderClient(OpenAIRerankerClient(), cassette),
+        }
+    return None, {}
+
+
 async def main():
     parser = argparse.ArgumentParser(
         description='Run eval_graph and optionally build_baseline_graph from the command line.'
@@ -19,21 +52,45 @@ async def main():
     parser.add_argument(
         '--build-baseline', action='store_true', help='If set, also runs build_baseline_graph'
     )
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        '--record-cassette', help='Record model requests and responses to this cassette file'
+    )
+    cassette_group.add_argument(
+        '--replay-cassette', help='Serve model responses from this cassette file instead'
+    )
+    parser.add_argument(
+        '--replay-latency',
+        action='store_true',
+        help='When replaying, delay each response by its recorded latency',
+    )
 
     args = parser.parse_args()
+    cassette, clients = cassette_clients(args)
 
-    # Optionally run the async function
-    if args.build_baseline:
-        print('Running build_baseline_graph...')
-        await build_baseline_graph(
-            multi_session_count=args.multi_session_count, session_length=args.session_length
-        )
+    try:
+        # Optionally run the async function
+        if args.build_baseline:
+            print('Running build_baseline_graph...')
+            await build_baseline_graph(
+                multi_session_count=args.multi_session_count,
+                session_length=args.session_length,
+                **clients,
+            )
 
-    # Always call eval_graph
-    result = await eval_graph(
-        multi_session_count=args.multi_session_count, session_length=args.session_length
-    )
-    print('Result of eval_graph:', result)
+        # Always call eval_graph
+        start = perf_counter()
+        result = await eval_graph(
+            multi_session_count=args.multi_session_count,
+            session_length=args.session_length,
+            **clients,
+        )
+        print('Result of eval_graph:', result)
+        print(f'eval_graph took {perf_counter() - start:.2f}s')
+    finally:
+        if args.record_cassette is not None and cassette is not None:
+            cassette.save()
+            print(f'Recorded {len(cassette)} responses to {args.record_cassette}')
 
 
 if __name__ == '__main__':
@@ -20,9 +20,11 @@ from datetime import datetime, timezone
 import pandas as pd
 
 from graphiti_core import Graphiti
+from graphiti_core.cross_encoder.client import CrossEncoderClient
+from graphiti_core.embedder.client import EmbedderClient
 from graphiti_core.graphiti import AddEpisodeResults
 from graphiti_core.helpers import semaphore_gather
-from graphiti_core.llm_client import LLMConfig, OpenAIClient
+from graphiti_core.llm_client import LLMClient, LLMConfig, OpenAIClient
 from graphiti_core.nodes import EpisodeType
 from graphiti_core.prompts import prompt_library
 from graphiti_core.prompts.eval import EvalAddEpisodeResults
@@ -102,10 +104,24 @@ async def build_graph(
     return add_episode_results, add_episode_context
 
 
-async def build_baseline_graph(multi_session_count: int, session_length: int):
+async def build_baseline_graph(
+    multi_session_count: int,
+    session_length: int,
+    llm_client: LLMClient | None = None,
+    embedder: EmbedderClient | None = None,
+    cross_encoder: CrossEncoderClient | None = None,
+):
     # Use gpt-4.1-mini for graph building baseline
-    llm_client = OpenAIClient(config=LLMConfig(model='gpt-4.1-mini'))
-    graphiti = Graphiti(NEO4J_URI, NEO4j_USER, NEO4j_PASSWORD, llm_client=llm_client)
+    if llm_client is None:
+        llm_client = OpenAIClient(config=LLMConfig(model='gpt-4.1-mini'))
+    graphiti = Graphiti(
+        NEO4J_URI,
+        NEO4j_USER,
+        NEO4j_PASSWORD,
+        llm_client=llm_client,
+        embedder=embedder,
+        cross_encoder=cross_encoder,
+    )
 
     add_episode_results, _ = await build_graph(
         'baseline', multi_session_count, session_length, graphiti
@@ -122,10 +138,23 @@ async def build_baseline_graph(multi_session_count: int, session_length: int):
         json.dump(serializable_baseline_graph_results, file, indent=4, default=str)
 
 
-async def eval_graph(multi_session_count: int, session_length: int, llm_client=None) -> float:
+async def eval_graph(
+    multi_session_count: int,
+    session_length: int,
+    llm_client=None,
+    embedder: EmbedderClient | None = None,
+    cross_encoder: CrossEncoderClient | None = None,
+) -> float:
     if llm_client is None:
         llm_client = OpenAIClient(config=LLMConfig(model='gpt-4.1-mini'))
-    graphiti = Graphiti(NEO4J_URI, NEO4j_USER, NEO4j_PASSWORD, llm_client=llm_client)
+    graphiti = Graphiti(
+        NEO4J_URI,
+        NEO4j_USER,
+        NEO4j_PASSWORD,
+        llm_client=llm_client,
+        embedder=embedder,
+        cross_encoder=cross_encoder,
+    )
     with open('baseline_graph_results.json') as file:
         baseline_results_raw = json.load(file)
 
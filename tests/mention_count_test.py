@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from benchmarks.fakes import FakeCrossEncoder, FakeEmbedder, FakeLLMClient
+from graphiti_core.driver.memory_driver import InMemoryDriver
+from graphiti_core.edges import EpisodicEdge
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.models.edges.edge_db_queries import EPISODIC_EDGE_SAVE
+from graphiti_core.models.nodes.node_db_queries import EPISODIC_NODE_DELETE
+from graphiti_core.nodes import EntityNode, EpisodeType, EpisodicNode
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+LATER = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+class MentionCountDriver:
+    """
+    Records the Cypher queries it receives and applies their effect on mention counts: a
+    MENTIONS edge created by EPISODIC_EDGE_SAVE increments its entity's count, and
+    EPISODIC_NODE_DELETE decrements the count of every entity the episode mentions.
+    """
+
+    provider = 'neo4j'
+    operations = None
+
+    def __init__(self):
+        self.queries: list[tuple[str, dict]] = []
+        self.mentions: dict[str, tuple[str, str]] = {}
+        self.mention_counts: dict[str, int] = {}
+
+    async def execute_query(self, query, **kwargs):
+        self.queries.append((query, kwargs))
+        if query == EPISODIC_EDGE_SAVE and kwargs['uuid'] not in self.mentions:
+            # MERGE only runs ON CREATE SET for a new edge
+            self.mentions[kwargs['uuid']] = (kwargs['episode_uuid'], kwargs['entity_uuid'])
+            entity_uuid = kwargs['entity_uuid']
+            self.mention_counts[entity_uuid] = self.mention_counts.get(entity_uuid, 0) + 1
+        elif query == EPISODIC_NODE_DELETE:
+            for uuid, (episode_uuid, entity_uuid) in list(self.mentions.items()):
+                if episode_uuid == kwargs['uuid']:
+                    del self.mentions[uuid]
+                    self.mention_counts[entity_uuid] -= 1
+        return [], None, None
+
+
+def make_episode(name: str) -> EpisodicNode:
+    return EpisodicNode(
+        name=name,
+        group_id='group',
+        source=EpisodeType.message,
+        source_description='chat',
+        content=name,
+        valid_at=NOW,
+    )
+
+
+def mention(episode: EpisodicNode, entity_uuid: str) -> EpisodicEdge:
+    return EpisodicEdge(
+        source_node_uuid=episode.uuid,
+        target_node_uuid=entity_uuid,
+        group_id='group',
+        created_at=NOW,
+    )
+
+
+def test_mention_count_queries_update_counts():
+    assert 'ON CREATE SET node.mention_count = coalesce(node.mention_count, 0) + 1' in (
+        EPISODIC_EDGE_SAVE
+    )
+    assert 'SET m.mention_count = coalesce(m.mention_count, 1) - 1' in EPISODIC_NODE_DELETE
+
+
+@pytest.mark.asyncio
+async def test_episodic_edge_save_and_episode_delete_maintain_mention_counts():
+    driver = MentionCountDriver()
+    first, second = make_episode('first'), make_episode('second')
+    first_mention = mention(first, 'alice')
+
+    await first_mention.save(driver)
+    await first_mention.save(driver)
+    await mention(second, 'alice').save(driver)
+    await mention(second, 'bob').save(driver)
+
+    query, params = driver.queries[0]
+    assert query == EPISODIC_EDGE_SAVE
+    assert params == {
+        'episode_uuid': first.uuid,
+        'entity_uuid': 'alice',
+        'uuid': first_mention.uuid,
+        'group_id': 'group',
+        'created_at': NOW,
+    }
+    # Saving the same edge again does not count it twice
+    assert driver.mention_counts == {'alice': 2, 'bob': 1}
+
+    await second.delete(driver)
+
+    assert driver.queries[-1] == (EPISODIC_NODE_DELETE, {'uuid': second.uuid})
+    assert driver.mention_counts == {'alice': 1, 'bob': 0}
+
+
+@pytest.mark.asyncio
+async def test_remove_episode_deletes_entities_only_it_mentions():
+    driver = InMemoryDriver()
+    graphiti = Graphiti(
+        graph_driver=driver,
+        llm_client=FakeLLMClient(),
+        embedder=FakeEmbedder(),
+        cross_encoder=FakeCrossEncoder(),
+    )
+    await graphiti.build_indices_and_constraints()
+
+    await graphiti.add_episode('first', 'Alice: I met Bob in Paris.', 'chat', NOW, group_id='group')
+    result = await graphiti.add_episode(
+        'second', 'Bob: Alice and I met Dana.', 'chat', LATER, group_id='group'
+    )
+    await graphiti.remove_episode(result.episode.uuid)
+
+    nodes = await EntityNode.get_by_group_ids(driver, ['group'])
+    assert sorted(node.name for node in nodes) == ['Alice', 'Bob', 'Paris']
+    assert all(node.mention_count == 1 for node in nodes)
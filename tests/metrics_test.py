@@ -0,0 +1,124 @@
+import pytest
+
+from graphiti_core.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    cache_requests,
+    provider_label,
+    query_fingerprint,
+    search_duration,
+    stage_duration,
+)
+from graphiti_core.search.search import search
+from graphiti_core.search.search_cache import SearchResultCache
+from graphiti_core.search.search_config import EdgeSearchConfig, EdgeSearchMethod, SearchConfig
+from graphiti_core.search.search_config_recipes import (
+    COMBINED_HYBRID_SEARCH_CROSS_ENCODER,
+    EDGE_HYBRID_SEARCH_RRF,
+    get_recipe_name,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.tracer import traced
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter('requests_total', 'Requests.', ['method'])
+    depth = registry.gauge('queue_depth', 'Queue depth.', ['group_id'])
+    latency = registry.histogram('latency_seconds', 'Latency.', buckets=(0.1, 1.0))
+
+    requests.inc(method='get')
+    requests.inc(2, method='get')
+    depth.set(3, group_id='a"b')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    assert registry.render().splitlines() == [
+        '# HELP requests_total Requests.',
+        '# TYPE requests_total counter',
+        'requests_total{method="get"} 3',
+        '# HELP queue_depth Queue depth.',
+        '# TYPE queue_depth gauge',
+        'queue_depth{group_id="a\\"b"} 3',
+        '# HELP latency_seconds Latency.',
+        '# TYPE latency_seconds histogram',
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        'latency_seconds_sum 5.55',
+        'latency_seconds_count 3',
+    ]
+
+
+def test_metrics_validate_labels_and_registration():
+    registry = MetricsRegistry()
+    counter = registry.counter('calls_total', 'Calls.', ['provider'])
+
+    with pytest.raises(ValueError):
+        counter.inc(model='gpt')
+    with pytest.raises(ValueError):
+        counter.inc(-1, provider='openai')
+    with pytest.raises(ValueError):
+        registry.gauge('calls_total', 'Calls.')
+
+    assert registry.counter('calls_total', 'Calls.', ['provider']) is counter
+    assert isinstance(counter, Counter)
+    assert isinstance(registry.gauge('g', 'G.'), Gauge)
+    assert isinstance(registry.histogram('h', 'H.'), Histogram)
+
+
+def test_provider_label_and_query_fingerprint():
+    class OpenAIEmbedder:
+        pass
+
+    class VoyageAIEmbedderClient:
+        pass
+
+    class Neo4jDriver:
+        pass
+
+    assert provider_label(OpenAIEmbedder()) == 'openai'
+    assert provider_label(VoyageAIEmbedderClient()) == 'voyageai'
+    assert provider_label(Neo4jDriver()) == 'neo4j'
+
+    assert query_fingerprint('MATCH (n)\n  RETURN n') == query_fingerprint('MATCH (n) RETURN n')
+    assert query_fingerprint('MATCH (n) RETURN n') != query_fingerprint('MATCH (m) RETURN m')
+
+
+def test_get_recipe_name():
+    assert get_recipe_name(EDGE_HYBRID_SEARCH_RRF) == 'EDGE_HYBRID_SEARCH_RRF'
+    config = COMBINED_HYBRID_SEARCH_CROSS_ENCODER.model_copy(update={'limit': 3})
+    assert get_recipe_name(config) == 'COMBINED_HYBRID_SEARCH_CROSS_ENCODER'
+    assert get_recipe_name(SearchConfig()) == 'custom'
+
+
+@traced('metrics_test.stage')
+async def stage() -> list[int]:
+    return [1]
+
+
+@pytest.mark.asyncio
+async def test_traced_records_stage_duration_without_tracer():
+    count = stage_duration.get_count(stage='metrics_test.stage')
+    await stage()
+    assert stage_duration.get_count(stage='metrics_test.stage') == count + 1
+
+
+@pytest.mark.asyncio
+async def test_search_records_duration_and_cache_lookups(clients):
+    config = SearchConfig(edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]))
+    cache = SearchResultCache()
+
+    searches = search_duration.get_count(recipe='custom')
+    hits = cache_requests.get(cache='search', result='hit')
+    misses = cache_requests.get(cache='search', result='miss')
+
+    for _ in range(2):
+        await search(clients, 'alice', ['group'], config, SearchFilters(), cache=cache)
+
+    assert search_duration.get_count(recipe='custom') == searches + 2
+    assert cache_requests.get(cache='search', result='hit') == hits + 1
+    assert cache_requests.get(cache='search', result='miss') == misses + 1
@@ -0,0 +1,57 @@
+import pytest
+
+from benchmarks.micro_benchmarks import BENCHMARKS, compare
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode
+from graphiti_core.utils.bulk_utils import edge_dedupe_candidates, node_dedupe_candidates
+
+
+@pytest.mark.parametrize('name', list(BENCHMARKS))
+def test_benchmark_runs_on_tiny_input(name):
+    BENCHMARKS[name].setup(3)()
+
+
+def test_compare_flags_regressions():
+    def results(rrf_us: float, mmr_us: float):
+        return {
+            'results': [
+                {'benchmark': 'rrf', 'scale': 'small', 'size': 100, 'min_us': rrf_us},
+                {'benchmark': 'mmr', 'scale': 'small', 'size': 10, 'min_us': mmr_us},
+            ]
+        }
+
+    lines, regressions = compare(results(100, 100), results(110, 150), threshold=0.2)
+    assert len(lines) == 2
+    assert [line.split()[0] for line in regressions] == ['mmr']
+
+
+def test_dedupe_candidates_come_from_other_episodes():
+    def node(name: str, embedding: list[float]) -> EntityNode:
+        return EntityNode(name=name, group_id='group', name_embedding=embedding)
+
+    alice = node('Alice', [1.0, 0.0])
+    alice_smith, al, bob = (
+        node('Alice Smith', [0.0, 1.0]),
+        node('Al', [0.9, 0.1]),
+        node('Bob', [0.0, 1.0]),
+    )
+    candidates = node_dedupe_candidates([[alice], [alice_smith, al, bob]])
+    assert candidates[0] == [alice_smith, al]
+
+    def edge(fact: str, embedding: list[float]) -> EntityEdge:
+        return EntityEdge(
+            source_node_uuid='a',
+            target_node_uuid='b',
+            name='KNOWS',
+            fact=fact,
+            group_id='group',
+            created_at=alice.created_at,
+            fact_embedding=embedding,
+        )
+
+    knows, left = edge('Alice knows Bob', [1.0, 0.0]), edge('Dave left', [1.0, 0.0])
+    bob_knows = edge('Bob knows Carol', [0.0, 1.0])
+    assert edge_dedupe_candidates([[knows, left], [bob_knows]]) == [
+        [[bob_knows], []],
+        [[knows]],
+    ]
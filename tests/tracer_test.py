@@ -0,0 +1,124 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from graphiti_core.search.search import search
+from graphiti_core.search.search_config import (
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.tracer import (
+    OpenTelemetryTracer,
+    Tracer,
+    TracerSpan,
+    add_span_attributes,
+    trace_span,
+    traced,
+    use_tracer,
+)
+
+
+class RecordingSpan(TracerSpan):
+    def __init__(self, name: str, parent: 'RecordingSpan | None'):
+        self.name = name
+        self.parent = parent
+        self.attributes: dict = {}
+        self.status: str | None = None
+        self.exceptions: list[BaseException] = []
+
+    def add_attributes(self, attributes):
+        self.attributes.update(attributes)
+
+    def set_status(self, status, description=None):
+        self.status = status
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.spans: list[RecordingSpan] = []
+        self.stack: list[RecordingSpan] = []
+
+    @contextmanager
+    def start_span(self, name):
+        span = RecordingSpan(name, self.stack[-1] if self.stack else None)
+        self.spans.append(span)
+        self.stack.append(span)
+        try:
+            yield span
+        finally:
+            self.stack.pop()
+
+    def span(self, name) -> RecordingSpan:
+        return next(span for span in self.spans if span.name == name)
+
+
+@traced('double')
+async def double(values: list[int]) -> list[int]:
+    add_span_attributes({'input_count': len(values)})
+    return values * 2
+
+
+@pytest.mark.asyncio
+async def test_traced_records_nested_spans_and_attributes():
+    tracer = RecordingTracer()
+    with use_tracer(tracer), trace_span('outer', {'group_id': 'group'}):
+        await double([1, 2])
+
+    outer, inner = tracer.span('outer'), tracer.span('double')
+    assert outer.attributes == {'group_id': 'group'}
+    assert inner.parent is outer
+    assert inner.attributes == {'input_count': 2, 'result_count': 4}
+
+
+def test_trace_span_records_exceptions():
+    tracer = RecordingTracer()
+    with pytest.raises(ValueError), use_tracer(tracer), trace_span('failing'):
+        raise ValueError('boom')
+
+    span = tracer.span('failing')
+    assert span.status == 'error'
+    assert isinstance(span.exceptions[0], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_no_spans_without_tracer():
+    assert await double([1]) == [1, 1]
+    add_span_attributes({'ignored': True})
+
+
+def test_open_telemetry_tracer_prefixes_names_and_converts_attributes():
+    otel_span = MagicMock()
+    otel_tracer = MagicMock()
+    otel_tracer.start_as_current_span.return_value.__enter__.return_value = otel_span
+
+    with use_tracer(OpenTelemetryTracer(otel_tracer)), trace_span('search') as span:
+        span.add_attributes({'group_ids': ('a', None), 'limit': 10, 'center': None})
+
+    assert otel_tracer.start_as_current_span.call_args.args == ('graphiti.search',)
+    otel_span.set_attribute.assert_any_call('group_ids', ['a', 'None'])
+    otel_span.set_attribute.assert_any_call('limit', 10)
+    assert otel_span.set_attribute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_spans(clients):
+    config = SearchConfig(edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]))
+
+    tracer = RecordingTracer()
+    with use_tracer(tracer):
+        await search(clients, 'alice', ['group'], config, SearchFilters())
+
+    search_span = tracer.span('search')
+    assert search_span.attributes['group_ids'] == ['group']
+    assert search_span.attributes['edge_count'] == 1
+    assert tracer.span('edge_search').attributes['search_methods'] == ['bm25']
+    assert tracer.span('edge_fulltext_search').attributes['result_count'] == 1
+    assert tracer.span('edge_search').attributes['result_count'] == 1
+    # Pure in-process rankers are covered by their search stage's span
+    assert 'rrf' not in [span.name for span in tracer.spans]
@@ -0,0 +1,84 @@
+import pytest
+
+from graphiti_core.helpers import semaphore_gather
+from graphiti_core.llm_client.client import LLMClient
+from graphiti_core.llm_client.config import LLMConfig
+from graphiti_core.prompts.models import Message
+from graphiti_core.usage import LLMUsage, ModelPrice, PromptUsage, collect_usage, llm_call
+
+
+class UsageLLMClient(LLMClient):
+    async def _generate_response(
+        self, messages, response_model=None, max_tokens=0, model_size=None
+    ):
+        self._record_token_usage(self.model, 10, 2)
+        return {}
+
+
+def messages() -> list[Message]:
+    return [Message(role='system', content='system'), Message(role='user', content='user')]
+
+
+@pytest.mark.asyncio
+async def test_usage_is_collected_by_prompt_and_model():
+    client = UsageLLMClient(LLMConfig(model='small-model'))
+
+    with collect_usage() as usage:
+        await semaphore_gather(
+            client.generate_response(messages(), prompt_name='extract_nodes.extract_message'),
+            client.generate_response(messages(), prompt_name='extract_nodes.extract_message'),
+            client.generate_response(messages(), prompt_name='dedupe_nodes.nodes'),
+        )
+        await client.generate_response(messages())
+
+    summary = usage.summary()
+    by_prompt = {prompt.prompt_name: prompt for prompt in summary.prompts}
+    assert set(by_prompt) == {'dedupe_nodes.nodes', 'extract_nodes.extract_message', 'unknown'}
+    extract_usage = by_prompt['extract_nodes.extract_message']
+    assert (extract_usage.model, extract_usage.calls) == ('small-model', 2)
+    assert (extract_usage.input_tokens, extract_usage.output_tokens) == (20, 4)
+    assert (summary.calls, summary.input_tokens, summary.output_tokens) == (4, 40, 8)
+
+
+@pytest.mark.asyncio
+async def test_nested_usage_counts_towards_outer_accumulator():
+    client = UsageLLMClient(LLMConfig(model='model'))
+
+    with collect_usage() as outer:
+        await client.generate_response(messages(), prompt_name='extract_edges.edge')
+        with collect_usage() as inner:
+            await client.generate_response(messages(), prompt_name='dedupe_edges.resolve_edge')
+
+    assert [prompt.prompt_name for prompt in inner.summary().prompts] == [
+        'dedupe_edges.resolve_edge'
+    ]
+    assert outer.summary().calls == 2
+
+
+def test_calls_outside_accumulator_are_not_recorded():
+    with llm_call('extract_nodes.extract_text', 'model'):
+        pass
+
+    with collect_usage() as usage:
+        pass
+    assert usage.summary().prompts == []
+
+
+def test_cost_uses_prices_by_model():
+    usage = LLMUsage(
+        prompts=[
+            PromptUsage(
+                prompt_name='extract_nodes', model='a', input_tokens=2_000_000, output_tokens=0
+            ),
+            PromptUsage(
+                prompt_name='dedupe_nodes', model='b', input_tokens=1_000_000, output_tokens=1_000
+            ),
+            PromptUsage(prompt_name='dedupe_nodes', model='unpriced', input_tokens=5),
+        ]
+    )
+    prices = {
+        'a': ModelPrice(input_per_million=0.5, output_per_million=2),
+        'b': ModelPrice(input_per_million=1, output_per_million=4000),
+    }
+
+    assert usage.cost(prices) == pytest.approx(1.0 + 1.0 + 4.0)
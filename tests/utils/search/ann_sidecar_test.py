@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode
+from graphiti_core.search.ann_sidecar import AnnSidecar, attach_ann_sidecar
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import (
+    get_edge_invalidation_candidates,
+    get_relevant_edges,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_edge(uuid: str, source: str, target: str, embedding: list[float]) -> EntityEdge:
+    return EntityEdge(
+        uuid=uuid,
+        source_node_uuid=source,
+        target_node_uuid=target,
+        name='RELATES_TO',
+        fact=uuid,
+        group_id='group',
+        created_at=NOW,
+        fact_embedding=embedding,
+    )
+
+
+class FakeGraphDriver:
+    """Serves sidecar rebuilds and uuid lookups from a list of facts."""
+
+    provider = 'neo4j'
+    operations = None
+
+    def __init__(self, edges: list[EntityEdge]):
+        self.edges = {edge.uuid: edge for edge in edges}
+        self.queries: list[str] = []
+        self.fetched: list[list[str]] = []
+
+    async def execute_query(self, query, **kwargs):
+        self.queries.append(query)
+        if 'AS embedding' in query:
+            if 'RELATES_TO' not in query or kwargs['cursor'] is not None:
+                return [], None, None
+            records = [
+                {
+                    'uuid': edge.uuid,
+                    'group_id': edge.group_id,
+                    'source_node_uuid': edge.source_node_uuid,
+                    'target_node_uuid': edge.target_node_uuid,
+                    'embedding': edge.fact_embedding,
+                }
+                for edge in sorted(self.edges.values(), key=lambda edge: edge.uuid, reverse=True)
+            ]
+            return records, None, None
+
+        if 'uuids' in kwargs:
+            self.fetched.append(kwargs['uuids'])
+            records = [
+                {**self.edges[uuid].model_dump(mode='json'), 'attributes': {}}
+                for uuid in kwargs['uuids']
+                if uuid in self.edges
+            ]
+            return records, None, None
+
+        # Edge deletes
+        return [], None, None
+
+
+def test_sidecar_persists_to_memory_mapped_files(tmp_path):
+    sidecar = AnnSidecar(str(tmp_path))
+    nodes = [
+        EntityNode(name=str(i), group_id='group', name_embedding=[1.0, i / 40]) for i in range(40)
+    ]
+    sidecar.add_nodes(nodes)
+    sidecar.add_edges(
+        [
+            make_edge('ab', nodes[0].uuid, nodes[1].uuid, [1.0, 0.0]),
+            make_edge('bc', nodes[1].uuid, nodes[2].uuid, [0.0, 1.0]),
+        ]
+    )
+    sidecar.remove_nodes('group', [nodes[2].uuid])
+    sidecar.flush()
+
+    reopened = AnnSidecar(str(tmp_path))
+
+    assert reopened.search_nodes('group', [1.0, 0.0], 0.5, 2) == [nodes[0].uuid, nodes[1].uuid]
+    assert reopened.search_edges_touching('group', [1.0, 1.0], [nodes[1].uuid], 0.0, 10) == ['ab']
+    assert reopened.get_edge_embedding('group', 'ab') == [1.0, 0.0]
+
+    reopened.add_nodes([EntityNode(name='other', group_id='group', name_embedding=[1.0] * 3)])
+    assert reopened.stale_groups == {'group'}
+    assert not AnnSidecar(str(tmp_path)).serves('group')
+
+
+@pytest.mark.asyncio
+async def test_relevant_edges_are_ranked_in_the_sidecar():
+    edges = [
+        make_edge('close', 'a', 'b', [1.0, 0.1]),
+        make_edge('far', 'b', 'a', [-1.0, 0.0]),
+        make_edge('elsewhere', 'c', 'd', [1.0, 0.0]),
+        make_edge('touching', 'a', 'c', [0.9, 0.2]),
+    ]
+    driver = FakeGraphDriver(edges)
+    sidecar = AnnSidecar()
+    attach_ann_sidecar(driver, sidecar)
+
+    extracted = make_edge('new', 'a', 'b', [1.0, 0.0])
+    assert not sidecar.serves('group')
+    await get_relevant_edges(driver, [extracted], SearchFilters())
+    assert 'vector.similarity.cosine' in driver.queries[-1]
+
+    await sidecar.rebuild(driver)
+    driver.queries.clear()
+
+    [related] = await get_relevant_edges(driver, [extracted], SearchFilters())
+    [candidates] = await get_edge_invalidation_candidates(
+        driver,
+        [extracted],
+        SearchFilters(),
+        0.2,
+    )
+
+    assert [edge.uuid for edge in related] == ['close']
+    assert related[0].fact_embedding == pytest.approx([1.0, 0.1])
+    assert [edge.uuid for edge in candidates] == ['close', 'touching']
+    assert driver.fetched[-2:] == [['close'], ['close', 'touching']]
+    assert not any('cosine' in query for query in driver.queries)
+
+    await edges[0].delete(driver)
+    [related] = await get_relevant_edges(driver, [extracted], SearchFilters())
+    assert related == []
@@ -0,0 +1,175 @@
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+import pytest
+
+from graphiti_core.search.search_filters import SearchFilters
+from graphiti_core.search.search_utils import edge_bfs_search, node_bfs_search
+
+NOW = datetime.now(timezone.utc).isoformat()
+
+
+def node_record(source: str, target: str) -> dict:
+    return {
+        'uuid': target,
+        'name': target,
+        'group_id': 'group',
+        'labels': ['Entity'],
+        'created_at': NOW,
+        'summary': '',
+        'attributes': {},
+        'matches': True,
+    }
+
+
+def edge_records(
+    mentions: frozenset[tuple[str, str]] = frozenset(),
+) -> Callable[[str, str], dict]:
+    """Edge record factory; the given (episode, entity) pairs are MENTIONS edges."""
+
+    def record(source: str, target: str) -> dict:
+        return {
+            'bfs_target_uuid': target,
+            'matches': (source, target) not in mentions,
+            'uuid': f'{source}->{target}',
+            'group_id': 'group',
+            'source_node_uuid': source,
+            'target_node_uuid': target,
+            'created_at': NOW,
+            'name': 'RELATES_TO',
+            'fact': f'{source}->{target}',
+            'episodes': [],
+            'expired_at': None,
+            'valid_at': None,
+            'invalid_at': None,
+            'attributes': {},
+        }
+
+    return record
+
+
+class FakeGraphDriver:
+    """
+    Answers the per-level BFS queries from an in-memory adjacency list, with the records built
+    by record(source, target).
+    """
+
+    provider = 'neo4j'
+    operations = None
+
+    def __init__(self, edges: list[tuple[str, str]], record: Callable[[str, str], dict]):
+        self.adjacency: dict[str, list[str]] = defaultdict(list)
+        for source, target in edges:
+            self.adjacency[source].append(target)
+        self.record = record
+        self.levels: list[list[str]] = []
+        self.rows_returned = 0
+
+    async def execute_query(self, query, **kwargs):
+        frontier = kwargs['frontier']
+        self.levels.append(frontier)
+        visited_nodes = set(kwargs.get('visited_node_uuids', []))
+        visited_edges = set(kwargs.get('visited_edge_uuids', []))
+
+        records = []
+        for source in frontier:
+            for target in self.adjacency[source]:
+                edge_uuid = f'{source}->{target}'
+                if target in visited_nodes or edge_uuid in visited_edges:
+                    continue
+                records.append(self.record(source, target))
+        records = list({record['uuid']: record for record in records}.values())
+        records = records[: kwargs['level_limit']]
+        self.rows_returned += len(records)
+        return records, None, None
+
+
+def hub_graph(spokes: int, children: int) -> list[tuple[str, str]]:
+    edges = [('origin', 'hub')]
+    for i in range(spokes):
+        edges.append(('hub', f'spoke{i}'))
+        edges.append((f'spoke{i}', 'hub'))
+        for j in range(children):
+            edges.append((f'spoke{i}', f'child{i}_{j}'))
+    return edges
+
+
+def count_paths(edges: list[tuple[str, str]], origin: str, max_depth: int) -> int:
+    """Number of paths a variable-length pattern of 1..max_depth hops would expand."""
+    adjacency: dict[str, list[str]] = defaultdict(list)
+    for source, target in edges:
+        adjacency[source].append(target)
+
+    paths = 0
+    frontier = [origin]
+    for _ in range(max_depth):
+        frontier = [target for source in frontier for target in adjacency[source]]
+        paths += len(frontier)
+    return paths
+
+
+@pytest.mark.asyncio
+async def test_node_bfs_search_respects_max_depth():
+    driver = FakeGraphDriver([('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'e')], node_record)
+
+    nodes = await node_bfs_search(driver, ['a'], SearchFilters(), bfs_max_depth=2, limit=10)
+
+    assert [node.uuid for node in nodes] == ['b', 'c']
+    assert driver.levels == [['a'], ['b']]
+
+
+@pytest.mark.asyncio
+async def test_node_bfs_search_does_not_revisit_nodes():
+    driver = FakeGraphDriver([('a', 'b'), ('b', 'a'), ('b', 'c'), ('c', 'b')], node_record)
+
+    nodes = await node_bfs_search(driver, ['a'], SearchFilters(), bfs_max_depth=3, limit=10)
+
+    assert [node.uuid for node in nodes] == ['b', 'c']
+    assert driver.levels == [['a'], ['b'], ['c']]
+
+
+@pytest.mark.asyncio
+async def test_node_bfs_search_stops_at_limit():
+    driver = FakeGraphDriver(hub_graph(spokes=1000, children=10), node_record)
+
+    nodes = await node_bfs_search(driver, ['hub'], SearchFilters(), bfs_max_depth=3, limit=10)
+
+    assert len(nodes) == 10
+    assert len(driver.levels) == 1
+
+
+@pytest.mark.asyncio
+async def test_node_bfs_search_caps_frontier():
+    driver = FakeGraphDriver(hub_graph(spokes=500, children=3), node_record)
+
+    await node_bfs_search(
+        driver, ['origin'], SearchFilters(), bfs_max_depth=3, limit=1000, max_frontier=5
+    )
+
+    assert all(len(frontier) <= 5 for frontier in driver.levels)
+
+
+@pytest.mark.asyncio
+async def test_edge_bfs_search_traverses_mentions_without_returning_them():
+    driver = FakeGraphDriver(
+        [('episode', 'a'), ('a', 'b'), ('b', 'c')], edge_records(frozenset({('episode', 'a')}))
+    )
+
+    edges = await edge_bfs_search(driver, ['episode'], 2, SearchFilters(), limit=10)
+
+    assert [edge.uuid for edge in edges] == ['a->b']
+
+
+@pytest.mark.asyncio
+async def test_edge_bfs_search_on_hub_graph_is_bounded():
+    edges = hub_graph(spokes=2000, children=20)
+    driver = FakeGraphDriver(edges, edge_records())
+    limit = 20
+
+    results = await edge_bfs_search(driver, ['origin'], 3, SearchFilters(), limit=limit)
+
+    assert len(results) == limit
+    # A variable-length {1,3} pattern would expand every path through the hub
+    assert count_paths(edges, 'origin', 3) > 40_000
+    assert driver.rows_returned <= len(driver.levels) * (limit + 100)
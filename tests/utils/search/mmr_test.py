@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.helpers import normalize_l2
+from graphiti_core.search.search_utils import get_embeddings_for_edges, maximal_marginal_relevance
+
+
+def pairwise_mmr(
+    query_vector: list[float], candidates: dict[str, list[float]], mmr_lambda: float
+) -> list[str]:
+    """Reference greedy MMR computing every similarity with a separate dot product."""
+    query_array = normalize_l2(query_vector)
+    vectors = {uuid: normalize_l2(embedding) for uuid, embedding in candidates.items()}
+    selected: list[str] = []
+    remaining = list(candidates.keys())
+    while remaining:
+
+        def score(uuid: str) -> float:
+            redundancy = max([0.0] + [np.dot(vectors[uuid], vectors[s]) for s in selected])
+            return mmr_lambda * np.dot(query_array, vectors[uuid]) - (1 - mmr_lambda) * redundancy
+
+        best = max(remaining, key=score)
+        selected.append(best)
+        remaining.remove(best)
+    return selected
+
+
+def random_candidates(n: int, dim: int = 64, seed: int = 0) -> dict[str, list[float]]:
+    rng = np.random.default_rng(seed)
+    return {f'uuid{i}': rng.standard_normal(dim).tolist() for i in range(n)}
+
+
+def test_mmr_prefers_diverse_candidates():
+    candidates = {
+        'a': [1.0, 0.0, 0.0],
+        'a_duplicate': [1.0, 0.0, 0.0],
+        'b': [0.0, 1.0, 0.3],
+    }
+
+    reranked = maximal_marginal_relevance([1.0, 1.0, 0.0], candidates, mmr_lambda=0.5)
+
+    assert reranked == ['a', 'b', 'a_duplicate']
+
+
+def test_mmr_matches_pairwise_reference():
+    candidates = random_candidates(50)
+    query_vector = np.random.default_rng(1).standard_normal(64).tolist()
+
+    assert maximal_marginal_relevance(query_vector, candidates, 0.5) == pairwise_mmr(
+        query_vector, candidates, 0.5
+    )
+
+
+def test_mmr_respects_min_score_and_max_results():
+    candidates = {'a': [1.0, 0.0], 'b': [0.0, 1.0], 'c': [-1.0, 0.0], 'zero': [0.0, 0.0]}
+
+    assert maximal_marginal_relevance([1.0, 0.0], candidates, 1.0, min_score=0.0) == [
+        'a',
+        'b',
+        'zero',
+    ]
+    assert maximal_marginal_relevance([1.0, 0.0], candidates, 1.0, max_results=1) == ['a']
+    assert maximal_marginal_relevance([1.0, 0.0], {}, 1.0) == []
+
+
+def test_mmr_dissimilarity_to_selected_candidates_is_not_a_bonus():
+    candidates = {'a': [1.0, 0.0], 'opposite': [-1.0, 0.01]}
+
+    assert maximal_marginal_relevance([1.0, 0.0], candidates, 0.5, min_score=-0.1) == ['a']
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_skips_query_when_embeddings_are_loaded():
+    class FailingDriver:
+        async def execute_query(self, query, **kwargs):
+            raise AssertionError('embeddings should not be refetched')
+
+    edge = EntityEdge(
+        uuid='edge',
+        source_node_uuid='a',
+        target_node_uuid='b',
+        group_id='group',
+        name='RELATES_TO',
+        fact='a relates to b',
+        fact_embedding=[0.1, 0.2],
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    )
+
+    assert await get_embeddings_for_edges(FailingDriver(), [edge]) == {'edge': [0.1, 0.2]}
+
+
+@pytest.mark.parametrize('n', [50, 200, 1000])
+def test_mmr_benchmark(n):
+    candidates = random_candidates(n, dim=1024)
+    query_vector = np.random.default_rng(1).standard_normal(1024).tolist()
+
+    start = perf_counter()
+    reranked = maximal_marginal_relevance(query_vector, candidates, 0.5, max_results=n // 5)
+    elapsed = perf_counter() - start
+
+    assert len(reranked) == n // 5
+    # The previous implementation computed each of the n^2 similarities with a separate dot product
+    assert elapsed < 2
@@ -0,0 +1,141 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import pytest
+
+from graphiti_core.edges import EntityEdge
+from graphiti_core.search.node_distance_cache import NodeDistanceCache, get_node_distance_cache
+from graphiti_core.search.search_utils import get_node_distances, node_distance_reranker
+
+
+class FakeGraphDriver:
+    """Answers neighborhood expansion queries from an undirected in-memory adjacency list."""
+
+    provider = 'neo4j'
+    operations = None
+
+    def __init__(self, edges: list[tuple[str, str]]):
+        self.adjacency: dict[str, set[str]] = defaultdict(set)
+        for source, target in edges:
+            self.add_edge(source, target)
+        self.queries = 0
+        self.frontiers: list[list[str]] = []
+
+    def add_edge(self, source: str, target: str):
+        self.adjacency[source].add(target)
+        self.adjacency[target].add(source)
+
+    async def execute_query(self, query, **kwargs):
+        if 'frontier' not in kwargs:
+            # Edge save
+            return [], None, None
+
+        self.queries += 1
+        self.frontiers.append(kwargs['frontier'])
+        neighbors = {
+            neighbor for node_uuid in kwargs['frontier'] for neighbor in self.adjacency[node_uuid]
+        }
+        return [{'uuid': neighbor} for neighbor in sorted(neighbors)], None, None
+
+
+def test_node_distance_cache_evicts_least_recently_used():
+    cache = NodeDistanceCache(max_center_nodes=2)
+    cache.put('a', 2, {'a': 0})
+    cache.put('b', 2, {'b': 0})
+    assert cache.get('a', 2) == {'a': 0}
+
+    cache.put('c', 2, {'c': 0})
+
+    assert cache.get('b', 2) is None
+    assert cache.get('a', 2) is not None
+    assert cache.get('c', 2) is not None
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_node_distance_cache_invalidates_neighborhoods():
+    cache = NodeDistanceCache()
+    cache.put('a', 2, {'a': 0, 'b': 1, 'c': 2})
+    cache.put('d', 2, {'d': 0, 'e': 1})
+
+    cache.invalidate(['c'])
+
+    assert cache.get('a', 2) is None
+    assert cache.get('d', 2) == {'d': 0, 'e': 1}
+    assert 'b' not in cache.entries_by_node
+
+
+@pytest.mark.asyncio
+async def test_node_distance_reranker_scores_multi_hop_distances():
+    driver = FakeGraphDriver([('center', 'a'), ('a', 'b'), ('b', 'c'), ('c', 'd')])
+
+    reranked = await node_distance_reranker(
+        driver, ['d', 'c', 'b', 'a', 'unrelated'], 'center', max_depth=3
+    )
+
+    assert reranked == ['a', 'b', 'c', 'd', 'unrelated']
+    assert await node_distance_reranker(driver, ['c', 'b'], 'center', min_score=0.5) == ['b']
+
+
+@pytest.mark.asyncio
+async def test_node_distance_reranker_reuses_cached_neighborhood_until_write():
+    driver = FakeGraphDriver([('center', 'a'), ('a', 'b')])
+
+    await node_distance_reranker(driver, ['b', 'a'], 'center', max_depth=2)
+    queries = driver.queries
+    assert await node_distance_reranker(driver, ['b', 'a'], 'center', max_depth=2) == ['a', 'b']
+    assert driver.queries == queries
+    assert get_node_distance_cache(driver).hits == 1
+
+    # A new edge from the center makes b a direct neighbor
+    driver.add_edge('center', 'b')
+    await EntityEdge(
+        source_node_uuid='center',
+        target_node_uuid='b',
+        group_id='group',
+        name='RELATES_TO',
+        fact='center relates to b',
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    ).save(driver)
+
+    assert await node_distance_reranker(driver, ['b', 'a'], 'center', max_depth=2) == ['b', 'a']
+    assert driver.queries > queries
+
+
+def relates_to(source: str, target: str) -> EntityEdge:
+    return EntityEdge(
+        source_node_uuid=source,
+        target_node_uuid=target,
+        group_id='group',
+        name='RELATES_TO',
+        fact=f'{source} relates to {target}',
+        episodes=[],
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_edge_save_within_a_cached_neighborhood_invalidates_it():
+    driver = FakeGraphDriver([('center', 'a'), ('a', 'b'), ('x', 'y')])
+    cache = get_node_distance_cache(driver)
+    await get_node_distances(driver, 'center', 2)
+
+    await relates_to('x', 'y').save(driver)
+    assert cache.get('center', 2) is not None
+
+    driver.add_edge('b', 'c')
+    await relates_to('b', 'c').save(driver)
+    assert cache.get('center', 2) is None
+
+    assert await get_node_distances(driver, 'center', 3) == {'center': 0, 'a': 1, 'b': 2, 'c': 3}
+
+
+@pytest.mark.asyncio
+async def test_node_distances_expand_at_most_max_frontier_nodes_per_level():
+    driver = FakeGraphDriver([('center', hub) for hub in 'abc'] + [('c', 'd')])
+
+    distances = await get_node_distances(driver, 'center', 2, max_frontier=2)
+
+    assert distances == {'center': 0, 'a': 1, 'b': 1, 'c': 1}
+    assert driver.frontiers == [['center'], ['a', 'b']]
@@ -0,0 +1,161 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from graphiti_core.edges import CommunityEdge, EpisodicEdge
+from graphiti_core.nodes import CommunityNode, EpisodeType, EpisodicNode
+from graphiti_core.search import search_cache
+from graphiti_core.search.search import search
+from graphiti_core.search.search_cache import SearchResultCache, record_graph_write
+from graphiti_core.search.search_config import (
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    SearchConfig,
+    SearchResults,
+)
+from graphiti_core.search.search_filters import SearchFilters
+from tests.conftest import EdgeGraphDriver
+
+CONFIG = SearchConfig(edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]))
+
+EMPTY_RESULTS = SearchResults(edges=[], nodes=[], episodes=[], communities=[])
+
+
+async def cached_search(clients, cache, query='Alice  Bob', group_ids=None):
+    if group_ids is None:
+        group_ids = ['group']
+    return await search(clients, query, group_ids, CONFIG, SearchFilters(), cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_skips_embedding_and_queries(clients, edge_driver, stub_embedder):
+    cache = SearchResultCache()
+
+    first = await cached_search(clients, cache)
+    queries = edge_driver.queries
+    second = await cached_search(clients, cache, query='alice bob')
+
+    assert [edge.uuid for edge in second.edges] == [edge.uuid for edge in first.edges]
+    assert edge_driver.queries == queries
+    assert len(stub_embedder.calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_write_to_searched_group_invalidates(clients, edge_driver):
+    cache = SearchResultCache()
+
+    await cached_search(clients, cache)
+    queries = edge_driver.queries
+    record_graph_write(edge_driver, ['other'])
+    await cached_search(clients, cache)
+    assert edge_driver.queries == queries
+
+    record_graph_write(edge_driver, ['group'])
+    await cached_search(clients, cache)
+    assert edge_driver.queries == 2 * queries
+
+    record_graph_write(edge_driver)
+    await cached_search(clients, cache)
+    assert edge_driver.queries == 3 * queries
+
+
+@pytest.mark.asyncio
+async def test_any_write_invalidates_search_across_all_groups(clients, edge_driver):
+    cache = SearchResultCache()
+
+    await search(clients, 'alice', None, CONFIG, SearchFilters(), cache=cache)
+    queries = edge_driver.queries
+    record_graph_write(edge_driver, ['other'])
+    await search(clients, 'alice', None, CONFIG, SearchFilters(), cache=cache)
+
+    assert edge_driver.queries == 2 * queries
+
+
+@pytest.mark.asyncio
+async def test_episode_and_community_writes_invalidate(clients, edge_driver):
+    cache = SearchResultCache()
+    now = datetime.now(timezone.utc)
+    episode = EpisodicNode(
+        name='episode',
+        group_id='group',
+        source=EpisodeType.text,
+        source_description='',
+        content='Alice met Bob',
+        valid_at=now,
+    )
+    mention = EpisodicEdge(
+        group_id='group', source_node_uuid=episode.uuid, target_node_uuid='a', created_at=now
+    )
+    community = CommunityNode(name='community', group_id='group')
+    member = CommunityEdge(
+        group_id='group', source_node_uuid=community.uuid, target_node_uuid='a', created_at=now
+    )
+
+    for write in (
+        episode.save,
+        mention.save,
+        community.save,
+        member.save,
+        mention.delete,
+        episode.delete,
+    ):
+        await cached_search(clients, cache)
+        misses = cache.misses
+        await write(edge_driver)
+        await cached_search(clients, cache)
+        assert cache.misses == misses + 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_above_threshold(clients, edge_driver, stub_embedder):
+    stub_embedder.vectors = {'alice': [1.0, 0.0], 'alice smith': [0.99, 0.1], 'bob': [0.0, 1.0]}
+    cache = SearchResultCache(semantic_threshold=0.95)
+
+    await cached_search(clients, cache, query='alice')
+    queries = edge_driver.queries
+    await cached_search(clients, cache, query='alice smith')
+    assert edge_driver.queries == queries
+    assert cache.semantic_hits == 1
+
+    await cached_search(clients, cache, query='bob')
+    assert edge_driver.queries == 2 * queries
+
+
+@pytest.mark.asyncio
+async def test_results_are_not_served_through_another_driver(clients, edge_driver):
+    cache = SearchResultCache()
+    other_driver = EdgeGraphDriver()
+    other_clients = clients.model_copy(update={'driver': other_driver})
+
+    await cached_search(clients, cache)
+    record_graph_write(other_driver, ['group'])
+    await cached_search(other_clients, cache)
+
+    assert other_driver.queries > 0
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_entries_expire_after_ttl(edge_driver, monkeypatch):
+    cache = SearchResultCache(ttl_seconds=10)
+    key = cache.key(edge_driver, 'a', CONFIG, SearchFilters(), ['group'])
+    cache.put(key, cache.version(edge_driver, key), EMPTY_RESULTS)
+
+    expiry = search_cache.monotonic() + 11
+    monkeypatch.setattr(search_cache, 'monotonic', lambda: expiry)
+
+    assert cache.get(edge_driver, key) is None
+
+
+def test_cache_evicts_least_recently_used(edge_driver):
+    cache = SearchResultCache(max_entries=2)
+    keys = [cache.key(edge_driver, query, CONFIG, SearchFilters(), ['group']) for query in 'abc']
+    for key in keys[:2]:
+        cache.put(key, cache.version(edge_driver, key), EMPTY_RESULTS)
+
+    assert cache.get(edge_driver, keys[0]) is not None
+    cache.put(keys[2], cache.version(edge_driver, keys[2]), EMPTY_RESULTS)
+
+    assert cache.get(edge_driver, keys[1]) is None
+    assert cache.get(edge_driver, keys[0]) is not None
+    assert cache.get(edge_driver, keys[2]) is not None
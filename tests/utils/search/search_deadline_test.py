@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from graphiti_core.search.search import search
+from graphiti_core.search.search_config import (
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import SearchFilters
+
+CONFIG = SearchConfig(
+    edge_config=EdgeSearchConfig(search_methods=[EdgeSearchMethod.bm25]),
+    node_config=NodeSearchConfig(search_methods=[NodeSearchMethod.bm25]),
+)
+
+
+@pytest.mark.asyncio
+async def test_search_returns_partial_results_at_deadline(clients, edge_driver):
+    edge_driver.delay = 5
+
+    results = await search(clients, 'alice bob', None, CONFIG, SearchFilters(), timeout=0.2)
+
+    assert [edge.uuid for edge in results.edges] == ['edge']
+    assert results.nodes == []
+    assert results.timed_out_stages == ['nodes']
+    assert all(timeout is not None and timeout <= 0.2 for timeout in edge_driver.timeouts)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_search_cancels_its_stages(clients, edge_driver):
+    edge_driver.delay = 5
+    search_task = asyncio.create_task(
+        search(clients, 'alice bob', None, CONFIG, SearchFilters(), timeout=10)
+    )
+    await asyncio.sleep(0.1)
+
+    search_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await search_task
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_search_skips_stages_when_embedding_exceeds_deadline(
+    clients, edge_driver, stub_embedder
+):
+    stub_embedder.delay = 5
+
+    results = await search(clients, 'alice bob', None, CONFIG, SearchFilters(), timeout=0.1)
+
+    assert results.skipped_stages == ['edges', 'nodes']
+    assert edge_driver.timeouts == []
+
+
+@pytest.mark.asyncio
+async def test_search_without_timeout_has_no_query_deadline(clients, edge_driver):
+    results = await search(clients, 'alice bob', None, CONFIG, SearchFilters())
+
+    assert results.timed_out_stages == [] and results.skipped_stages == []
+    assert set(edge_driver.timeouts) == {None}
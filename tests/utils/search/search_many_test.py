@@ -0,0 +1,117 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from graphiti_core.search.search import search, search_many
+from graphiti_core.search.search_cache import SearchResultCache
+from graphiti_core.search.search_config import (
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import SearchFilters
+
+NOW = datetime.now(timezone.utc).isoformat()
+
+
+def node_record(uuid: str) -> dict:
+    return {
+        'uuid': uuid,
+        'name': uuid,
+        'group_id': 'group',
+        'created_at': NOW,
+        'summary': '',
+        'labels': ['Entity'],
+        'attributes': {},
+    }
+
+
+class FakeGraphDriver:
+    """Answers batched search queries with one result per query index."""
+
+    provider = 'neo4j'
+    operations = None
+
+    def __init__(self, edge_record):
+        self.edge_record = edge_record
+        self.queries: list[str] = []
+
+    async def execute_query(self, query, **kwargs):
+        self.queries.append(query)
+        batch = kwargs.get('queries') or kwargs.get('search_vectors')
+        method = 'fulltext' if 'queries' in kwargs else 'similarity'
+        if 'RELATES_TO' in query:
+            return (
+                [
+                    {
+                        'query_index': q['index'],
+                        'edges': [self.edge_record(f'{method}-edge-{q["index"]}')],
+                    }
+                    for q in batch
+                ],
+                None,
+                None,
+            )
+        return (
+            [
+                {'query_index': q['index'], 'nodes': [node_record(f'{method}-node-{q["index"]}')]}
+                for q in batch
+            ],
+            None,
+            None,
+        )
+
+
+CONFIG = SearchConfig(
+    edge_config=EdgeSearchConfig(
+        search_methods=[EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity]
+    ),
+    node_config=NodeSearchConfig(
+        search_methods=[NodeSearchMethod.bm25, NodeSearchMethod.cosine_similarity]
+    ),
+)
+
+
+@pytest.mark.asyncio
+async def test_search_many_batches_embeddings_and_queries(clients, stub_embedder, make_edge_record):
+    driver = FakeGraphDriver(make_edge_record)
+    clients = clients.model_copy(update={'driver': driver})
+
+    results = await search_many(
+        clients, ['alice knows bob', ' ', 'carol works at acme'], None, CONFIG, SearchFilters()
+    )
+
+    assert stub_embedder.calls == [['alice knows bob', 'carol works at acme']]
+    assert len(driver.queries) == 4
+    assert all('UNWIND' in query for query in driver.queries)
+
+    assert [edge.uuid for edge in results[0].edges] == ['fulltext-edge-0', 'similarity-edge-0']
+    assert results[1].edges == [] and results[1].nodes == []
+    assert [node.uuid for node in results[2].nodes] == ['fulltext-node-1', 'similarity-node-1']
+
+
+@pytest.mark.asyncio
+async def test_search_many_serves_and_fills_the_search_cache(
+    clients, stub_embedder, make_edge_record
+):
+    driver = FakeGraphDriver(make_edge_record)
+    clients = clients.model_copy(update={'driver': driver})
+    cache = SearchResultCache()
+
+    first = await search_many(clients, ['alice'], ['group'], CONFIG, SearchFilters(), cache=cache)
+    queries = len(driver.queries)
+    results = await search_many(
+        clients, ['Alice', 'bob'], ['group'], CONFIG, SearchFilters(), cache=cache
+    )
+
+    # Only the uncached query is embedded and searched
+    assert stub_embedder.calls[-1] == ['bob']
+    assert len(driver.queries) == 2 * queries
+    assert [edge.uuid for edge in results[0].edges] == [edge.uuid for edge in first[0].edges]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cached = await search(clients, 'bob', ['group'], CONFIG, SearchFilters(), cache=cache)
+    assert [edge.uuid for edge in cached.edges] == [edge.uuid for edge in results[1].edges]
+    assert len(driver.queries) == 2 * queries
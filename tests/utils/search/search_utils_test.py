@@ -2,9 +2,21 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from graphiti_core.cross_encoder.client import CrossEncoderClient
 from graphiti_core.nodes import EntityNode
+from graphiti_core.search.search import get_shortlist_size
+from graphiti_core.search.search_config import DEFAULT_SHORTLIST_MULTIPLIER
 from graphiti_core.search.search_filters import SearchFilters
-from graphiti_core.search.search_utils import hybrid_node_search
+from graphiti_core.search.search_utils import (
+    MAX_QUERY_LENGTH,
+    cosine_similarity_ranking,
+    cross_encoder_reranker,
+    episode_mentions_reranker,
+    fulltext_query,
+    get_relevant_nodes,
+    hybrid_node_search,
+    node_fulltext_search,
+)
 
 
 @pytest.mark.asyncio
@@ -161,3 +173,131 @@ async def test_hybrid_node_search_with_limit_and_duplicates():
         mock_similarity_search.assert_called_with(
             mock_driver, [0.1, 0.2, 0.3], SearchFilters(), ['1'], 4
         )
+
+
+def test_fulltext_query_drops_stopwords():
+    assert fulltext_query('What did Alice say about the new product?') == 'alice say new product'
+
+
+def test_fulltext_query_falls_back_to_stopwords():
+    assert fulltext_query('The Who') == 'the who'
+    assert fulltext_query('?!') == ''
+
+
+def test_fulltext_query_keeps_top_terms_within_budget():
+    conversation = ' '.join(f'word{i}' for i in range(200)) + ' alice alice bob bob bob'
+    query = fulltext_query(conversation)
+
+    terms = query.split(' ')
+    assert len(terms) == MAX_QUERY_LENGTH
+    assert 'alice' in terms and 'bob' in terms
+    # Selected terms keep the order in which they appear in the query
+    assert terms.index('alice') < terms.index('bob')
+
+
+@pytest.mark.asyncio
+async def test_node_fulltext_search_filters_groups_in_cypher():
+    mock_driver = AsyncMock()
+    mock_driver.provider = 'neo4j'
+    mock_driver.operations = None
+    mock_driver.execute_query.return_value = ([], None, None)
+
+    await node_fulltext_search(
+        mock_driver, 'Alice ' * 100, SearchFilters(), group_ids=['group:1'], limit=5
+    )
+
+    query = mock_driver.execute_query.call_args.args[0]
+    kwargs = mock_driver.execute_query.call_args.kwargs
+    assert 'n.group_id IN $group_ids' in query
+    assert kwargs['query'] == 'alice'
+    assert kwargs['group_ids'] == ['group:1']
+    assert kwargs['fulltext_limit'] > kwargs['limit']
+
+
+@pytest.mark.asyncio
+async def test_get_relevant_nodes_scopes_fulltext_lookup_to_group():
+    mock_driver = AsyncMock()
+    mock_driver.provider = 'neo4j'
+    mock_driver.operations = None
+    mock_driver.execute_query.return_value = ([], None, None)
+
+    nodes = [EntityNode(name='Alice', group_id='group-1', name_embedding=[1.0])]
+    await get_relevant_nodes(mock_driver, nodes, SearchFilters(), limit=5)
+
+    query = mock_driver.execute_query.call_args.args[0]
+    kwargs = mock_driver.execute_query.call_args.kwargs
+    assert kwargs['nodes'][0]['fulltext_query'] == 'group_id:"group\\-1" AND (alice)'
+    assert kwargs['fulltext_limit'] > kwargs['limit']
+    assert 'collect(m)[..$limit]' in query
+
+
+def test_episode_mentions_reranker_sorts_by_mention_count():
+    reranked = episode_mentions_reranker(
+        [['a', 'b', 'c'], ['c', 'd']], {'a': 1, 'b': 5, 'c': 1}, min_score=1
+    )
+
+    # Ties keep their rrf order and nodes without mentions fall below min_score
+    assert reranked == ['b', 'c', 'a']
+
+
+class LengthReranker(CrossEncoderClient):
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def rank(self, query: str, passages: list[str]) -> list[tuple[str, float]]:
+        self.calls.append(passages)
+        return sorted(((p, len(p) / 10) for p in passages), reverse=True, key=lambda x: x[1])
+
+
+def test_cosine_similarity_ranking():
+    candidates = {'far': [0.0, 1.0], 'near': [1.0, 0.1], 'opposite': [-1.0, 0.0]}
+
+    assert cosine_similarity_ranking([1.0, 0.0], candidates) == ['near', 'far', 'opposite']
+    assert cosine_similarity_ranking([1.0, 0.0], candidates, min_score=0) == ['near', 'far']
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_exits_early():
+    cross_encoder = LengthReranker()
+    shortlist = {'aaaaaaaaa': '1', 'aaaaaaaa': '2', 'a': '3', 'aa': '4'}
+
+    reranked = await cross_encoder_reranker(
+        cross_encoder, 'query', shortlist, min_score=0.5, limit=2, early_exit_score=0.5
+    )
+
+    assert reranked == ['1', '2']
+    assert cross_encoder.calls == [['aaaaaaaaa', 'aaaaaaaa']]
+
+    await cross_encoder_reranker(cross_encoder, 'query', shortlist, limit=2)
+    assert cross_encoder.calls[-1] == list(shortlist.keys())
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_never_ranks_a_lone_passage():
+    cross_encoder = LengthReranker()
+    shortlist = {'a': '1', 'aa': '2', 'aaa': '3', 'aaaa': '4', 'aaaaa': '5'}
+
+    await cross_encoder_reranker(cross_encoder, 'query', shortlist, limit=2, early_exit_score=1.0)
+
+    assert cross_encoder.calls == [['a', 'aa'], ['aaa', 'aaaa', 'aaaaa']]
+
+    await cross_encoder_reranker(cross_encoder, 'query', shortlist, limit=1, early_exit_score=1.0)
+
+    assert cross_encoder.calls[-2:] == [['a', 'aa'], ['aaa', 'aaaa', 'aaaaa']]
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_ranks_whole_shortlist_for_listwise_rerankers():
+    cross_encoder = LengthReranker()
+    cross_encoder.listwise = True
+    shortlist = {'aaaaaaaaa': '1', 'aaaaaaaa': '2', 'a': '3', 'aa': '4'}
+
+    await cross_encoder_reranker(cross_encoder, 'query', shortlist, limit=2, early_exit_score=0.5)
+
+    assert cross_encoder.calls == [list(shortlist.keys())]
+
+
+def test_shortlist_size_defaults_to_a_multiple_of_limit():
+    assert get_shortlist_size(None, 10) == DEFAULT_SHORTLIST_MULTIPLIER * 10
+    assert get_shortlist_size(5, 10) == 10
+    assert get_shortlist_size(20, 10) == 20
@@ -0,0 +1,86 @@
+"""
+Copyright 2025, Zep Software, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+
+from graphiti_core.errors import AdmissionRejectedError
+from graphiti_core.utils.admission_control import (
+    DEFAULT_RETRY_AFTER_SECONDS,
+    AdmissionController,
+)
+
+
+def test_unbounded_controller_admits_everything():
+    controller = AdmissionController()
+    controller.check(incoming=10_000, group_depth=10_000, total_depth=100_000)
+
+
+def test_group_cap_rejects_with_retry_after():
+    controller = AdmissionController(max_group_queue=10)
+
+    controller.check(incoming=2, group_depth=8, total_depth=8)
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        controller.check(incoming=3, group_depth=8, total_depth=8)
+    assert exc_info.value.retry_after == DEFAULT_RETRY_AFTER_SECONDS
+
+    controller.record_processed(episodes=1, seconds=2.0)
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        controller.check(incoming=3, group_depth=8, total_depth=8)
+    # One episode over the cap, two seconds per episode
+    assert exc_info.value.retry_after == 2
+
+
+def test_request_larger_than_cap_is_not_retryable():
+    controller = AdmissionController(max_group_queue=5, max_total_queue=100)
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        controller.check(incoming=6, group_depth=0, total_depth=0)
+    assert exc_info.value.retry_after is None
+
+
+def test_total_cap_accounts_for_concurrency():
+    controller = AdmissionController(max_total_queue=100, concurrency=4)
+    controller.record_processed(episodes=10, seconds=10.0)
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        controller.check(incoming=1, group_depth=0, total_depth=107)
+    assert exc_info.value.retry_after == 2
+
+
+def test_estimated_wait_limit():
+    controller = AdmissionController(max_estimated_wait=60, concurrency=2)
+
+    # No processing rate observed yet, so there is nothing to estimate from
+    controller.check(incoming=1, group_depth=1_000, total_depth=1_000)
+
+    controller.record_processed(episodes=1, seconds=1.0)
+    controller.check(incoming=1, group_depth=50, total_depth=50)
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        controller.check(incoming=1, group_depth=70, total_depth=70)
+    assert exc_info.value.retry_after == 11
+
+
+def test_processing_rate_is_smoothed():
+    controller = AdmissionController()
+    controller.record_processed(episodes=2, seconds=4.0)
+    assert controller.seconds_per_episode == 2.0
+
+    controller.record_processed(episodes=1, seconds=12.0)
+    assert controller.seconds_per_episode == pytest.approx(4.0)
+
+    status = controller.status(total_depth=10, group_depth=3)
+    assert status.estimated_wait == pytest.approx(40.0)